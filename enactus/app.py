@@ -1,107 +1,213 @@
 import os
 import datetime
-from io import BytesIO
-from flask import Flask, render_template, request, redirect, url_for, flash, session, make_response
-from sqlalchemy import text
-from flask_sqlalchemy import SQLAlchemy
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4, landscape
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-try:
-    from openpyxl import Workbook
-    from openpyxl.styles import Font, Alignment, PatternFill
-    OPENPYXL_AVAILABLE = True
-except ImportError:
-    OPENPYXL_AVAILABLE = False
-
+from flask import Flask, render_template, request, redirect, url_for, flash, session, send_file, Response, stream_with_context, jsonify
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import update, or_, func, case
+from sqlalchemy.orm import joinedload, contains_eager
+from sqlalchemy.exc import OperationalError, IntegrityError
+from werkzeug.http import is_resource_modified
+from werkzeug.middleware.proxy_fix import ProxyFix
+import assets
+import database
+import exports
+import imports
+from export_jobs import ExportJobs
+from images import ImageError, images, variant_widths
+from metrics import metrics
+import migrations
+import offload
+from outbox import outbox
+from models import db, Event, Registration, data_version, is_valid_email
+from page_cache import page_cache
+from ratelimit import limiter
+from scheduler import scheduler
+
+# Routes below attach to this instance; create_app() configures it once
 app = Flask(__name__)
 app.secret_key = 'super_secret_key_for_flash_messages'
-
-# --- DATABASE CONFIGURATION ---
 basedir = os.path.abspath(os.path.dirname(__file__))
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.join(basedir, 'enactus.db')
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-
-db = SQLAlchemy(app)
-
-# --- MODELS ---
-class Event(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    title = db.Column(db.String(100), nullable=False)
-    date_day = db.Column(db.String(10), nullable=False) 
-    date_month = db.Column(db.String(10), nullable=False) 
-    short_desc = db.Column(db.String(200), nullable=False)
-    full_desc = db.Column(db.Text, nullable=False)
-    image_url = db.Column(db.String(500), nullable=False)
-    is_open = db.Column(db.Boolean, default=True)
-    # Event type: 'solo' or 'team'
-    event_type = db.Column(db.String(20), default='solo')  # 'solo' or 'team'
-    # New fields for event duration
-    start_date = db.Column(db.String(20), nullable=True)  # Format: YYYY-MM-DD
-    end_date = db.Column(db.String(20), nullable=True)    # Format: YYYY-MM-DD
-    event_time = db.Column(db.String(20), nullable=True)  # Format: HH:MM
-    venue = db.Column(db.String(200), nullable=True)
-    max_registrations = db.Column(db.Integer, nullable=True)
-    # Team event fields
-    min_team_size = db.Column(db.Integer, nullable=True)  # Minimum team members
-    max_team_size = db.Column(db.Integer, nullable=True)  # Maximum team members
-    event_link = db.Column(db.String(500), nullable=True)  # External link/URL for event
-    brochure_link = db.Column(db.String(500), nullable=True)  # Optional document link
-
-class Registration(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    event_id = db.Column(db.Integer, db.ForeignKey('event.id'), nullable=False)
-    # Common fields
-    registration_type = db.Column(db.String(20), default='solo')  # 'solo' or 'team'
-    # Solo event fields
-    name = db.Column(db.String(100), nullable=True)
-    email = db.Column(db.String(100), nullable=True)
-    student_id = db.Column(db.String(50), nullable=True)
-    contact_no = db.Column(db.String(20), nullable=True)
-    branch = db.Column(db.String(100), nullable=True)
-    college_name = db.Column(db.String(200), nullable=True)
-    # Team event fields
-    team_name = db.Column(db.String(100), nullable=True)
-    team_size = db.Column(db.Integer, nullable=True)
-    leader_name = db.Column(db.String(100), nullable=True)
-    leader_email = db.Column(db.String(100), nullable=True)
-    leader_contact = db.Column(db.String(20), nullable=True)
-    # Relationship
-    event = db.relationship('Event', backref='registrations')
+
+export_jobs = ExportJobs()
+
+def create_app(config=None):
+    """Configure the app and its extensions, then return it.
+
+    Nothing touches the database at import time; the WSGI module, the dev
+    server, maintenance.py and the benchmarks all call this first. ``config``
+    overrides app.config (e.g. SQLALCHEMY_DATABASE_URI in a test). Calling it
+    again returns the already configured app.
+    """
+    if 'sqlalchemy' in app.extensions:
+        return app
+    app.config.update(config or {})
+
+    # --- DATABASE CONFIGURATION ---
+    app.config.setdefault('SQLALCHEMY_DATABASE_URI', database.database_uri(basedir))
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', database.engine_options(app.config['SQLALCHEMY_DATABASE_URI']))
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+    # Behind nginx etc.: trust this many X-Forwarded-* hops for the client IP (rate limits key on it).
+    # File offload only works behind a proxy, so SENDFILE_MODE implies one hop unless set explicitly.
+    trusted_proxies = app.config.get('TRUSTED_PROXIES', os.environ.get('TRUSTED_PROXIES', ''))
+    if trusted_proxies in (None, ''):
+        trusted_proxies = 1 if app.config.get('SENDFILE_MODE') or os.environ.get('SENDFILE_MODE') else 0
+    trusted_proxies = int(trusted_proxies)
+    if trusted_proxies:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=trusted_proxies, x_proto=trusted_proxies)
+
+    # Compiled templates are kept on disk, so a new worker loads admin.html & co. instead of recompiling them
+    # ('' turns the cache off)
+    jinja_cache_dir = app.config.get('JINJA_CACHE_DIR', os.environ.get('JINJA_CACHE_DIR', os.path.join(basedir, 'jinja_cache')))
+    if jinja_cache_dir:
+        os.makedirs(jinja_cache_dir, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(jinja_cache_dir)
+
+    assets.init_app(app)
+    offload.init_app(app)
+    db.init_app(app)
+    metrics.init_app(app)
+    with app.app_context():
+        database.install_sqlite_pragmas(db.engine)
+        metrics.instrument_engine(db.engine)
+
+    export_jobs.init_app(app)
+    images.init_app(app)
+    page_cache.init_app(app)
+    metrics.add_collector(page_cache.collect)
+    outbox.init_app(app)
+    metrics.add_collector(outbox.collect)
+    limiter.init_app(app)
+    metrics.add_collector(limiter.collect)
+    scheduler.init_app(app)
+    scheduler.add_job(archive_past_events)
+    if outbox.enabled:
+        scheduler.add_job(outbox.deliver, interval=outbox.interval)
+        scheduler.add_job(outbox.prune, interval=3600)
+
+    # Load every template while the worker boots, so its first requests don't pay for it
+    if str(app.config.get('TEMPLATE_PREWARM', os.environ.get('TEMPLATE_PREWARM', '0'))) != '0':
+        prewarm_templates()
+    return app
+
+def prewarm_templates():
+    """Compile (or load from the bytecode cache) every template; returns how many."""
+    names = app.jinja_env.list_templates()
+    for name in names:
+        app.jinja_env.get_template(name)
+    return len(names)
+
+# --- REGISTRATION HELPERS ---
+def reserve_seat(event_id):
+    """Atomically claim one seat on an open event.
+
+    A single conditional UPDATE bumps registration_count only while the event
+    is open and below max_registrations, so concurrent sign-ups can never
+    overfill it. Returns True if a seat was claimed; the caller must commit
+    (or roll back) the surrounding transaction.
+    """
+    result = db.session.execute(
+        update(Event)
+        .where(
+            Event.id == event_id,
+            Event.is_open.is_(True),
+            or_(Event.max_registrations.is_(None), Event.registration_count < Event.max_registrations),
+        )
+        .values(registration_count=Event.registration_count + 1, data_version=Event.data_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+# --- EVENT FORM HELPERS ---
+def form_date(name):
+    value = request.form.get(name)
+    return datetime.date.fromisoformat(value) if value else None
+
+def form_time(name):
+    value = request.form.get(name)
+    return datetime.time.fromisoformat(value) if value else None
+
+def apply_cover_image(event):
+    """Set the cover from the form: an uploaded file wins over a pasted image_url.
+
+    Keeps the current cover when neither is given; raises ImageError
+    for an unusable upload or a new event with no cover at all.
+    """
+    upload = request.files.get('image_file')
+    if upload and upload.filename:
+        event.image_key, event.image_width = images.save(upload)
+        # Largest JPEG, for whatever reads image_url directly (API, old clients)
+        event.image_url = images.url(event.image_key, variant_widths(event.image_width)[-1], 'jpg')
+    elif request.form.get('image_url'):
+        event.image_url = request.form['image_url']
+        event.image_key = event.image_width = None
+    elif not event.image_url:
+        raise ImageError("Add a cover image: upload a file or paste an image URL.")
+
+def archive_past_events(today=None):
+    """Close registration on events whose end_date has passed and archive them.
+
+    Runs every SCHEDULER_INTERVAL seconds (and from ``maintenance.py
+    archive``). Each event is archived once; an admin may reopen it
+    afterwards and it stays open. Returns the number of events archived.
+    """
+    today = today or datetime.date.today()
+    result = db.session.execute(
+        update(Event)
+        .where(Event.is_archived.is_(False), Event.end_date < today)
+        .values(is_open=False, is_archived=True, data_version=Event.data_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+    if result.rowcount:
+        page_cache.invalidate('events')
+        app.logger.info("Archived %d past event(s)", result.rowcount)
+    return result.rowcount
 
 # --- PUBLIC ROUTES ---
 @app.route('/')
+@page_cache.cached()
 def home(): return render_template('home.html', title="Home")
 
 @app.route('/projects')
+@page_cache.cached()
 def projects(): return render_template('projects.html', title="Our Work")
 
 @app.route('/project/navodaya')
+@page_cache.cached()
 def project_navodaya(): return render_template('project_navodaya.html', title="Project Navodaya")
 
 @app.route('/project/astitva')
+@page_cache.cached()
 def project_astitva(): return render_template('project_astitva.html', title="Project Astitva")
 
 @app.route('/project/vriksh')
+@page_cache.cached()
 def project_vriksh(): return render_template('project_vriksh.html', title="Project Vriksh")
 
 @app.route('/team')
+@page_cache.cached()
 def team(): return render_template('team.html', title="Our Team")
 
 @app.route('/about')
+@page_cache.cached()
 def about(): return render_template('about.html', title="About Us")
 
 @app.route('/store')
+@page_cache.cached()
 def store(): return render_template('store.html', title="Store")
 
 @app.route('/events')
+@page_cache.cached(tag='events', version=data_version)
 def events():
-    all_events = Event.query.all()
-    return render_template('events.html', events=all_events, title="Events")
+    # Two slices straight off ix_event_open_start: soonest open first, latest closed first
+    open_events = Event.query.filter(Event.is_open.is_(True)).order_by(Event.start_date, Event.id).all()
+    closed_events = (Event.query.filter(Event.is_open.is_(False))
+                     .order_by(Event.start_date.desc(), Event.id.desc()).all())
+    return render_template('events.html', open_events=open_events, closed_events=closed_events, title="Events")
 
 @app.route('/register_event', methods=['POST'])
+@limiter.limit('30/minute')
+@limiter.admit
 def register_event():
     event_id = request.form.get('event_id')
     event_type = request.form.get('event_type', 'solo')
@@ -116,12 +222,10 @@ def register_event():
         flash("Registration for this event is closed.", "error")
         return redirect(url_for('events'))
     
-    # Check max registrations limit
-    if event.max_registrations:
-        current_reg_count = Registration.query.filter_by(event_id=event_id).count()
-        if current_reg_count >= event.max_registrations:
-            flash("Sorry, this event is full. Registration is closed.", "error")
-            return redirect(url_for('events'))
+    # Cheap early exit; the authoritative capacity check is reserve_seat() below
+    if event.max_registrations and event.registration_count >= event.max_registrations:
+        flash("Sorry, this event is full. Registration is closed.", "error")
+        return redirect(url_for('events'))
 
     try:
         if event_type == 'team':
@@ -129,7 +233,7 @@ def register_event():
             team_name = request.form.get('team_name')
             team_size = request.form.get('team_size')
             leader_name = request.form.get('name')
-            leader_email = request.form.get('email')
+            leader_email = (request.form.get('email') or '').strip()
             leader_contact = request.form.get('phone')
             college = request.form.get('college')
             
@@ -153,7 +257,7 @@ def register_event():
         else:
             # Solo event registration
             name = request.form.get('name')
-            email = request.form.get('email')
+            email = (request.form.get('email') or '').strip()
             student_id = request.form.get('student_id')
             phone = request.form.get('phone')
             branch = request.form.get('branch')
@@ -174,13 +278,28 @@ def register_event():
                 college_name=college
             )
             reg_name = name
-        
+
+        if not is_valid_email(new_reg.email):
+            flash("Please enter a valid email address.", "error")
+            return redirect(url_for('events'))
+
+        if not reserve_seat(event.id):
+            db.session.rollback()
+            flash("Sorry, this event is full. Registration is closed.", "error")
+            return redirect(url_for('events'))
+
         db.session.add(new_reg)
+        # Same commit as the registration; the scheduler's outbox job sends it
+        outbox.enqueue(
+            new_reg.email, f"Registration confirmed: {event.title}",
+            render_template('emails/registration_confirmation.txt', event=event, registration=new_reg, name=reg_name),
+        )
         db.session.commit()
+        page_cache.invalidate('events')
         
         # Check if max reached after this registration and auto-close if so
         if event.max_registrations:
-            updated_count = Registration.query.filter_by(event_id=event_id).count()
+            updated_count = event.registration_count
             if updated_count >= event.max_registrations:
                 # Event is full but keeps is_open=True so it shows in Upcoming (as "Full")
                 flash(f"Success! {reg_name}, you are registered. The event has now reached maximum capacity.", "success")
@@ -188,16 +307,26 @@ def register_event():
                 flash(f"Success! {reg_name}, you are registered. ({updated_count}/{event.max_registrations} spots filled)", "success")
         else:
             flash(f"Success! {reg_name}, you are registered.", "success")
+    except IntegrityError:
+        # uq_registration_event_*_key: same email or student ID already registered here
+        db.session.rollback()
+        flash("You're already registered for this event with that email or student ID.", "error")
     except Exception as e:
         db.session.rollback()
-        print(f"Registration error: {e}")
-        flash("Something went wrong.", "error")
+        if isinstance(e, OperationalError) and database.is_busy_error(e):
+            # Lock contention that outlasted the busy timeout; safe to retry
+            print(f"Registration busy: {e}")
+            flash("We're handling a lot of sign-ups right now. Please try again in a moment.", "error")
+        else:
+            print(f"Registration error: {e}")
+            flash("Something went wrong.", "error")
 
     return redirect(url_for('events'))
 
 # --- ADMIN ROUTES (SECURE) ---
 
 @app.route('/admin_login', methods=['GET', 'POST'])
+@limiter.limit('5/minute')
 def admin_login():
     if request.method == 'POST':
         password = request.form.get('password')
@@ -218,50 +347,91 @@ def admin():
     if not session.get('is_admin'):
         return redirect(url_for('admin_login'))
 
-    regs = Registration.query.all()
     events = Event.query.all()
-    return render_template('admin.html', regs=regs, events=events, title="Admin Dashboard")
+    stats = db.session.query(
+        func.count(Event.id).label('events'),
+        func.coalesce(func.sum(case((Event.is_open.is_(True), 1), else_=0)), 0).label('open'),
+        func.coalesce(func.sum(Event.registration_count), 0).label('registrations'),
+    ).one()
+    recent_regs = (Registration.query.options(joinedload(Registration.event))
+                   .order_by(Registration.id.desc()).limit(5).all())
+
+    search = request.args.get('q', '').strip()
+    event_filter = request.args.get('event', type=int)
+    before = request.args.get('before', type=int)
+    regs, next_cursor = registrations_page(search, event_filter, before)
+
+    return render_template('admin.html', regs=regs, events=events, stats=stats, recent_regs=recent_regs,
+                           search=search, event_filter=event_filter, before=before, next_cursor=next_cursor,
+                           title="Admin Dashboard")
+
+ADMIN_PAGE_SIZE = 50
+
+def registrations_page(search='', event_id=None, before=None, per_page=ADMIN_PAGE_SIZE):
+    """Return one keyset page of registrations, newest first, plus the next cursor.
+
+    Pages are addressed by the last registration id seen (``before``) rather
+    than an OFFSET, so every page walks the primary-key / event_id index from
+    a known point and costs the same no matter how deep it is. ``search``
+    matches name, email, team name, college or event title.
+
+    The search is a case-insensitive substring match, which no index can
+    serve: it filters rows as the id walk goes, so a common term fills the
+    page early but a rare one scans every registration (of the chosen event).
+    """
+    query = Registration.query.join(Registration.event).options(contains_eager(Registration.event))
+    if event_id:
+        query = query.filter(Registration.event_id == event_id)
+    if before:
+        query = query.filter(Registration.id < before)
+    if search:
+        pattern = f"%{search}%"
+        query = query.filter(or_(
+            Registration.name.ilike(pattern),
+            Registration.email.ilike(pattern),
+            Registration.leader_name.ilike(pattern),
+            Registration.leader_email.ilike(pattern),
+            Registration.team_name.ilike(pattern),
+            Registration.college_name.ilike(pattern),
+            Event.title.ilike(pattern),
+        ))
+    rows = query.order_by(Registration.id.desc()).limit(per_page + 1).all()
+    next_cursor = rows[per_page - 1].id if len(rows) > per_page else None
+    return rows[:per_page], next_cursor
 
 @app.route('/add_event', methods=['POST'])
+@limiter.admit
 def add_event():
     if not session.get('is_admin'):
         return redirect(url_for('admin_login'))
 
     title = request.form.get('title')
-    start_date = request.form.get('start_date')
-    end_date = request.form.get('end_date')
     short_desc = request.form.get('short_desc')
     full_desc = request.form.get('full_desc')
-    image_url = request.form.get('image_url')
     # Event type
     event_type = request.form.get('event_type', 'solo')
     # Team size constraints
     min_team_size = request.form.get('min_team_size')
     max_team_size = request.form.get('max_team_size')
     # Other fields
-    event_time = request.form.get('time')
     venue = request.form.get('venue')
     max_reg = request.form.get('max_registrations')
     event_link = request.form.get('event_link')
     brochure_link = request.form.get('brochure_link')
 
     try:
-        start_date_obj = datetime.datetime.strptime(start_date, '%Y-%m-%d')
-        day = start_date_obj.strftime("%d")
-        month = start_date_obj.strftime("%b").upper()
+        start_date = form_date('start_date')
+        end_date = form_date('end_date')
 
         new_event = Event(
             title=title,
-            date_day=day,
-            date_month=month,
             short_desc=short_desc,
             full_desc=full_desc,
-            image_url=image_url,
             is_open=True,
             event_type=event_type,
             start_date=start_date,
             end_date=end_date if end_date else start_date,
-            event_time=event_time if event_time else None,
+            event_time=form_time('time'),
             venue=venue if venue else None,
             max_registrations=int(max_reg) if max_reg else None,
             min_team_size=int(min_team_size) if min_team_size and event_type == 'team' else None,
@@ -269,9 +439,14 @@ def add_event():
             event_link=event_link if event_link else None,
             brochure_link=brochure_link if brochure_link else None
         )
+        apply_cover_image(new_event)
         db.session.add(new_event)
         db.session.commit()
+        page_cache.invalidate('events')
         flash("New Event Published Successfully!", "success")
+    except ImageError as e:
+        db.session.rollback()
+        flash(str(e), "error")
     except Exception as e:
         print(e)
         flash("Error creating event. Check date format.", "error")
@@ -279,6 +454,7 @@ def add_event():
     return redirect(url_for('admin'))
 
 @app.route('/edit_event/<int:event_id>', methods=['GET', 'POST'])
+@limiter.admit
 def edit_event(event_id):
     if not session.get('is_admin'):
         return redirect(url_for('admin_login'))
@@ -286,12 +462,17 @@ def edit_event(event_id):
     event = Event.query.get_or_404(event_id)
     
     if request.method == 'POST':
+        try:
+            apply_cover_image(event)
+        except ImageError as e:
+            db.session.rollback()
+            flash(str(e), "error")
+            return redirect(url_for('edit_event', event_id=event_id))
         event.title = request.form.get('title')
         event.short_desc = request.form.get('short_desc')
         event.full_desc = request.form.get('full_desc')
-        event.image_url = request.form.get('image_url')
         event.venue = request.form.get('venue') if request.form.get('venue') else None
-        event.event_time = request.form.get('time') if request.form.get('time') else None
+        event.event_time = form_time('time')
         
         # Handle event type
         event.event_type = request.form.get('event_type', 'solo')
@@ -302,18 +483,18 @@ def edit_event(event_id):
         event.min_team_size = int(min_team) if min_team and event.event_type == 'team' else None
         event.max_team_size = int(max_team) if max_team and event.event_type == 'team' else None
         
-        # Handle dates
-        start_date = request.form.get('start_date')
-        end_date = request.form.get('end_date')
+        # Handle dates; a blank start date keeps the current one (and its card badge)
+        start_date = form_date('start_date')
+        end_date = form_date('end_date')
         if start_date:
             event.start_date = start_date
-            date_obj = datetime.datetime.strptime(start_date, '%Y-%m-%d')
-            event.date_day = date_obj.strftime("%d")
-            event.date_month = date_obj.strftime("%b").upper()
         if end_date:
             event.end_date = end_date
         else:
             event.end_date = start_date
+        # Moved into the future: let the scheduler archive it again when it ends
+        if event.end_date is None or event.end_date >= datetime.date.today():
+            event.is_archived = False
             
         # Handle max registrations
         max_reg = request.form.get('max_registrations')
@@ -327,26 +508,32 @@ def edit_event(event_id):
         brochure_link = request.form.get('brochure_link')
         event.brochure_link = brochure_link if brochure_link else None
         
+        event.data_version = Event.data_version + 1
         db.session.commit()
+        page_cache.invalidate('events')
         flash(f"Event '{event.title}' updated successfully!", "success")
         return redirect(url_for('admin'))
     
     return render_template('edit_event.html', event=event, title="Edit Event")
 
 @app.route('/toggle_event/<int:event_id>', methods=['POST'])
+@limiter.admit
 def toggle_event(event_id):
     if not session.get('is_admin'):
         return redirect(url_for('admin_login'))
     
     event = Event.query.get_or_404(event_id)
     event.is_open = not event.is_open
+    event.data_version = Event.data_version + 1
     db.session.commit()
+    page_cache.invalidate('events')
     
     status = "opened" if event.is_open else "closed"
     flash(f"Registration for '{event.title}' has been {status}.", "success")
     return redirect(url_for('admin'))
 
 @app.route('/delete_event/<int:event_id>', methods=['POST'])
+@limiter.admit
 def delete_event(event_id):
     if not session.get('is_admin'):
         return redirect(url_for('admin_login'))
@@ -359,11 +546,13 @@ def delete_event(event_id):
     
     db.session.delete(event)
     db.session.commit()
+    page_cache.invalidate('events')
     
     flash(f"Event '{event_title}' and all its registrations have been deleted.", "success")
     return redirect(url_for('admin'))
 
 @app.route('/delete_registration/<int:reg_id>', methods=['POST'])
+@limiter.admit
 def delete_registration(reg_id):
     if not session.get('is_admin'):
         return redirect(url_for('admin_login'))
@@ -371,86 +560,154 @@ def delete_registration(reg_id):
     registration = Registration.query.get_or_404(reg_id)
     reg_name = registration.name
     
+    Event.query.filter_by(id=registration.event_id).update(
+        {Event.registration_count: Event.registration_count - 1, Event.data_version: Event.data_version + 1},
+        synchronize_session=False)
     db.session.delete(registration)
     db.session.commit()
+    page_cache.invalidate('events')
     
     flash(f"Registration for '{reg_name}' has been deleted.", "success")
     return redirect(url_for('admin'))
 
+@app.route('/import_registrations/<int:event_id>', methods=['POST'])
+@limiter.admit
+def import_registrations(event_id):
+    if not session.get('is_admin'):
+        return redirect(url_for('admin_login'))
+
+    event = Event.query.get_or_404(event_id)
+    title = event.title
+    upload = request.files.get('file')
+    if not upload or not upload.filename:
+        flash("Choose a CSV or Excel file to import.", "error")
+        return redirect(url_for('admin'))
+
+    try:
+        result = imports.import_registrations(event, upload.stream, upload.filename)
+    except imports.ImportFileError as e:
+        db.session.rollback()
+        flash(str(e), "error")
+        return redirect(url_for('admin'))
+    except Exception as e:
+        # Batches committed before the failure stay imported
+        db.session.rollback()
+        page_cache.invalidate('events')
+        print(f"Import error: {e}")
+        flash("Import stopped partway because of an error. Check the registrations list before retrying.", "error")
+        return redirect(url_for('admin'))
+    page_cache.invalidate('events')
+
+    message = f"Imported {result['accepted']} registration(s) into '{title}'."
+    if result['rejected']:
+        reasons = ', '.join(f"{reason} ({count})" for reason, count in result['reasons'].items())
+        lines = ', '.join(str(line) for line, _ in result['rejects'][:10])
+        more = ' and more' if result['rejected'] > 10 else ''
+        message += f" Skipped {result['rejected']} row(s): {reasons}. See line {lines}{more}."
+    flash(message, "success" if result['accepted'] else "error")
+    return redirect(url_for('admin'))
+
+@app.route('/cache_stats')
+def cache_stats():
+    if not session.get('is_admin'):
+        return jsonify(error="Admin login required."), 403
+    return jsonify(page_cache.stats())
+
+@app.route('/metrics')
+def metrics_endpoint():
+    if not (session.get('is_admin') or metrics.authorized(request)):
+        return Response("Admin login required.\n", status=403, mimetype='text/plain')
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+# --- JSON API ---
+# Listing omits full_desc and links; /api/events/<id> adds them
+API_EVENT_FIELDS = ('id', 'title', 'date_day', 'date_month', 'short_desc', 'image_url', 'is_open',
+                    'event_type', 'start_date', 'end_date', 'event_time', 'venue',
+                    'max_registrations', 'min_team_size', 'max_team_size', 'registration_count')
+API_EVENT_DETAIL_FIELDS = API_EVENT_FIELDS + ('full_desc', 'event_link', 'brochure_link')
+
+def api_event_payload(row):
+    payload = dict(row._mapping)
+    # Same YYYY-MM-DD / HH:MM strings the API served before the columns were typed
+    for field in ('start_date', 'end_date'):
+        if payload[field] is not None:
+            payload[field] = payload[field].isoformat()
+    if payload['event_time'] is not None:
+        payload['event_time'] = payload['event_time'].strftime('%H:%M')
+    capacity = payload['max_registrations']
+    payload['seats_left'] = max(capacity - payload['registration_count'], 0) if capacity else None
+    payload['is_full'] = bool(capacity) and payload['registration_count'] >= capacity
+    return payload
+
+def api_response(etag, last_modified, build):
+    """Answer 304 if the client's validators still match, else JSON from ``build()``."""
+    if last_modified is not None:
+        last_modified = last_modified.replace(tzinfo=datetime.timezone.utc, microsecond=0)
+    if not is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        response = Response(status=304)
+    else:
+        response = jsonify(build())
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    response.headers['Cache-Control'] = 'no-cache'
+    # Read-only public data, so any site may embed it
+    response.headers['Access-Control-Allow-Origin'] = '*'
+    return response
+
+@app.route('/api/events')
+def api_events():
+    status = request.args.get('status', 'all')
+    if status not in ('all', 'open', 'closed'):
+        return jsonify(error="status must be one of: all, open, closed."), 400
+
+    def build():
+        query = db.session.query(*(getattr(Event, f) for f in API_EVENT_FIELDS)).order_by(Event.id)
+        if status != 'all':
+            query = query.filter(Event.is_open == (status == 'open'))
+        return {'events': [api_event_payload(row) for row in query]}
+
+    last_modified = db.session.query(func.max(Event.updated_at)).scalar()
+    return api_response(f"{data_version()}-{status}", last_modified, build)
+
+@app.route('/api/events/<int:event_id>')
+def api_event(event_id):
+    meta = db.session.query(Event.data_version, Event.updated_at).filter_by(id=event_id).first()
+    if meta is None:
+        return jsonify(error="Event not found."), 404
+
+    def build():
+        query = db.session.query(*(getattr(Event, f) for f in API_EVENT_DETAIL_FIELDS))
+        return api_event_payload(query.filter_by(id=event_id).one())
+
+    return api_response(f"event{event_id}-{meta.data_version}", meta.updated_at, build)
+
 @app.route('/logout')
 def logout():
     session.pop('is_admin', None)
     flash("Logged out successfully.", "success")
     return redirect(url_for('home'))
 
-# --- PDF EXPORT ROUTES ---
+# --- EXPORT ROUTES ---
+def export_response(output, writer, filename):
+    """Wrap an export engine result as a download."""
+    if isinstance(writer, exports.CsvWriter):
+        response = Response(stream_with_context(output), mimetype=writer.content_type)
+        response.headers['Content-Disposition'] = f'attachment; filename={filename}.{writer.extension}'
+        return response
+    # Spooled temp file, streamed back in blocks
+    return send_file(output, mimetype=writer.content_type, as_attachment=True,
+                     download_name=f'{filename}.{writer.extension}')
+
+def event_filename(event):
+    return f'{event.title.replace(" ", "_")}_registrations'
+
 @app.route('/export_all_pdf')
 def export_all_pdf():
     if not session.get('is_admin'):
         return redirect(url_for('admin_login'))
     
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=landscape(A4), rightMargin=30, leftMargin=30, topMargin=30, bottomMargin=30)
-    elements = []
-    styles = getSampleStyleSheet()
-    
-    # Title
-    title_style = ParagraphStyle('Title', parent=styles['Heading1'], fontSize=20, spaceAfter=20, textColor=colors.HexColor('#d4a553'))
-    elements.append(Paragraph("Enactus - All Registrations", title_style))
-    elements.append(Spacer(1, 0.25*inch))
-    
-    # Get all events with registrations
-    events = Event.query.all()
-    
-    for event in events:
-        regs = Registration.query.filter_by(event_id=event.id).all()
-        if not regs:
-            continue
-            
-        # Event header
-        event_style = ParagraphStyle('EventTitle', parent=styles['Heading2'], fontSize=14, spaceAfter=10, spaceBefore=20)
-        elements.append(Paragraph(f"{event.title} ({event.date_day} {event.date_month})", event_style))
-        
-        # Table data
-        if event.event_type == 'team':
-            headers = ['#', 'Team Name', 'Leader Name', 'Leader Email', 'Leader Contact', 'Team Size']
-            data = [headers]
-            for i, reg in enumerate(regs, 1):
-                data.append([str(i), reg.team_name or '-', reg.leader_name or '-', reg.leader_email or '-', reg.leader_contact or '-', str(reg.team_size or '-')])
-        else:
-            headers = ['#', 'Name', 'Email', 'Student ID', 'Contact', 'Branch', 'College']
-            data = [headers]
-            for i, reg in enumerate(regs, 1):
-                data.append([str(i), reg.name or '-', reg.email or '-', reg.student_id or '-', reg.contact_no or '-', reg.branch or '-', reg.college_name or '-'])
-        
-        # Create table
-        table = Table(data, repeatRows=1)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a1f26')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#d4a553')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8f8f8')),
-            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cccccc')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 1), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-        ]))
-        elements.append(table)
-        elements.append(Spacer(1, 0.3*inch))
-    
-    doc.build(elements)
-    buffer.seek(0)
-    
-    response = make_response(buffer.getvalue())
-    response.headers['Content-Type'] = 'application/pdf'
-    response.headers['Content-Disposition'] = 'attachment; filename=all_registrations.pdf'
-    return response
+    writer = exports.PdfWriter()
+    return export_response(exports.export(Event.query.all(), writer), writer, 'all_registrations')
 
 @app.route('/export_event_pdf/<int:event_id>')
 def export_event_pdf(event_id):
@@ -458,198 +715,113 @@ def export_event_pdf(event_id):
         return redirect(url_for('admin_login'))
     
     event = Event.query.get_or_404(event_id)
-    regs = Registration.query.filter_by(event_id=event_id).all()
-    
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=landscape(A4), rightMargin=30, leftMargin=30, topMargin=30, bottomMargin=30)
-    elements = []
-    styles = getSampleStyleSheet()
-    
-    # Title
-    title_style = ParagraphStyle('Title', parent=styles['Heading1'], fontSize=20, spaceAfter=10, textColor=colors.HexColor('#d4a553'))
-    elements.append(Paragraph(f"Enactus - {event.title}", title_style))
-    
-    # Event info
-    info_style = ParagraphStyle('Info', parent=styles['Normal'], fontSize=11, spaceAfter=20)
-    elements.append(Paragraph(f"Date: {event.date_day} {event.date_month} | Venue: {event.venue or 'TBA'} | Total Registrations: {len(regs)}", info_style))
-    elements.append(Spacer(1, 0.25*inch))
-    
-    if regs:
-        # Table data
-        if event.event_type == 'team':
-            headers = ['#', 'Team Name', 'Leader Name', 'Leader Email', 'Leader Contact', 'Team Size']
-            data = [headers]
-            for i, reg in enumerate(regs, 1):
-                data.append([str(i), reg.team_name or '-', reg.leader_name or '-', reg.leader_email or '-', reg.leader_contact or '-', str(reg.team_size or '-')])
-        else:
-            headers = ['#', 'Name', 'Email', 'Student ID', 'Contact', 'Branch', 'College']
-            data = [headers]
-            for i, reg in enumerate(regs, 1):
-                data.append([str(i), reg.name or '-', reg.email or '-', reg.student_id or '-', reg.contact_no or '-', reg.branch or '-', reg.college_name or '-'])
-        
-        table = Table(data, repeatRows=1)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a1f26')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#d4a553')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8f8f8')),
-            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cccccc')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 1), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-        ]))
-        elements.append(table)
-    else:
-        elements.append(Paragraph("No registrations yet.", styles['Normal']))
-    
-    doc.build(elements)
-    buffer.seek(0)
-    
-    response = make_response(buffer.getvalue())
-    response.headers['Content-Type'] = 'application/pdf'
-    response.headers['Content-Disposition'] = f'attachment; filename={event.title.replace(" ", "_")}_registrations.pdf'
-    return response
+    writer = exports.PdfWriter(single_event=True)
+    return export_response(exports.export([event], writer, include_empty=True), writer, event_filename(event))
 
-# --- EXCEL EXPORT ROUTES ---
 @app.route('/export_all_excel')
 def export_all_excel():
     if not session.get('is_admin'):
         return redirect(url_for('admin_login'))
     
-    if not OPENPYXL_AVAILABLE:
+    if not exports.OPENPYXL_AVAILABLE:
         flash('Excel export requires openpyxl. Install with: pip install openpyxl', 'error')
         return redirect(url_for('admin'))
     
-    wb = Workbook()
-    events = Event.query.all()
-    
-    # Remove default sheet
-    wb.remove(wb.active)
-    
-    header_font = Font(bold=True, color="FFFFFF")
-    header_fill = PatternFill(start_color="1a3c34", end_color="1a3c34", fill_type="solid")
-    
-    for event in events:
-        regs = Registration.query.filter_by(event_id=event.id).all()
-        if not regs:
-            continue
-        
-        # Create sheet for each event (limit title to 30 chars)
-        ws = wb.create_sheet(title=event.title[:30])
-        
-        if event.event_type == 'team':
-            headers = ['#', 'Team Name', 'Leader Name', 'Leader Email', 'Leader Contact', 'Team Size', 'College']
-            ws.append(headers)
-            for i, reg in enumerate(regs, 1):
-                ws.append([i, reg.team_name or '', reg.leader_name or '', reg.leader_email or '', reg.leader_contact or '', reg.team_size or '', reg.college_name or ''])
-        else:
-            headers = ['#', 'Name', 'Email', 'Student ID', 'Contact', 'Branch', 'College']
-            ws.append(headers)
-            for i, reg in enumerate(regs, 1):
-                ws.append([i, reg.name or '', reg.email or '', reg.student_id or '', reg.contact_no or '', reg.branch or '', reg.college_name or ''])
-        
-        # Style headers
-        for cell in ws[1]:
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal='center')
-        
-        # Auto-adjust column widths
-        for column_cells in ws.columns:
-            max_length = max(len(str(cell.value or "")) for cell in column_cells)
-            ws.column_dimensions[column_cells[0].column_letter].width = min(max_length + 2, 50)
-    
-    if not wb.worksheets:
-        ws = wb.create_sheet(title="No Data")
-        ws.append(["No registrations found"])
-    
-    buffer = BytesIO()
-    wb.save(buffer)
-    buffer.seek(0)
-    
-    response = make_response(buffer.getvalue())
-    response.headers['Content-Type'] = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-    response.headers['Content-Disposition'] = 'attachment; filename=all_registrations.xlsx'
-    return response
-
+    writer = exports.XlsxWriter()
+    return export_response(exports.export(Event.query.all(), writer), writer, 'all_registrations')
 
 @app.route('/export_event_excel/<int:event_id>')
 def export_event_excel(event_id):
     if not session.get('is_admin'):
         return redirect(url_for('admin_login'))
     
-    if not OPENPYXL_AVAILABLE:
+    if not exports.OPENPYXL_AVAILABLE:
         flash('Excel export requires openpyxl. Install with: pip install openpyxl', 'error')
         return redirect(url_for('admin'))
     
     event = Event.query.get_or_404(event_id)
-    regs = Registration.query.filter_by(event_id=event_id).all()
-    
-    wb = Workbook()
-    ws = wb.active
-    ws.title = event.title[:30]
-    
-    header_font = Font(bold=True, color="FFFFFF")
-    header_fill = PatternFill(start_color="1a3c34", end_color="1a3c34", fill_type="solid")
-    
-    if event.event_type == 'team':
-        headers = ['#', 'Team Name', 'Leader Name', 'Leader Email', 'Leader Contact', 'Team Size', 'College']
-        ws.append(headers)
-        for i, reg in enumerate(regs, 1):
-            ws.append([i, reg.team_name or '', reg.leader_name or '', reg.leader_email or '', reg.leader_contact or '', reg.team_size or '', reg.college_name or ''])
-    else:
-        headers = ['#', 'Name', 'Email', 'Student ID', 'Contact', 'Branch', 'College']
-        ws.append(headers)
-        for i, reg in enumerate(regs, 1):
-            ws.append([i, reg.name or '', reg.email or '', reg.student_id or '', reg.contact_no or '', reg.branch or '', reg.college_name or ''])
+    writer = exports.XlsxWriter()
+    return export_response(exports.export([event], writer, include_empty=True), writer, event_filename(event))
+
+@app.route('/export_all_csv')
+def export_all_csv():
+    if not session.get('is_admin'):
+        return redirect(url_for('admin_login'))
     
-    # Style headers
-    for cell in ws[1]:
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal='center')
+    writer = exports.CsvWriter(with_titles=True)
+    return export_response(exports.export(Event.query.all(), writer), writer, 'all_registrations')
+
+@app.route('/export_event_csv/<int:event_id>')
+def export_event_csv(event_id):
+    if not session.get('is_admin'):
+        return redirect(url_for('admin_login'))
     
-    # Auto-adjust column widths
-    for column_cells in ws.columns:
-        max_length = max(len(str(cell.value or "")) for cell in column_cells)
-        ws.column_dimensions[column_cells[0].column_letter].width = min(max_length + 2, 50)
+    event = Event.query.get_or_404(event_id)
+    writer = exports.CsvWriter()
+    return export_response(exports.export([event], writer, include_empty=True), writer, event_filename(event))
+
+# --- BACKGROUND EXPORT JOBS ---
+@app.route('/export_jobs', methods=['POST'])
+def submit_export_job():
+    if not session.get('is_admin'):
+        return jsonify(error="Admin login required."), 403
     
-    buffer = BytesIO()
-    wb.save(buffer)
-    buffer.seek(0)
+    fmt = request.form.get('format', 'pdf')
+    event_id = request.form.get('event_id', type=int)
+    try:
+        job = export_jobs.submit(fmt, event_id)
+    except ValueError as e:
+        return jsonify(error=str(e)), 400
+    except LookupError as e:
+        return jsonify(error=str(e)), 404
+    return jsonify(job_status_payload(job)), 202
+
+@app.route('/export_jobs/<job_id>')
+def export_job_status(job_id):
+    if not session.get('is_admin'):
+        return jsonify(error="Admin login required."), 403
     
-    response = make_response(buffer.getvalue())
-    response.headers['Content-Type'] = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-    response.headers['Content-Disposition'] = f'attachment; filename={event.title.replace(" ", "_")}_registrations.xlsx'
-    return response
+    job = export_jobs.resume(job_id)
+    if job is None:
+        return jsonify(error="Unknown export job."), 404
+    return jsonify(job_status_payload(job))
 
-def seed_database():
+@app.route('/export_jobs/<job_id>/download')
+def download_export_job(job_id):
+    if not session.get('is_admin'):
+        return redirect(url_for('admin_login'))
+    
+    job = export_jobs.status(job_id)
+    if job is None or job['status'] != 'done':
+        flash("That export is not ready yet.", "error")
+        return redirect(url_for('admin'))
+    return send_file(export_jobs.artifact_path(job_id), as_attachment=True,
+                     download_name=export_jobs.download_name(job_id))
+
+def job_status_payload(job):
+    payload = dict(job, status_url=url_for('export_job_status', job_id=job['id']))
+    if job['status'] == 'done':
+        payload['download_url'] = url_for('download_export_job', job_id=job['id'])
+    return payload
+
+def migrate_database():
+    """Create missing tables and apply pending migrations (``maintenance.py migrate``)."""
+    create_app()
     with app.app_context():
         db.create_all()
         
-        # Check and migrate brochure_link if missing
-        try:
-            with db.engine.connect() as connection:
-                connection.execute(text("SELECT brochure_link FROM event LIMIT 1"))
-        except Exception:
-            print("Migrating: Adding brochure_link column to event table...")
-            try:
-                with db.engine.connect() as connection:
-                    connection.execute(text("ALTER TABLE event ADD COLUMN brochure_link VARCHAR(500)"))
-                    connection.commit()
-            except Exception as e:
-                print(f"Migration error: {e}")
+        return migrations.upgrade(db.engine)
 
+def seed_database():
+    """Migrate, then add a demo event to an empty database (``maintenance.py seed``)."""
+    migrate_database()
+    with app.app_context():
         if Event.query.count() == 0:
+            summit = datetime.date.today() + datetime.timedelta(days=30)
             e1 = Event(
                 title="Social Entrepreneurship Summit",
-                date_day="12", date_month="NOV",
+                start_date=summit,  # the validator derives the date_day/date_month badge
+                end_date=summit,
                 short_desc="Leading the future of social impact.",
                 full_desc="Join industry giants for a masterclass.",
                 image_url="https://images.unsplash.com/photo-1544531586-fde5298cdd40?w=800",
@@ -659,5 +831,8 @@ def seed_database():
             db.session.commit()
 
 if __name__ == '__main__':
-    seed_database()
-    app.run(host='0.0.0.0',port=5003, threaded=True)
+    # Development server only. Production serves wsgi.py under gunicorn, and
+    # the schema is set up once with `python maintenance.py seed`.
+    create_app()
+    scheduler.start()
+    app.run(host='0.0.0.0', port=5003, threaded=True)
@@ -0,0 +1,65 @@
+"""Serve the hashed, precompressed assets produced by build_assets.py.
+
+``init_app`` loads ``static/dist/manifest.json`` when it exists and then:
+
+- rewrites ``url_for('static', filename=...)`` to the hashed file, so
+  templates keep using logical names
+- replaces the static view so hashed files go out with a one-year
+  ``immutable`` Cache-Control, picking the ``.br`` or ``.gz`` sibling the
+  client accepts
+
+Without a manifest (e.g. in development) nothing changes and Flask's normal
+static handling applies.
+"""
+import json
+import mimetypes
+import os
+
+from flask import request, send_from_directory
+
+from build_assets import DIST_NAME, MANIFEST_NAME
+
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+
+
+def load_manifest(static_folder):
+    path = os.path.join(static_folder, DIST_NAME, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def init_app(app):
+    manifest = load_manifest(app.static_folder)
+    app.extensions['asset_manifest'] = manifest
+    if not manifest:
+        return
+
+    @app.url_defaults
+    def hashed_static_url(endpoint, values):
+        if endpoint == 'static' and values.get('filename') in manifest:
+            values['filename'] = manifest[values['filename']]
+
+    default_static = app.view_functions['static']
+    dist_prefix = DIST_NAME + '/'
+
+    def static(filename):
+        if not filename.startswith(dist_prefix):
+            return default_static(filename=filename)
+
+        accepted = request.accept_encodings
+        for encoding, suffix in ENCODINGS:
+            if accepted[encoding] and os.path.exists(os.path.join(app.static_folder, filename + suffix)):
+                response = send_from_directory(app.static_folder, filename + suffix, max_age=IMMUTABLE_MAX_AGE,
+                                               mimetype=mimetypes.guess_type(filename)[0])
+                response.headers['Content-Encoding'] = encoding
+                break
+        else:
+            response = send_from_directory(app.static_folder, filename, max_age=IMMUTABLE_MAX_AGE)
+        response.headers['Cache-Control'] = f'public, max-age={IMMUTABLE_MAX_AGE}, immutable'
+        response.vary.add('Accept-Encoding')
+        return response
+
+    app.view_functions['static'] = static
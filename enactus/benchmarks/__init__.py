@@ -0,0 +1,6 @@
+"""Load, concurrency and latency benchmarks for the Enactus app.
+
+Run modules from the ``enactus`` directory, e.g.::
+
+    python -m benchmarks.registration_burst
+"""
@@ -0,0 +1,83 @@
+"""Per-format benchmark of the shared export engine.
+
+Seeds a scratch database with ``--events`` x ``--registrations`` rows and
+times the all-events export for each writer, counting SQL statements issued.
+RSS is the process high-water mark, so run formats separately to isolate them.
+
+    python -m benchmarks.export_formats --events 20 --registrations 2000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import resource
+
+from sqlalchemy import event as sa_event, insert, text
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--events', type=int, default=20)
+    parser.add_argument('--registrations', type=int, default=2000, help='registrations per event')
+    parser.add_argument('--formats', default='csv,xlsx,pdf,pdf-parallel')
+    parser.add_argument('--pdf-processes', type=int, default=os.cpu_count() or 2)
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix='enactus_bench_')
+    os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tmpdir, 'bench.db')
+    import app as enactus
+    enactus.create_app()
+    import exports
+
+    writers = {
+        'csv': lambda: exports.CsvWriter(with_titles=True),
+        'xlsx': exports.XlsxWriter,
+        'pdf': lambda: exports.PdfWriter(processes=0),
+        'pdf-parallel': lambda: exports.PdfWriter(processes=args.pdf_processes),
+    }
+
+    with enactus.app.app_context():
+        db = enactus.db
+        db.create_all()
+        db.session.execute(insert(enactus.Event), [
+            dict(title=f'Event {i}', date_day='01', date_month='JAN', short_desc='-', full_desc='-',
+                 image_url='-', event_type='team' if i % 4 == 0 else 'solo')
+            for i in range(args.events)
+        ])
+        db.session.execute(insert(enactus.Registration), [
+            dict(event_id=e + 1, name=f'Student {e}-{i}', email=f's{e}-{i}@example.com', student_id=str(i),
+                 college_name='ADGIPS', team_name=f'Team {i}', team_size=4, leader_name=f'Leader {i}')
+            for e in range(args.events) for i in range(args.registrations)
+        ])
+        db.session.execute(text(
+            "UPDATE event SET registration_count = "
+            "(SELECT COUNT(*) FROM registration WHERE registration.event_id = event.id)"))
+        db.session.commit()
+
+        statements = [0]
+        sa_event.listen(db.engine, 'before_cursor_execute',
+                        lambda *a: statements.__setitem__(0, statements[0] + 1))
+
+        total = args.events * args.registrations
+        print(f"{args.events} events x {args.registrations} registrations ({total} rows)")
+        print(f"{'format':<14}{'seconds':>10}{'rows/s':>12}{'bytes':>12}{'RSS MB':>10}{'queries':>9}")
+        for name in args.formats.split(','):
+            events = enactus.Event.query.all()
+            statements[0] = 0
+            start = time.perf_counter()
+            output = exports.export(events, writers[name]())
+            if name == 'csv':
+                size = sum(len(chunk.encode()) for chunk in output)
+            else:
+                size = len(output.read())
+                output.close()
+            elapsed = time.perf_counter() - start
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            print(f"{name:<14}{elapsed:>10.2f}{total / elapsed:>12.0f}{size:>12}{peak:>10.1f}{statements[0]:>9}")
+            db.session.remove()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
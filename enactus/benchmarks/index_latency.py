@@ -0,0 +1,93 @@
+"""Registration lookup/count latency before and after the index migration.
+
+Seeds a scratch SQLite database with the indexes removed, times the
+``filter_by(event_id=...)`` lookups used by the export and delete routes,
+then runs ``migrations.upgrade()`` and times them again.
+
+    python -m benchmarks.index_latency --registrations 100000 --events 50
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from sqlalchemy import text
+
+
+def _time(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return samples[len(samples) // 2] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--registrations', type=int, default=100000)
+    parser.add_argument('--events', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix='enactus_bench_')
+    os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tmpdir, 'bench.db')
+    import app as enactus
+    enactus.create_app({'SLOW_QUERY_MS': 60000})
+    import migrations
+
+    with enactus.app.app_context():
+        db = enactus.db
+        db.create_all()
+        with db.engine.begin() as conn:
+            # Every index create_all() built on these tables (the lookup, unique-key and
+            # date indexes alike); the migrations put them all back
+            names = conn.execute(text(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL "
+                "AND tbl_name IN ('event', 'registration')")).scalars().all()
+            for name in names:
+                conn.execute(text(f"DROP INDEX {name}"))
+            conn.execute(
+                text("INSERT INTO event (title, date_day, date_month, short_desc, full_desc, image_url, is_open, "
+                     "registration_count) VALUES (:t, '01', 'JAN', '-', '-', '-', 1, 0)"),
+                [{'t': f'Event {i}'} for i in range(args.events)],
+            )
+            conn.execute(
+                text("INSERT INTO registration (event_id, registration_type, name, email) "
+                     "VALUES (:e, 'solo', :n, :m)"),
+                [{'e': i % args.events + 1, 'n': f'Student {i}', 'm': f'student{i}@example.com'}
+                 for i in range(args.registrations)],
+            )
+
+        target = args.events // 2 or 1
+        email = f'student{args.registrations - args.events + target - 1}@example.com'
+        Registration = enactus.Registration
+        queries = {
+            'lookup event_id': lambda: Registration.query.filter_by(event_id=target).all(),
+            'count event_id': lambda: Registration.query.filter_by(event_id=target).count(),
+            'lookup (event_id, email)': lambda: Registration.query.filter_by(event_id=target, email=email).first(),
+            'open events': lambda: enactus.Event.query.filter_by(is_open=True).count(),
+        }
+
+        def run_all():
+            results = {}
+            for label, fn in queries.items():
+                results[label] = _time(fn, args.repeat)
+                db.session.remove()
+            return results
+
+        before = run_all()
+        migrations.upgrade(db.engine)
+        after = run_all()
+
+    print(f"{args.registrations} registrations across {args.events} events (median of {args.repeat}, ms)")
+    print(f"{'query':<28}{'before':>10}{'after':>10}")
+    for label in queries:
+        print(f"{label:<28}{before[label]:>10.2f}{after[label]:>10.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
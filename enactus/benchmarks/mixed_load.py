@@ -0,0 +1,109 @@
+"""Mixed read/write load test: /events readers alongside /register_event writers.
+
+Serves the app from a local threaded WSGI server on a scratch SQLite database
+and hammers it for a fixed duration, once per database profile (each in its
+own process, since the profile is read at import time).
+
+    python -m benchmarks.mixed_load --duration 10 --readers 16 --writers 8
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+
+def run_profile(args):
+    tmpdir = tempfile.mkdtemp(prefix='enactus_bench_')
+    os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tmpdir, 'bench.db')
+    from werkzeug.serving import WSGIRequestHandler, make_server
+    import app as enactus
+    # Every simulated client shares 127.0.0.1; per-client limits would cap the load itself
+    enactus.create_app({'RATELIMIT_ENABLED': '0'})
+
+    class QuietHandler(WSGIRequestHandler):
+        def log_request(self, *args, **kwargs):
+            pass
+
+    enactus.seed_database()
+    with enactus.app.app_context():
+        event_id = enactus.Event.query.first().id
+
+    server = make_server('127.0.0.1', 0, enactus.app, threaded=True, request_handler=QuietHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{server.server_port}'
+
+    counts = {'read': 0, 'write': 0, 'error': 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.duration
+
+    class NoRedirect(urllib.request.HTTPRedirectHandler):
+        def redirect_request(self, *a, **kw):
+            return None
+
+    def worker(kind, n):
+        opener = urllib.request.build_opener(NoRedirect)
+        i = 0
+        while time.perf_counter() < deadline:
+            i += 1
+            try:
+                if kind == 'read':
+                    opener.open(base + '/events').read()
+                else:
+                    body = urllib.parse.urlencode({
+                        'event_id': event_id, 'name': f'W{n}-{i}', 'email': f'w{n}-{i}@example.com',
+                    }).encode()
+                    opener.open(base + '/register_event', data=body).read()
+                key = kind
+            except urllib.error.HTTPError as e:
+                key = kind if e.code == 302 else 'error'
+            except OSError:
+                key = 'error'
+            with lock:
+                counts[key] += 1
+
+    threads = [threading.Thread(target=worker, args=('read', n)) for n in range(args.readers)]
+    threads += [threading.Thread(target=worker, args=('write', n)) for n in range(args.writers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    server.shutdown()
+
+    with enactus.app.app_context():
+        stored = enactus.Registration.query.count()
+    profile = os.environ.get('DB_PROFILE', 'tuned')
+    print(f"{profile:<8}{counts['read'] / args.duration:>12.1f}{counts['write'] / args.duration:>12.1f}"
+          f"{stored:>12}{counts['error']:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--readers', type=int, default=16)
+    parser.add_argument('--writers', type=int, default=8)
+    parser.add_argument('--profile', choices=['plain', 'tuned'], help='run a single profile in-process')
+    args = parser.parse_args()
+
+    if args.profile:
+        os.environ['DB_PROFILE'] = args.profile
+        run_profile(args)
+        return 0
+
+    print(f"{'profile':<8}{'reads/s':>12}{'writes/s':>12}{'stored':>12}{'errors':>8}")
+    for profile in ('plain', 'tuned'):
+        subprocess.run(
+            [sys.executable, '-m', 'benchmarks.mixed_load', '--profile', profile,
+             '--duration', str(args.duration), '--readers', str(args.readers), '--writers', str(args.writers)],
+            check=True,
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""Concurrency stress test for register_event capacity enforcement.
+
+Fires a burst of parallel sign-ups at a capped event on a scratch SQLite
+database and checks that exactly ``max_registrations`` are admitted.
+
+    python -m benchmarks.registration_burst --requests 300 --capacity 50
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=300, help='number of parallel sign-ups')
+    parser.add_argument('--capacity', type=int, default=50, help='max_registrations of the target event')
+    parser.add_argument('--workers', type=int, default=64, help='concurrent client threads')
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix='enactus_bench_')
+    os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tmpdir, 'bench.db')
+    import app as enactus
+    # Every simulated client shares 127.0.0.1; per-client limits would cap the load itself
+    enactus.create_app({'RATELIMIT_ENABLED': '0'})
+
+    with enactus.app.app_context():
+        enactus.db.create_all()
+        event = enactus.Event(
+            title='Burst Test', date_day='01', date_month='JAN',
+            short_desc='-', full_desc='-', image_url='-',
+            is_open=True, max_registrations=args.capacity,
+        )
+        enactus.db.session.add(event)
+        enactus.db.session.commit()
+        event_id = event.id
+
+    local = threading.local()
+
+    def sign_up(i):
+        client = getattr(local, 'client', None)
+        if client is None:
+            client = local.client = enactus.app.test_client()
+        client.post('/register_event', data={
+            'event_id': event_id, 'name': f'Student {i}', 'email': f'student{i}@example.com',
+        })
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        list(pool.map(sign_up, range(args.requests)))
+    elapsed = time.perf_counter() - start
+
+    with enactus.app.app_context():
+        rows = enactus.Registration.query.filter_by(event_id=event_id).count()
+        counter = enactus.db.session.get(enactus.Event, event_id).registration_count
+
+    print(f"{args.requests} sign-ups in {elapsed:.2f}s ({args.requests / elapsed:.0f} req/s)")
+    print(f"capacity={args.capacity} registrations={rows} counter={counter}")
+
+    expected = min(args.capacity, args.requests)
+    if rows != expected or counter != rows:
+        print("FAIL: capacity was not enforced exactly")
+        return 1
+    print("OK: no overflow")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
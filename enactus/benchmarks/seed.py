@@ -0,0 +1,89 @@
+"""Deterministic benchmark data: ``--events`` x ``--registrations`` rows.
+
+Creates the schema (including migrations) in the database named by
+``--db``/``DATABASE_URL`` and bulk-inserts open events with registrations,
+plus ``--capped`` empty events with ``max_registrations = --capacity`` for
+registration-burst scenarios. The same arguments always produce the same rows.
+
+    python -m benchmarks.seed --db /tmp/bench.db --events 50 --registrations 20000
+"""
+import argparse
+import os
+import sys
+
+from sqlalchemy import insert, text
+
+BATCH_SIZE = 10000
+CAPPED_PREFIX = 'Bench capped'
+
+
+def seed(enactus, events, registrations, capped=1, capacity=100):
+    """Populate the app's database; call inside ``enactus.app.app_context()``."""
+    import migrations
+
+    db = enactus.db
+    db.create_all()
+    migrations.upgrade(db.engine)
+
+    rows = [
+        dict(title=f'Bench event {i}', date_day=f'{i % 28 + 1:02d}', date_month='JAN',
+             short_desc='Benchmark event', full_desc='Benchmark event ' * 20,
+             image_url='https://example.com/event.jpg', is_open=True,
+             event_type='team' if i % 4 == 0 else 'solo', venue='Main hall')
+        for i in range(events)
+    ]
+    rows += [
+        dict(title=f'{CAPPED_PREFIX} {i}', date_day='01', date_month='FEB', short_desc='Capped',
+             full_desc='Capped benchmark event', image_url='https://example.com/event.jpg',
+             is_open=True, event_type='solo', max_registrations=capacity)
+        for i in range(capped)
+    ]
+    db.session.execute(insert(enactus.Event), rows)
+    event_ids = [row.id for row in db.session.query(enactus.Event.id)
+                 .filter(enactus.Event.title.like('Bench event %')).order_by(enactus.Event.id)]
+
+    batch = []
+    for event_id in event_ids:
+        for i in range(registrations):
+            batch.append(dict(
+                event_id=event_id, registration_type='solo', name=f'Student {event_id}-{i}',
+                email=f's{event_id}-{i}@example.com', student_id=f'{event_id:03d}{i:06d}',
+                contact_no='9999999999', branch='CSE', college_name='ADGIPS',
+                team_name=f'Team {i // 4}', team_size=4, leader_name=f'Leader {i // 4}'))
+            if len(batch) >= BATCH_SIZE:
+                db.session.execute(insert(enactus.Registration), batch)
+                batch = []
+    if batch:
+        db.session.execute(insert(enactus.Registration), batch)
+
+    db.session.execute(text(
+        "UPDATE event SET registration_count = "
+        "(SELECT COUNT(*) FROM registration WHERE registration.event_id = event.id)"))
+    db.session.commit()
+    return len(event_ids) * registrations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--db', required=True, help='SQLite file to create')
+    parser.add_argument('--events', type=int, default=50)
+    parser.add_argument('--registrations', type=int, default=20000, help='registrations per event')
+    parser.add_argument('--capped', type=int, default=1, help='empty events with a registration cap')
+    parser.add_argument('--capacity', type=int, default=100)
+    args = parser.parse_args()
+
+    if os.path.exists(args.db):
+        print(f"{args.db} already exists; refusing to seed on top of it")
+        return 1
+    os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.abspath(args.db)
+    import app as enactus
+    enactus.create_app()
+
+    with enactus.app.app_context():
+        total = seed(enactus, args.events, args.registrations, args.capped, args.capacity)
+    print(f"Seeded {args.events} events, {total} registrations and {args.capped} capped events into {args.db}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""Worker cold start: import time, create_app() and first-request latency.
+
+Every sample is a fresh Python process, as a new gunicorn worker would be,
+against a scratch SQLite database seeded once up front. Three modes:
+
+``cold``     empty Jinja bytecode cache: templates compile on first render
+``warm``     bytecode cache filled by an earlier process
+``prewarm``  warm cache plus ``TEMPLATE_PREWARM=1``: templates load during
+             create_app(), before the first request
+
+Each process times ``import app``, ``create_app()`` and the first GET of
+/events and /admin, and checks that no export library was imported.
+
+    python -m benchmarks.startup --runs 5
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+EXPORT_MODULES = ('reportlab', 'openpyxl', 'pypdf')
+COLUMNS = ('import', 'create_app', 'first /events', 'first /admin')
+
+
+def measure():
+    """Time one cold start in this process; prints a JSON line of milliseconds."""
+    start = time.perf_counter()
+    import app as enactus
+    imported = time.perf_counter()
+    enactus.create_app({'RATELIMIT_ENABLED': '0', 'SCHEDULER_ENABLED': '0'})
+    created = time.perf_counter()
+
+    client = enactus.app.test_client()
+    client.get('/events').close()
+    events = time.perf_counter()
+    with client.session_transaction() as session:
+        session['is_admin'] = True
+    admin_start = time.perf_counter()
+    client.get('/admin').close()
+    admin = time.perf_counter()
+
+    print(json.dumps({
+        'import': (imported - start) * 1000,
+        'create_app': (created - imported) * 1000,
+        'first /events': (events - created) * 1000,
+        'first /admin': (admin - admin_start) * 1000,
+        'export modules': [name for name in EXPORT_MODULES if name in sys.modules],
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help='processes per mode (median is reported)')
+    parser.add_argument('--measure', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure()
+        return 0
+
+    tmpdir = tempfile.mkdtemp(prefix='enactus_bench_')
+    cache_dir = os.path.join(tmpdir, 'jinja_cache')
+    env = dict(os.environ, DATABASE_URL='sqlite:///' + os.path.join(tmpdir, 'bench.db'),
+               JINJA_CACHE_DIR=cache_dir, TEMPLATE_PREWARM='0')
+    subprocess.run([sys.executable, '-c', 'import app; app.create_app(); app.seed_database()'],
+                   env=env, check=True, stdout=subprocess.DEVNULL)
+
+    def sample(mode):
+        if mode == 'cold':
+            shutil.rmtree(cache_dir, ignore_errors=True)
+        output = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.startup', '--measure'],
+            env=dict(env, TEMPLATE_PREWARM='1' if mode == 'prewarm' else '0'),
+            check=True, capture_output=True, text=True,
+        ).stdout
+        return json.loads(output.strip().splitlines()[-1])
+
+    print("Milliseconds per fresh process (median of %d)" % args.runs)
+    print(f"{'mode':<9}" + ''.join(f"{column:>15}" for column in COLUMNS) + f"{'total':>10}  export libs")
+    for mode in ('cold', 'warm', 'prewarm'):
+        if mode == 'warm':
+            sample('prewarm')  # fill the cache once; samples below never start empty
+        samples = [sample(mode) for _ in range(args.runs)]
+        medians = [statistics.median(s[column] for s in samples) for column in COLUMNS]
+        loaded = sorted({name for s in samples for name in s['export modules']}) or ['none']
+        print(f"{mode:<9}" + ''.join(f"{value:>15.1f}" for value in medians)
+              + f"{sum(medians):>10.1f}  {', '.join(loaded)}")
+    shutil.rmtree(tmpdir, ignore_errors=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,315 @@
+"""Reproducible load test of the public, admin and export routes.
+
+Seeds a scratch SQLite database (see ``benchmarks.seed``), then drives each
+scenario with ``--concurrency`` workers, either through Flask's test client
+(``--driver client``, no sockets) or a local threaded WSGI server
+(``--driver wsgi``, real HTTP). Every scenario reports p50/p95/p99 latency,
+requests per second, status codes and peak RSS, and the whole run is written
+as JSON so runs can be compared::
+
+    python -m benchmarks.suite --events 50 --registrations 20000 --output before.json
+    python -m benchmarks.suite --events 50 --registrations 20000 --baseline before.json
+
+RSS is the process high-water mark. With ``--isolate`` each scenario runs in
+its own process on a fresh copy of the seeded database, so its RSS and its
+writes don't leak into the next scenario.
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import CookieJar
+
+from benchmarks.seed import CAPPED_PREFIX
+
+ADMIN_PASSWORD = 'enactus_adgips'
+
+# name -> (method, path, needs admin, default request count key)
+SCENARIOS = {
+    'events': ('GET', '/events', False, 'requests'),
+    'api_events': ('GET', '/api/events', False, 'requests'),
+    'register_burst': ('POST', '/register_event', False, 'requests'),
+    'admin': ('GET', '/admin', True, 'requests'),
+    'export_all_pdf': ('GET', '/export_all_pdf', True, 'export_requests'),
+    'export_all_excel': ('GET', '/export_all_excel', True, 'export_requests'),
+    'export_all_csv': ('GET', '/export_all_csv', True, 'export_requests'),
+    'export_event_pdf': ('GET', '/export_event_pdf/{event_id}', True, 'export_requests'),
+    'export_event_excel': ('GET', '/export_event_excel/{event_id}', True, 'export_requests'),
+    'export_event_csv': ('GET', '/export_event_csv/{event_id}', True, 'export_requests'),
+}
+
+
+# --- drivers ---
+
+class ClientSession:
+    """One logical user on Flask's test client."""
+
+    def __init__(self, app):
+        self.client = app.test_client()
+
+    def request(self, method, path, data=None):
+        response = self.client.open(path, method=method, data=data)
+        size = len(response.get_data())
+        response.close()
+        return response.status_code, size
+
+
+class HttpSession:
+    """One logical user over real HTTP, with its own cookie jar and no redirect following."""
+
+    class _NoRedirect(urllib.request.HTTPRedirectHandler):
+        def redirect_request(self, *args, **kwargs):
+            return None
+
+    def __init__(self, base):
+        self.base = base
+        self.opener = urllib.request.build_opener(
+            self._NoRedirect, urllib.request.HTTPCookieProcessor(CookieJar()))
+
+    def request(self, method, path, data=None):
+        body = urllib.parse.urlencode(data).encode() if data is not None else None
+        try:
+            with self.opener.open(urllib.request.Request(self.base + path, data=body, method=method)) as response:
+                return response.status, len(response.read())
+        except urllib.error.HTTPError as e:
+            return e.code, len(e.read())
+
+
+def start_driver(enactus, kind):
+    """Return (session factory, stop function)."""
+    if kind == 'client':
+        return (lambda: ClientSession(enactus.app)), (lambda: None)
+
+    from werkzeug.serving import WSGIRequestHandler, make_server
+
+    class QuietHandler(WSGIRequestHandler):
+        def log_request(self, *args, **kwargs):
+            pass
+
+    server = make_server('127.0.0.1', 0, enactus.app, threaded=True, request_handler=QuietHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{server.server_port}'
+    return (lambda: HttpSession(base)), server.shutdown
+
+
+# --- measurement ---
+
+def percentile(sorted_samples, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_samples:
+        return None
+    rank = max(int(round(pct / 100 * len(sorted_samples))) - 1, 0)
+    return sorted_samples[min(rank, len(sorted_samples) - 1)]
+
+
+def run_scenario(enactus, name, new_session, args):
+    method, path, admin, count_key = SCENARIOS[name]
+    total = getattr(args, count_key)
+
+    with enactus.app.app_context():
+        Event = enactus.Event
+        event_id = Event.query.filter(Event.title.like('Bench event %')).order_by(Event.id).first().id
+        capped = Event.query.filter(Event.title.like(f'{CAPPED_PREFIX} %')).order_by(Event.id).first()
+        capped_id = capped.id if capped else event_id
+    path = path.format(event_id=event_id)
+
+    # One session per worker, logged in up front so login isn't timed
+    sessions = [new_session() for _ in range(args.concurrency)]
+    if admin:
+        for session in sessions:
+            session.request('POST', '/admin_login', {'password': ADMIN_PASSWORD})
+    local = threading.local()
+    counter = iter(range(total))
+    counter_lock = threading.Lock()
+    pool = iter(sessions)
+
+    def one(_):
+        if not hasattr(local, 'session'):
+            with counter_lock:
+                local.session = next(pool)
+        with counter_lock:
+            i = next(counter)
+        data = None
+        if name == 'register_burst':
+            data = {'event_id': capped_id, 'event_type': 'solo', 'name': f'Burst {i}',
+                    'email': f'burst{i}-{time.time_ns()}@example.com', 'student_id': f'B{i}'}
+        start = time.perf_counter()
+        status, size = local.session.request(method, path, data)
+        return time.perf_counter() - start, status, size
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(one, range(total)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(r[0] * 1000 for r in results)
+    statuses = {}
+    for _, status, _ in results:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+    # Redirects are the normal answer for form posts
+    errors = sum(count for status, count in statuses.items() if int(status) >= 400)
+    report = {
+        'path': path,
+        'requests': total,
+        'concurrency': args.concurrency,
+        'seconds': round(elapsed, 3),
+        'rps': round(total / elapsed, 1) if elapsed else None,
+        'p50_ms': round(percentile(latencies, 50), 2),
+        'p95_ms': round(percentile(latencies, 95), 2),
+        'p99_ms': round(percentile(latencies, 99), 2),
+        'max_ms': round(latencies[-1], 2),
+        'bytes': sum(r[2] for r in results),
+        'statuses': statuses,
+        'errors': errors,
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+    if name == 'register_burst':
+        with enactus.app.app_context():
+            capped = enactus.db.session.get(enactus.Event, capped_id)
+            report['registered'] = capped.registration_count
+            report['capacity'] = capped.max_registrations
+    return report
+
+
+# --- orchestration ---
+
+def run_in_process(db_path, names, args):
+    os.environ['DATABASE_URL'] = 'sqlite:///' + db_path
+    import app as enactus
+    # Every simulated client shares 127.0.0.1; per-client limits would cap the load itself
+    enactus.create_app({'RATELIMIT_ENABLED': '0'})
+
+    new_session, stop = start_driver(enactus, args.driver)
+    try:
+        return {name: run_scenario(enactus, name, new_session, args) for name in names}
+    finally:
+        stop()
+
+
+def run_isolated(seeded_path, names, args):
+    results = {}
+    for name in names:
+        workdir = tempfile.mkdtemp(prefix='enactus_bench_')
+        db_path = os.path.join(workdir, 'bench.db')
+        shutil.copy(seeded_path, db_path)
+        out_path = os.path.join(workdir, 'result.json')
+        subprocess.run(
+            [sys.executable, '-m', 'benchmarks.suite', '--child-db', db_path, '--scenarios', name,
+             '--driver', args.driver, '--concurrency', str(args.concurrency),
+             '--requests', str(args.requests), '--export-requests', str(args.export_requests),
+             '--output', out_path],
+            check=True,
+        )
+        with open(out_path) as f:
+            results.update(json.load(f)['scenarios'])
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(results, baseline=None):
+    print(f"{'scenario':<20}{'req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}{'RSS MB':>9}"
+          + (f"{'Δp95':>9}{'Δreq/s':>9}" if baseline else ''))
+    for name, r in results.items():
+        line = (f"{name:<20}{r['rps']:>9}{r['p50_ms']:>10}{r['p95_ms']:>10}{r['p99_ms']:>10}"
+                f"{r['errors']:>8}{r['peak_rss_mb']:>9}")
+        previous = (baseline or {}).get(name)
+        if previous:
+            line += f"{_change(previous['p95_ms'], r['p95_ms']):>9}{_change(previous['rps'], r['rps']):>9}"
+        print(line)
+        if 'registered' in r:
+            print(f"{'':<20}registered {r['registered']} of capacity {r['capacity']}")
+
+
+def _change(old, new):
+    if not old or new is None:
+        return '-'
+    return f"{(new - old) / old * 100:+.0f}%"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--events', type=int, default=20)
+    parser.add_argument('--registrations', type=int, default=1000, help='registrations per event')
+    parser.add_argument('--capacity', type=int, default=100, help='seats on the register_burst event')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS))
+    parser.add_argument('--driver', choices=['client', 'wsgi'], default='wsgi')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=200, help='requests per page/form scenario')
+    parser.add_argument('--export-requests', type=int, default=4, help='requests per export scenario')
+    parser.add_argument('--isolate', action='store_true', help='run each scenario in a fresh process')
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--baseline', help='earlier results file to compare against')
+    parser.add_argument('--child-db', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    names = [name for name in args.scenarios.split(',') if name]
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        print(f"Unknown scenario(s): {', '.join(sorted(unknown))}")
+        return 1
+
+    if args.child_db:
+        results = run_in_process(args.child_db, names, args)
+    else:
+        workdir = tempfile.mkdtemp(prefix='enactus_bench_')
+        seeded_path = os.path.join(workdir, 'seed.db')
+        # Seed in a child so this process's RSS and engine don't carry the seeding cost
+        subprocess.run(
+            [sys.executable, '-m', 'benchmarks.seed', '--db', seeded_path, '--events', str(args.events),
+             '--registrations', str(args.registrations), '--capacity', str(args.capacity)],
+            check=True,
+        )
+        if args.isolate:
+            results = run_isolated(seeded_path, names, args)
+        else:
+            results = run_in_process(seeded_path, names, args)
+
+    payload = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'driver': args.driver,
+            'events': args.events,
+            'registrations_per_event': args.registrations,
+            'concurrency': args.concurrency,
+            'isolated': args.isolate,
+        },
+        'scenarios': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(payload, f, indent=2)
+
+    if not args.child_db:
+        baseline = None
+        if args.baseline:
+            with open(args.baseline) as f:
+                baseline = json.load(f)['scenarios']
+        print_report(results, baseline)
+        print(f"Wrote {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""Read latency under a register_event flood, with and without admission control.
+
+Serves the app from a local threaded WSGI server on a scratch SQLite database.
+Readers fetch /events for a quiet phase, then keep going while flooders POST
+to /register_event as fast as they can from ``--flood-clients`` addresses
+(sent as X-Forwarded-For, with TRUSTED_PROXIES=1). Each mode runs in its own
+process: ``off`` with rate limits and the write cap disabled, ``on`` with the
+defaults.
+
+    python -m benchmarks.write_flood --duration 10 --readers 4 --flooders 32
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from benchmarks.suite import percentile
+
+
+def run_mode(args):
+    tmpdir = tempfile.mkdtemp(prefix='enactus_bench_')
+    os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tmpdir, 'bench.db')
+    from werkzeug.serving import WSGIRequestHandler, make_server
+    import app as enactus
+    enactus.create_app({'RATELIMIT_ENABLED': '1' if args.mode == 'on' else '0', 'TRUSTED_PROXIES': 1,
+                        'SLOW_QUERY_MS': 60000})
+
+    class QuietHandler(WSGIRequestHandler):
+        def log_request(self, *args, **kwargs):
+            pass
+
+    enactus.seed_database()
+    with enactus.app.app_context():
+        event_id = enactus.Event.query.first().id
+
+    server = make_server('127.0.0.1', 0, enactus.app, threaded=True, request_handler=QuietHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{server.server_port}'
+
+    class NoRedirect(urllib.request.HTTPRedirectHandler):
+        def redirect_request(self, *a, **kw):
+            return None
+
+    latencies = {'quiet': [], 'flood': []}
+    writes = {}
+    lock = threading.Lock()
+    flooding = threading.Event()
+    done = threading.Event()
+
+    def reader():
+        opener = urllib.request.build_opener(NoRedirect)
+        while not done.is_set():
+            phase = 'flood' if flooding.is_set() else 'quiet'
+            start = time.perf_counter()
+            try:
+                opener.open(base + '/events').read()
+            except OSError:
+                continue
+            with lock:
+                latencies[phase].append((time.perf_counter() - start) * 1000)
+
+    def flooder(n):
+        opener = urllib.request.build_opener(NoRedirect)
+        client = f'10.0.0.{n % args.flood_clients + 1}'
+        i = 0
+        while not done.is_set():
+            i += 1
+            body = urllib.parse.urlencode({
+                'event_id': event_id, 'name': f'F{n}-{i}', 'email': f'f{n}-{i}@example.com',
+            }).encode()
+            request = urllib.request.Request(base + '/register_event', data=body,
+                                             headers={'X-Forwarded-For': client})
+            try:
+                with opener.open(request) as response:
+                    status = response.status
+            except urllib.error.HTTPError as e:
+                status = e.code
+            except OSError:
+                status = 'error'
+            with lock:
+                writes[status] = writes.get(status, 0) + 1
+
+    readers = [threading.Thread(target=reader) for _ in range(args.readers)]
+    for t in readers:
+        t.start()
+    time.sleep(args.duration / 2)
+    flooding.set()
+    flooders = [threading.Thread(target=flooder, args=(n,)) for n in range(args.flooders)]
+    for t in flooders:
+        t.start()
+    time.sleep(args.duration)
+    done.set()
+    for t in readers + flooders:
+        t.join()
+    server.shutdown()
+
+    quiet, flood = sorted(latencies['quiet']), sorted(latencies['flood'])
+    accepted = writes.get(302, 0)
+    print(f"{args.mode:<6}{percentile(quiet, 50):>10.1f}{percentile(quiet, 95):>10.1f}"
+          f"{percentile(flood, 50):>10.1f}{percentile(flood, 95):>10.1f}{percentile(flood, 99):>10.1f}"
+          f"{len(flood) / args.duration:>10.1f}{accepted / args.duration:>10.1f}"
+          f"{writes.get(429, 0) / args.duration:>10.1f}{writes.get('error', 0):>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--duration', type=float, default=10, help='seconds of flooding (quiet phase is half)')
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--flooders', type=int, default=32)
+    parser.add_argument('--flood-clients', type=int, default=4, help='distinct client IPs among the flooders')
+    parser.add_argument('--mode', choices=['off', 'on'], help='run a single mode in-process')
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args)
+        return 0
+
+    print("Read latency in ms: quiet phase, then under the flood")
+    print(f"{'mode':<6}{'q p50':>10}{'q p95':>10}{'f p50':>10}{'f p95':>10}{'f p99':>10}"
+          f"{'reads/s':>10}{'writes/s':>10}{'429/s':>10}{'errors':>8}")
+    for mode in ('off', 'on'):
+        subprocess.run(
+            [sys.executable, '-m', 'benchmarks.write_flood', '--mode', mode, '--duration', str(args.duration),
+             '--readers', str(args.readers), '--flooders', str(args.flooders),
+             '--flood-clients', str(args.flood_clients)],
+            check=True,
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
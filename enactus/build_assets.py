@@ -0,0 +1,191 @@
+"""Offline static asset build: minify, content-hash and precompress.
+
+Reads everything under ``static/`` (except the output directory) and writes
+``static/dist/``:
+
+- CSS and JS minified (``rcssmin`` / ``rjsmin`` when installed; otherwise a
+  conservative built-in CSS minifier, and JS is copied as-is)
+- every file renamed with a content hash, e.g. ``css/style.3f2a1b9c0d.css``;
+  relative ``url()`` and ``@import`` targets inside CSS are rewritten to the
+  hashed names (dependencies are hashed first, so a changed image or
+  imported stylesheet changes the hash of the CSS that points at it)
+- ``.gz`` (and ``.br`` when the ``brotli`` package is installed) siblings
+  for text assets, so the server never compresses on the fly
+- ``manifest.json`` mapping each original path to its hashed path, read by
+  ``assets.py`` to rewrite ``url_for('static', ...)``
+
+Run from the ``enactus`` directory before deploying:
+
+    python build_assets.py
+"""
+import gzip
+import hashlib
+import json
+import os
+import posixpath
+import re
+import shutil
+import sys
+
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(BASE_DIR, 'static')
+DIST_NAME = 'dist'
+DIST_DIR = os.path.join(STATIC_DIR, DIST_NAME)
+MANIFEST_NAME = 'manifest.json'
+
+COMPRESSIBLE = {'.css', '.js', '.json', '.svg', '.txt', '.html', '.map'}
+HASH_LENGTH = 10
+
+_CSS_TOKENS = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|/\*.*?\*/|\s+', re.S)
+# Space before ':' is kept: '.a :hover' and '.a:hover' are different selectors
+_CSS_PUNCTUATION = re.compile(r'\s*([{};,>])\s*|(:)\s+')
+_CSS_REFERENCE = re.compile(r'''(url\(\s*(['"]?))([^'")\s]+)(\2\s*\))|(@import\s+(['"]))([^'"]+)(\6)''')
+
+
+def minify_css(text):
+    """Strip comments and collapse whitespace, leaving quoted strings intact."""
+    if rcssmin is not None:
+        return rcssmin.cssmin(text)
+
+    def token(match):
+        if match.group(1):
+            return match.group(1)
+        return '' if match.group(0).startswith('/*') else ' '
+
+    parts = []
+    # Split out strings first so punctuation squeezing never touches them
+    for i, chunk in enumerate(re.split(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')', _CSS_TOKENS.sub(token, text))):
+        parts.append(chunk if i % 2 else _CSS_PUNCTUATION.sub(lambda m: m.group(1) or m.group(2), chunk).replace(';}', '}'))
+    return ''.join(parts).strip()
+
+
+def minify_js(text):
+    return rjsmin.jsmin(text) if rjsmin is not None else text
+
+
+def hashed_name(path, content):
+    root, ext = os.path.splitext(path)
+    return f"{root}.{hashlib.sha256(content).hexdigest()[:HASH_LENGTH]}{ext}"
+
+
+def _css_target(reference, css_logical, sources):
+    """Logical path a relative CSS reference points at, or None to leave it alone."""
+    path = reference.split('#', 1)[0].split('?', 1)[0]
+    if not path or path.startswith(('/', '#', 'data:')) or ':' in path.split('/', 1)[0]:
+        return None
+    logical = posixpath.normpath(posixpath.join(posixpath.dirname(css_logical), path))
+    return logical if logical in sources else None
+
+
+def rewrite_css_urls(text, css_logical, sources, resolve):
+    """Point relative url()/@import targets at their hashed files.
+
+    ``resolve(logical)`` returns the hashed dist path of a dependency,
+    building it first if needed; query strings and fragments are kept.
+    """
+    def replace(match):
+        prefix, reference, suffix = (match.group(1, 3, 4) if match.group(1) else match.group(5, 7, 8))
+        logical = _css_target(reference, css_logical, sources)
+        if logical is None:
+            return match.group(0)
+        target = resolve(logical)
+        if target is None:  # import cycle: leave this one as written
+            return match.group(0)
+        relative = posixpath.relpath(target, posixpath.dirname(css_logical))
+        rest = reference[len(reference.split('#', 1)[0].split('?', 1)[0]):]
+        return f"{prefix}{relative}{rest}{suffix}"
+
+    return _CSS_REFERENCE.sub(replace, text)
+
+
+def build(static_dir=STATIC_DIR, dist_dir=DIST_DIR):
+    """Rebuild ``dist_dir`` and return (manifest, per-file size report)."""
+    if os.path.isdir(dist_dir):
+        shutil.rmtree(dist_dir)
+    sources = {}
+    for root, dirs, files in os.walk(static_dir):
+        dirs[:] = sorted(d for d in dirs if os.path.join(root, d) != dist_dir)
+        for name in sorted(files):
+            source = os.path.join(root, name)
+            sources[os.path.relpath(source, static_dir).replace(os.sep, '/')] = source
+
+    targets = {}  # logical -> hashed path inside dist; None while being built
+    report = []
+
+    def emit(logical):
+        if logical in targets:
+            return targets[logical]
+        targets[logical] = None
+        ext = os.path.splitext(logical)[1].lower()
+        with open(sources[logical], 'rb') as f:
+            raw = f.read()
+
+        content = raw
+        if ext == '.css':
+            text = rewrite_css_urls(raw.decode('utf-8'), logical, sources, emit)
+            content = minify_css(text).encode('utf-8')
+        elif ext == '.js':
+            content = minify_js(raw.decode('utf-8')).encode('utf-8')
+
+        target = hashed_name(logical, content)
+        target_path = os.path.join(dist_dir, *target.split('/'))
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        with open(target_path, 'wb') as f:
+            f.write(content)
+
+        gz_size = br_size = None
+        if ext in COMPRESSIBLE:
+            gz = gzip.compress(content, compresslevel=9, mtime=0)
+            with open(target_path + '.gz', 'wb') as f:
+                f.write(gz)
+            gz_size = len(gz)
+            if brotli is not None:
+                br = brotli.compress(content, quality=11)
+                with open(target_path + '.br', 'wb') as f:
+                    f.write(br)
+                br_size = len(br)
+
+        targets[logical] = target
+        report.append((logical, len(raw), len(content), gz_size, br_size))
+        return target
+
+    for logical in sources:
+        emit(logical)
+
+    manifest = {logical: f"{DIST_NAME}/{target}" for logical, target in sorted(targets.items())}
+    with open(os.path.join(dist_dir, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    report.sort()
+    return manifest, report
+
+
+def main():
+    manifest, report = build()
+    print(f"{'asset':<32}{'source':>10}{'minified':>10}{'gzip':>10}{'brotli':>10}")
+    totals = [0, 0, 0]
+    for logical, raw, minified, gz, br in report:
+        best = min(size for size in (minified, gz, br) if size is not None)
+        totals[0] += raw
+        totals[1] += minified
+        totals[2] += best
+        print(f"{logical:<32}{raw:>10}{minified:>10}{gz or '-':>10}{br or '-':>10}")
+    print(f"{'total (smallest variant)':<32}{totals[0]:>10}{totals[1]:>10}{totals[2]:>10}")
+    print(f"Wrote {len(manifest)} assets and {MANIFEST_NAME} to {DIST_DIR}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
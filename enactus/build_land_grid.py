@@ -0,0 +1,107 @@
+"""Offline build of the about page's dotted-map land grid.
+
+Samples ``data/world_map_mask.png`` (dark pixels are land) once per grid cell
+at several resolutions and writes ``static/js/world_land_grid.js``:
+
+    window.WORLD_LAND_GRID = [{"cols": 80, "rows": 40, "runs": [...]}, ...]
+
+Each level is a row-major run-length encoding of the land bits. Runs
+alternate ocean/land and start with ocean, so a grid that begins on land
+starts with a 0. The browser picks the level whose dot spacing is closest to
+the one it wants and never downloads or scans the mask image.
+
+Requires Pillow. Run from the ``enactus`` directory whenever the mask
+changes, before ``build_assets.py``:
+
+    python build_land_grid.py
+"""
+import argparse
+import json
+import os
+import sys
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_MASK = os.path.join(BASE_DIR, 'data', 'world_map_mask.png')
+DEFAULT_OUTPUT = os.path.join(BASE_DIR, 'static', 'js', 'world_land_grid.js')
+
+# Columns per level; rows are half (2:1 equirectangular). At the page's 6px
+# dot spacing these cover wrappers from roughly 480px to 1920px wide.
+LEVELS = (80, 120, 160, 200, 240, 320)
+# Same threshold the client-side sampler used: opaque and dark is land
+LAND_MAX_RED = 100
+LAND_MIN_ALPHA = 100
+
+
+def sample(mask, cols):
+    """Return the row-major land bits of a ``cols`` x ``cols/2`` grid, sampled at cell centers."""
+    rows = cols // 2
+    width, height = mask.size
+    pixels = mask.load()
+    bits = []
+    for row in range(rows):
+        y = int((row + 0.5) / rows * height)
+        for col in range(cols):
+            r, _, _, a = pixels[int((col + 0.5) / cols * width), y]
+            bits.append(a > LAND_MIN_ALPHA and r < LAND_MAX_RED)
+    return bits
+
+
+def run_lengths(bits):
+    runs = []
+    current, count = False, 0
+    for bit in bits:
+        if bit == current:
+            count += 1
+        else:
+            runs.append(count)
+            current, count = bit, 1
+    runs.append(count)
+    return runs
+
+
+def build(mask_path=DEFAULT_MASK, output_path=DEFAULT_OUTPUT, levels=LEVELS):
+    """Write the grid asset and return a list of (cols, rows, land cells, runs) per level."""
+    if Image is None:
+        raise RuntimeError("Pillow is required: pip install Pillow")
+    mask = Image.open(mask_path).convert('RGBA')
+
+    grid, report = [], []
+    for cols in levels:
+        bits = sample(mask, cols)
+        runs = run_lengths(bits)
+        grid.append({'cols': cols, 'rows': cols // 2, 'runs': runs})
+        report.append((cols, cols // 2, sum(bits), len(runs)))
+
+    content = f"window.WORLD_LAND_GRID = {json.dumps(grid, separators=(',', ':'))};\n"
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_path, output_path)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sample the world mask into the dotted-map land grid.")
+    parser.add_argument('--mask', default=DEFAULT_MASK)
+    parser.add_argument('--output', default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+    if not os.path.exists(args.mask):
+        print(f"Mask not found at {args.mask}")
+        return 1
+
+    report = build(args.mask, args.output)
+    print(f"{'grid':<12}{'land cells':>12}{'runs':>8}")
+    for cols, rows, land, runs in report:
+        print(f"{f'{cols}x{rows}':<12}{land:>12}{runs:>8}")
+    print(f"Wrote {os.path.getsize(args.output)} bytes to {args.output} "
+          f"(mask was {os.path.getsize(args.mask)} bytes)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,185 @@
+"""Background export jobs with artifacts cached on disk.
+
+Admins submit an export; a small worker pool renders it through the shared
+export engine into ``EXPORT_DIR`` while the dashboard polls for status. Each
+artifact's file name is its job id: scope (one event or ``all``), format and
+a data version derived from ``Event.data_version``. A repeat request for
+unchanged data therefore finds the finished file and is served instantly, and
+any worker process sharing the directory can answer for it.
+
+Configuration (app.config, falling back to the environment):
+
+``EXPORT_DIR``      where artifacts are written (default ``export_cache``
+                    next to app.py)
+``EXPORT_WORKERS``  size of the render thread pool (default 2)
+"""
+import glob
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import exports
+from models import Event, data_version
+
+WRITERS = {
+    'pdf': lambda single: exports.PdfWriter(single_event=single),
+    'xlsx': lambda single: exports.XlsxWriter(),
+    'csv': lambda single: exports.CsvWriter(with_titles=not single),
+}
+
+JOB_ID_PATTERN = re.compile(r'^(all|event\d+)-[0-9a-f]+-(pdf|xlsx|csv)$')
+
+
+class ExportJobs:
+    """Job registry and worker pool, registered as ``app.extensions['export_jobs']``."""
+
+    def __init__(self, app=None):
+        self._jobs = {}
+        self._lock = threading.RLock()
+        self._executor = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        self.directory = app.config.get('EXPORT_DIR') or os.environ.get(
+            'EXPORT_DIR', os.path.join(app.root_path, 'export_cache'))
+        self.workers = int(app.config.get('EXPORT_WORKERS') or os.environ.get('EXPORT_WORKERS', 2))
+        os.makedirs(self.directory, exist_ok=True)
+        app.extensions['export_jobs'] = self
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='export')
+        return self._executor
+
+    # --- keys and paths ---
+
+    @staticmethod
+    def job_id(fmt, event_id, version):
+        scope = f"event{event_id}" if event_id is not None else 'all'
+        return f"{scope}-{version}-{fmt}"
+
+    @staticmethod
+    def is_valid_id(job_id):
+        return bool(JOB_ID_PATTERN.match(job_id))
+
+    def artifact_path(self, job_id):
+        fmt = job_id.rsplit('-', 1)[-1]
+        return os.path.join(self.directory, f"{job_id}.{fmt}")
+
+    # --- public API ---
+
+    def submit(self, fmt, event_id=None):
+        """Queue an export (or reuse a finished/in-flight one) and return its status."""
+        if fmt not in WRITERS:
+            raise ValueError(f"Unknown export format: {fmt}")
+        version = data_version(event_id)
+        if version is None:
+            raise LookupError(f"Event {event_id} not found")
+        job_id = self.job_id(fmt, event_id, version)
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job['status'] == 'failed':
+                if os.path.exists(self.artifact_path(job_id)):
+                    return self.status(job_id)
+                job = {'id': job_id, 'status': 'queued', 'format': fmt, 'event_id': event_id,
+                       'submitted': time.time(), 'error': None}
+                self._jobs[job_id] = job
+                self.executor.submit(self._run, job)
+        return self.status(job_id)
+
+    def status(self, job_id):
+        """Return the job's status dict, or None if this id is unknown."""
+        if not self.is_valid_id(job_id):
+            return None
+        path = self.artifact_path(job_id)
+        job = self._jobs.get(job_id)
+        if os.path.exists(path):
+            return {'id': job_id, 'status': 'done', 'size': os.path.getsize(path)}
+        if job is None:
+            return None
+        return {key: job[key] for key in ('id', 'status', 'error')}
+
+    def resume(self, job_id):
+        """Status of a job this process never saw, re-queued if its data is current.
+
+        Under several worker processes the poll for a job can land on a
+        worker other than the one that queued it. The id carries everything
+        needed to render it again; the atomic rename in ``_run`` makes a
+        duplicate render harmless. Returns None for stale or malformed ids.
+        """
+        status = self.status(job_id)
+        if status is not None or not self.is_valid_id(job_id):
+            return status
+        scope, version, fmt = job_id.split('-')
+        event_id = None if scope == 'all' else int(scope[len('event'):])
+        if data_version(event_id) != version:
+            return None
+        return self.submit(fmt, event_id)
+
+    def download_name(self, job_id):
+        scope, _, fmt = job_id.split('-')
+        return f"{'all' if scope == 'all' else scope}_registrations.{fmt}"
+
+    # --- worker ---
+
+    def _run(self, job):
+        job['status'] = 'running'
+        started = time.time()
+        path = self.artifact_path(job['id'])
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with self.app.app_context():
+                single = job['event_id'] is not None
+                if single:
+                    events = Event.query.filter_by(id=job['event_id']).all()
+                else:
+                    events = Event.query.all()
+                writer = WRITERS[job['format']](single)
+                output = exports.export(events, writer, include_empty=single)
+                with open(tmp_path, 'wb') as f:
+                    if isinstance(writer, exports.CsvWriter):
+                        for chunk in output:
+                            f.write(chunk.encode())
+                    else:
+                        with output:
+                            while True:
+                                block = output.read(1024 * 1024)
+                                if not block:
+                                    break
+                                f.write(block)
+            os.replace(tmp_path, path)
+            self._prune(job['id'], started)
+            job['status'] = 'done'
+            # The artifact on disk is now the record of this job
+            with self._lock:
+                self._jobs.pop(job['id'], None)
+        except Exception as e:
+            print(f"Export job {job['id']} failed: {e}")
+            job['status'] = 'failed'
+            job['error'] = str(e)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _prune(self, job_id, started):
+        """Delete other versions' artifacts for the same scope and format, if older than this job.
+
+        Only files written before this job ``started`` reading its data can
+        hold older data; a job (in any process) that began later and finished
+        first wrote a newer version, which is kept.
+        """
+        scope, _, fmt = job_id.split('-')
+        for stale in glob.glob(os.path.join(self.directory, f"{scope}-*-{fmt}.{fmt}")):
+            if os.path.basename(stale) == f"{job_id}.{fmt}":
+                continue
+            try:
+                if os.path.getmtime(stale) < started:
+                    os.remove(stale)
+            except OSError:
+                pass
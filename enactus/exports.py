@@ -0,0 +1,482 @@
+"""Registration export engine shared by the PDF, Excel and CSV routes.
+
+``export()`` fetches every requested event's registrations in one ordered
+query (event_id, id), projected to plain column tuples and streamed through a
+server-side cursor (``yield_per``), then hands each event's rows to a writer.
+Writers only know how to lay rows out in their format; each has a
+``render(events, groups)`` method fed by ``iter_events()``:
+
+- ``CsvWriter``  yields text chunks, for ``Response(stream_with_context(...))``
+- ``XlsxWriter`` fills a write-only workbook spooled to a temporary file
+- ``PdfWriter``  builds a ReportLab document into a temporary file, in
+                 fixed-size table chunks, optionally across processes
+
+ReportLab, openpyxl and pypdf are imported by the writers on first use, not
+here: only admins export, and every web worker would otherwise pay for them
+at startup.
+"""
+import atexit
+import collections
+import csv
+import functools
+import importlib.util
+import io
+import itertools
+import os
+import tempfile
+import threading
+from types import SimpleNamespace
+
+from sqlalchemy import func, select
+
+from models import db, Registration
+
+OPENPYXL_AVAILABLE = importlib.util.find_spec('openpyxl') is not None
+PYPDF_AVAILABLE = importlib.util.find_spec('pypdf') is not None
+
+FETCH_BATCH = 1000
+MAX_COLUMN_WIDTH = 50
+
+SOLO_COLUMNS = [
+    ('Name', Registration.name),
+    ('Email', Registration.email),
+    ('Student ID', Registration.student_id),
+    ('Contact', Registration.contact_no),
+    ('Branch', Registration.branch),
+    ('College', Registration.college_name),
+]
+
+TEAM_COLUMNS = [
+    ('Team Name', Registration.team_name),
+    ('Leader Name', Registration.leader_name),
+    ('Leader Email', Registration.leader_email),
+    ('Leader Contact', Registration.leader_contact),
+    ('Team Size', Registration.team_size),
+    ('College', Registration.college_name),
+]
+
+# Every column either layout needs, fetched once; events pick their subset by index.
+_FETCH_COLUMNS = list(dict.fromkeys(column for _, column in SOLO_COLUMNS + TEAM_COLUMNS))
+_SOLO_INDEXES = [_FETCH_COLUMNS.index(column) for _, column in SOLO_COLUMNS]
+_TEAM_INDEXES = [_FETCH_COLUMNS.index(column) for _, column in TEAM_COLUMNS]
+
+
+def columns_for(event):
+    return TEAM_COLUMNS if event.event_type == 'team' else SOLO_COLUMNS
+
+
+def headers_for(event):
+    return ['#'] + [label for label, _ in columns_for(event)]
+
+
+def _fetch_grouped(event_ids):
+    """Yield ``(event_id, rows)`` groups from a single ordered query."""
+    if not event_ids:
+        return
+    stmt = (
+        select(Registration.event_id, *_FETCH_COLUMNS)
+        .where(Registration.event_id.in_(event_ids))
+        .order_by(Registration.event_id, Registration.id)
+        .execution_options(yield_per=FETCH_BATCH)
+    )
+    for event_id, rows in itertools.groupby(db.session.execute(stmt), key=lambda row: row[0]):
+        yield event_id, (row[1:] for row in rows)
+
+
+def _project(event, rows):
+    indexes = _TEAM_INDEXES if event.event_type == 'team' else _SOLO_INDEXES
+    for i, row in enumerate(rows, 1):
+        yield [i] + [row[index] for index in indexes]
+
+
+def iter_events(events, include_empty=False):
+    """Yield ``(event, rows)`` for each event, all read from one query.
+
+    Rows are ``[n, value, ...]`` lists in the event's column layout. They come
+    off a shared cursor, so consume each event's rows before advancing.
+    Events without registrations are skipped unless ``include_empty`` is set
+    (single-event exports still want a page saying so).
+    """
+    events = sorted(events, key=lambda event: event.id)
+    groups = _fetch_grouped([event.id for event in events])
+    pending = next(groups, None)
+    for event in events:
+        if pending is not None and pending[0] == event.id:
+            yield event, _project(event, pending[1])
+            # Skip whatever the consumer left unread so the cursor advances
+            for _ in pending[1]:
+                pass
+            pending = next(groups, None)
+        elif include_empty:
+            yield event, iter(())
+
+
+def export(events, writer, include_empty=False):
+    """Render ``events`` with ``writer`` and return its output."""
+    events = list(events)
+    return writer.render(events, iter_events(events, include_empty))
+
+
+def _event_stats(events):
+    """``{event_id: (row count, longest value per fetched column)}`` from one grouped query."""
+    if not events:
+        return {}
+    stmt = (
+        select(Registration.event_id, func.count(Registration.id),
+               *[func.max(func.length(column)) for column in _FETCH_COLUMNS])
+        .where(Registration.event_id.in_([event.id for event in events]))
+        .group_by(Registration.event_id)
+    )
+    return {row[0]: row[1:] for row in db.session.execute(stmt)}
+
+
+def _column_widths(events, stats=None):
+    """Auto-fit widths per event from one grouped MAX(LENGTH()) query.
+
+    Write-only sheets need their widths before the first row, so the database
+    reports the longest value in each column (and the row count, for ``#``).
+    """
+    if stats is None:
+        stats = _event_stats(events)
+    widths = {}
+    for event in events:
+        count, *lengths = stats.get(event.id, (0,) + (None,) * len(_FETCH_COLUMNS))
+        indexes = _TEAM_INDEXES if event.event_type == 'team' else _SOLO_INDEXES
+        headers = headers_for(event)
+        event_widths = [max(len(headers[0]), len(str(count)))]
+        event_widths += [max(len(header), lengths[index] or 0) for header, index in zip(headers[1:], indexes)]
+        widths[event.id] = [min(width + 2, MAX_COLUMN_WIDTH) for width in event_widths]
+    return widths
+
+
+class CsvWriter:
+    """CSV text chunks; ``render()`` returns a generator to stream."""
+
+    content_type = 'text/csv'
+    extension = 'csv'
+
+    def __init__(self, with_titles=False):
+        self.with_titles = with_titles
+
+    def render(self, events, groups):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        def flush():
+            chunk = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            return chunk
+
+        for n, (event, rows) in enumerate(groups):
+            if self.with_titles:
+                if n:
+                    writer.writerow([])
+                writer.writerow([f"{event.title} ({event.date_day} {event.date_month})"])
+            writer.writerow(headers_for(event))
+            for i, row in enumerate(rows, 1):
+                writer.writerow(['' if value is None else value for value in row])
+                if i % FETCH_BATCH == 0:
+                    yield flush()
+            yield flush()
+
+
+class XlsxWriter:
+    """One write-only sheet per event; ``render()`` returns a rewound temp file."""
+
+    content_type = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    extension = 'xlsx'
+
+    def render(self, events, groups):
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font, Alignment, PatternFill
+        from openpyxl.utils import get_column_letter
+
+        wb = Workbook(write_only=True)
+        widths = _column_widths(events)
+        header_font = Font(bold=True, color="FFFFFF")
+        header_fill = PatternFill(start_color="1a3c34", end_color="1a3c34", fill_type="solid")
+        header_alignment = Alignment(horizontal='center')
+
+        for event, rows in groups:
+            ws = wb.create_sheet(title=event.title[:30])
+            for index, width in enumerate(widths[event.id], 1):
+                ws.column_dimensions[get_column_letter(index)].width = width
+            header = []
+            for label in headers_for(event):
+                cell = WriteOnlyCell(ws, value=label)
+                cell.font = header_font
+                cell.fill = header_fill
+                cell.alignment = header_alignment
+                header.append(cell)
+            ws.append(header)
+            for row in rows:
+                ws.append(['' if value is None else value for value in row])
+
+        if not wb.worksheets:
+            ws = wb.create_sheet(title="No Data")
+            ws.append(["No registrations found"])
+        output = tempfile.TemporaryFile(suffix='.xlsx')
+        wb.save(output)
+        output.seek(0)
+        return output
+
+
+@functools.lru_cache(maxsize=None)
+def _pdf_kit():
+    """ReportLab classes and the report styles, imported on the first PDF render."""
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+
+    styles = getSampleStyleSheet()
+    return SimpleNamespace(
+        SimpleDocTemplate=SimpleDocTemplate, Table=Table, Paragraph=Paragraph, Spacer=Spacer, inch=inch,
+        page_size=landscape(A4),
+        title_style=ParagraphStyle('Title', parent=styles['Heading1'], fontSize=20, spaceAfter=20,
+                                   textColor=colors.HexColor('#d4a553')),
+        event_style=ParagraphStyle('EventTitle', parent=styles['Heading2'], fontSize=14, spaceAfter=10, spaceBefore=20),
+        info_style=ParagraphStyle('Info', parent=styles['Normal'], fontSize=11, spaceAfter=20),
+        normal_style=styles['Normal'],
+        table_style=TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a1f26')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#d4a553')),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8f8f8')),
+            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 9),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cccccc')),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 1), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+        ]),
+    )
+
+
+PDF_MARGIN = 30
+# Rows per Table flowable. ReportLab lays out and splits one table at a time,
+# so many small tables keep layout cost linear in the row count.
+PDF_CHUNK_ROWS = 250
+
+
+def _pdf_col_widths(char_widths):
+    """Scale per-column character widths to fill the printable page width.
+
+    Fixed widths spare ReportLab from measuring every cell to size columns.
+    """
+    usable = _pdf_kit().page_size[0] - 2 * PDF_MARGIN
+    total = sum(char_widths)
+    return [usable * width / total for width in char_widths]
+
+
+def _pdf_chunks(rows):
+    """Yield rows as cell text, PDF_CHUNK_ROWS at a time, without reading ahead."""
+    rows = iter(rows)
+    while True:
+        chunk = [[str(value) if value not in (None, '') else '-' for value in row]
+                 for row in itertools.islice(rows, PDF_CHUNK_ROWS)]
+        if not chunk:
+            return
+        yield chunk
+
+
+def _event_flowables(heading, info, headers, chunks, col_widths, trailing_space):
+    """Yield one event's flowables: headings, then one table per chunk of rows.
+
+    ``heading`` pairs each text with a style name from ``_pdf_kit()``, so the
+    arguments stay cheap to pickle for a worker process.
+    """
+    kit = _pdf_kit()
+    for text, style in heading:
+        yield kit.Paragraph(text, getattr(kit, style))
+    if info:
+        yield kit.Paragraph(info, kit.info_style)
+        yield kit.Spacer(1, 0.25*kit.inch)
+    empty = True
+    for chunk in chunks:
+        table = kit.Table([headers] + chunk, colWidths=col_widths, repeatRows=1)
+        table.setStyle(kit.table_style)
+        yield table
+        empty = False
+    if empty:
+        yield kit.Paragraph("No registrations yet.", kit.normal_style)
+    if trailing_space:
+        yield kit.Spacer(1, 0.3*kit.inch)
+
+
+class _LazyFlowables(list):
+    """Flowable list that ReportLab fills from a generator as it lays out.
+
+    ``doc.build`` pops flowables off the front and checks ``len()`` on every
+    step, so topping up there keeps only a few tables alive at a time
+    instead of the whole report. A small look-ahead is kept for
+    keepWithNext handling.
+    """
+
+    LOOKAHEAD = 4
+
+    def __init__(self, flowables):
+        super().__init__()
+        self._source = iter(flowables)
+
+    def __len__(self):
+        while self._source is not None and super().__len__() < self.LOOKAHEAD:
+            try:
+                self.append(next(self._source))
+            except StopIteration:
+                self._source = None
+        return super().__len__()
+
+
+def _build_pdf(flowables, output):
+    kit = _pdf_kit()
+    doc = kit.SimpleDocTemplate(output, pagesize=kit.page_size, rightMargin=PDF_MARGIN, leftMargin=PDF_MARGIN,
+                                topMargin=PDF_MARGIN, bottomMargin=PDF_MARGIN)
+    doc.build(_LazyFlowables(flowables))
+
+
+def _render_pdf_part(part):
+    """Process-pool entry point: render one event's flowables to PDF bytes."""
+    buffer = io.BytesIO()
+    _build_pdf(_event_flowables(*part), buffer)
+    return buffer.getvalue()
+
+
+_pdf_pools = {}
+_pdf_pools_lock = threading.Lock()
+
+
+def _pdf_pool(processes):
+    """Process pool shared by every parallel PDF export, started on first use.
+
+    Workers are spawned, not forked: the web worker is multithreaded, and a
+    forked child would inherit whatever locks its other threads held.
+    """
+    with _pdf_pools_lock:
+        pool = _pdf_pools.get(processes)
+        if pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+            import multiprocessing
+
+            pool = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('spawn'))
+            if not _pdf_pools:
+                atexit.register(_shutdown_pdf_pools)
+            _pdf_pools[processes] = pool
+        return pool
+
+
+def _shutdown_pdf_pools():
+    with _pdf_pools_lock:
+        for pool in _pdf_pools.values():
+            pool.shutdown(cancel_futures=True)
+        _pdf_pools.clear()
+
+
+@functools.lru_cache(maxsize=None)
+def _warn_no_pypdf():
+    # Once per process: the setting is read for every export
+    print("PDF_RENDER_PROCESSES is set but pypdf is not installed; rendering PDFs in-line")
+
+
+class PdfWriter:
+    """Landscape A4 report; ``render()`` returns a rewound temp file.
+
+    With ``single_event`` the report is titled after the one event and carries
+    its date/venue/total line, matching the per-event export.
+
+    In-line rendering streams: rows are fetched, turned into tables and laid
+    out PDF_CHUNK_ROWS at a time, so memory follows the size of the finished
+    PDF (which ReportLab holds until it saves) rather than the row count.
+
+    ``processes`` (default: the ``PDF_RENDER_PROCESSES`` environment variable,
+    0 = render in-line) renders each event in a worker process of a shared
+    pool and concatenates the pages; each event then starts on a new page,
+    and at most two events per process are in flight. It needs ``pypdf``
+    and falls back to in-line rendering without it.
+    """
+
+    content_type = 'application/pdf'
+    extension = 'pdf'
+
+    def __init__(self, single_event=False, processes=None):
+        self.single_event = single_event
+        if processes is None:
+            processes = int(os.environ.get('PDF_RENDER_PROCESSES', 0))
+        if processes and not PYPDF_AVAILABLE:
+            _warn_no_pypdf()
+        self.processes = processes if PYPDF_AVAILABLE and not single_event else 0
+
+    def _parts(self, events, groups):
+        """Yield ``_event_flowables`` arguments, one per event.
+
+        An event's rows arrive as a lazy iterator of PDF_CHUNK_ROWS chunks;
+        materialise it before handing the part to another process.
+        """
+        stats = _event_stats(events)
+        widths = _column_widths(events, stats)
+        first = True
+        for event, rows in groups:
+            if self.single_event:
+                heading = [(f"Enactus - {event.title}", 'title_style')]
+                info = (f"Date: {event.date_day} {event.date_month} | Venue: {event.venue or 'TBA'} | "
+                        f"Total Registrations: {stats.get(event.id, (0,))[0]}")
+            else:
+                heading = [(f"{event.title} ({event.date_day} {event.date_month})", 'event_style')]
+                if first:
+                    heading.insert(0, ("Enactus - All Registrations", 'title_style'))
+                info = None
+            first = False
+            yield (heading, info, headers_for(event), _pdf_chunks(rows), _pdf_col_widths(widths[event.id]),
+                   not self.single_event)
+
+    def render(self, events, groups):
+        output = tempfile.TemporaryFile(suffix='.pdf')
+        if self.processes:
+            self._render_parallel(events, groups, output)
+        else:
+            _build_pdf(self._flowables(events, groups), output)
+        output.seek(0)
+        return output
+
+    def _flowables(self, events, groups):
+        """Every event's flowables in order, built only as ReportLab reaches them."""
+        empty = True
+        for part in self._parts(events, groups):
+            for flowable in _event_flowables(*part):
+                empty = False
+                yield flowable
+        if empty:
+            kit = _pdf_kit()
+            yield kit.Paragraph("Enactus - All Registrations", kit.title_style)
+
+    def _render_parallel(self, events, groups, output):
+        import pypdf
+
+        pool = _pdf_pool(self.processes)
+        merged = pypdf.PdfWriter()
+        pending = collections.deque()
+        rendered = 0
+        # Rows are read on this thread (the DB session lives here) and handed
+        # off per event, so rendering overlaps with fetching; the window keeps
+        # only a few events' rows in memory at once.
+        for heading, info, headers, chunks, col_widths, trailing_space in self._parts(events, groups):
+            part = (heading, info, headers, list(chunks), col_widths, trailing_space)
+            pending.append(pool.submit(_render_pdf_part, part))
+            if len(pending) >= 2 * self.processes:
+                merged.append(pypdf.PdfReader(io.BytesIO(pending.popleft().result())))
+                rendered += 1
+        while pending:
+            merged.append(pypdf.PdfReader(io.BytesIO(pending.popleft().result())))
+            rendered += 1
+        if not rendered:
+            kit = _pdf_kit()
+            _build_pdf([kit.Paragraph("Enactus - All Registrations", kit.title_style)], output)
+            return
+        merged.write(output)
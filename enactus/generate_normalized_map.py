@@ -1,82 +1,182 @@
+"""Generate static/js/world_map_data.js from a local countries GeoJSON file.
+
+The output defines ``window.WORLD_MAP_PATH``, one SVG path of every country
+outline projected equirectangularly onto a ``width`` x ``width/2`` box
+(``window.WORLD_MAP_VIEWBOX``). To keep the payload small:
+
+- rings are simplified with Douglas-Peucker at ``--tolerance`` (in output
+  units) before quantizing
+- coordinates are quantized to integers, so the grid is the viewbox itself
+- after the first absolute ``M``, points are delta-encoded as relative ``l``
+  commands, which is still a valid SVG path for ``Path2D`` or ``<path d>``
+
+Nothing is downloaded at run time. The vendored ``data/countries.geo.json``
+holds the land outlines the site shipped before this generator existed
+(unprojected back to lon/lat, 293 rings, 10.7k vertices); pass ``--input`` to
+build from another dataset, e.g. countries.geo.json from
+github.com/johan/world.geo.json:
+
+    python generate_normalized_map.py --tolerance 0.6
+"""
+import argparse
+import io
 import json
-import urllib.request
 import os
+import sys
 
-def generate_normalized_map():
-    url = "https://raw.githubusercontent.com/johan/world.geo.json/master/countries.geo.json"
-    output_path = os.path.join("static", "js", "world_map_data.js")
-    
-    print(f"Fetching GeoJSON from {url}...")
-    try:
-        with urllib.request.urlopen(url) as response:
-            data = json.loads(response.read().decode())
-    except Exception as e:
-        print(f"Error fetching data: {e}")
-        return
-
-    svg_path_parts = []
-    
-    # Target Viewbox: 1000 x 500
-    # Source Geo: Lon -180..180 (Width 360), Lat -90..90 (Height 180)
-    
-    scale_x = 1000 / 360
-    scale_y = 500 / 180
-    
-    print("Processing features...")
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_INPUT = os.path.join(BASE_DIR, 'data', 'countries.geo.json')
+DEFAULT_OUTPUT = os.path.join(BASE_DIR, 'static', 'js', 'world_map_data.js')
+
+
+def project(ring, width, height):
+    # x: shift lon by +180 to get 0..360, then scale
+    # y: 90 degrees (North) is Y=0, -90 (South) is Y=height (canvas Y goes down)
+    scale_x = width / 360
+    scale_y = height / 180
+    return [((lon + 180) * scale_x, (90 - lat) * scale_y) for lon, lat, *_ in ring]
+
+
+def simplify(points, tolerance):
+    """Douglas-Peucker simplification (iterative, so large rings can't overflow the stack)."""
+    if tolerance <= 0 or len(points) < 3:
+        return points
+    tolerance_sq = tolerance * tolerance
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        ax, ay = points[first]
+        bx, by = points[last]
+        dx, dy = bx - ax, by - ay
+        length_sq = dx * dx + dy * dy
+        max_dist_sq, index = 0.0, None
+        for i in range(first + 1, last):
+            px, py = points[i]
+            if length_sq == 0:
+                dist_sq = (px - ax) ** 2 + (py - ay) ** 2
+            else:
+                # Squared distance from the segment's supporting line
+                cross = dx * (py - ay) - dy * (px - ax)
+                dist_sq = cross * cross / length_sq
+            if dist_sq > max_dist_sq:
+                max_dist_sq, index = dist_sq, i
+        if index is not None and max_dist_sq > tolerance_sq:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+    return [point for point, kept in zip(points, keep) if kept]
+
+
+def quantize(points):
+    """Round to the integer grid, dropping consecutive duplicates."""
+    out = []
+    for x, y in points:
+        q = (int(round(x)), int(round(y)))
+        if not out or q != out[-1]:
+            out.append(q)
+    if len(out) > 1 and out[0] == out[-1]:
+        out.pop()  # 'z' closes the ring
+    return out
+
+
+def iter_rings(data):
     for feature in data['features']:
         geometry = feature['geometry']
-        t = geometry['type']
-        coords = geometry['coordinates']
-        
-        polygons = []
-        if t == 'Polygon':
-            polygons = [coords] # Polygon is list of rings
-        elif t == 'MultiPolygon':
-            polygons = coords   # MultiPolygon is list of Polygons (list of list of rings)
-            
+        if geometry['type'] == 'Polygon':
+            polygons = [geometry['coordinates']]  # Polygon is list of rings
+        elif geometry['type'] == 'MultiPolygon':
+            polygons = geometry['coordinates']  # list of Polygons
+        else:
+            continue
         for poly in polygons:
             # Each poly is a list of rings (first is exterior, others holes)
             for ring in poly:
-                if not ring: continue
-                
-                path_str = ""
-                first = True
-                for point in ring:
-                    lon, lat = point[0], point[1]
-                    
-                    # Normalize
-                    # x: shift lon by +180 to get 0..360, then scale
-                    x = (lon + 180) * scale_x
-                    
-                    # y: shift lat from 90..-90 to 0..180 (Canvas Y goes down)
-                    # 90 degrees (North) should be Y=0
-                    # -90 degrees (South) should be Y=500
-                    y = (90 - lat) * scale_y
-                    
-                    # Round to 1 decimal for compactness
-                    x = round(x, 1)
-                    y = round(y, 1)
-                    
-                    if first:
-                        path_str += f"M{x} {y}"
-                        first = False
-                    else:
-                        path_str += f"L{x} {y}"
-                
-                path_str += "z" # Close path
-                svg_path_parts.append(path_str)
-
-    # Join all parts
-    full_svg_path = " ".join(svg_path_parts)
-
-    # Wrap in JS - assign to window to ensure global accessibility
-    js_content = f"window.WORLD_MAP_PATH = \"{full_svg_path}\"; console.log('World Map JS file loaded, length: {len(full_svg_path)}');"
-    
-    with open(output_path, "w") as f:
+                if ring:
+                    yield ring
+
+
+def encode_path(rings):
+    """SVG path with an absolute start and relative integer steps."""
+    out = io.StringIO()
+    cx = cy = 0
+    for ring in rings:
+        x, y = ring[0]
+        # Relative moveto keeps even the ring starts small
+        out.write(f"m{x - cx} {y - cy}" if out.tell() else f"M{x} {y}")
+        steps = []
+        px, py = x, y
+        for x, y in ring[1:]:
+            steps.append(_pair(x - px, y - py))
+            px, py = x, y
+        if steps:
+            out.write('l' + ''.join(steps).lstrip(' '))
+        out.write('z')
+        # After 'z' the current point returns to the ring's start
+        cx, cy = ring[0]
+    return out.getvalue()
+
+
+def _pair(dx, dy):
+    # A '-' sign already separates numbers, so the space can go
+    return (f" {dx}" if dx >= 0 else str(dx)) + (f" {dy}" if dy >= 0 else str(dy))
+
+
+def generate_normalized_map(input_path=DEFAULT_INPUT, output_path=DEFAULT_OUTPUT, width=1000, tolerance=0.6):
+    if not os.path.exists(input_path):
+        print(f"GeoJSON not found at {input_path}. Vendor countries.geo.json there or pass --input.")
+        return None
+
+    with open(input_path, encoding='utf-8') as f:
+        data = json.load(f)
+
+    height = width // 2
+    vertices_in = vertices_out = 0
+    rings = []
+    print("Processing features...")
+    for ring in iter_rings(data):
+        points = project(ring, width, height)
+        vertices_in += len(points)
+        points = quantize(simplify(points, tolerance))
+        if len(points) < 3:
+            continue  # Collapsed below one grid cell
+        vertices_out += len(points)
+        rings.append(points)
+
+    path = encode_path(rings)
+    js_content = (
+        f"window.WORLD_MAP_VIEWBOX = [0, 0, {width}, {height}];\n"
+        f"window.WORLD_MAP_PATH = \"{path}\";\n"
+    )
+    previous = os.path.getsize(output_path) if os.path.exists(output_path) else None
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
         f.write(js_content)
-        
+    os.replace(tmp_path, output_path)
+
+    size = len(js_content.encode('utf-8'))
     print(f"Successfully created {output_path}")
-    print(f"Path length: {len(full_svg_path)} chars")
+    print(f"Rings: {len(rings)}  vertices: {vertices_in} -> {vertices_out}")
+    if previous is None:
+        print(f"Size: {size} bytes")
+    else:
+        print(f"Size: {previous} -> {size} bytes")
+    return {'rings': len(rings), 'vertices_in': vertices_in, 'vertices_out': vertices_out,
+            'bytes': size, 'previous_bytes': previous}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the about-page world map path.")
+    parser.add_argument('--input', default=DEFAULT_INPUT, help='countries GeoJSON file')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT)
+    parser.add_argument('--width', type=int, default=1000, help='viewbox width (height is half)')
+    parser.add_argument('--tolerance', type=float, default=0.6,
+                        help='Douglas-Peucker tolerance in viewbox units (0 disables)')
+    args = parser.parse_args()
+    result = generate_normalized_map(args.input, args.output, args.width, args.tolerance)
+    return 0 if result else 1
+
 
 if __name__ == "__main__":
-    generate_normalized_map()
+    sys.exit(main())
@@ -0,0 +1,30 @@
+"""gunicorn settings for ``gunicorn -c gunicorn.conf.py wsgi:application``.
+
+Every value can be overridden from the environment:
+
+``WEB_BIND``     address to listen on (default ``0.0.0.0:5003``)
+``WEB_WORKERS``  worker processes (default 2 x CPUs + 1); these are what
+                 scale with cores, since one Python process runs on one
+                 core at a time
+``WEB_THREADS``  threads per worker (default 4); requests mostly wait on
+                 SQLite or a socket, so a few threads keep a worker busy
+``WEB_TIMEOUT``  seconds before a stuck worker is restarted (default 120,
+                 enough for the largest synchronous export)
+
+The app is not preloaded: each worker opens its own database engine and
+export pool after forking. To keep spawning a worker cheap, templates compile
+to a shared bytecode cache (``JINJA_CACHE_DIR``, default ``jinja_cache/``)
+and ``TEMPLATE_PREWARM=1`` loads them all before the worker takes requests;
+``python -m benchmarks.startup`` measures both.
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get('WEB_BIND', '0.0.0.0:5003')
+workers = int(os.environ.get('WEB_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('WEB_THREADS', 4))
+worker_class = 'gthread'
+timeout = int(os.environ.get('WEB_TIMEOUT', 120))
+keepalive = 5
+preload_app = False
+accesslog = '-'
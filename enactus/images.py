@@ -0,0 +1,185 @@
+"""Event cover images uploaded by admins, pre-resized at upload time.
+
+``images.save(file)`` keeps the original and writes every variant once: the
+``VARIANT_WIDTHS`` (never upscaled) in WebP and JPEG, encoded in parallel on
+a small thread pool (Pillow releases the GIL while resizing and encoding).
+Files are named by the first 16 hex digits of the original's SHA-256, so a
+re-upload of the same picture reuses what is on disk and every URL can be
+cached forever:
+
+    IMAGE_ORIGINALS_DIR/<key>.<ext>
+    IMAGE_DIR/<key>-<width>.webp
+    IMAGE_DIR/<key>-<width>.jpg
+
+Only the variants are served, from ``/media/events/`` with a one-year
+``immutable`` Cache-Control; they carry no EXIF, while originals (GPS and
+all) stay outside the served directory. Templates call ``event_picture(event, sizes)``, which emits a
+``<picture>`` with WebP and JPEG ``srcset``s and ``loading="lazy"``, or a
+plain lazy ``<img>`` for events that still use an external ``image_url``.
+
+Configuration (app.config, falling back to the environment):
+
+``IMAGE_DIR``            where variants are written (default
+                         ``uploads/events`` next to app.py)
+``IMAGE_ORIGINALS_DIR``  where uploads are kept as sent (default
+                         ``uploads/originals`` next to app.py); never served
+``IMAGE_WORKERS``        encoder threads (default 4)
+``IMAGE_MAX_BYTES``      largest accepted upload (default 15 MB)
+
+Pillow is optional and imported on the first upload; without it uploads are
+refused with a clear message and external image URLs keep working.
+"""
+import hashlib
+import importlib.util
+import io
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import send_from_directory, url_for
+from markupsafe import Markup, escape
+
+HAS_PILLOW = importlib.util.find_spec('PIL') is not None
+
+VARIANT_WIDTHS = (400, 800, 1400)  # thumbnail, card, hero
+ENCODINGS = (
+    ('webp', 'WEBP', {'quality': 80, 'method': 4}),
+    ('jpg', 'JPEG', {'quality': 82, 'optimize': True, 'progressive': True}),
+)
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+
+class ImageError(ValueError):
+    """The upload can't be used as an event image; the message is shown to the admin."""
+
+
+def variant_widths(original_width):
+    """Widths actually produced for an original this wide (no upscaling, no duplicates)."""
+    return sorted({min(width, original_width) for width in VARIANT_WIDTHS})
+
+
+def _write_atomic(path, write):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+class ImageStore:
+
+    def __init__(self, app=None):
+        self._executor = None
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.directory = app.config.get('IMAGE_DIR') or os.environ.get(
+            'IMAGE_DIR', os.path.join(app.root_path, 'uploads', 'events'))
+        self.workers = int(app.config.get('IMAGE_WORKERS') or os.environ.get('IMAGE_WORKERS', 4))
+        self.max_bytes = int(app.config.get('IMAGE_MAX_BYTES') or os.environ.get('IMAGE_MAX_BYTES', 15 * 1024 * 1024))
+        self.originals = app.config.get('IMAGE_ORIGINALS_DIR') or os.environ.get(
+            'IMAGE_ORIGINALS_DIR', os.path.join(app.root_path, 'uploads', 'originals'))
+        os.makedirs(self.directory, exist_ok=True)
+        os.makedirs(self.originals, exist_ok=True)
+
+        # Variants are flat files: no sub-paths (an older layout kept originals in orig/)
+        @app.route('/media/events/<filename>')
+        def event_media(filename):
+            response = send_from_directory(self.directory, filename, max_age=IMMUTABLE_MAX_AGE)
+            response.headers['Cache-Control'] = f'public, max-age={IMMUTABLE_MAX_AGE}, immutable'
+            return response
+
+        app.add_template_global(self.picture, 'event_picture')
+        app.extensions['images'] = self
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='image')
+        return self._executor
+
+    # --- upload ---
+
+    def save(self, file):
+        """Store an uploaded image and its variants; returns (key, original width)."""
+        if not HAS_PILLOW:
+            raise ImageError("Image uploads need the Pillow package on the server.")
+        from PIL import Image, ImageOps
+
+        data = file.read(self.max_bytes + 1)
+        if len(data) > self.max_bytes:
+            raise ImageError(f"Images must be under {self.max_bytes // (1024 * 1024)} MB.")
+        try:
+            probe = Image.open(io.BytesIO(data))
+            original_format = (probe.format or 'img').lower()
+            probe.verify()
+            # verify() leaves the image unusable; decode it again for real
+            image = ImageOps.exif_transpose(Image.open(io.BytesIO(data)))
+        except (OSError, SyntaxError, Image.DecompressionBombError) as e:
+            raise ImageError("That file is not an image Pillow can read.") from e
+
+        key = hashlib.sha256(data).hexdigest()[:16]
+        widths = variant_widths(image.width)
+        original = os.path.join(self.originals, f"{key}.{original_format}")
+        if not os.path.exists(original):
+            _write_atomic(original, lambda f: f.write(data))
+
+        if image.mode not in ('RGB', 'L'):
+            # JPEG has no alpha: flatten transparent images onto white
+            background = Image.new('RGB', image.size, 'white')
+            background.paste(image, mask=image.convert('RGBA').getchannel('A'))
+            image = background
+        image = image.convert('RGB')
+        image.load()
+
+        jobs = [self.executor.submit(self._render, image, key, width) for width in widths
+                if not all(os.path.exists(self.path(key, width, ext)) for ext, _, _ in ENCODINGS)]
+        for job in jobs:
+            job.result()
+        return key, image.width
+
+    def _render(self, image, key, width):
+        from PIL import Image
+
+        height = max(round(image.height * width / image.width), 1)
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS, reducing_gap=3.0)
+        for ext, pil_format, options in ENCODINGS:
+            _write_atomic(self.path(key, width, ext), lambda f: resized.save(f, pil_format, **options))
+
+    # --- URLs and markup ---
+
+    def path(self, key, width, ext):
+        return os.path.join(self.directory, f"{key}-{width}.{ext}")
+
+    def url(self, key, width, ext):
+        return url_for('event_media', filename=f"{key}-{width}.{ext}")
+
+    def srcset(self, key, original_width, ext):
+        return ', '.join(f"{self.url(key, width, ext)} {width}w" for width in variant_widths(original_width))
+
+    def picture(self, event, sizes, lazy=True):
+        """``<picture>`` for an event's cover; ``sizes`` is the CSS width it is shown at."""
+        loading = Markup(' loading="lazy"') if lazy else Markup('')
+        alt = escape(event.title)
+        if not event.image_key:
+            return Markup(f'<img src="{escape(event.image_url)}" alt="{alt}"{loading} decoding="async">')
+        key, width = event.image_key, event.image_width
+        fallback = self.url(key, variant_widths(width)[-1], 'jpg')
+        return Markup(
+            f'<picture>'
+            f'<source type="image/webp" srcset="{self.srcset(key, width, "webp")}" sizes="{sizes}">'
+            f'<img src="{fallback}" srcset="{self.srcset(key, width, "jpg")}" sizes="{sizes}" '
+            f'alt="{alt}"{loading} decoding="async">'
+            f'</picture>'
+        )
+
+
+images = ImageStore()
@@ -0,0 +1,259 @@
+"""Bulk registration import from CSV or XLSX sign-up sheets.
+
+``import_registrations()`` reads rows in one streaming pass and, for each:
+
+- maps the header to ``Registration`` fields; the export headers (``Name``,
+  ``Leader Email``, ...) are accepted, so an exported sheet imports back
+- validates the fields ``register_event`` requires for the event's type
+- drops rows whose normalized email or student ID is already registered for
+  the event or repeated in the file (the keys of the unique indexes)
+
+Valid rows are inserted ``IMPORT_BATCH`` at a time, each batch in its own
+transaction with one executemany INSERT. Each batch first claims its seats
+with a compare-and-swap UPDATE of ``registration_count``, so the import
+respects ``max_registrations`` even while live sign-ups land. Rows beyond
+capacity are rejected, not inserted. The result lists accepted and rejected
+counts with per-row reasons.
+"""
+import codecs
+import csv
+import importlib.util
+import io
+import os
+
+from sqlalchemy import insert, update
+
+from models import (db, Event, Registration, EMAIL_KEY, STUDENT_ID_KEY, is_valid_email, normalize_email,
+                    normalize_student_id)
+
+# Imported on the first Excel upload; see exports.py
+OPENPYXL_AVAILABLE = importlib.util.find_spec('openpyxl') is not None
+
+IMPORT_BATCH = 1000
+MAX_REPORTED_REJECTS = 100
+CLAIM_ATTEMPTS = 5
+
+# Normalized header -> Registration attribute
+HEADER_FIELDS = {
+    'name': 'name',
+    'full name': 'name',
+    'email': 'email',
+    'e-mail': 'email',
+    'email address': 'email',
+    'student id': 'student_id',
+    'enrollment no': 'student_id',
+    'contact': 'contact_no',
+    'contact no': 'contact_no',
+    'phone': 'contact_no',
+    'mobile': 'contact_no',
+    'branch': 'branch',
+    'college': 'college_name',
+    'college name': 'college_name',
+    'team name': 'team_name',
+    'team size': 'team_size',
+    'leader name': 'leader_name',
+    'leader email': 'leader_email',
+    'leader contact': 'leader_contact',
+}
+
+# Column widths from models.Registration, checked before insert
+FIELD_LIMITS = {
+    field: getattr(Registration, field).type.length
+    for field in set(HEADER_FIELDS.values())
+    if getattr(getattr(Registration, field).type, 'length', None)
+}
+
+
+class ImportFileError(ValueError):
+    """The upload can't be read at all (bad format, no usable header)."""
+
+
+def _normalize_header(value):
+    return ' '.join(str(value or '').strip().lower().replace('_', ' ').split())
+
+
+NOT_UTF8 = "The CSV isn't UTF-8; re-save it as 'CSV UTF-8' and retry."
+
+
+def _check_utf8(stream):
+    """Decode the whole upload once, before any batch is committed.
+
+    Excel's plain "CSV" is cp1252; caught here, the admin gets the reason
+    instead of an import that stops partway.
+    """
+    if not stream.seekable():
+        return
+    start = stream.tell()
+    decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    try:
+        for block in iter(lambda: stream.read(64 * 1024), b''):
+            decoder.decode(block)
+        decoder.decode(b'', final=True)
+    except UnicodeDecodeError:
+        raise ImportFileError(NOT_UTF8) from None
+    finally:
+        stream.seek(start)
+
+
+def _iter_csv(stream):
+    _check_utf8(stream)
+    reader = csv.reader(io.TextIOWrapper(stream, encoding='utf-8-sig', newline=''))
+    try:
+        yield from reader
+    except UnicodeDecodeError:
+        # Unseekable stream: only found out on the way through
+        raise ImportFileError(NOT_UTF8) from None
+
+
+def _iter_xlsx(stream):
+    if not OPENPYXL_AVAILABLE:
+        raise ImportFileError("Excel import needs openpyxl; upload a CSV instead.")
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(stream, read_only=True, data_only=True)
+    try:
+        yield from workbook.worksheets[0].iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def iter_records(stream, filename):
+    """Yield ``(line number, {field: value})`` for each data row of the upload."""
+    ext = os.path.splitext(filename or '')[1].lower()
+    if ext == '.csv':
+        rows = _iter_csv(stream)
+    elif ext in ('.xlsx', '.xlsm'):
+        rows = _iter_xlsx(stream)
+    else:
+        raise ImportFileError("Upload a .csv or .xlsx file.")
+
+    fields = None
+    for line, row in enumerate(rows, 1):
+        if fields is None:
+            # The first row that names a known column is the header; anything above is a title
+            candidate = [HEADER_FIELDS.get(_normalize_header(cell)) for cell in row]
+            if any(candidate):
+                fields = candidate
+            continue
+        record = {}
+        for field, value in zip(fields, row):
+            if isinstance(value, float) and value.is_integer():
+                value = int(value)  # Excel stores phone numbers and IDs as floats
+            if field and value is not None and str(value).strip():
+                record[field] = str(value).strip()
+        if record:
+            yield line, record
+    if fields is None:
+        raise ImportFileError("No header row with recognizable columns (e.g. Name, Email).")
+
+
+def _validate(event_id, event_type, record):
+    """Return (mapping, None) for a good row or (None, reason)."""
+    if event_type == 'team':
+        # Same shape register_event stores: leader doubles as name/email
+        record.setdefault('leader_name', record.get('name'))
+        record.setdefault('leader_email', record.get('email'))
+        if not record.get('team_name') or not record.get('leader_name') or not record.get('leader_email'):
+            return None, "missing team name, leader name or leader email"
+        record['name'] = record['leader_name']
+        record['email'] = record['leader_email']
+        if record.get('team_size'):
+            try:
+                record['team_size'] = int(float(record['team_size']))
+            except ValueError:
+                return None, "team size is not a number"
+    elif not record.get('name') or not record.get('email'):
+        return None, "missing name or email"
+
+    # Same rule as register_event; for team rows this is the leader email
+    if not is_valid_email(record['email']):
+        return None, "invalid email"
+    for field, limit in FIELD_LIMITS.items():
+        if isinstance(record.get(field), str) and len(record[field]) > limit:
+            return None, f"{field.replace('_', ' ')} longer than {limit} characters"
+    mapping = dict(record, event_id=event_id, registration_type=event_type)
+    return mapping, None
+
+
+def _claim_seats(event_id, wanted):
+    """Reserve up to ``wanted`` seats; return how many were granted."""
+    for _ in range(CLAIM_ATTEMPTS):
+        count, capacity = db.session.query(Event.registration_count, Event.max_registrations) \
+            .filter_by(id=event_id).one()
+        granted = wanted if not capacity else max(min(wanted, capacity - count), 0)
+        if granted == 0:
+            return 0
+        result = db.session.execute(
+            update(Event)
+            .where(Event.id == event_id, Event.registration_count == count)
+            .values(registration_count=count + granted, data_version=Event.data_version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 1:
+            return granted
+        db.session.rollback()
+    raise RuntimeError("Could not reserve seats; the event is changing too quickly. Try again.")
+
+
+def _flush(event_id, batch, result):
+    granted = _claim_seats(event_id, len(batch))
+    if granted:
+        db.session.execute(insert(Registration), [mapping for _, mapping in batch[:granted]])
+    db.session.commit()
+    result['accepted'] += granted
+    for line, _ in batch[granted:]:
+        _reject(result, line, "event is full")
+    return granted == len(batch)
+
+
+def _reject(result, line, reason):
+    result['rejected'] += 1
+    result['reasons'][reason] = result['reasons'].get(reason, 0) + 1
+    if len(result['rejects']) < MAX_REPORTED_REJECTS:
+        result['rejects'].append((line, reason))
+
+
+def import_registrations(event, stream, filename):
+    """Import one upload into ``event`` and return a summary dict.
+
+    Keys: ``accepted``, ``rejected``, ``reasons`` ({reason: count}) and
+    ``rejects`` (the first ``MAX_REPORTED_REJECTS`` ``(line, reason)`` pairs).
+    Raises ``ImportFileError`` if the file can't be read.
+    """
+    result = {'accepted': 0, 'rejected': 0, 'reasons': {}, 'rejects': []}
+    # Team rows carry the leader's address in email too, so one key covers both
+    seen_emails = set()
+    seen_students = set()
+    for email, student_id in db.session.query(EMAIL_KEY, STUDENT_ID_KEY).filter(Registration.event_id == event.id):
+        seen_emails.add(email)
+        seen_students.add(student_id)
+    seen_students.discard(None)
+    # Plain values: the event instance expires at every batch commit
+    event_id, event_type = event.id, event.event_type or 'solo'
+
+    batch = []
+    full = False
+    for line, record in iter_records(stream, filename):
+        mapping, reason = _validate(event_id, event_type, record)
+        if reason is None:
+            email = normalize_email(mapping['email'])
+            student_id = normalize_student_id(mapping.get('student_id'))
+            if email in seen_emails:
+                reason = "duplicate email"
+            elif student_id and student_id in seen_students:
+                reason = "duplicate student ID"
+            elif full:
+                reason = "event is full"
+        if reason is not None:
+            _reject(result, line, reason)
+            continue
+        seen_emails.add(email)
+        if student_id:
+            seen_students.add(student_id)
+        batch.append((line, mapping))
+        if len(batch) >= IMPORT_BATCH:
+            full = not _flush(event_id, batch, result)
+            batch = []
+    if batch:
+        _flush(event_id, batch, result)
+    return result
@@ -0,0 +1,144 @@
+"""Database maintenance commands.
+
+``migrate`` creates missing tables and applies pending migrations; ``seed``
+does the same and adds a demo event to an empty database. Run one of them
+once per deploy, before starting the web workers, which no longer touch the
+schema at startup.
+
+``archive`` closes and archives events whose end date has passed, and
+``send-mail`` drains the email outbox once. The web workers' scheduler runs
+both on its own; use these from cron when ``SCHEDULER_ENABLED=0``.
+
+``dedupe`` collapses duplicate registrations (same event and normalized
+email, then same event and normalized student ID; see ``models.EMAIL_KEY``)
+onto the earliest row. Each key takes two set-based statements: one UPDATE
+fills the keeper's empty fields from its duplicates, one DELETE removes the
+rest. Afterwards, affected events get their ``registration_count``
+recomputed and ``data_version`` bumped so cached pages and exports refresh.
+Migration 6 runs the same merge before it creates the unique indexes.
+
+Run from the ``enactus`` directory:
+
+    python maintenance.py migrate
+    python maintenance.py seed
+    python maintenance.py archive
+    python maintenance.py send-mail
+    python maintenance.py dedupe --dry-run   # report only
+    python maintenance.py dedupe
+"""
+import argparse
+import sys
+
+from sqlalchemy import text
+
+# SQL twins of models.EMAIL_KEY / STUDENT_ID_KEY; {t} is an optional "alias." prefix
+KEYS = {
+    'email': "nullif(lower(trim({t}email)), '')",
+    'student ID': "nullif(upper(trim({t}student_id)), '')",
+}
+
+# Detail fields a duplicate may have filled in when the kept row didn't
+MERGE_FIELDS = ('student_id', 'contact_no', 'branch', 'college_name', 'team_name',
+                'team_size', 'leader_name', 'leader_email', 'leader_contact')
+
+
+def find_duplicates(conn):
+    """Return {key label: [(event_id, key, count), ...]} for every duplicated key."""
+    found = {}
+    for label, key in KEYS.items():
+        expr = key.format(t='registration.')
+        found[label] = conn.execute(text(
+            f"SELECT event_id, {expr} AS k, COUNT(*) AS n FROM registration "
+            f"WHERE {expr} IS NOT NULL GROUP BY event_id, {expr} HAVING COUNT(*) > 1 "
+            f"ORDER BY event_id, k"
+        )).all()
+    return found
+
+
+def merge_duplicates(conn):
+    """Merge every duplicate group onto its earliest row; return rows removed."""
+    removed = 0
+    affected = set()
+    for key in KEYS.values():
+        own, dup = key.format(t='registration.'), key.format(t='d.')
+        groups = (f"SELECT event_id, {own} AS k, MIN(id) AS keep_id FROM registration "
+                  f"WHERE {own} IS NOT NULL GROUP BY event_id, {own} HAVING COUNT(*) > 1")
+        affected.update(row.event_id for row in conn.execute(text(groups)))
+
+        fills = ', '.join(
+            f"{field} = COALESCE({field}, (SELECT d.{field} FROM registration d "
+            f"WHERE d.event_id = registration.event_id AND {dup} = {own} "
+            f"AND d.{field} IS NOT NULL ORDER BY d.id LIMIT 1))"
+            for field in MERGE_FIELDS
+        )
+        conn.execute(text(
+            f"UPDATE registration SET {fills} "
+            f"WHERE id IN (SELECT keep_id FROM ({groups}) AS g)"
+        ))
+        removed += conn.execute(text(
+            f"DELETE FROM registration WHERE {own} IS NOT NULL AND id NOT IN ("
+            f"SELECT MIN(id) FROM registration WHERE {own} IS NOT NULL GROUP BY event_id, {own})"
+        )).rowcount
+
+    if affected:
+        ids = ', '.join(str(int(event_id)) for event_id in sorted(affected))
+        conn.execute(text(
+            "UPDATE event SET registration_count = "
+            "(SELECT COUNT(*) FROM registration WHERE registration.event_id = event.id), "
+            f"data_version = data_version + 1 WHERE id IN ({ids})"
+        ))
+    return removed
+
+
+def dedupe(engine, dry_run=False):
+    with engine.begin() as conn:
+        found = find_duplicates(conn)
+        for label, groups in found.items():
+            for event_id, key, count in groups:
+                print(f"event {event_id}: {count} registrations share {label} {key}")
+        if dry_run:
+            total = sum(count - 1 for groups in found.values() for _, _, count in groups)
+            print(f"Up to {total} duplicate registration(s) would be removed")
+            return total
+        removed = merge_duplicates(conn)
+    print(f"Removed {removed} duplicate registration(s)")
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Enactus database maintenance.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('migrate', help='create tables and apply pending migrations')
+    commands.add_parser('seed', help='migrate, then add a demo event to an empty database')
+    commands.add_parser('archive', help='close and archive events whose end date has passed')
+    commands.add_parser('send-mail', help='send every due email in the outbox')
+    dedupe_parser = commands.add_parser('dedupe', help='merge duplicate registrations per event')
+    dedupe_parser.add_argument('--dry-run', action='store_true')
+    args = parser.parse_args()
+
+    import app as enactus
+
+    if args.command == 'migrate':
+        print(f"Schema at version {enactus.migrate_database()}")
+    elif args.command == 'seed':
+        enactus.seed_database()
+        print("Database ready")
+    elif args.command == 'archive':
+        with enactus.create_app().app_context():
+            archived = enactus.archive_past_events()
+        print(f"Archived {archived} past event(s)")
+    elif args.command == 'send-mail':
+        with enactus.create_app().app_context():
+            if not enactus.outbox.enabled:
+                print("SMTP_HOST is not set; nothing to send")
+                return 1
+            sent, retried, failed = enactus.outbox.deliver()
+        print(f"Sent {sent}, will retry {retried}, gave up on {failed}")
+    elif args.command == 'dedupe':
+        with enactus.create_app().app_context():
+            dedupe(enactus.db.engine, dry_run=args.dry_run)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
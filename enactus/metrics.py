@@ -0,0 +1,233 @@
+"""Request-level performance instrumentation.
+
+Hooks Flask's request and template signals and the SQLAlchemy engine to
+record, per endpoint:
+
+- request latency (histogram) and response counts by status
+- SQL statements and SQL time per request (histogram of statement counts,
+  so an N+1 loop shows up as a high bucket rather than a slow page)
+- top-level template render time
+
+Statements slower than ``SLOW_QUERY_MS`` are logged with their parameters
+through ``app.logger``. Each response carries a ``Server-Timing`` header
+(``app``, ``db``, ``tpl``) for the browser's network panel, and
+``/metrics`` in app.py serves everything in Prometheus text format. Other
+components can add their own samples with ``add_collector``.
+
+Configuration (app.config, falling back to the environment):
+
+``METRICS_ENABLED``  ``0`` turns all hooks off (default on)
+``SLOW_QUERY_MS``    slow-query log threshold in milliseconds (default 100)
+``METRICS_TOKEN``    optional bearer token that lets a scraper read
+                     ``/metrics`` without an admin session
+"""
+import os
+import threading
+import time
+from collections import defaultdict
+
+from flask import g, has_request_context, request, template_rendered, before_render_template
+from sqlalchemy import event
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+PARAMS_LOG_LIMIT = 500
+
+
+class Histogram:
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.total += value
+
+    def samples(self, name, labels):
+        cumulative = 0
+        for bound, count in zip(self.buckets + ('+Inf',), self.counts):
+            cumulative += count
+            yield f'{name}_bucket{_labels(labels, le=bound)} {cumulative}'
+        yield f'{name}_sum{_labels(labels)} {self.total:.6f}'
+        yield f'{name}_count{_labels(labels)} {cumulative}'
+
+
+def _labels(labels, **extra):
+    pairs = dict(labels, **{k: str(v) for k, v in extra.items()})
+    if not pairs:
+        return ''
+    escaped = (f'{k}="{_escape(v)}"' for k, v in pairs.items())
+    return '{' + ','.join(escaped) + '}'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Metrics:
+
+    def __init__(self, app=None):
+        self._lock = threading.Lock()
+        self._latency = {}
+        self._query_counts = {}
+        self._responses = defaultdict(int)
+        self._sql_seconds = defaultdict(float)
+        self._sql_statements = defaultdict(int)
+        self._templates = defaultdict(lambda: [0, 0.0])
+        self.slow_queries = 0
+        self._collectors = []
+        self.enabled = True
+        self.slow_query_seconds = 0.1
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        enabled = app.config.get('METRICS_ENABLED', os.environ.get('METRICS_ENABLED', '1'))
+        self.enabled = str(enabled).lower() not in ('0', 'false', 'no', 'off')
+        self.slow_query_seconds = float(app.config.get('SLOW_QUERY_MS') or os.environ.get('SLOW_QUERY_MS', 100)) / 1000
+        self.token = app.config.get('METRICS_TOKEN') or os.environ.get('METRICS_TOKEN')
+        app.extensions['metrics'] = self
+        if not self.enabled:
+            return
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        before_render_template.connect(self._before_render, app)
+        template_rendered.connect(self._after_render, app)
+
+    def instrument_engine(self, engine):
+        """Time every statement on ``engine``; call once inside an app context."""
+        if not self.enabled:
+            return
+        event.listen(engine, 'before_cursor_execute', self._before_execute)
+        event.listen(engine, 'after_cursor_execute', self._after_execute)
+
+    def add_collector(self, collect):
+        """Register ``collect()`` returning (name, type, help, value) tuples for /metrics.
+
+        ``value`` is a number, or a ``Histogram`` for type ``histogram``.
+        """
+        self._collectors.append(collect)
+
+    # --- hooks ---
+
+    def _before_request(self):
+        g._metrics = {'start': time.perf_counter(), 'sql_count': 0, 'sql_time': 0.0, 'tpl_time': 0.0}
+
+    def _after_request(self, response):
+        state = g.pop('_metrics', None)
+        if state is None:
+            return response
+        elapsed = time.perf_counter() - state['start']
+        endpoint = request.endpoint or 'unmatched'
+        with self._lock:
+            self._latency.setdefault(endpoint, Histogram(LATENCY_BUCKETS)).observe(elapsed)
+            self._query_counts.setdefault(endpoint, Histogram(QUERY_COUNT_BUCKETS)).observe(state['sql_count'])
+            self._responses[(endpoint, response.status_code)] += 1
+            self._sql_seconds[endpoint] += state['sql_time']
+            self._sql_statements[endpoint] += state['sql_count']
+        response.headers.add(
+            'Server-Timing',
+            f'app;dur={elapsed * 1000:.1f}, '
+            f'db;dur={state["sql_time"] * 1000:.1f};desc="{state["sql_count"]} queries", '
+            f'tpl;dur={state["tpl_time"] * 1000:.1f}',
+        )
+        return response
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # On the statement's own context, so a statement that raises leaves nothing behind
+        if context is not None:
+            context._metrics_start = time.perf_counter()
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        start = getattr(context, '_metrics_start', None)
+        if start is None:
+            return
+        elapsed = time.perf_counter() - start
+        if has_request_context():
+            state = g.get('_metrics')
+            if state is not None:
+                state['sql_count'] += 1
+                state['sql_time'] += elapsed
+        if elapsed >= self.slow_query_seconds:
+            with self._lock:
+                self.slow_queries += 1
+            self.app.logger.warning(
+                "Slow query (%.1f ms) on %s: %s | params=%s",
+                elapsed * 1000,
+                request.endpoint if has_request_context() else 'background',
+                ' '.join(statement.split()),
+                repr(parameters)[:PARAMS_LOG_LIMIT],
+            )
+
+    def _before_render(self, sender, template, context, **extra):
+        if has_request_context() and '_metrics' in g:
+            g._metrics_tpl_start = time.perf_counter()
+
+    def _after_render(self, sender, template, context, **extra):
+        start = g.pop('_metrics_tpl_start', None) if has_request_context() else None
+        if start is None:
+            return
+        elapsed = time.perf_counter() - start
+        g._metrics['tpl_time'] += elapsed
+        with self._lock:
+            entry = self._templates[template.name or '<string>']
+            entry[0] += 1
+            entry[1] += elapsed
+
+    # --- exposition ---
+
+    def authorized(self, req):
+        return bool(self.token) and req.headers.get('Authorization') == f'Bearer {self.token}'
+
+    def render(self):
+        """Everything in Prometheus text exposition format."""
+        lines = []
+
+        def family(name, kind, help_text):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+
+        with self._lock:
+            family('enactus_request_duration_seconds', 'histogram', 'Request latency by endpoint.')
+            for endpoint, histogram in sorted(self._latency.items()):
+                lines.extend(histogram.samples('enactus_request_duration_seconds', {'endpoint': endpoint}))
+            family('enactus_responses_total', 'counter', 'Responses by endpoint and status.')
+            for (endpoint, status), count in sorted(self._responses.items()):
+                lines.append(f'enactus_responses_total{_labels({"endpoint": endpoint, "status": status})} {count}')
+            family('enactus_request_sql_statements', 'histogram', 'SQL statements executed per request.')
+            for endpoint, histogram in sorted(self._query_counts.items()):
+                lines.extend(histogram.samples('enactus_request_sql_statements', {'endpoint': endpoint}))
+            family('enactus_sql_statements_total', 'counter', 'SQL statements executed by endpoint.')
+            for endpoint, count in sorted(self._sql_statements.items()):
+                lines.append(f'enactus_sql_statements_total{_labels({"endpoint": endpoint})} {count}')
+            family('enactus_sql_seconds_total', 'counter', 'Time spent in SQL by endpoint.')
+            for endpoint, seconds in sorted(self._sql_seconds.items()):
+                lines.append(f'enactus_sql_seconds_total{_labels({"endpoint": endpoint})} {seconds:.6f}')
+            family('enactus_template_renders_total', 'counter', 'Top-level template renders.')
+            for name, (count, _) in sorted(self._templates.items()):
+                lines.append(f'enactus_template_renders_total{_labels({"template": name})} {count}')
+            family('enactus_template_seconds_total', 'counter', 'Time spent rendering templates.')
+            for name, (_, seconds) in sorted(self._templates.items()):
+                lines.append(f'enactus_template_seconds_total{_labels({"template": name})} {seconds:.6f}')
+            family('enactus_slow_queries_total', 'counter', f'Statements slower than {self.slow_query_seconds * 1000:g} ms.')
+            lines.append(f'enactus_slow_queries_total {self.slow_queries}')
+
+        for collect in self._collectors:
+            for name, kind, help_text, value in collect():
+                family(name, kind, help_text)
+                if isinstance(value, Histogram):
+                    lines.extend(value.samples(name, {}))
+                else:
+                    lines.append(f'{name} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+metrics = Metrics()
@@ -0,0 +1,166 @@
+"""Versioned schema migrations for the Enactus database.
+
+Each migration is a ``(version, description, function)`` entry in
+``MIGRATIONS``. ``upgrade()`` applies the ones newer than the version stored
+in the ``schema_version`` table, each inside its own transaction, and is
+run once per deploy by ``python maintenance.py migrate`` (or ``seed``).
+
+Migrations must be idempotent: a fresh database is built by ``db.create_all()``
+from the current models first, so a step may find its column or index already
+in place and should then do nothing.
+"""
+import datetime
+import warnings
+
+from sqlalchemy import Date, String, Time, bindparam, inspect, text
+from sqlalchemy.exc import SAWarning
+
+from maintenance import KEYS, merge_duplicates
+from models import OutboxEmail
+
+
+def _has_column(conn, table, column):
+    return any(col['name'] == column for col in inspect(conn).get_columns(table))
+
+
+def _has_index(conn, table, name):
+    with warnings.catch_warnings():
+        # SQLite reflection skips (and warns about) the expression indexes
+        warnings.filterwarnings('ignore', 'Skipped unsupported reflection', SAWarning)
+        return any(ix['name'] == name for ix in inspect(conn).get_indexes(table))
+
+
+def _create_index(conn, name, table, columns):
+    if not _has_index(conn, table, name):
+        conn.execute(text(f"CREATE INDEX {name} ON {table} ({', '.join(columns)})"))
+
+
+def _add_brochure_link(conn):
+    if not _has_column(conn, 'event', 'brochure_link'):
+        conn.execute(text("ALTER TABLE event ADD COLUMN brochure_link VARCHAR(500)"))
+
+
+def _add_registration_count(conn):
+    if not _has_column(conn, 'event', 'registration_count'):
+        conn.execute(text("ALTER TABLE event ADD COLUMN registration_count INTEGER NOT NULL DEFAULT 0"))
+        conn.execute(text(
+            "UPDATE event SET registration_count = "
+            "(SELECT COUNT(*) FROM registration WHERE registration.event_id = event.id)"
+        ))
+
+
+def _add_lookup_indexes(conn):
+    _create_index(conn, 'ix_registration_event_id', 'registration', ['event_id'])
+    _create_index(conn, 'ix_registration_event_email', 'registration', ['event_id', 'email'])
+    _create_index(conn, 'ix_event_is_open', 'event', ['is_open'])
+
+
+def _add_data_version(conn):
+    if not _has_column(conn, 'event', 'data_version'):
+        conn.execute(text("ALTER TABLE event ADD COLUMN data_version INTEGER NOT NULL DEFAULT 0"))
+
+
+def _add_updated_at(conn):
+    if not _has_column(conn, 'event', 'updated_at'):
+        conn.execute(text("ALTER TABLE event ADD COLUMN updated_at DATETIME"))
+        conn.execute(text("UPDATE event SET updated_at = CURRENT_TIMESTAMP"))
+
+
+def _add_identity_unique_indexes(conn):
+    # Existing duplicates would make the unique indexes fail; merge them first
+    removed = merge_duplicates(conn)
+    if removed:
+        print(f"  merged {removed} duplicate registration(s)")
+    # IF NOT EXISTS rather than _has_index: reflection can't see expression indexes
+    for name, key in (('uq_registration_event_email_key', KEYS['email']),
+                      ('uq_registration_event_student_key', KEYS['student ID'])):
+        conn.execute(text(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS {name} ON registration (event_id, ({key.format(t='')}))"))
+
+
+def _parse(value, parse):
+    """Old free-text date/time column value -> date/time, or None if unusable."""
+    if value is None or not isinstance(value, str):
+        return value
+    try:
+        return parse(value.strip())
+    except ValueError:
+        return None
+
+
+def _type_event_dates(conn):
+    # Re-write every row through the Date/Time types so SQLite holds the
+    # strings they read back ('HH:MM' times become 'HH:MM:SS.ffffff')
+    rows = conn.execute(text("SELECT id, start_date, end_date, event_time FROM event")).all()
+    unreadable = 0
+    for row in rows:
+        start = _parse(row.start_date, lambda v: datetime.date.fromisoformat(v[:10]))
+        end = _parse(row.end_date, lambda v: datetime.date.fromisoformat(v[:10])) or start
+        at = _parse(row.event_time, datetime.time.fromisoformat)
+        unreadable += sum(1 for old, new in ((row.start_date, start), (row.event_time, at)) if old and not new)
+        conn.execute(
+            text("UPDATE event SET start_date = :start, end_date = :end, event_time = :at WHERE id = :id")
+            .bindparams(bindparam('start', type_=Date), bindparam('end', type_=Date),
+                        bindparam('at', type_=Time)),
+            {'start': start, 'end': end, 'at': at, 'id': row.id},
+        )
+    if unreadable:
+        print(f"  cleared {unreadable} unreadable date/time value(s)")
+
+    # SQLite ignores declared column types; server databases convert in place
+    if conn.dialect.name == 'postgresql':
+        columns = {col['name']: col['type'] for col in inspect(conn).get_columns('event')}
+        for name, sql_type in (('start_date', 'DATE'), ('end_date', 'DATE'), ('event_time', 'TIME')):
+            if isinstance(columns[name], String):
+                conn.execute(text(f"ALTER TABLE event ALTER COLUMN {name} TYPE {sql_type} USING {name}::{sql_type}"))
+
+    if not _has_column(conn, 'event', 'is_archived'):
+        conn.execute(text("ALTER TABLE event ADD COLUMN is_archived BOOLEAN NOT NULL DEFAULT 0"))
+    _create_index(conn, 'ix_event_open_start', 'event', ['is_open', 'start_date'])
+    _create_index(conn, 'ix_event_end_date', 'event', ['end_date'])
+
+
+def _add_outbox(conn):
+    OutboxEmail.__table__.create(conn, checkfirst=True)
+
+
+def _add_event_image_columns(conn):
+    if not _has_column(conn, 'event', 'image_key'):
+        conn.execute(text("ALTER TABLE event ADD COLUMN image_key VARCHAR(32)"))
+    if not _has_column(conn, 'event', 'image_width'):
+        conn.execute(text("ALTER TABLE event ADD COLUMN image_width INTEGER"))
+
+
+MIGRATIONS = [
+    (1, "Add brochure_link column to event", _add_brochure_link),
+    (2, "Add registration_count column to event", _add_registration_count),
+    (3, "Index registration.event_id, (event_id, email) and event.is_open", _add_lookup_indexes),
+    (4, "Add data_version column to event", _add_data_version),
+    (5, "Add updated_at column to event", _add_updated_at),
+    (6, "Unique normalized email and student ID per event", _add_identity_unique_indexes),
+    (7, "Typed event dates, archive flag and date indexes", _type_event_dates),
+    (8, "Add outbox_email table", _add_outbox),
+    (9, "Add uploaded image columns to event", _add_event_image_columns),
+]
+
+
+def current_version(engine):
+    """Return the applied schema version (0 for an unversioned database)."""
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE IF NOT EXISTS schema_version (version INTEGER NOT NULL)"))
+        version = conn.execute(text("SELECT MAX(version) FROM schema_version")).scalar()
+    return version or 0
+
+
+def upgrade(engine):
+    """Apply all pending migrations and return the resulting schema version."""
+    version = current_version(engine)
+    for number, description, migrate in MIGRATIONS:
+        if number <= version:
+            continue
+        print(f"Migrating ({number}): {description}...")
+        with engine.begin() as conn:
+            migrate(conn)
+            conn.execute(text("INSERT INTO schema_version (version) VALUES (:v)"), {'v': number})
+        version = number
+    return version
@@ -0,0 +1,147 @@
+"""SQLAlchemy models shared by the app, exports and maintenance scripts."""
+import datetime
+import hashlib
+import re
+
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import func
+from sqlalchemy.orm import validates
+
+db = SQLAlchemy()
+
+
+def utcnow():
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+class Event(db.Model):
+    # /events lists open events, then closed ones, each in date order
+    __table_args__ = (db.Index('ix_event_open_start', 'is_open', 'start_date'),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    title = db.Column(db.String(100), nullable=False)
+    date_day = db.Column(db.String(10), nullable=False) 
+    date_month = db.Column(db.String(10), nullable=False) 
+    short_desc = db.Column(db.String(200), nullable=False)
+    full_desc = db.Column(db.Text, nullable=False)
+    image_url = db.Column(db.String(500), nullable=False)
+    # Uploaded cover (images.ImageStore): content hash naming its variants, and its width
+    image_key = db.Column(db.String(32), nullable=True)
+    image_width = db.Column(db.Integer, nullable=True)
+    is_open = db.Column(db.Boolean, default=True, index=True)
+    # Event type: 'solo' or 'team'
+    event_type = db.Column(db.String(20), default='solo')  # 'solo' or 'team'
+    # Event duration; date_day/date_month above are the card badge, derived from start_date
+    start_date = db.Column(db.Date, nullable=True)
+    end_date = db.Column(db.Date, nullable=True, index=True)
+    event_time = db.Column(db.Time, nullable=True)
+    venue = db.Column(db.String(200), nullable=True)
+    max_registrations = db.Column(db.Integer, nullable=True)
+    # Team event fields
+    min_team_size = db.Column(db.Integer, nullable=True)  # Minimum team members
+    max_team_size = db.Column(db.Integer, nullable=True)  # Maximum team members
+    event_link = db.Column(db.String(500), nullable=True)  # External link/URL for event
+    brochure_link = db.Column(db.String(500), nullable=True)  # Optional document link
+    # Denormalized count of Registration rows, kept in step by the write routes
+    registration_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    # Bumped on every change to the event or its registrations; keys cached exports
+    data_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    # Set by the database on every UPDATE (ORM or bulk); Last-Modified for the API
+    updated_at = db.Column(db.DateTime, nullable=True, default=func.now(), onupdate=func.now())
+    # Set (with is_open cleared) once end_date has passed; see app.archive_past_events
+    is_archived = db.Column(db.Boolean, nullable=False, default=False, server_default='0')
+
+    @validates('start_date')
+    def _set_badge(self, key, value):
+        if value is not None:
+            self.date_day = value.strftime('%d')
+            self.date_month = value.strftime('%b').upper()
+        return value
+
+class Registration(db.Model):
+    __table_args__ = (db.Index('ix_registration_event_email', 'event_id', 'email'),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    event_id = db.Column(db.Integer, db.ForeignKey('event.id'), nullable=False, index=True)
+    # Common fields
+    registration_type = db.Column(db.String(20), default='solo')  # 'solo' or 'team'
+    # Solo event fields
+    name = db.Column(db.String(100), nullable=True)
+    email = db.Column(db.String(100), nullable=True)
+    student_id = db.Column(db.String(50), nullable=True)
+    contact_no = db.Column(db.String(20), nullable=True)
+    branch = db.Column(db.String(100), nullable=True)
+    college_name = db.Column(db.String(200), nullable=True)
+    # Team event fields
+    team_name = db.Column(db.String(100), nullable=True)
+    team_size = db.Column(db.Integer, nullable=True)
+    leader_name = db.Column(db.String(100), nullable=True)
+    leader_email = db.Column(db.String(100), nullable=True)
+    leader_contact = db.Column(db.String(20), nullable=True)
+    # Relationship
+    event = db.relationship('Event', backref='registrations')
+
+
+class OutboxEmail(db.Model):
+    """A queued email, written in the same transaction as the change it reports.
+
+    ``outbox.Outbox`` delivers due rows in batches; see there for the states.
+    Times are naive UTC.
+    """
+    __tablename__ = 'outbox_email'
+    __table_args__ = (db.Index('ix_outbox_email_due', 'status', 'next_attempt_at'),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    recipient = db.Column(db.String(100), nullable=False)
+    subject = db.Column(db.String(200), nullable=False)
+    body = db.Column(db.Text, nullable=False)
+    status = db.Column(db.String(10), nullable=False, default='pending')  # pending, sending, sent, failed
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    next_attempt_at = db.Column(db.DateTime, nullable=False, default=utcnow)
+    claim = db.Column(db.String(32), nullable=True)  # batch token of the worker holding it
+    last_error = db.Column(db.String(500), nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=utcnow)
+    sent_at = db.Column(db.DateTime, nullable=True)
+
+
+# Normalized identity keys. One registration per email and per student ID per
+# event, enforced by the unique indexes below (migration 6 builds them on old
+# databases); blanks normalize to NULL and never collide.
+EMAIL_KEY = func.nullif(func.lower(func.trim(Registration.email)), '')
+STUDENT_ID_KEY = func.nullif(func.upper(func.trim(Registration.student_id)), '')
+db.Index('uq_registration_event_email_key', Registration.event_id, EMAIL_KEY, unique=True)
+db.Index('uq_registration_event_student_key', Registration.event_id, STUDENT_ID_KEY, unique=True)
+
+
+def normalize_email(value):
+    """Python twin of EMAIL_KEY."""
+    return (value or '').strip().lower() or None
+
+
+# One address, no whitespace (so no header injection through a CR/LF)
+EMAIL_PATTERN = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+
+
+def is_valid_email(value):
+    return bool(value) and EMAIL_PATTERN.fullmatch(value) is not None
+
+
+def normalize_student_id(value):
+    """Python twin of STUDENT_ID_KEY."""
+    return (value or '').strip().upper() or None
+
+
+def data_version(event_id=None):
+    """Version string for one event's data, or a digest over every event.
+
+    Built from Event.data_version, which every write route bumps, so it
+    changes whenever anything an export or a rendered page shows changes.
+    Returns None for an unknown event.
+    """
+    if event_id is not None:
+        version = db.session.query(Event.data_version).filter_by(id=event_id).scalar()
+        return None if version is None else str(version)
+    digest = hashlib.sha1()
+    for row in db.session.query(Event.id, Event.data_version).order_by(Event.id):
+        digest.update(f"{row.id}:{row.data_version};".encode())
+    return digest.hexdigest()[:12]
@@ -0,0 +1,69 @@
+"""Hand file downloads to the front proxy instead of streaming them from Python.
+
+Static files (hashed and precompressed ones included) and finished export
+artifacts are sent with ``send_file``/``send_from_directory``. With offload
+on, the response carries only headers and the proxy reads the file itself,
+so a web worker is never tied up pushing bytes.
+
+``SENDFILE_MODE`` (app.config, falling back to the environment):
+
+``''``          default; Python streams the file
+``x-sendfile``  ``X-Sendfile: /abs/path`` for Apache mod_xsendfile or
+                lighttpd (Flask's ``USE_X_SENDFILE``)
+``x-accel``     ``X-Accel-Redirect: /internal/uri`` for nginx. Paths are
+                mapped through ``X_ACCEL_LOCATIONS``, comma-separated
+                ``directory=/uri-prefix/`` pairs. The default maps
+                ``static/`` to ``/_static/``, the export directory to
+                ``/_exports/`` and uploaded event images to ``/_media/``.
+                Each prefix needs an ``internal`` nginx location aliased
+                to its directory, e.g.
+                ``location /_static/ { internal; alias /srv/enactus/static/; }``.
+
+A file outside every mapped directory is streamed by Python as usual.
+"""
+import os
+
+from flask import request
+from werkzeug.wsgi import wrap_file
+
+MODES = ('', 'x-sendfile', 'x-accel')
+
+
+def init_app(app):
+    mode = (app.config.get('SENDFILE_MODE') or os.environ.get('SENDFILE_MODE', '')).lower()
+    if mode not in MODES:
+        raise ValueError(f"SENDFILE_MODE must be one of {', '.join(repr(m) for m in MODES)}")
+    app.extensions['offload'] = mode
+    if not mode:
+        return
+    # Both modes start from Flask's X-Sendfile response: headers only, no body
+    app.config['USE_X_SENDFILE'] = True
+    if mode == 'x-sendfile':
+        return
+
+    locations = app.config.get('X_ACCEL_LOCATIONS') or os.environ.get('X_ACCEL_LOCATIONS')
+    if locations:
+        pairs = [item.split('=', 1) for item in locations.split(',') if item.strip()]
+    else:
+        export_dir = app.config.get('EXPORT_DIR') or os.environ.get(
+            'EXPORT_DIR', os.path.join(app.root_path, 'export_cache'))
+        image_dir = app.config.get('IMAGE_DIR') or os.environ.get(
+            'IMAGE_DIR', os.path.join(app.root_path, 'uploads', 'events'))
+        pairs = [(app.static_folder, '/_static/'), (export_dir, '/_exports/'), (image_dir, '/_media/')]
+    prefixes = [(os.path.abspath(directory.strip()) + os.sep, uri.strip().rstrip('/') + '/')
+                for directory, uri in pairs]
+
+    @app.after_request
+    def x_accel_redirect(response):
+        path = response.headers.get('X-Sendfile')
+        if path is None:
+            return response
+        del response.headers['X-Sendfile']
+        for directory, uri in prefixes:
+            if path.startswith(directory):
+                response.headers['X-Accel-Redirect'] = uri + path[len(directory):].replace(os.sep, '/')
+                return response
+        # Not under a proxy location: send the body ourselves after all
+        response.response = wrap_file(request.environ, open(path, 'rb'))
+        response.direct_passthrough = True
+        return response
@@ -0,0 +1,265 @@
+"""Transactional email outbox.
+
+Request handlers never talk to SMTP. They call ``outbox.enqueue(...)``,
+which only adds an ``OutboxEmail`` row to the current session, so the email
+is committed (or rolled back) together with the registration it confirms. A
+scheduler job (``deliver``) then drains due rows in batches over one SMTP
+connection, kept open while there is work and closed once the queue is
+empty.
+
+Row states: ``pending`` -> ``sending`` (claimed by one worker's batch, with a
+lease) -> ``sent``, or back to ``pending`` with exponential backoff after a
+temporary failure, or ``failed`` after a permanent (5xx) refusal or
+``OUTBOX_MAX_ATTEMPTS`` tries. A worker that dies mid-batch leaves its rows
+``sending``; they become due again when the lease runs out, and keep their
+Message-ID so a duplicate can be recognised.
+
+Configuration (app.config, falling back to the environment). Nothing is
+queued while ``SMTP_HOST`` is unset.
+
+``SMTP_HOST`` / ``SMTP_PORT``      mail server (port default 587)
+``SMTP_SECURITY``                  ``starttls`` (default), ``ssl`` or ``none``
+``SMTP_USER`` / ``SMTP_PASSWORD``  login, if the server wants one
+``SMTP_TIMEOUT``                   socket timeout in seconds (default 30)
+``MAIL_FROM``                      sender address (default ``SMTP_USER``)
+``OUTBOX_BATCH``                   messages claimed per batch (default 50)
+``OUTBOX_INTERVAL``                seconds between queue polls (default 5)
+``OUTBOX_MAX_ATTEMPTS``            tries before giving up (default 8)
+``OUTBOX_RETENTION_DAYS``          sent rows kept this long (default 14)
+"""
+import datetime
+import os
+import random
+import smtplib
+import threading
+import uuid
+from email.message import EmailMessage
+from email.utils import formatdate
+
+from sqlalchemy import delete, func, select, update
+
+from metrics import Histogram
+from models import db, OutboxEmail, is_valid_email, utcnow
+
+LEASE = datetime.timedelta(minutes=5)
+BACKOFF_BASE = 30  # seconds before the first retry, doubled per attempt
+BACKOFF_MAX = 3600
+DELIVERY_BUCKETS = (1.0, 5.0, 15.0, 60.0, 300.0, 900.0, 3600.0, 21600.0)
+
+
+class Outbox:
+
+    def __init__(self, app=None):
+        self._smtp = None
+        self._lock = threading.Lock()
+        self.sent = 0
+        self.retried = 0
+        self.delivery_seconds = Histogram(DELIVERY_BUCKETS)
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        def setting(name, default=None):
+            return app.config.get(name) or os.environ.get(name, default)
+
+        self.host = setting('SMTP_HOST')
+        self.port = int(setting('SMTP_PORT', 587))
+        self.security = setting('SMTP_SECURITY', 'starttls').lower()
+        self.user = setting('SMTP_USER')
+        self.password = setting('SMTP_PASSWORD')
+        self.timeout = float(setting('SMTP_TIMEOUT', 30))
+        self.sender = setting('MAIL_FROM') or self.user
+        self.batch_size = int(setting('OUTBOX_BATCH', 50))
+        self.interval = float(setting('OUTBOX_INTERVAL', 5))
+        self.max_attempts = int(setting('OUTBOX_MAX_ATTEMPTS', 8))
+        self.retention = datetime.timedelta(days=float(setting('OUTBOX_RETENTION_DAYS', 14)))
+        if self.security not in ('starttls', 'ssl', 'none'):
+            raise ValueError("SMTP_SECURITY must be one of 'starttls', 'ssl', 'none'")
+        app.extensions['outbox'] = self
+
+    @property
+    def enabled(self):
+        return bool(self.host)
+
+    # --- producer ---
+
+    def enqueue(self, recipient, subject, body):
+        """Add an email to the caller's transaction; it is sent only if that commits."""
+        if not self.enabled or not is_valid_email(recipient):
+            return None
+        message = OutboxEmail(recipient=recipient, subject=subject, body=body)
+        db.session.add(message)
+        return message
+
+    # --- worker ---
+
+    def deliver(self):
+        """Send every due message, batch by batch; returns (sent, retried, failed)."""
+        totals = [0, 0, 0]
+        with self._lock:
+            try:
+                while True:
+                    batch = self._claim()
+                    reachable = True
+                    if batch:
+                        *counts, reachable = self._send(batch)
+                        totals = [total + count for total, count in zip(totals, counts)]
+                    if len(batch) < self.batch_size or not reachable:
+                        break
+            finally:
+                # Queue drained (or we failed): don't hold the server's connection open
+                self._disconnect()
+        return tuple(totals)
+
+    def prune(self):
+        """Delete sent messages older than OUTBOX_RETENTION_DAYS."""
+        result = db.session.execute(
+            delete(OutboxEmail)
+            .where(OutboxEmail.status == 'sent', OutboxEmail.sent_at < utcnow() - self.retention)
+        )
+        db.session.commit()
+        return result.rowcount
+
+    def _claim(self):
+        now = utcnow()
+        token = uuid.uuid4().hex
+        due = (OutboxEmail.status.in_(('pending', 'sending')), OutboxEmail.next_attempt_at <= now)
+        # One conditional UPDATE claims the batch, so concurrent workers never share a row
+        db.session.execute(
+            update(OutboxEmail)
+            .where(OutboxEmail.id.in_(
+                select(OutboxEmail.id).where(*due).order_by(OutboxEmail.id).limit(self.batch_size)
+                .scalar_subquery()), *due)
+            .values(status='sending', claim=token, next_attempt_at=now + LEASE)
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        return OutboxEmail.query.filter_by(claim=token).order_by(OutboxEmail.id).all()
+
+    def _send(self, batch):
+        """Send one claimed batch; returns (sent, retried, failed, server reachable)."""
+        sent = retried = failed = 0
+        reachable = True
+        try:
+            for position, message in enumerate(batch):
+                try:
+                    email = self._build(message)
+                except Exception as e:
+                    # e.g. a line break in a header: no retry will ever build it
+                    self._retry(message, e, permanent=True)
+                    failed += 1
+                    continue
+                try:
+                    smtp = self._connection()
+                except OSError as e:
+                    # Server down: back off the rest of the batch rather than dialling per message
+                    reachable = False
+                    for unsent in batch[position:]:
+                        if self._retry(unsent, e):
+                            retried += 1
+                        else:
+                            failed += 1
+                    break
+                try:
+                    smtp.send_message(email)
+                except Exception as e:
+                    code = _smtp_code(e)
+                    # Anything but a socket/SMTP error is about the message itself
+                    permanent = not isinstance(e, OSError) or (code is not None and code >= 500)
+                    if isinstance(e, OSError) and not permanent:
+                        # Dropped or unhappy connection: reconnect for the next message
+                        self._disconnect()
+                    if self._retry(message, e, permanent):
+                        retried += 1
+                    else:
+                        failed += 1
+                else:
+                    message.status = 'sent'
+                    message.sent_at = utcnow()
+                    message.claim = None
+                    self.delivery_seconds.observe((message.sent_at - message.created_at).total_seconds())
+                    sent += 1
+        finally:
+            # Record what happened even if something unexpected escapes, so sent
+            # mail isn't sent again when the lease runs out
+            db.session.commit()
+            self.sent += sent
+            self.retried += retried
+        return sent, retried, failed, reachable
+
+    def _retry(self, message, error, permanent=False):
+        """Record a failed attempt; returns True if the message will be tried again."""
+        message.attempts += 1
+        message.last_error = str(error)[:500]
+        message.claim = None
+        if permanent or message.attempts >= self.max_attempts:
+            message.status = 'failed'
+            print(f"Outbox: giving up on message {message.id} to {message.recipient!r}: {error}")
+            return False
+        delay = min(BACKOFF_BASE * 2 ** (message.attempts - 1), BACKOFF_MAX)
+        message.status = 'pending'
+        message.next_attempt_at = utcnow() + datetime.timedelta(seconds=delay * random.uniform(0.5, 1.0))
+        return True
+
+    def _build(self, message):
+        email = EmailMessage()
+        email['From'] = self.sender
+        email['To'] = message.recipient
+        email['Subject'] = message.subject
+        email['Date'] = formatdate(localtime=True)
+        # Stable across retries, so a resend after a lost lease is recognisable
+        domain = (self.sender or 'localhost').rpartition('@')[2] or 'localhost'
+        email['Message-ID'] = f"<outbox-{message.id}@{domain}>"
+        email.set_content(message.body)
+        return email
+
+    # --- SMTP connection ---
+
+    def _connection(self):
+        if self._smtp is None:
+            if self.security == 'ssl':
+                smtp = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout)
+            else:
+                smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+                if self.security == 'starttls':
+                    smtp.starttls()
+            if self.user:
+                smtp.login(self.user, self.password or '')
+            self._smtp = smtp
+        return self._smtp
+
+    def _disconnect(self):
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._smtp = None
+
+    # --- metrics ---
+
+    def collect(self):
+        """Samples for the /metrics endpoint (see metrics.Metrics.add_collector)."""
+        counts = dict(db.session.query(OutboxEmail.status, func.count()).group_by(OutboxEmail.status).all())
+        oldest = db.session.query(func.min(OutboxEmail.created_at)).filter(
+            OutboxEmail.status.in_(('pending', 'sending'))).scalar()
+        age = (utcnow() - oldest).total_seconds() if oldest else 0
+        return [
+            ('enactus_outbox_pending', 'gauge', 'Emails waiting to be sent (including retries).',
+             counts.get('pending', 0) + counts.get('sending', 0)),
+            ('enactus_outbox_failed', 'gauge', 'Emails given up on.', counts.get('failed', 0)),
+            ('enactus_outbox_oldest_pending_seconds', 'gauge', 'Age of the oldest unsent email.', round(age, 3)),
+            ('enactus_outbox_sent_total', 'counter', 'Emails sent by this process.', self.sent),
+            ('enactus_outbox_retries_total', 'counter', 'Failed attempts that will be retried.', self.retried),
+            ('enactus_outbox_delivery_seconds', 'histogram', 'Time from queueing to sending, per email.',
+             self.delivery_seconds),
+        ]
+
+
+def _smtp_code(error):
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return min((code for code, _ in error.recipients.values()), default=None)
+    return getattr(error, 'smtp_code', None)
+
+
+outbox = Outbox()
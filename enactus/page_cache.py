@@ -0,0 +1,133 @@
+"""Server-side cache of rendered public pages.
+
+Views decorated with ``page_cache.cached(...)`` render once and are then
+served from an in-process LRU with a TTL. Every response carries a strong
+ETag (a hash of the body), and a matching ``If-None-Match`` gets a bodiless
+304.
+
+Entries belong to a tag. Write routes call ``page_cache.invalidate(tag)``
+after they commit to drop everything under that tag. A view may also pass a
+``version`` function (e.g. ``models.data_version``) whose value becomes part
+of the key, so workers that did not see the write still miss instead of
+serving a stale page.
+
+Requests carrying flashed messages bypass the cache, since those pages are
+personal.
+
+Configuration: ``PAGE_CACHE_SIZE`` (entries, default 128) and
+``PAGE_CACHE_TTL`` (seconds, default 3600), from app.config or the
+environment.
+"""
+import functools
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from flask import request, session, make_response
+
+
+class PageCache:
+
+    def __init__(self, app=None):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.max_entries = 128
+        self.ttl = 3600
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.max_entries = int(app.config.get('PAGE_CACHE_SIZE') or os.environ.get('PAGE_CACHE_SIZE', 128))
+        self.ttl = float(app.config.get('PAGE_CACHE_TTL') or os.environ.get('PAGE_CACHE_TTL', 3600))
+        app.extensions['page_cache'] = self
+
+    # --- storage ---
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry['expires'] < time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+    def _set(self, key, tag, body):
+        entry = {
+            'tag': tag,
+            'body': body,
+            'etag': hashlib.sha1(body).hexdigest(),
+            'expires': time.monotonic() + self.ttl,
+        }
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, tag=None):
+        """Drop every entry under ``tag`` (or everything when tag is None)."""
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if tag is None or entry['tag'] == tag]:
+                del self._entries[key]
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'not_modified': self.not_modified,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def collect(self):
+        """Samples for the /metrics endpoint (see metrics.Metrics.add_collector)."""
+        stats = self.stats()
+        return [
+            ('enactus_page_cache_entries', 'gauge', 'Rendered pages held in the cache.', stats['entries']),
+            ('enactus_page_cache_hits_total', 'counter', 'Page cache hits.', stats['hits']),
+            ('enactus_page_cache_misses_total', 'counter', 'Page cache misses.', stats['misses']),
+            ('enactus_page_cache_not_modified_total', 'counter', 'Cached pages answered with 304.', stats['not_modified']),
+        ]
+
+    # --- view decorator ---
+
+    def cached(self, tag='static', version=None):
+        def decorator(view):
+            @functools.wraps(view)
+            def wrapper(*args, **kwargs):
+                if request.method != 'GET' or session.get('_flashes'):
+                    return view(*args, **kwargs)
+
+                key = (request.full_path, version() if version else None)
+                entry = self._get(key)
+                if entry is None:
+                    response = make_response(view(*args, **kwargs))
+                    if response.status_code != 200 or session.get('_flashes'):
+                        return response
+                    entry = self._set(key, tag, response.get_data())
+
+                response = make_response(entry['body'])
+                response.set_etag(entry['etag'])
+                # Revalidate every time; unchanged pages cost a bodiless 304
+                response.headers['Cache-Control'] = 'no-cache'
+                response.make_conditional(request)
+                if response.status_code == 304:
+                    self.not_modified += 1
+                return response
+            return wrapper
+        return decorator
+
+
+page_cache = PageCache()
@@ -0,0 +1,166 @@
+"""Replace named marker blocks in templates with snippet files.
+
+A template opts in by wrapping a region in Jinja comment markers, which
+render to nothing:
+
+    {# patch:dotted_map #}
+    ...replaced content...
+    {# endpatch:dotted_map #}
+
+The body of each block is replaced with ``template_patches/<name>.html``.
+Every template under ``templates/`` is scanned in one pass, each snippet is
+read once however many templates use it, and a template is only rewritten
+when its content hash changes. Writes go to a temp file in the same
+directory followed by ``os.replace``, so an interrupted run never leaves a
+half-written template. Running it twice changes nothing the second time.
+
+Run from anywhere as part of a deploy, after the asset/map builds:
+
+    python patch_templates.py              # apply every snippet
+    python patch_templates.py dotted_map   # only the named blocks
+    python patch_templates.py --check      # exit 1 if anything is stale
+"""
+import argparse
+import hashlib
+import os
+import re
+import sys
+import tempfile
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATES_DIR = os.path.join(BASE_DIR, 'templates')
+PATCHES_DIR = os.path.join(BASE_DIR, 'template_patches')
+TEMPLATE_EXTENSIONS = ('.html',)
+
+_BLOCK = re.compile(
+    r'(?P<begin>\{#\s*patch:(?P<name>[\w-]+)\s*#\}[^\n]*\n)'
+    r'(?P<body>.*?)'
+    r'(?P<end>^[ \t]*\{#\s*endpatch:(?P=name)\s*#\})',
+    re.S | re.M,
+)
+_BEGIN = re.compile(r'\{#\s*patch:([\w-]+)\s*#\}')
+
+
+class PatchError(Exception):
+    pass
+
+
+def load_patches(patches_dir=PATCHES_DIR, names=None):
+    """Map block name -> snippet text for every (or every named) snippet file."""
+    patches = {}
+    if os.path.isdir(patches_dir):
+        for filename in sorted(os.listdir(patches_dir)):
+            name, ext = os.path.splitext(filename)
+            if ext in TEMPLATE_EXTENSIONS and (not names or name in names):
+                with open(os.path.join(patches_dir, filename), encoding='utf-8') as f:
+                    body = f.read()
+                patches[name] = body if body.endswith('\n') else body + '\n'
+    missing = set(names or ()) - set(patches)
+    if missing:
+        raise PatchError(f"No snippet for: {', '.join(sorted(missing))}")
+    return patches
+
+
+def apply_patches(text, patches):
+    """Return (new_text, names of blocks replaced). Raises on unterminated blocks."""
+    applied = []
+
+    def replace(match):
+        name = match.group('name')
+        if name not in patches:
+            return match.group(0)
+        applied.append(name)
+        return match.group('begin') + patches[name] + match.group('end')
+
+    new_text = _BLOCK.sub(replace, text)
+    opened = _BEGIN.findall(text)
+    closed = [m.group('name') for m in _BLOCK.finditer(text)]
+    unterminated = sorted(set(opened) - set(closed))
+    if len(opened) != len(closed) or unterminated:
+        raise PatchError(f"unterminated block(s): {', '.join(unterminated) or 'duplicate begin marker'}")
+    return new_text, applied
+
+
+def write_atomic(path, text):
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _digest(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def patch_templates(templates_dir=TEMPLATES_DIR, patches=None, dry_run=False):
+    """Patch every template in one pass. Returns {'changed': [...], 'unchanged': [...], 'errors': [...], 'used': set}."""
+    result = {'changed': [], 'unchanged': [], 'errors': [], 'used': set()}
+    for root, dirs, files in os.walk(templates_dir):
+        dirs.sort()
+        for filename in sorted(files):
+            if not filename.endswith(TEMPLATE_EXTENSIONS):
+                continue
+            path = os.path.join(root, filename)
+            relative = os.path.relpath(path, templates_dir)
+            with open(path, encoding='utf-8', newline='') as f:
+                text = f.read()
+            if 'patch:' not in text:
+                continue
+            try:
+                new_text, applied = apply_patches(text, patches)
+            except PatchError as e:
+                result['errors'].append(f"{relative}: {e}")
+                continue
+            result['used'].update(applied)
+            if not applied:
+                continue
+            if _digest(new_text) == _digest(text):
+                result['unchanged'].append(relative)
+                continue
+            if not dry_run:
+                write_atomic(path, new_text)
+            result['changed'].append(relative)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replace {# patch:NAME #} blocks in templates with snippet files.")
+    parser.add_argument('names', nargs='*', help='only apply these snippets (default: all)')
+    parser.add_argument('--templates', default=TEMPLATES_DIR)
+    parser.add_argument('--patches', default=PATCHES_DIR)
+    parser.add_argument('--check', action='store_true', help="don't write; exit 1 if any template would change")
+    args = parser.parse_args()
+
+    try:
+        patches = load_patches(args.patches, args.names)
+    except PatchError as e:
+        print(e)
+        return 1
+
+    result = patch_templates(args.templates, patches, dry_run=args.check)
+    verb = 'Would update' if args.check else 'Updated'
+    for relative in result['changed']:
+        print(f"{verb} {relative}")
+    for relative in result['unchanged']:
+        print(f"Unchanged {relative}")
+    for error in result['errors']:
+        print(f"Error in {error}")
+    for name in sorted(set(patches) - result['used']):
+        print(f"Note: no template has a '{name}' block")
+
+    if result['errors'] or (args.check and result['changed']):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,276 @@
+"""Per-client rate limiting and admission control for the write routes.
+
+Two guards, both answering ``429 Too Many Requests`` with ``Retry-After``
+straight away instead of letting work pile up behind the SQLite writer:
+
+``@limiter.limit('20/minute')``
+    Token bucket per client IP and route: up to N requests at once, refilled
+    at N per period. Only the listed methods (POST by default) spend tokens,
+    so a login form can still be viewed. ``RATELIMIT_<ENDPOINT>`` (e.g.
+    ``RATELIMIT_REGISTER_EVENT=60/minute``) overrides a route's default.
+
+``@limiter.admit``
+    A process-wide cap of ``WRITE_CONCURRENCY`` write requests in flight
+    across every decorated route. A request over the cap is shed at once,
+    since queueing it would only hold a server thread that readers need.
+
+Buckets live in a backend chosen by ``RATELIMIT_STORAGE``:
+
+``memory://`` (default)    this process only; with N gunicorn workers a
+                           client effectively gets N buckets
+``sqlite:////path/file``   shared by every worker on the host, through a
+                           small SQLite file separate from the app database
+``redis://host:6379/0``    shared across hosts (needs the ``redis`` package)
+
+Browsers submitting a form get the 429 as a page that flashes the message
+and sends them straight back where they came from; other callers get it as
+plain text.
+
+A backend error lets the request through; rate limiting never takes the
+site down. Behind a reverse proxy set ``TRUSTED_PROXIES`` (see
+``app.create_app``; it defaults to one hop when ``SENDFILE_MODE`` is set) so
+the client IP comes from ``X-Forwarded-For``; otherwise every visitor shares
+the proxy's bucket.
+
+Other configuration (app.config, falling back to the environment):
+``RATELIMIT_ENABLED`` (``0`` turns both guards off) and
+``WRITE_CONCURRENCY`` (default 4 per process).
+"""
+import functools
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from flask import Response, flash, request
+from markupsafe import escape
+
+try:
+    import redis
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+PERIODS = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
+
+
+def parse_limit(spec):
+    """'20/minute' -> (refill rate in tokens per second, burst)."""
+    count, _, period = spec.partition('/')
+    count, period = int(count), period.strip().lower().rstrip('s')
+    if count < 1 or period not in PERIODS:
+        raise ValueError(f"Bad rate limit {spec!r}; expected e.g. '20/minute'")
+    return count / PERIODS[period], count
+
+
+def _refill(tokens, updated, now, rate, burst):
+    """Token bucket step: returns (tokens left, seconds to wait; 0 if allowed)."""
+    tokens = min(burst, tokens + (now - updated) * rate)
+    if tokens >= 1:
+        return tokens - 1, 0.0
+    return tokens, (1 - tokens) / rate
+
+
+# --- backends: take(key, rate, burst) -> seconds to wait, 0 if allowed ---
+
+class MemoryBackend:
+
+    def __init__(self, max_keys=100000):
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_keys = max_keys
+
+    def take(self, key, rate, burst):
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (burst, now))
+            tokens, wait = _refill(tokens, updated, now, rate, burst)
+            self._buckets[key] = (tokens, now)
+            # Least recently seen clients go first; a dropped bucket was close to full anyway
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return wait
+
+
+class SqliteBackend:
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._calls = 0
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS bucket "
+                         "(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)")
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA synchronous=OFF")
+            self._local.conn = conn
+        return conn
+
+    def take(self, key, rate, burst):
+        conn = self._connect()
+        now = time.time()
+        # IMMEDIATE takes the write lock up front, so two workers can't both spend the last token
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT tokens, updated FROM bucket WHERE key = ?", (key,)).fetchone()
+            tokens, wait = _refill(*(row or (burst, now)), now, rate, burst)
+            conn.execute("INSERT OR REPLACE INTO bucket (key, tokens, updated) VALUES (?, ?, ?)", (key, tokens, now))
+            self._calls += 1
+            if self._calls % 1000 == 0:
+                conn.execute("DELETE FROM bucket WHERE updated < ?", (now - 86400,))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return wait
+
+
+class RedisBackend:
+
+    # Same arithmetic as _refill, atomic on the server; the key expires once it would be full again
+    SCRIPT = """
+    local rate, burst, now = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+    local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+    local tokens = tonumber(state[1]) or burst
+    local updated = tonumber(state[2]) or now
+    tokens = math.min(burst, tokens + (now - updated) * rate)
+    local wait = 0
+    if tokens >= 1 then tokens = tokens - 1 else wait = (1 - tokens) / rate end
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+    redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+    return tostring(wait)
+    """
+
+    def __init__(self, url):
+        if not HAS_REDIS:
+            raise RuntimeError("RATELIMIT_STORAGE is redis:// but the redis package is not installed")
+        self._client = redis.Redis.from_url(url)
+        self._script = self._client.register_script(self.SCRIPT)
+
+    def take(self, key, rate, burst):
+        return float(self._script(keys=[f'enactus:ratelimit:{key}'], args=[rate, burst, time.time()]))
+
+
+def make_backend(url):
+    if url.startswith('memory://'):
+        return MemoryBackend()
+    if url.startswith('sqlite:///'):
+        return SqliteBackend(url[len('sqlite:///'):])
+    if url.startswith(('redis://', 'rediss://', 'unix://')):
+        return RedisBackend(url)
+    raise ValueError(f"Unsupported RATELIMIT_STORAGE: {url}")
+
+
+def too_many_requests(retry_after, message):
+    if request.accept_mimetypes.best in ('text/html', 'application/xhtml+xml'):
+        # A browser form post: show the message on the page it came from
+        flash(message, 'error')
+        referrer = request.referrer or ''
+        back = escape(referrer if referrer.startswith(request.host_url) else '/')
+        response = Response(
+            f'<!doctype html><meta http-equiv="refresh" content="0;url={back}">'
+            f'<p>{escape(message)} <a href="{back}">Go back</a></p>\n',
+            status=429, mimetype='text/html')
+    else:
+        response = Response(message + "\n", status=429, mimetype='text/plain')
+    response.headers['Retry-After'] = str(max(int(math.ceil(retry_after)), 1))
+    return response
+
+
+class Limiter:
+
+    def __init__(self, app=None):
+        self._defaults = {}
+        self._limits = {}
+        self.enabled = True
+        self.backend = MemoryBackend()
+        self.write_concurrency = 4
+        self._slots = threading.BoundedSemaphore(self.write_concurrency)
+        self._lock = threading.Lock()
+        self.inflight = 0
+        self.limited = 0
+        self.shed = 0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        def setting(name, default=None):
+            return app.config.get(name) or os.environ.get(name, default)
+
+        enabled = app.config.get('RATELIMIT_ENABLED', os.environ.get('RATELIMIT_ENABLED', '1'))
+        self.enabled = str(enabled).lower() not in ('0', 'false', 'no', 'off')
+        self.backend = make_backend(setting('RATELIMIT_STORAGE', 'memory://'))
+        self.write_concurrency = int(setting('WRITE_CONCURRENCY', 4))
+        self._slots = threading.BoundedSemaphore(self.write_concurrency)
+        # Routes are decorated at import time, before this runs
+        self._limits = {name: parse_limit(setting(f'RATELIMIT_{name.upper()}', spec))
+                        for name, spec in self._defaults.items()}
+        app.extensions['limiter'] = self
+
+    # --- decorators ---
+
+    def limit(self, spec, methods=('POST',)):
+        """Token bucket per client IP for this route; ``spec`` like '20/minute'."""
+        parse_limit(spec)
+
+        def decorator(view):
+            name = view.__name__
+            self._defaults[name] = spec
+
+            @functools.wraps(view)
+            def wrapper(*args, **kwargs):
+                if self.enabled and request.method in methods:
+                    rate, burst = self._limits.get(name) or parse_limit(spec)
+                    try:
+                        wait = self.backend.take(f'{name}:{request.remote_addr}', rate, burst)
+                    except Exception as e:
+                        print(f"Rate limit backend error, allowing request: {e}")
+                        wait = 0
+                    if wait:
+                        with self._lock:
+                            self.limited += 1
+                        return too_many_requests(wait, "Too many attempts. Please wait a moment and try again.")
+                return view(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def admit(self, view):
+        """Shed write requests beyond WRITE_CONCURRENCY in flight in this process."""
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            if not self.enabled or request.method in ('GET', 'HEAD'):
+                return view(*args, **kwargs)
+            slots = self._slots
+            if not slots.acquire(blocking=False):
+                with self._lock:
+                    self.shed += 1
+                return too_many_requests(1, "We're handling a lot of requests right now. Please try again in a moment.")
+            with self._lock:
+                self.inflight += 1
+            try:
+                return view(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.inflight -= 1
+                slots.release()
+        return wrapper
+
+    # --- metrics ---
+
+    def collect(self):
+        """Samples for the /metrics endpoint (see metrics.Metrics.add_collector)."""
+        return [
+            ('enactus_rate_limited_total', 'counter', 'Requests refused by a per-client rate limit.', self.limited),
+            ('enactus_write_shed_total', 'counter', 'Write requests shed at the concurrency cap.', self.shed),
+            ('enactus_write_inflight', 'gauge', 'Write requests in progress in this process.', self.inflight),
+        ]
+
+
+limiter = Limiter()
@@ -0,0 +1,80 @@
+"""Periodic jobs run by a daemon thread inside each web process.
+
+Jobs are plain functions registered with ``scheduler.add_job(fn, interval)``;
+each runs inside an app context, first when the thread starts and then every
+``interval`` seconds. A job that raises is logged and retried on its next
+turn. Under several worker processes every worker runs every job, so jobs
+must be safe to run concurrently (a conditional UPDATE is).
+
+The thread is started explicitly by the servers (``wsgi.py`` and the
+development server), never by ``create_app()``, so maintenance commands and
+benchmarks don't run jobs behind their back.
+
+Configuration (app.config, falling back to the environment):
+
+``SCHEDULER_ENABLED``   ``0`` leaves the thread off, e.g. when cron runs
+                        ``python maintenance.py archive`` instead (default 1)
+``SCHEDULER_INTERVAL``  default seconds between runs of a job (default 300)
+"""
+import os
+import threading
+import time
+
+from models import db
+
+
+class Scheduler:
+
+    def __init__(self, app=None):
+        self._jobs = []
+        self._thread = None
+        self._stop = threading.Event()
+        self.enabled = True
+        self.interval = 300
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        self.enabled = str(app.config.get('SCHEDULER_ENABLED', os.environ.get('SCHEDULER_ENABLED', '1'))) != '0'
+        self.interval = float(app.config.get('SCHEDULER_INTERVAL') or os.environ.get('SCHEDULER_INTERVAL', 300))
+        app.extensions['scheduler'] = self
+
+    def add_job(self, fn, interval=None):
+        """Run ``fn()`` every ``interval`` seconds (default ``SCHEDULER_INTERVAL``)."""
+        self._jobs.append({'fn': fn, 'interval': interval, 'due': 0.0})
+
+    def start(self):
+        """Start the thread once per process; no-op when disabled or already running."""
+        if not self.enabled or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name='scheduler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def run_pending(self):
+        """Run every job that is due; returns seconds until the next one is."""
+        now = time.monotonic()
+        for job in self._jobs:
+            if job['due'] <= now:
+                self._run(job['fn'])
+                job['due'] = time.monotonic() + (job['interval'] or self.interval)
+        return max(min((job['due'] for job in self._jobs), default=now + self.interval) - time.monotonic(), 0)
+
+    def _run(self, fn):
+        with self.app.app_context():
+            try:
+                fn()
+            except Exception as e:
+                db.session.rollback()
+                print(f"Scheduled job {fn.__name__} failed: {e}")
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self._stop.wait(self.run_pending())
+
+
+scheduler = Scheduler()
@@ -0,0 +1 @@
+window.WORLD_LAND_GRID = [{"cols":80,"rows":40,"runs":[421,3,4,5,66,16,23,1,36,1,2,1,1,2,1,11,7,2,16,2,30,2,2,3,1,2,2,10,19,1,7,2,29,2,3,2,1,1,6,8,16,1,5,8,19,2,9,2,1,1,1,4,3,6,11,2,8,20,9,18,2,3,1,5,3,1,6,4,1,1,1,5,1,25,3,16,3,1,1,1,3,2,10,3,1,34,6,1,4,10,3,4,16,1,2,25,4,1,16,10,1,5,10,34,21,13,14,8,1,2,1,19,22,11,14,2,3,8,1,17,2,1,22,9,15,5,5,19,28,4,18,14,2,14,30,4,3,2,11,12,1,3,3,3,2,4,36,1,1,3,11,15,5,1,5,1,3,1,35,6,13,8,12,1,2,2,35,10,11,6,22,2,30,9,11,6,2,1,16,3,34,6,12,5,2,1,15,8,30,5,15,3,19,8,30,4,43,3,30,2,52,1,24,2,241,1,77,2,21,1,1,7,2,16,24,1,5,1,1,1,10,42,10,17,10,41,9,18,9,44,11,15,6,2,3,42,11,19,5,46,10,72,3,80]},{"cols":120,"rows":60,"runs":[990,7,6,7,98,8,1,16,91,1,1,8,1,16,12,3,10,1,10,2,51,1,2,3,1,1,1,4,1,16,11,3,26,2,46,1,2,1,4,1,1,4,2,17,11,1,27,2,48,2,2,1,1,5,7,12,25,2,9,8,8,2,1,1,30,4,2,1,1,1,1,1,1,4,7,10,26,1,4,1,3,12,1,2,26,1,12,5,3,1,1,6,6,10,15,1,9,1,3,28,1,1,7,1,5,19,5,2,1,1,3,2,5,8,14,8,1,1,3,4,1,1,1,35,5,27,4,2,1,1,3,5,4,3,9,8,2,45,1,3,3,24,7,2,5,3,16,3,1,52,7,5,1,17,6,2,8,1,16,4,4,41,3,1,1,1,10,1,7,16,4,5,18,1,4,3,1,39,6,2,10,1,12,16,1,8,15,1,1,1,2,46,4,1,25,20,1,1,1,1,18,48,31,21,20,10,1,1,1,3,2,28,33,18,20,4,3,2,1,3,1,2,1,3,1,25,37,15,23,2,2,2,3,1,1,8,1,23,1,1,3,1,34,13,23,8,2,1,4,29,41,1,1,4,5,1,22,21,1,22,45,3,4,2,21,25,3,15,2,1,46,4,24,18,2,4,6,3,4,4,4,1,50,2,3,1,18,20,2,1,8,1,6,1,1,2,58,7,15,4,1,15,10,1,6,1,4,1,54,10,19,12,18,2,2,5,51,15,16,10,21,1,10,3,45,14,17,9,36,1,45,11,17,10,2,1,25,4,2,1,48,10,18,7,3,2,22,11,5,1,41,7,21,6,27,14,45,6,23,4,29,13,44,5,65,5,7,1,37,4,116,3,77,2,37,3,118,1,482,1,118,1,35,10,3,23,45,1,1,3,22,6,1,14,1,31,31,1,3,1,5,1,1,2,16,62,17,9,3,13,14,62,16,25,14,64,14,25,1,1,8,1,4,67,11,1,4,23,9,2,4,64,17,26,12,65,16,30,3,2,1,69,15,108,5,4,5,110,1,120]},{"cols":160,"rows":80,"runs":[1659,6,134,11,4,1,1,11,130,10,3,17,1,3,124,2,2,1,2,4,1,21,28,2,4,1,13,2,77,9,4,20,13,3,1,2,30,3,71,2,1,1,1,7,2,22,16,3,34,2,62,2,8,1,3,4,3,23,14,2,36,2,62,4,1,1,1,3,2,1,3,1,9,17,35,3,12,9,10,3,43,2,28,16,32,2,12,11,56,3,1,2,2,1,1,5,1,6,9,14,33,2,10,22,34,1,17,5,4,2,2,7,9,13,32,2,4,4,1,2,1,20,1,8,12,2,9,10,2,7,1,7,1,1,1,2,2,1,2,5,7,12,18,7,6,1,5,2,1,44,1,3,10,37,1,1,2,3,5,9,21,11,1,1,1,11,1,48,5,36,6,3,1,1,4,7,5,5,12,4,1,5,2,61,1,3,6,31,9,1,1,1,6,4,22,5,1,69,8,32,7,3,10,3,20,6,2,59,3,4,13,3,7,20,7,4,1,2,30,1,1,3,3,52,7,3,16,1,11,21,3,1,1,7,24,1,5,1,1,2,2,51,8,3,14,1,14,1,1,21,2,9,21,2,1,1,4,2,1,55,1,1,5,2,33,32,22,64,1,1,5,1,35,27,2,3,21,64,43,26,1,1,27,14,1,6,2,38,2,1,41,24,27,6,4,1,2,4,2,1,3,3,2,34,4,1,43,21,29,4,7,1,2,1,1,10,2,29,3,1,5,1,44,20,30,8,6,1,3,38,3,2,1,4,46,16,31,11,2,3,4,38,4,1,51,8,6,1,30,20,1,6,1,31,57,1,1,4,36,23,1,9,4,23,1,1,59,3,3,2,4,1,26,24,1,9,6,6,3,6,69,4,32,25,1,5,9,4,5,1,1,5,5,1,67,1,30,27,4,1,9,2,8,1,1,3,75,1,1,8,20,29,13,1,7,1,10,2,69,12,26,18,21,1,1,2,4,2,72,14,25,16,25,2,2,4,4,1,66,20,21,13,28,2,6,1,6,4,3,1,56,20,21,12,32,4,2,1,6,1,2,1,59,18,22,13,3,1,36,2,67,15,23,12,2,3,32,7,1,3,14,1,48,14,23,10,4,2,31,14,62,11,27,9,4,2,29,17,61,10,28,8,36,18,60,8,31,6,38,6,1,10,59,7,87,6,60,6,90,2,12,2,47,5,93,2,10,1,50,3,104,2,50,4,157,2,158,3,643,1,157,2,49,2,25,1,80,1,48,11,5,30,62,5,41,3,1,13,3,38,55,3,1,3,21,1,1,34,1,44,28,1,9,4,1,1,1,1,3,1,4,4,20,82,28,1,3,2,1,1,4,17,20,82,21,36,18,84,17,2,2,32,19,88,19,32,2,1,11,2,3,90,15,2,4,32,2,1,8,3,4,1,1,86,22,32,4,1,1,1,3,4,6,85,20,39,11,91,21,40,2,98,19,144,7,3,9,144,4,320]},{"cols":200,"rows":100,"runs":[2653,6,11,12,167,13,3,1,2,1,1,13,163,14,2,1,1,17,1,1,3,2,156,2,1,12,1,22,1,4,39,1,2,1,15,3,93,1,1,7,1,6,2,25,1,1,19,5,17,1,19,1,90,1,6,10,4,26,16,5,40,3,1,1,88,2,1,2,1,2,1,6,2,28,17,2,1,3,42,3,78,2,16,4,6,26,19,2,46,2,75,2,2,2,1,1,2,1,2,1,3,1,12,26,45,3,15,1,1,8,77,3,3,2,1,1,1,7,12,20,42,3,14,14,13,4,1,2,50,5,9,1,1,3,19,18,42,2,16,13,15,1,55,7,1,3,1,3,1,1,2,2,1,3,13,16,1,1,41,2,7,2,3,28,62,1,2,7,5,2,1,11,9,17,41,2,6,34,1,11,15,2,11,11,6,3,5,9,3,2,5,9,7,17,22,1,1,5,15,1,4,3,1,47,5,2,14,29,3,1,7,3,1,3,3,5,7,14,23,13,3,1,4,1,1,6,1,2,1,59,10,46,5,5,5,11,26,15,2,15,1,62,5,46,4,6,1,1,6,6,10,5,14,5,2,5,3,77,2,2,8,40,2,1,7,4,7,6,11,2,14,6,2,86,10,40,7,1,1,3,12,4,26,7,2,84,12,8,1,2,1,28,10,4,14,1,26,8,2,1,3,68,4,3,21,2,11,23,9,8,30,3,5,1,2,3,4,64,9,3,22,1,13,26,6,9,30,2,6,1,1,2,3,64,10,4,38,27,2,12,26,2,1,2,5,1,1,1,1,67,1,1,8,3,41,26,1,13,24,2,1,4,1,76,1,1,7,1,42,33,2,1,2,2,29,79,1,1,52,33,34,78,2,1,52,34,34,7,2,8,2,1,1,5,3,47,3,1,52,29,34,7,3,1,1,1,3,5,8,3,3,43,6,1,52,28,35,5,5,1,3,1,1,2,2,13,2,37,1,3,7,1,54,26,38,2,6,2,1,1,3,1,3,13,1,38,3,1,4,3,55,24,38,10,14,47,6,2,61,1,1,18,39,14,3,4,1,1,1,49,69,1,1,9,7,1,38,33,2,39,70,1,1,7,45,28,1,8,2,1,2,33,75,4,9,2,34,30,1,12,5,25,3,1,46,1,27,5,3,2,8,2,29,30,2,10,8,7,5,6,2,1,84,5,40,32,2,5,11,5,7,1,1,6,6,1,84,2,37,34,17,3,10,1,1,4,8,1,83,2,1,1,2,8,26,36,14,3,9,1,3,1,6,1,3,1,87,11,25,8,1,25,17,1,10,2,7,1,4,1,87,14,34,21,28,1,1,1,5,3,90,18,31,19,32,2,3,5,8,1,81,23,28,16,34,3,4,1,2,2,6,6,4,1,70,25,27,15,37,4,14,5,74,23,28,15,46,1,20,1,67,21,28,16,4,2,44,3,3,2,79,19,28,16,2,3,42,8,1,3,80,16,30,12,5,3,39,17,77,15,33,11,5,2,37,21,76,13,35,10,45,22,75,12,37,8,47,21,75,11,39,6,48,7,3,11,74,8,1,1,41,1,54,1,10,8,75,9,110,5,14,1,60,7,132,1,60,6,117,1,13,1,63,3,131,2,63,5,195,3,198,2,200,2,1001,1,1,2,195,3,61,4,24,3,3,3,8,4,85,3,60,12,8,38,78,1,1,3,52,2,3,16,4,45,73,6,36,11,1,24,2,51,52,4,11,4,1,3,27,44,1,57,48,3,2,3,4,1,2,1,3,5,24,104,34,1,5,2,1,1,5,22,21,1,2,103,28,44,24,102,29,41,22,108,22,45,23,110,23,42,16,3,5,113,17,2,5,38,5,2,10,4,4,110,30,38,8,1,4,4,11,103,29,40,1,1,10,1,9,110,25,50,12,114,25,51,2,123,24,50,2,127,22,181,6,7,7,185,1,400]},{"cols":240,"rows":120,"runs":[3689,8,206,9,12,15,199,2,1,14,3,1,2,2,1,1,1,13,196,17,2,24,1,1,3,3,46,1,140,2,1,15,2,32,45,1,5,1,18,2,115,4,5,8,2,33,40,3,2,1,1,1,1,1,20,3,115,6,1,7,1,1,4,30,20,1,1,2,2,3,43,5,107,3,4,5,1,6,4,32,21,6,49,2,1,2,100,1,5,1,2,1,2,1,2,8,2,33,1,1,21,4,1,1,50,3,94,2,7,1,9,1,1,6,7,31,22,3,3,1,51,2,91,6,2,1,3,1,1,2,2,3,1,3,1,3,6,31,57,2,21,7,90,8,4,1,1,2,1,8,14,25,51,4,17,15,14,1,1,5,70,2,14,7,15,24,50,3,17,16,86,5,6,2,2,3,1,3,2,2,1,1,1,2,14,23,49,2,17,16,1,2,2,1,4,1,10,2,64,4,1,8,2,4,1,1,3,6,1,2,13,22,49,2,9,2,1,1,3,32,7,2,65,1,4,8,3,1,2,1,3,12,10,1,1,20,48,3,8,40,2,1,1,1,1,8,19,1,15,8,25,6,1,1,2,3,2,13,10,18,32,6,23,4,1,56,27,17,2,12,3,4,1,2,2,6,4,2,4,5,11,17,27,13,8,1,7,4,1,3,3,60,1,6,13,34,4,4,3,1,1,4,2,3,3,1,2,5,7,14,31,17,2,2,2,15,2,71,12,53,6,8,5,13,11,1,19,13,1,4,2,17,2,76,6,53,1,1,6,6,1,1,7,8,12,5,17,7,2,6,4,92,2,3,10,47,2,5,5,5,9,7,11,4,18,7,1,103,13,49,5,1,3,2,4,2,11,5,31,8,2,103,14,11,1,35,11,6,14,3,32,8,2,89,3,1,1,6,19,5,10,30,11,6,2,2,45,9,3,79,5,3,3,2,28,1,1,1,11,29,11,10,37,1,10,4,5,76,11,4,25,2,17,31,7,11,35,2,8,1,1,2,4,77,12,5,46,32,2,14,33,2,1,2,6,1,4,80,1,1,10,4,48,32,2,15,30,2,2,4,1,93,8,2,49,1,1,44,2,1,33,3,2,92,1,1,61,38,1,2,4,3,34,94,65,40,41,26,1,8,2,56,3,1,62,38,1,2,40,10,1,10,3,1,2,6,2,57,4,1,62,36,40,8,4,1,1,2,2,7,9,4,4,52,5,3,62,34,43,6,5,1,3,7,1,16,2,45,1,4,8,1,64,32,44,5,15,2,1,15,3,44,4,2,7,1,66,30,46,1,3,8,16,57,4,2,4,3,68,26,47,13,16,57,6,1,75,1,1,22,47,18,2,68,83,12,9,1,42,1,3,40,2,47,84,1,1,8,10,1,44,33,1,9,5,42,86,1,2,6,54,35,1,14,6,33,2,1,89,5,5,2,6,1,39,36,2,13,7,1,1,10,3,10,100,10,7,1,1,3,2,1,33,36,3,10,10,8,7,8,1,1,7,1,94,1,1,7,44,38,2,7,14,5,11,7,8,1,100,3,44,40,1,1,20,4,11,1,1,6,7,1,101,2,5,7,1,1,32,44,16,3,12,1,3,3,9,2,102,1,2,13,30,42,20,1,12,1,14,3,104,17,29,2,2,1,4,29,31,2,2,2,7,3,108,19,40,24,35,2,1,1,5,5,107,21,38,23,38,3,3,6,10,1,97,28,33,20,41,3,5,1,2,3,2,1,1,1,1,8,5,1,84,30,32,18,44,2,17,1,2,7,4,1,83,29,32,18,57,1,10,1,3,1,7,1,81,27,34,18,61,2,99,25,34,19,5,2,50,1,1,5,3,2,96,22,33,19,3,4,48,12,1,4,95,20,35,15,6,4,47,19,94,19,37,15,5,3,44,25,92,15,41,14,6,2,45,26,90,15,43,12,54,26,90,14,45,10,56,25,90,13,47,7,58,7,5,13,90,12,48,1,64,3,10,1,1,9,14,1,75,11,131,7,91,7,158,2,72,6,140,3,16,1,75,5,141,1,15,3,75,4,156,3,76,6,233,6,235,4,6,1,230,1,1,1,239,2,1206,1,235,2,237,3,74,4,29,4,3,3,11,4,104,1,73,11,1,2,11,44,94,1,2,3,63,2,3,20,6,50,1,1,88,7,45,2,4,2,8,25,3,60,83,3,1,4,33,1,1,1,1,3,1,45,2,66,61,3,15,2,2,4,31,124,41,1,15,10,5,1,1,2,3,6,29,125,48,3,1,1,5,28,25,1,3,123,35,22,1,3,1,24,29,122,1,1,33,52,27,126,27,1,1,1,4,46,30,131,26,55,26,133,27,51,19,4,5,136,20,3,5,46,6,2,12,5,5,133,35,44,11,1,6,5,9,128,35,46,7,4,4,5,9,129,30,57,19,135,31,58,11,2,2,138,30,60,3,148,28,61,1,153,26,215,10,6,16,213,1,1,3,12,3,705]},{"cols":320,"rows":160,"runs":[6519,9,281,1,1,2,20,11,1,6,271,16,15,21,263,22,4,4,1,3,1,20,261,24,2,2,1,22,1,5,2,1,5,2,251,1,2,22,3,42,60,2,187,3,2,2,1,5,2,8,3,43,56,1,4,1,1,1,1,1,2,2,23,5,152,10,1,12,2,44,31,2,1,2,19,2,3,1,2,2,29,5,149,1,2,12,1,9,5,41,29,2,1,7,56,1,1,5,142,2,9,6,1,8,8,40,27,7,3,2,60,5,1,2,132,3,5,4,1,2,2,5,1,11,2,44,28,9,68,5,128,1,1,3,7,2,2,2,8,9,2,45,31,4,2,2,66,2,4,1,122,4,8,1,12,1,2,8,5,1,5,39,30,4,3,2,69,2,123,4,6,1,10,3,2,12,6,45,30,1,43,2,28,6,119,3,3,3,3,1,1,1,2,5,5,2,18,5,1,37,71,6,27,12,118,11,1,1,3,2,1,3,1,11,19,33,67,5,23,21,19,1,1,7,1,1,91,3,14,2,1,11,20,32,67,3,23,22,23,2,7,1,80,8,15,1,2,4,31,29,67,3,25,20,22,1,3,1,88,7,1,1,6,3,3,3,2,4,2,2,1,8,18,27,1,1,66,3,11,2,7,24,1,9,4,4,11,2,85,15,1,2,3,5,1,2,3,3,1,4,2,3,18,28,65,3,11,4,7,42,10,4,85,3,2,12,4,2,2,2,3,14,1,1,14,29,64,4,11,4,1,1,1,46,3,1,5,9,49,7,30,13,6,4,2,18,13,1,1,23,1,2,41,4,21,4,8,5,1,8,1,65,38,19,8,2,1,2,1,1,7,14,4,4,10,1,2,9,11,2,1,24,36,1,2,8,1,1,23,1,6,5,1,75,7,1,2,4,22,44,1,5,3,2,1,1,1,3,1,3,1,1,3,3,2,1,2,7,15,22,37,18,10,1,3,1,3,1,2,5,1,4,4,81,1,8,16,46,6,4,4,2,1,6,2,4,4,2,2,7,10,18,1,1,40,21,4,2,3,21,1,95,16,72,8,9,8,17,42,24,2,2,1,22,1,99,10,2,1,68,10,7,1,3,8,15,11,1,1,1,2,2,25,19,3,1,2,130,7,70,1,3,4,11,12,10,15,9,21,9,3,9,2,1,2,123,3,3,14,64,2,5,7,7,11,10,15,6,23,10,2,12,1,123,18,66,17,4,1,1,12,8,43,10,2,139,16,65,11,1,1,5,20,7,41,11,3,120,2,3,1,9,21,11,1,3,1,47,14,8,20,3,42,11,3,118,4,1,2,7,26,8,1,2,9,40,15,8,3,2,60,12,5,110,2,3,4,3,37,3,1,1,15,38,13,14,50,2,8,2,2,5,5,1,1,103,15,4,36,2,2,1,18,38,13,13,48,4,10,1,1,4,1,1,3,1,1,101,16,5,33,3,23,42,8,15,48,3,8,2,1,3,6,102,17,6,61,44,2,19,43,2,1,4,8,2,5,2,1,103,17,5,60,1,2,44,1,21,40,3,1,5,4,120,1,1,11,3,66,43,1,20,40,2,3,6,2,121,1,1,12,1,67,61,2,1,45,1,5,123,1,2,10,1,71,50,1,3,5,4,46,126,1,1,83,54,8,2,44,126,2,1,84,54,1,2,52,27,3,2,2,9,5,74,89,50,1,3,54,13,2,12,9,7,3,76,5,2,82,49,53,11,7,3,3,9,12,6,4,70,1,1,6,3,83,46,56,9,11,3,2,27,4,67,9,1,85,44,57,8,3,1,4,1,10,2,3,21,3,58,3,1,2,2,11,2,85,41,60,7,12,2,6,2,3,20,4,57,1,2,4,2,9,2,87,41,61,1,4,10,23,75,5,3,5,4,89,38,63,15,23,74,10,2,2,1,95,33,62,22,5,2,11,77,7,2,100,1,1,29,63,25,2,90,110,1,2,14,12,2,61,53,2,63,111,2,1,12,13,2,59,42,2,12,3,60,113,2,2,10,14,1,57,45,2,13,3,1,4,52,116,1,2,8,72,47,2,18,9,43,3,1,119,7,6,3,7,2,52,49,2,18,9,16,4,14,1,1,84,1,44,8,4,3,13,4,46,48,3,15,13,12,7,11,2,2,132,12,63,50,3,11,16,9,10,11,12,2,128,8,59,51,3,8,19,6,16,10,10,1,133,5,58,54,1,2,25,6,15,10,10,1,1,1,133,3,8,2,2,1,47,53,5,2,21,4,17,1,3,5,11,1,2,1,133,2,2,2,1,4,1,9,42,57,23,2,1,1,16,1,4,1,15,1,1,1,136,1,2,17,41,55,27,2,16,1,20,3,138,22,38,8,5,40,41,1,3,3,11,3,145,24,54,33,45,2,1,2,7,6,144,26,53,31,49,4,5,9,1,2,1,1,2,1,134,31,49,29,52,4,5,6,2,3,4,1,2,3,130,36,44,27,54,4,5,5,2,1,1,1,3,1,1,2,2,10,120,41,41,25,57,2,12,1,16,7,4,1,114,40,42,24,60,6,22,8,119,39,42,24,75,2,19,3,8,1,108,36,45,24,80,1,1,1,7,1,125,33,46,25,7,2,71,5,5,2,125,32,45,26,6,3,66,10,5,4,127,28,45,24,5,5,65,21,28,1,99,26,47,21,7,5,64,24,126,26,48,20,7,4,60,31,13,1,109,23,53,19,7,4,58,34,122,20,56,17,9,3,59,35,121,20,56,16,72,36,119,20,58,15,73,35,119,19,60,12,76,34,119,17,63,9,78,9,7,17,120,16,64,4,83,4,14,1,1,12,120,14,175,10,21,1,98,15,176,8,23,3,95,11,210,3,96,8,187,3,22,1,1,1,97,10,185,3,20,3,99,8,208,3,100,7,209,3,102,8,311,7,314,5,316,4,7,2,306,3,1,1,317,1,1,4,2247,1,315,4,314,2,317,2,100,6,28,1,8,8,3,5,8,2,3,9,135,3,97,2,1,11,19,57,131,2,94,24,9,63,123,2,2,5,84,3,3,26,7,73,115,9,61,3,2,6,9,35,3,80,113,2,1,6,44,1,2,1,6,60,3,87,80,2,2,1,18,6,1,6,43,71,2,91,102,4,2,6,41,71,1,93,55,2,2,1,17,15,3,2,3,1,3,10,38,167,65,1,1,1,10,37,33,1,5,163,50,23,10,34,37,165,45,71,39,163,43,1,1,70,35,171,37,1,6,61,5,1,35,173,36,71,37,177,35,67,1,5,23,2,9,179,2,1,32,64,1,3,8,2,15,5,7,181,27,3,7,62,9,2,16,6,7,178,33,2,9,59,1,2,5,1,17,7,10,172,45,64,12,3,5,8,14,169,46,63,9,5,6,4,13,174,39,76,26,179,41,78,20,182,41,76,11,7,2,183,1,1,39,81,4,198,36,81,3,203,34,288,33,290,10,9,20,288,3,11,11,1258]}];
@@ -1 +1,2 @@
-window.WORLD_MAP_PATH = "M670.0 151.0L672.9 152.0L675.0 151.7L675.5 150.4L677.7 150.0L679.3 149.1L679.9 146.9L682.2 146.4L682.6 145.4L683.9 146.1L684.8 146.2L686.3 146.2L688.4 146.8L689.3 147.2L691.3 146.3L692.2 146.8L693.1 145.5L694.8 145.6L695.2 145.2L695.5 144.1L696.7 143.1L698.2 143.7L697.9 144.6L698.7 144.7L698.5 147.0L699.6 147.9L700.5 147.4L701.8 147.1L703.5 145.8L705.4 146.1L708.3 146.1L708.8 146.9L707.2 147.2L705.7 147.7L702.6 148.0L699.6 148.6L698.0 149.8L698.6 151.0L698.9 152.4L697.5 153.5L697.7 154.6L696.9 155.6L694.3 155.5L695.3 157.3L693.6 158.0L692.4 159.7L692.5 161.4L691.5 162.2L690.4 161.9L688.3 162.3L688.0 163.0L685.9 163.0L684.4 164.6L684.3 167.0L680.7 168.1L678.8 167.9L678.2 168.5L676.5 168.1L673.7 168.6L669.1 167.1L671.6 164.6L671.4 162.8L669.3 162.4L669.1 160.6L668.2 158.4L669.3 156.9L668.1 156.5L668.9 154.4L670.0 151.0z M545.4 266.3L546.0 268.4L546.8 270.1L547.5 271.0L548.5 272.4L550.4 272.2L551.3 271.8L552.8 272.2L553.2 271.5L553.9 269.9L555.7 269.8L555.8 269.3L557.2 269.3L557.0 270.3L560.4 270.3L560.4 272.0L561.0 273.1L560.6 274.7L560.8 276.5L561.7 277.5L561.5 280.8L562.2 280.5L563.4 280.6L565.2 280.2L566.4 280.4L566.7 281.2L566.4 282.6L566.9 283.9L566.5 284.9L566.7 285.9L560.9 285.8L560.8 294.7L562.7 296.9L564.5 298.7L559.4 299.8L552.7 299.4L550.7 298.1L539.5 298.2L539.1 298.4L537.4 297.1L535.6 297.1L533.9 297.5L532.6 298.1L532.3 296.3L532.7 293.9L533.7 291.3L533.8 290.1L534.7 287.6L535.4 286.5L537.0 284.7L537.9 283.4L538.2 281.4L538.0 279.8L537.2 278.8L536.4 277.1L535.8 275.5L535.9 274.9L536.8 273.8L535.9 271.1L535.4 269.2L534.0 267.5L534.2 266.9L535.4 266.6L536.2 266.6L537.2 266.3L545.4 266.3z M534.5 265.8L533.8 266.1L533.1 264.0L534.2 262.8L535.1 262.3L536.1 263.3L535.1 263.9L534.6 264.6L534.5 265.8z M557.2 133.7L556.8 134.7L557.2 135.9L558.4 136.5L558.3 137.3L557.4 137.7L557.3 138.6L556.0 139.9L555.5 139.7L555.4 139.1L553.9 138.2L553.7 136.9L553.9 135.0L554.3 134.1L553.8 133.7L553.6 132.8L554.8 131.4L555.0 131.9L555.8 131.7L556.3 132.4L557.0 132.7L557.2 133.7z M643.3 182.7L643.8 182.5L643.9 183.3L646.0 182.8L648.3 182.9L650.0 183.0L651.9 181.1L654.0 179.3L655.8 177.6L656.3 178.6L656.7 180.8L655.2 180.8L655.0 182.6L655.5 183.0L654.2 183.5L654.2 184.7L653.4 185.8L653.4 186.9L652.8 187.5L644.4 186.1L643.4 183.3L643.3 182.7z M318.1 403.3L315.4 403.5L314.0 402.5L312.3 402.4L309.4 402.4L309.3 396.2L310.4 397.5L311.8 399.6L315.4 401.2L319.3 401.9L318.1 403.3z M319.5 311.3L321.2 313.3L322.3 311.1L325.4 311.2L325.9 311.8L331.0 316.3L333.3 316.8L336.6 318.8L339.5 319.9L339.9 321.1L337.2 325.3L340.0 326.1L343.1 326.5L345.3 326.1L347.8 323.9L348.3 321.5L349.6 321.0L351.0 322.6L351.0 324.8L348.6 326.3L346.8 327.4L343.6 330.1L339.9 333.9L339.2 336.2L338.5 339.0L338.5 341.8L337.9 342.4L337.7 344.2L337.5 345.6L341.0 348.0L340.7 349.9L342.4 351.1L342.3 352.5L339.6 356.1L335.5 357.6L329.9 358.1L326.8 357.9L327.4 359.5L326.9 361.6L327.4 363.0L325.7 364.0L322.9 364.4L320.2 363.3L319.1 364.1L319.5 366.8L321.4 367.7L322.9 366.8L323.7 368.2L321.2 369.1L318.9 370.8L318.5 373.6L317.9 375.1L315.3 375.1L313.1 376.5L312.3 378.6L315.0 380.6L317.7 381.2L316.7 383.7L313.4 385.3L311.6 388.5L309.1 389.6L307.9 390.9L308.8 393.8L310.7 395.4L309.5 395.3L306.9 394.8L300.2 394.5L299.1 392.8L299.1 390.8L297.3 390.9L296.3 389.9L296.1 387.0L298.2 385.8L299.1 384.0L298.8 382.6L300.2 380.2L301.2 376.6L300.9 374.9L302.2 374.4L301.9 373.4L300.6 372.8L301.5 371.6L300.2 370.6L299.6 367.4L300.7 366.8L300.2 363.4L300.9 360.6L301.6 358.1L303.3 357.1L302.4 354.4L302.4 351.8L304.5 350.0L304.5 347.7L306.1 345.0L306.1 342.4L305.3 341.9L304.1 337.1L305.8 334.3L305.5 331.6L306.5 329.1L308.3 326.4L310.3 324.7L309.5 323.6L310.0 322.7L310.0 318.1L313.0 316.7L313.9 313.9L313.6 313.2L315.9 310.6L319.5 311.3z M621.1 135.9L624.9 135.4L625.5 136.2L626.6 136.6L626.0 137.3L627.5 138.3L626.7 139.2L627.9 139.9L629.1 140.4L629.2 142.3L628.2 142.4L627.0 140.8L627.1 140.4L625.8 140.4L625.0 139.6L624.4 139.7L623.3 138.9L621.3 138.2L621.5 136.8L621.1 135.9z M334.5 472.3L333.7 473.7L332.9 475.0L327.1 474.6L320.9 474.8L317.4 473.9L317.4 473.7L315.9 472.9L322.1 473.0L328.1 473.3L330.2 472.2L331.6 471.2L334.5 472.3z M57.8 470.8L52.4 471.2L48.8 470.2L47.1 469.2L47.0 469.1L45.2 468.3L46.9 467.3L52.1 467.7L54.9 468.6L57.0 469.6L57.8 470.8z M374.6 466.8L378.0 468.0L379.2 469.7L379.5 470.9L379.6 472.3L375.3 473.2L370.8 473.9L365.6 474.5L359.8 475.1L353.2 474.9L349.5 474.0L350.0 472.8L356.0 472.1L358.4 471.2L360.1 470.0L361.3 468.9L363.0 467.9L364.8 466.8L364.8 466.8L366.2 466.8L370.4 466.2L374.6 466.8z M163.3 454.2L166.9 454.6L170.2 454.1L168.6 455.1L166.0 455.8L162.2 455.6L159.4 454.6L159.4 454.6L160.0 453.7L163.3 454.2z M151.2 454.1L155.5 455.2L153.8 455.1L150.2 454.8L146.4 454.1L146.4 454.1L148.4 453.5L151.2 454.1z M225.1 449.8L228.1 450.2L231.1 449.9L232.8 451.4L230.6 451.2L227.2 451.3L223.8 451.2L220.0 451.4L217.2 450.8L215.7 449.7L217.5 449.2L221.0 449.6L225.1 449.8z M309.9 447.1L310.2 448.4L309.7 449.4L308.9 450.5L305.7 450.9L302.6 451.4L298.9 451.3L300.3 450.3L297.0 450.6L293.9 451.0L291.8 450.2L291.6 449.1L294.7 448.0L294.7 448.0L296.6 447.6L299.8 447.8L300.6 446.3L300.8 445.3L300.7 443.1L302.3 441.8L304.9 441.3L306.3 442.4L307.0 443.4L308.2 444.7L309.1 445.8L309.9 447.1z M337.2 428.2L336.0 428.8L333.9 428.4L331.6 428.6L329.7 429.3L327.7 430.0L326.4 430.8L326.0 431.9L326.1 432.9L327.4 433.9L325.5 434.5L322.9 434.7L321.4 435.7L319.8 436.5L318.0 437.7L317.6 438.8L318.6 439.9L320.0 440.8L322.3 441.4L324.5 442.3L325.6 443.4L326.2 444.4L327.0 445.5L328.3 446.4L329.1 447.5L329.5 450.0L330.3 451.1L330.5 452.2L331.4 453.2L331.0 454.7L329.5 455.9L327.9 456.8L324.2 457.2L322.9 458.1L321.2 459.1L317.1 460.1L313.4 460.5L309.9 461.1L306.1 461.7L303.9 462.9L299.4 463.0L294.5 462.9L290.1 463.1L285.4 463.1L286.3 464.2L290.6 464.7L293.7 465.4L295.4 466.4L292.3 467.3L287.5 467.0L283.5 467.7L283.4 468.9L283.3 469.9L286.5 470.9L287.1 471.9L290.7 472.9L296.5 473.4L301.5 474.1L305.5 475.0L310.6 475.9L317.5 476.3L324.3 477.1L329.0 477.9L334.2 478.8L336.9 480.1L338.3 481.2L341.6 480.2L346.2 479.4L351.1 478.5L356.8 477.8L361.8 477.0L368.7 477.0L375.5 477.4L381.1 478.0L382.9 476.8L386.7 476.0L393.8 475.9L399.3 475.3L404.5 474.7L410.2 474.4L416.4 473.9L420.7 473.2L418.7 472.2L417.5 471.2L417.5 470.2L412.2 470.3L406.4 470.7L401.0 470.7L400.2 469.7L400.6 467.6L401.9 467.0L405.8 466.4L410.5 465.7L413.9 464.9L417.3 464.1L419.8 463.0L423.6 462.5L427.3 462.1L429.2 461.9L433.5 461.8L437.6 461.4L441.0 460.9L444.4 460.2L447.5 459.6L451.3 458.7L453.8 457.8L456.4 456.9L457.2 455.9L454.3 455.2L455.2 454.1L457.1 453.2L460.0 452.6L463.0 452.0L465.9 451.1L468.0 450.0L469.4 448.7L471.4 448.0L474.7 448.1L476.1 449.0L479.4 449.2L479.5 448.1L480.9 447.0L483.9 447.3L484.6 448.3L487.9 448.5L491.5 448.0L495.0 447.7L498.2 447.9L499.4 449.0L502.4 448.1L505.2 447.6L508.4 447.2L511.5 446.8L514.3 446.2L517.4 445.7L519.8 445.1L521.5 444.1L523.6 444.9L526.5 444.5L528.5 445.8L530.0 446.8L533.2 446.2L534.5 445.1L537.3 444.4L540.9 444.5L542.0 445.6L544.3 444.5L547.3 444.2L550.6 444.1L553.5 444.1L556.6 444.5L559.6 444.6L560.9 445.6L562.7 446.4L565.7 445.9L569.0 445.8L572.2 445.8L575.3 445.7L578.0 445.3L581.0 445.0L583.4 444.3L586.0 443.8L588.9 443.5L591.0 442.7L592.5 441.2L594.1 440.3L597.0 440.7L598.1 441.7L600.5 442.4L603.3 442.1L605.3 443.1L607.4 443.8L610.2 443.2L611.2 442.0L613.7 441.5L616.6 440.6L619.3 440.2L622.5 439.6L624.7 439.0L627.0 438.4L629.2 437.8L631.8 438.1L634.3 437.1L636.1 436.4L638.7 436.4L641.0 435.8L641.5 434.8L643.9 434.0L646.2 433.5L648.9 433.0L651.5 432.8L653.9 433.0L656.5 433.3L658.8 434.0L659.0 435.2L661.5 436.1L663.2 436.9L666.5 437.2L668.3 438.0L670.6 438.8L673.3 438.9L675.5 438.4L677.9 437.2L680.5 437.8L683.3 438.2L685.9 438.5L688.6 438.7L691.4 438.7L693.6 441.6L693.5 442.3L693.2 443.6L690.5 444.3L688.4 445.3L688.7 446.4L691.9 446.3L691.5 447.4L690.1 448.4L688.7 449.6L690.9 450.5L694.1 450.7L697.3 450.2L698.8 449.2L699.7 448.1L701.3 447.3L703.0 446.4L703.7 445.5L705.2 444.1L706.9 443.8L710.1 443.7L712.9 443.4L715.7 443.0L717.0 441.9L717.9 440.8L719.8 439.8L722.5 439.1L724.8 438.5L726.3 437.6L727.9 437.1L729.9 436.7L732.7 437.0L735.2 436.7L737.9 436.4L741.0 436.5L743.0 435.8L744.4 433.9L745.4 434.7L746.7 436.0L749.1 436.5L751.8 436.7L754.4 436.4L757.2 436.6L759.9 436.7L761.6 436.4L763.9 436.6L766.1 437.2L768.6 436.8L771.6 436.8L774.1 436.4L777.0 436.8L778.8 435.9L780.3 435.0L782.2 434.2L785.6 432.1L787.4 432.5L789.6 433.3L791.4 434.2L794.9 435.9L797.7 436.0L800.2 436.0L803.2 435.7L806.2 435.3L808.5 434.5L810.4 433.7L813.5 433.6L815.6 433.0L817.7 433.5L819.2 434.4L821.1 435.3L824.2 435.2L826.1 435.9L829.4 436.6L832.9 436.9L835.8 436.6L837.9 435.8L839.8 434.9L842.3 434.7L844.8 435.1L847.7 435.3L850.3 434.9L852.8 434.9L855.2 435.2L857.8 435.4L860.3 435.0L863.3 434.5L866.1 434.4L869.3 434.4L871.8 434.1L874.3 433.9L875.1 432.6L875.2 431.4L876.9 432.2L877.4 433.4L878.4 434.6L879.5 435.5L881.8 436.0L885.0 435.8L888.6 435.8L891.1 435.6L894.8 435.6L897.4 435.5L901.0 435.7L904.1 435.9L906.1 436.7L905.6 437.8L907.4 438.6L910.3 439.3L913.4 440.0L917.0 440.4L920.8 440.9L923.6 441.3L926.8 441.4L928.6 440.4L931.0 441.2L933.1 442.1L935.6 442.7L939.0 443.0L942.2 443.3L943.5 444.4L946.7 445.1L948.8 446.1L951.9 446.5L955.1 446.4L958.1 446.6L961.4 446.5L964.7 446.8L967.8 447.1L970.7 447.8L973.6 448.3L975.6 449.2L975.2 450.2L973.8 451.2L972.5 452.5L971.5 453.5L970.2 454.6L966.6 455.0L965.0 456.0L961.4 456.6L960.1 457.7L958.2 458.7L956.2 459.6L955.1 460.8L954.4 461.8L954.1 463.0L954.1 464.1L955.7 465.2L956.3 466.2L957.6 467.2L962.8 467.6L963.9 468.8L958.9 469.2L954.6 469.8L949.4 469.9L947.0 471.5L946.5 472.8L945.3 473.8L943.9 474.8L947.6 475.8L949.0 476.9L951.4 478.0L954.7 478.9L958.6 479.7L962.8 480.6L969.2 481.5L970.6 482.8L978.6 483.4L979.1 483.7L981.2 484.5L988.8 483.8L995.2 484.6L1000.0 485.3L0.2 485.3L2.6 483.7L7.6 484.6L7.9 484.5L10.9 483.6L11.3 483.6L11.6 483.7L15.6 484.8L19.1 483.7L19.8 483.5L27.9 483.0L30.6 483.7L31.9 484.0L36.0 484.9L43.9 485.6L50.2 486.5L60.9 487.1L68.9 486.4L80.7 486.9L87.4 487.8L94.8 487.0L102.5 486.2L103.1 484.9L92.1 484.8L83.2 484.2L80.8 483.1L73.4 482.5L73.9 481.2L74.9 480.1L75.9 479.0L75.4 477.9L70.8 477.1L68.6 476.2L64.3 475.3L71.1 475.4L77.5 475.0L81.5 475.9L86.5 475.1L91.1 474.1L93.3 473.2L92.3 472.0L88.7 471.3L84.6 470.4L78.9 470.3L73.9 469.9L68.5 469.6L66.7 468.6L63.1 467.7L61.0 466.7L60.1 463.6L61.5 463.9L64.0 464.7L68.5 464.5L72.9 464.1L75.2 465.3L79.6 465.0L83.3 464.4L86.8 463.6L90.0 462.7L94.2 462.4L94.0 461.4L93.1 460.4L93.9 459.4L97.5 458.9L99.1 459.8L103.3 459.3L106.6 458.6L110.5 458.5L114.3 458.2L118.0 457.6L121.0 457.0L124.4 456.4L126.6 456.6L128.5 456.8L132.6 456.4L136.3 456.9L140.1 456.8L143.8 456.5L147.5 456.7L151.7 457.0L155.5 456.9L159.5 456.9L163.7 457.0L167.5 456.9L170.3 456.1L173.7 455.6L177.2 456.2L180.5 455.7L183.5 454.8L185.3 455.6L186.3 456.6L188.1 457.5L190.9 456.7L194.3 457.8L198.0 458.1L201.2 458.8L205.1 458.7L208.7 458.2L212.9 458.3L216.6 458.7L220.4 459.2L221.9 458.0L220.1 457.0L218.7 456.1L215.2 455.9L213.6 454.8L213.0 453.8L212.0 451.7L214.1 452.1L217.8 452.3L221.4 452.1L224.6 452.5L227.4 453.3L228.6 454.3L232.4 454.5L236.0 454.1L239.8 453.6L243.2 453.2L246.1 453.9L249.8 453.7L252.1 451.6L254.4 452.8L257.6 453.3L261.1 453.0L263.4 454.1L267.0 454.2L270.4 454.5L273.7 455.1L275.9 454.1L277.0 453.1L279.7 454.2L283.5 453.9L286.4 454.5L288.3 455.5L292.0 455.2L294.9 454.6L297.7 453.9L301.1 453.5L305.0 453.2L308.5 452.8L311.2 452.2L312.9 451.3L313.5 450.1L313.2 449.0L312.3 447.9L311.3 446.8L310.5 445.7L309.8 444.7L309.6 443.7L309.9 442.6L311.2 441.5L312.3 440.4L312.7 439.3L312.2 438.1L311.8 437.0L313.2 435.8L314.7 435.0L316.5 433.9L318.4 433.0L320.6 432.2L321.7 431.0L323.3 430.3L325.0 429.6L327.7 429.4L329.4 428.5L331.4 428.0L333.6 427.7L335.7 426.9L337.2 426.1L339.4 425.8L341.0 426.5L340.0 427.4L337.2 428.2z M691.5 385.1L693.3 385.9L695.9 386.3L696.0 386.8L695.2 388.1L691.0 388.3L690.9 386.8L691.3 385.6L691.5 385.1z M903.9 363.3L906.6 364.3L908.1 363.9L910.2 363.4L911.9 363.5L912.1 366.8L911.2 367.8L910.9 370.0L909.9 369.3L908.0 371.2L907.4 371.1L905.7 371.0L904.0 368.6L903.6 366.8L902.0 364.3L902.1 363.1L903.9 363.3z M898.8 288.2L899.8 290.4L901.6 289.4L902.5 290.5L903.8 291.6L903.5 292.9L904.1 295.2L904.5 296.6L905.2 297.0L906.0 299.3L905.7 300.8L906.6 302.7L909.6 304.1L911.6 305.4L913.5 306.6L913.1 307.3L914.7 309.1L915.8 312.1L916.9 311.5L918.0 312.7L918.7 312.2L919.2 315.2L921.1 316.9L922.4 317.9L924.6 320.2L925.4 322.4L925.4 324.0L925.3 325.7L926.6 328.1L926.4 330.5L925.9 331.8L925.2 334.3L925.2 335.9L924.7 337.9L923.5 340.4L921.4 341.8L920.4 343.9L919.5 345.3L918.7 347.7L917.6 349.1L916.9 351.2L916.5 353.1L916.7 354.0L915.1 354.9L912.0 355.0L909.4 356.2L908.1 357.2L906.4 358.4L904.1 357.2L902.4 356.7L902.9 355.3L901.3 355.8L898.9 357.8L896.5 357.1L894.9 356.6L893.4 356.4L890.7 355.6L888.9 353.9L888.4 351.8L887.7 350.4L886.3 349.3L883.7 348.9L884.6 347.6L883.9 345.5L882.6 347.4L880.1 347.9L881.5 346.4L882.0 344.8L883.0 343.4L882.8 341.4L880.5 343.8L878.8 344.7L877.7 346.9L875.6 345.8L875.7 344.3L873.9 342.3L872.5 341.2L873.0 340.6L869.4 338.9L867.5 338.8L864.8 337.5L859.8 337.8L856.2 338.7L853.1 339.7L850.4 339.5L847.5 340.9L845.1 341.6L844.5 343.0L843.5 344.1L841.1 344.2L839.4 344.5L836.9 343.9L834.9 344.3L833.0 344.4L831.4 345.9L830.6 345.7L829.2 346.5L827.8 347.4L825.8 347.3L824.0 347.3L821.0 345.5L819.5 345.0L819.6 343.4L821.0 343.0L821.4 342.4L821.3 341.4L821.7 339.5L821.4 337.8L819.9 335.0L819.4 333.4L819.6 331.8L818.4 330.0L818.4 329.2L817.1 328.1L816.8 325.9L815.2 323.7L814.8 322.5L816.1 323.7L815.1 321.2L816.5 322.0L817.3 323.1L817.3 321.6L815.9 319.4L815.6 318.6L815.0 317.7L815.3 316.1L815.9 315.4L816.2 314.1L815.9 312.4L817.1 310.4L817.3 312.5L818.5 310.6L820.7 309.7L822.1 308.5L824.2 307.5L825.5 307.3L826.2 307.6L828.4 306.6L830.1 306.3L830.5 305.7L831.3 305.4L832.8 305.5L835.7 304.7L837.2 303.4L837.9 302.0L839.6 300.5L839.7 299.4L839.8 297.9L841.7 295.6L842.9 298.0L844.1 297.4L843.1 296.1L843.9 294.8L845.2 295.4L845.5 293.2L847.0 291.9L847.7 290.8L849.1 290.3L849.1 289.5L850.3 289.9L850.4 289.2L851.6 288.8L853.0 288.4L855.0 289.7L856.6 291.3L858.3 291.3L860.1 291.6L859.5 290.1L860.8 287.8L862.1 287.1L861.6 286.4L862.8 284.8L864.5 283.8L865.9 284.2L868.3 283.7L868.2 282.2L866.2 281.3L867.7 280.9L869.5 281.6L871.0 282.7L873.3 283.5L874.1 283.2L875.8 284.0L877.5 283.2L878.5 283.5L879.1 282.9L880.4 284.3L879.7 285.8L878.6 286.9L877.7 287.0L878.0 288.1L877.2 289.5L876.2 290.9L876.4 291.7L878.6 293.2L880.7 294.1L882.2 295.0L884.2 296.7L885.0 296.7L886.4 297.4L886.8 298.3L889.5 299.2L891.3 298.2L891.9 296.8L892.4 295.5L892.8 294.0L893.6 291.8L893.2 290.4L893.4 289.6L893.1 288.1L893.5 286.0L894.0 285.4L893.6 284.5L894.2 283.0L894.8 281.5L894.8 280.7L895.9 279.6L896.7 281.0L896.9 282.7L897.5 283.1L897.7 284.2L898.7 285.7L898.9 287.2L898.8 288.2z M547.2 116.3L547.0 117.5L545.4 117.5L545.9 118.1L545.0 119.9L544.5 120.3L542.0 120.4L540.6 121.0L538.4 120.8L534.4 120.1L533.8 119.1L531.0 119.6L530.7 120.1L529.0 119.7L527.6 119.7L526.3 119.2L526.8 118.5L526.7 118.0L527.5 117.8L528.9 118.6L529.3 117.9L531.7 118.0L533.7 117.5L535.1 117.6L535.9 118.1L536.2 117.7L535.8 115.9L536.8 115.5L537.8 114.2L539.8 115.1L541.4 114.0L542.4 113.8L544.5 114.6L545.8 114.5L547.1 115.0L546.9 115.4L547.2 116.3z M625.0 139.6L625.8 140.4L627.1 140.4L627.0 140.8L628.2 142.4L626.3 142.0L624.9 140.7L624.4 139.7L625.0 139.6z M631.6 135.5L632.8 135.7L633.3 135.0L635.0 133.9L636.4 135.3L637.8 137.3L639.1 137.4L640.0 138.2L637.7 138.4L637.2 140.6L636.7 141.5L635.7 142.2L635.8 143.6L635.1 143.7L633.4 142.2L634.3 140.9L633.5 140.0L632.5 140.3L629.2 142.3L629.1 140.4L627.9 139.9L626.7 139.2L627.5 138.3L626.0 137.3L626.6 136.6L625.5 136.2L624.9 135.4L625.6 135.0L627.7 135.8L629.2 135.9L629.5 135.6L628.2 134.1L628.9 133.7L629.7 133.8L631.6 135.5z M581.5 262.5L581.3 259.1L580.6 257.9L582.3 258.1L583.2 256.5L584.6 256.7L584.8 257.8L585.4 258.4L585.4 259.3L584.7 259.9L583.7 261.4L582.6 262.4L581.5 262.5z M509.2 107.4L511.2 107.6L513.8 107.0L515.6 108.2L517.1 108.9L516.8 110.8L516.1 110.9L515.8 112.4L513.3 111.2L511.9 111.4L510.0 110.1L508.7 108.9L507.4 108.9L507.0 107.9L509.2 107.4z M507.5 232.6L505.2 232.9L504.5 231.0L504.6 224.6L504.1 224.1L504.0 222.7L503.0 221.7L502.1 220.9L502.5 219.5L503.5 219.1L504.0 217.9L505.4 217.7L506.0 216.8L506.9 216.0L507.9 216.0L510.0 217.6L509.9 218.5L510.5 220.2L510.0 221.3L510.3 222.0L508.9 223.8L508.1 224.6L507.6 226.4L507.6 228.1L507.5 232.6z M492.1 223.2L490.2 222.5L488.9 222.6L488.0 223.3L486.7 222.7L486.2 221.8L485.0 221.2L484.8 219.6L485.6 218.4L485.5 217.5L487.7 215.2L488.1 213.3L488.9 212.6L490.2 213.0L491.4 212.4L491.8 211.7L493.9 210.4L494.4 209.6L497.0 208.4L498.6 208.0L499.3 208.5L501.0 208.5L500.8 209.9L501.2 211.1L502.8 213.0L502.8 214.3L506.0 214.9L506.0 216.8L505.4 217.7L504.0 217.9L503.5 219.1L502.5 219.5L500.1 219.4L498.8 219.2L497.9 219.6L496.7 219.4L491.8 219.5L491.8 221.1L492.1 223.2z M757.4 188.8L757.4 190.8L756.4 190.3L756.6 192.6L755.8 191.1L755.6 189.7L755.1 188.4L753.9 186.8L751.4 186.7L751.6 187.8L750.8 189.3L749.6 188.8L749.2 189.3L748.4 189.0L747.3 188.7L746.9 186.4L745.9 184.4L746.4 182.7L744.7 181.9L745.3 180.9L747.0 179.9L745.0 178.4L746.0 176.5L748.2 177.7L749.5 177.9L749.8 179.8L752.4 180.2L755.0 180.1L756.6 180.6L755.3 183.0L754.1 183.1L753.2 184.7L754.7 186.2L755.2 184.4L756.0 184.4L757.4 188.8z M562.9 127.1L563.7 128.3L564.8 128.1L566.9 128.5L571.0 128.6L572.4 127.9L575.7 127.3L577.7 128.3L579.3 128.6L577.9 129.7L576.9 131.7L577.8 133.3L575.4 132.9L572.5 133.8L572.5 135.2L570.0 135.5L568.0 134.5L565.8 135.3L563.8 135.2L563.6 133.3L562.2 132.4L562.6 132.1L562.3 131.7L562.8 130.8L563.9 130.0L562.5 128.8L562.3 127.8L562.9 127.1z M284.6 184.0L283.9 184.1L283.2 182.5L282.2 181.7L282.8 180.0L283.6 180.1L284.6 182.4L284.6 184.0z M283.8 176.2L280.8 176.6L280.6 175.6L281.9 175.4L283.8 175.4L283.8 176.2z M286.1 176.1L285.6 178.1L285.1 177.8L285.2 176.3L283.9 175.2L283.9 174.9L286.1 176.1z M552.8 125.4L553.8 125.4L553.1 126.6L554.4 127.7L554.0 129.0L553.4 129.1L552.9 129.4L552.0 130.0L551.6 131.5L549.1 130.5L548.0 129.3L547.0 128.7L545.7 127.7L545.1 126.8L543.8 125.5L544.3 124.4L545.3 125.0L545.9 124.4L547.2 124.4L549.6 124.8L551.5 124.8L552.8 125.4z M565.2 100.2L567.9 100.3L570.9 99.2L571.6 97.6L573.9 96.8L573.6 95.5L575.3 95.0L578.3 94.0L581.2 94.7L581.6 95.4L583.0 95.0L585.8 95.7L586.0 97.0L585.4 97.7L587.2 99.6L588.3 100.1L588.1 100.6L590.0 101.1L590.8 101.8L589.7 102.4L587.5 102.3L587.0 102.6L587.6 103.5L588.3 105.3L585.9 105.4L585.1 106.0L584.9 107.4L583.8 107.2L581.3 107.3L580.5 106.7L579.5 107.1L578.4 106.7L576.3 106.7L573.2 106.0L570.4 105.8L568.2 105.9L566.7 106.6L565.4 106.7L565.3 105.5L564.4 104.2L566.1 103.6L566.1 102.5L565.4 101.5L565.2 100.2z M252.4 200.5L252.4 200.1L252.7 200.0L253.2 200.3L254.2 198.6L254.7 198.6L254.7 199.0L255.3 199.0L255.2 199.8L254.8 201.0L255.0 201.4L254.7 202.4L254.9 202.7L254.6 204.1L254.0 204.8L253.5 204.9L253.0 205.9L252.1 205.9L252.4 202.7L252.4 200.5z M320.1 160.3L320.0 160.3L320.0 160.3L320.0 160.3L320.0 160.3L320.0 160.3L320.0 160.3L320.1 160.3L320.0 160.3L320.0 160.3L319.9 160.4L319.9 160.4L319.9 160.4L319.9 160.4L319.8 160.4L319.8 160.4L319.8 160.4L319.8 160.3L319.8 160.3L319.8 160.3L319.8 160.3L319.8 160.3L319.9 160.2L319.9 160.2L319.9 160.2L319.9 160.2L319.8 160.3L319.8 160.3L319.8 160.3L319.8 160.3L319.8 160.3L319.8 160.3L319.8 160.4L319.8 160.4L319.9 160.4L319.9 160.4L319.9 160.4L319.9 160.4L319.9 160.4L319.9 160.4L320.0 160.4L320.0 160.4L320.1 160.4L320.1 160.3L320.1 160.3L320.2 160.3L320.2 160.2L320.2 160.2L320.3 160.2L320.3 160.2L320.4 160.2L320.4 160.1L320.4 160.1L320.4 160.1L320.4 160.1L320.4 160.1L320.4 160.0L320.3 160.0L320.3 160.1L320.3 160.1L320.2 160.1L320.3 160.1L320.3 160.1L320.3 160.1L320.3 160.1L320.3 160.1L320.3 160.1L320.3 160.1L320.3 160.1L320.4 160.1L320.4 160.1L320.4 160.2L320.3 160.2L320.3 160.2L320.2 160.1L320.2 160.1L320.2 160.1L320.2 160.1L320.2 160.2L320.2 160.2L320.2 160.2L320.2 160.2L320.1 160.2L320.1 160.2L320.1 160.3L320.1 160.3z M325.4 311.2L322.3 311.1L321.2 313.3L319.5 311.3L315.9 310.6L313.6 313.2L311.6 313.5L310.5 309.7L309.0 306.6L309.9 303.9L308.4 302.7L308.1 300.7L306.7 298.8L308.4 295.8L307.3 293.5L307.9 292.6L307.4 291.5L308.5 290.1L308.5 287.8L308.7 285.8L309.3 284.9L306.9 280.4L308.9 280.7L310.4 280.6L311.0 279.8L313.4 278.6L314.9 277.6L318.5 277.1L318.2 279.2L318.6 280.3L318.3 282.1L321.3 284.6L324.5 285.1L325.5 286.1L327.4 286.7L328.6 287.5L330.3 287.4L331.9 288.3L332.1 289.9L332.6 290.7L332.6 291.9L331.8 291.9L332.9 295.2L338.2 295.3L337.8 296.9L338.1 298.0L339.6 298.8L340.3 300.5L339.8 302.7L339.0 303.9L339.3 305.5L338.4 306.0L338.4 305.2L335.8 303.8L333.2 303.7L328.4 304.5L327.0 307.0L327.0 308.5L325.9 311.8L325.4 311.2z M339.9 333.9L343.6 330.1L346.8 327.4L348.6 326.3L351.0 324.8L351.0 322.6L349.6 321.0L348.3 321.5L348.8 319.9L349.2 318.3L349.2 316.7L348.2 316.2L347.1 316.7L346.1 316.5L345.8 315.5L345.5 312.9L345.0 312.1L343.1 311.4L342.0 311.9L339.1 311.4L339.2 307.6L338.4 306.0L339.3 305.5L339.0 303.9L339.8 302.7L340.3 300.5L339.6 298.8L338.1 298.0L337.8 296.9L338.2 295.3L332.9 295.2L331.8 291.9L332.6 291.9L332.6 290.7L332.1 289.9L331.9 288.3L330.3 287.4L328.6 287.5L327.4 286.7L325.5 286.1L324.5 285.1L321.3 284.6L318.3 282.1L318.6 280.3L318.2 279.2L318.5 277.1L314.9 277.6L313.4 278.6L311.0 279.8L310.4 280.6L308.9 280.7L306.9 280.4L305.3 280.9L304.0 280.6L304.2 276.4L301.9 278.0L299.5 277.9L298.4 276.4L296.6 276.3L297.2 275.1L295.6 273.4L294.5 270.9L295.2 270.4L295.2 269.2L296.9 268.4L296.6 266.9L297.3 265.9L297.5 264.7L300.7 262.8L303.0 262.2L303.3 261.8L305.9 261.9L307.1 254.3L307.2 253.1L306.7 251.5L305.5 250.5L305.5 248.5L307.1 248.0L307.6 248.3L307.7 247.3L306.1 247.0L306.1 245.2L311.5 245.3L312.4 244.3L313.2 245.2L313.7 246.9L314.2 246.5L315.8 248.0L317.9 247.8L318.5 247.0L320.5 246.3L321.7 245.9L322.0 244.7L324.0 243.9L323.8 243.3L321.5 243.1L321.1 241.3L321.2 239.5L320.0 238.7L320.5 238.5L322.5 238.8L324.7 239.5L325.5 238.9L327.5 238.4L330.6 237.4L331.7 236.3L331.3 235.6L332.7 235.4L333.4 236.1L333.0 237.3L334.0 237.7L334.6 239.0L333.8 240.0L333.4 242.3L334.1 243.8L334.3 245.0L336.0 246.3L337.4 246.5L337.7 245.9L338.6 245.8L339.8 245.3L340.7 244.6L342.3 244.8L342.9 244.7L344.5 245.0L344.7 244.4L344.2 243.8L344.5 243.0L345.6 243.3L347.0 243.0L348.5 243.6L349.8 244.2L350.6 243.4L351.2 243.5L351.6 244.3L352.9 244.1L354.0 243.0L354.9 241.0L356.5 238.5L357.5 238.3L358.1 239.9L359.7 244.7L361.2 245.2L361.3 247.1L359.2 249.4L360.0 250.2L364.9 250.7L365.0 253.4L367.2 251.6L370.6 252.6L375.3 254.3L376.6 255.9L376.2 257.5L379.4 256.6L384.8 258.1L388.9 258.0L393.1 260.3L396.6 263.4L398.7 264.2L401.1 264.3L402.1 265.2L403.1 268.7L403.5 270.4L402.4 275.0L401.0 276.8L397.1 280.7L395.3 283.8L393.3 286.2L392.6 286.3L391.8 288.3L392.0 293.5L391.2 297.8L390.9 299.6L390.0 300.7L389.6 304.4L386.7 308.1L386.3 310.9L384.0 312.1L383.4 313.8L380.3 313.8L376.0 314.9L374.0 316.1L370.9 316.9L367.6 319.1L365.3 321.9L364.9 324.0L365.3 325.5L364.8 328.3L364.2 329.7L362.3 331.2L359.2 336.1L356.7 338.3L354.8 339.6L353.6 342.2L351.7 343.8L351.0 342.2L352.2 340.9L350.6 339.0L348.4 337.5L345.6 335.7L344.5 335.8L341.7 333.6L339.9 333.9z M817.2 237.4L818.3 236.4L820.7 234.9L820.6 236.2L820.4 238.0L819.1 237.9L818.5 238.9L817.2 237.4z M754.7 172.9L755.8 173.7L755.6 175.4L753.4 175.5L751.0 175.3L749.3 175.8L746.8 174.7L746.7 174.2L748.5 172.1L750.0 171.4L752.0 172.0L753.5 172.1L754.7 172.9z M571.2 301.5L571.8 302.0L572.7 303.6L575.8 306.6L577.0 306.9L577.0 307.9L577.8 309.7L580.0 310.1L581.8 311.4L577.8 313.4L575.3 315.5L574.4 317.3L573.6 318.4L572.1 318.6L571.6 319.9L571.3 320.8L569.5 321.4L567.3 321.3L565.9 320.5L564.8 320.2L563.4 320.8L562.7 322.2L561.4 323.0L560.0 324.2L558.0 324.5L557.4 323.5L557.7 321.9L556.0 319.2L555.3 318.8L555.3 310.7L558.0 310.6L558.1 300.7L560.2 300.6L564.4 299.6L565.5 300.8L567.3 299.7L568.1 299.7L569.7 299.1L570.2 299.3L571.2 301.5z M542.4 229.4L544.7 229.2L545.3 228.5L545.7 228.5L546.4 229.1L549.9 228.1L551.1 227.0L552.5 226.0L552.3 225.0L553.0 224.8L555.7 225.0L558.3 223.7L560.3 220.6L561.8 219.5L563.5 219.0L563.8 220.2L565.4 222.0L565.4 223.1L565.0 224.3L565.2 225.1L566.1 225.9L568.2 227.1L569.8 228.3L569.8 229.2L571.7 230.6L572.8 231.8L573.5 233.5L575.6 234.6L576.0 235.5L575.1 235.8L573.3 235.7L571.3 235.4L570.2 235.6L569.8 236.3L568.9 236.4L567.8 235.8L564.7 237.2L563.4 236.9L563.1 237.1L562.2 238.8L560.2 238.3L558.1 238.0L556.4 237.0L554.1 236.0L552.6 236.9L551.5 238.3L551.3 240.3L549.5 240.1L547.6 239.6L545.9 241.1L544.5 243.7L544.2 242.9L544.1 241.6L542.8 240.7L541.8 239.3L541.5 238.3L540.2 236.9L540.4 236.0L540.2 234.9L540.4 232.7L541.0 232.2L542.4 229.4z M323.2 120.7L325.2 121.1L327.7 121.0L326.4 122.1L325.3 122.3L321.8 121.1L321.1 120.2L322.2 119.3L323.2 120.7z M328.3 113.6L327.0 113.6L323.4 112.8L320.8 111.5L321.7 111.2L325.4 111.9L328.2 113.1L328.3 113.6z M156.9 115.2L155.5 115.6L151.0 114.4L150.1 113.4L147.6 112.4L147.1 111.6L144.3 111.1L143.2 109.6L143.4 109.0L146.4 109.6L148.1 110.0L150.7 110.3L151.6 111.2L153.0 112.6L155.8 113.7L156.9 115.2z M344.1 109.2L342.2 111.6L344.0 110.7L345.9 111.3L344.9 112.3L347.4 113.0L348.7 112.3L351.5 113.2L350.6 115.2L352.5 114.8L352.9 116.2L353.8 118.0L352.6 120.4L351.3 120.5L349.5 120.0L350.1 117.7L349.3 117.4L346.1 119.8L344.5 119.7L346.4 118.4L343.7 117.7L340.8 117.9L335.4 117.8L334.9 116.9L336.7 116.0L335.5 115.2L337.8 113.5L340.7 109.1L342.4 107.5L344.8 106.6L346.1 106.7L345.6 107.5L344.1 109.2z M131.4 99.9L134.0 99.7L133.2 102.8L135.6 105.1L134.5 105.0L132.8 103.8L131.8 102.5L130.4 101.6L129.9 100.4L130.1 99.5L131.4 99.9z M279.8 77.3L278.7 78.8L277.5 78.6L276.8 77.7L276.9 77.5L278.0 76.7L279.1 76.8L279.8 77.3z M272.5 75.8L269.3 77.3L267.3 77.3L266.7 76.5L268.7 75.2L272.6 75.3L272.5 75.8z M263.4 67.6L264.0 68.8L265.4 68.4L267.0 69.1L270.0 70.1L273.2 71.0L273.5 72.3L275.5 72.1L277.5 73.0L275.0 73.9L270.7 73.2L269.1 71.9L266.4 73.4L262.4 74.9L261.5 73.2L257.7 73.5L260.1 72.1L260.5 69.9L261.4 67.4L263.4 67.6z M289.3 63.5L286.1 63.6L285.5 62.3L286.6 60.7L289.2 60.3L291.3 61.1L291.4 62.3L291.1 62.7L289.3 63.5z M234.3 58.0L232.6 59.0L228.8 58.2L226.6 58.5L222.8 57.2L225.2 56.4L227.2 55.2L230.1 55.9L231.8 56.4L232.6 57.0L234.3 58.0z M248.5 57.0L248.5 59.8L252.2 57.6L255.5 59.4L254.7 61.5L257.4 63.3L260.3 61.3L262.3 58.9L262.4 55.9L266.4 56.1L270.5 56.5L274.2 57.9L274.4 59.3L272.3 60.7L274.3 62.2L273.9 63.6L268.5 65.5L264.6 66.0L261.8 65.1L260.9 66.5L258.2 68.9L257.4 70.1L254.2 71.9L250.2 72.1L248.0 73.3L247.9 75.1L244.6 75.5L241.2 77.7L238.2 80.8L237.1 83.0L237.0 86.3L241.1 86.7L242.3 89.3L243.6 91.4L247.5 90.9L252.7 92.1L255.4 93.1L257.4 94.4L260.9 95.2L263.9 96.4L268.4 96.5L271.5 96.8L271.0 99.2L271.9 102.0L273.9 105.1L278.0 107.8L280.2 106.9L281.7 104.0L280.2 99.6L278.3 98.1L282.7 96.8L285.8 94.9L287.4 93.0L287.2 91.1L285.3 88.7L281.9 86.7L285.2 83.7L284.0 81.2L283.0 76.9L285.0 76.2L289.7 77.0L292.6 77.3L294.9 76.5L297.5 77.5L300.9 79.1L301.7 80.2L306.7 80.4L306.6 82.7L307.5 86.2L310.1 86.7L312.1 88.3L316.1 86.8L318.8 83.7L320.6 82.4L322.8 84.9L326.4 88.4L329.5 91.8L328.3 93.5L332.0 95.1L334.5 96.7L339.0 97.4L340.7 98.3L341.8 100.6L344.0 101.0L345.1 102.0L345.3 105.1L343.3 106.2L341.3 107.2L336.7 108.2L333.2 110.4L328.5 110.9L322.6 110.3L318.4 110.3L315.6 110.5L313.2 112.5L309.7 113.7L305.7 117.4L302.5 119.9L304.8 119.5L309.3 115.8L315.1 113.5L319.3 113.2L321.7 114.6L319.1 116.5L320.0 119.5L320.9 121.6L324.5 122.9L329.1 122.5L331.9 119.4L332.1 121.4L333.9 122.4L330.4 124.3L324.3 125.9L321.5 127.0L318.4 129.0L316.3 128.8L316.2 126.5L321.0 124.2L316.6 124.3L313.5 124.6L311.7 123.0L311.7 119.3L310.5 118.5L308.6 118.9L307.7 118.2L305.6 120.3L304.7 122.5L303.7 123.7L302.5 124.2L301.7 124.3L301.4 125.0L296.3 125.0L292.0 125.0L290.8 125.5L287.8 127.5L287.5 127.7L286.6 128.8L284.1 128.8L281.3 128.8L280.1 129.3L280.5 129.8L280.8 130.7L280.7 130.9L277.1 132.3L274.2 132.8L271.0 134.2L270.3 134.2L269.4 133.8L269.1 133.4L269.1 133.1L269.7 132.1L271.0 130.6L271.8 129.0L271.3 126.6L270.7 124.0L267.8 122.7L268.1 122.2L267.7 121.9L267.0 121.9L266.4 121.5L266.3 120.8L265.7 121.1L265.0 121.0L265.2 120.7L264.5 120.5L264.2 119.7L262.1 118.8L259.8 117.9L257.1 116.8L254.5 115.8L252.0 116.6L251.1 116.6L247.7 115.9L245.4 116.3L242.8 115.4L239.9 115.0L238.0 114.8L237.1 114.3L236.6 112.8L235.7 112.8L235.7 113.9L229.9 113.9L220.4 113.9L211.0 113.9L202.6 113.9L194.3 113.9L186.1 113.9L177.6 113.9L174.9 113.9L166.7 113.9L158.8 113.9L158.4 113.9L153.0 111.2L151.0 110.0L146.0 108.8L144.5 106.3L144.9 104.6L141.3 103.5L140.8 101.2L137.5 99.2L137.4 97.8L138.9 96.4L138.9 94.7L134.1 92.9L131.3 89.7L129.6 87.7L127.0 86.5L125.2 85.4L123.7 83.9L120.9 84.8L118.2 86.4L115.7 84.5L113.8 83.3L111.1 82.6L108.3 82.5L108.4 66.7L108.4 56.4L113.6 57.0L117.9 58.4L120.8 58.6L123.3 57.5L126.6 56.6L130.8 56.9L134.9 55.7L139.5 55.0L141.4 56.2L143.4 55.5L144.1 54.2L146.0 54.5L150.7 57.0L154.4 55.1L154.8 57.2L158.2 56.8L159.2 56.0L162.6 56.1L166.8 57.3L173.3 58.3L177.1 58.8L179.9 58.6L183.6 60.0L179.7 61.4L184.7 62.0L192.2 61.6L194.6 61.2L197.6 62.8L200.6 61.4L197.7 60.2L199.5 59.3L202.9 59.2L205.1 58.9L207.4 59.6L210.2 61.1L213.3 60.8L218.2 62.1L222.5 61.7L226.5 61.7L226.2 60.0L228.7 59.5L233.0 60.4L233.0 63.1L234.8 60.9L237.0 60.9L238.2 58.1L235.3 56.4L232.0 55.3L232.2 52.2L235.5 50.2L239.2 50.7L242.0 51.9L245.8 55.0L243.3 56.4L248.5 57.0z M182.9 46.9L181.5 48.2L187.7 47.3L191.5 48.7L194.7 47.3L197.2 48.2L199.5 51.0L200.9 49.8L198.9 47.0L201.3 46.6L204.1 47.0L207.2 48.1L209.0 50.8L209.8 52.8L214.5 54.2L219.5 55.5L219.2 56.7L214.6 56.9L216.4 58.0L215.5 59.0L210.4 58.6L205.7 57.8L202.4 58.0L197.2 58.9L190.2 59.4L185.2 59.6L183.7 58.3L179.9 57.6L177.5 57.9L174.1 55.7L175.9 55.4L180.2 54.9L184.1 55.0L187.7 54.5L182.4 53.9L176.4 54.1L172.5 54.1L171.0 53.0L177.5 51.9L173.2 52.0L168.3 51.2L170.7 49.1L172.6 48.0L180.0 46.3L182.9 46.9z M209.7 46.1L207.3 47.9L202.9 45.9L203.9 45.6L207.6 45.4L209.7 46.1z M287.9 46.9L288.2 47.7L285.2 47.6L282.2 47.6L279.2 47.9L278.4 47.8L275.3 46.3L275.5 45.3L276.8 45.1L283.2 45.4L287.9 46.9z M259.5 46.8L261.7 48.5L264.3 46.3L271.3 45.1L276.1 48.0L275.7 49.8L281.2 49.0L283.8 47.9L290.0 49.3L293.8 50.6L294.2 51.9L299.3 51.2L302.2 53.0L308.9 54.1L311.3 55.2L314.0 57.8L308.9 59.1L315.4 60.9L319.8 61.5L323.8 64.1L328.2 64.3L327.3 66.2L322.4 69.4L319.0 68.3L314.7 65.6L311.1 65.9L310.7 67.5L313.6 69.1L317.4 70.4L318.6 71.2L320.4 73.9L319.4 75.9L315.9 75.2L308.9 72.9L312.9 75.3L315.8 77.0L316.2 78.0L308.7 76.9L302.7 75.2L299.3 73.9L300.3 73.1L296.2 71.7L292.1 70.3L292.2 71.1L284.1 71.6L281.8 70.6L283.6 68.6L288.8 68.5L294.6 68.2L293.6 67.2L294.6 65.8L298.2 63.1L297.4 61.9L296.4 60.9L292.1 59.6L286.5 58.6L288.3 57.9L285.3 56.2L282.9 56.0L280.7 55.1L279.2 55.9L274.2 56.3L264.0 55.6L258.2 54.8L253.7 54.4L251.4 53.4L254.3 52.2L250.3 52.2L249.4 49.3L251.6 46.9L254.4 45.7L261.6 45.0L259.5 46.8z M221.2 44.9L224.5 45.5L229.5 45.1L230.2 45.9L227.6 47.2L231.8 48.4L231.3 50.9L226.8 52.0L224.1 51.8L222.2 50.7L215.3 48.6L215.3 47.7L221.0 48.0L217.9 46.2L221.2 44.9z M241.1 47.9L238.1 49.9L235.0 49.8L233.2 47.4L233.3 46.0L234.7 44.8L237.5 44.1L243.3 44.2L248.6 44.8L244.4 47.3L241.1 47.9z M165.4 51.7L158.1 53.1L156.6 51.8L150.2 50.4L151.4 49.2L153.3 47.2L155.7 45.3L153.0 43.6L162.4 43.2L166.4 43.8L173.5 43.9L176.2 44.7L179.1 45.9L175.6 46.6L168.8 48.6L165.4 50.5L165.4 51.7z M240.0 41.7L238.5 42.8L234.4 42.6L231.1 41.9L232.5 40.6L236.5 39.9L239.0 40.8L240.0 41.7z M226.4 36.9L228.5 38.2L228.6 39.6L227.3 41.7L222.8 42.0L219.8 41.5L219.8 39.9L215.3 40.1L215.1 38.0L218.1 38.0L222.3 37.1L226.2 37.3L226.4 36.9z M199.4 38.3L200.5 39.3L203.0 38.9L205.9 39.0L206.4 40.3L204.7 41.7L195.3 42.1L188.3 43.3L184.0 43.3L183.7 42.4L189.5 41.2L176.9 41.5L173.0 41.0L176.8 38.3L179.4 37.6L187.2 38.5L192.2 40.1L197.0 40.4L193.1 37.7L195.6 36.7L198.5 37.0L199.4 38.3z M237.0 35.8L240.1 36.7L245.5 36.7L247.9 37.6L247.3 38.7L250.5 39.3L252.3 40.0L256.0 40.1L260.1 40.3L264.5 39.7L270.1 39.5L274.6 39.7L277.6 40.7L278.2 41.9L276.5 42.6L272.4 43.2L268.8 42.9L260.8 43.3L255.1 43.4L250.7 43.0L243.3 42.1L242.3 40.6L242.0 39.2L239.2 38.0L233.4 37.7L230.2 36.8L231.3 35.7L237.0 35.8z M177.2 34.3L176.8 36.5L174.7 37.4L172.1 37.6L166.9 38.7L162.5 39.2L158.7 38.6L158.7 38.6L163.5 36.5L169.2 34.7L173.4 34.7L177.2 34.3z M239.3 34.7L238.1 34.7L232.9 34.6L232.1 33.8L237.7 33.8L239.7 34.3L239.3 34.7z M193.9 34.2L188.7 35.0L184.6 34.1L186.9 33.2L190.9 32.9L194.8 33.3L193.9 34.2z M195.4 31.7L192.0 32.2L187.4 32.2L187.4 31.8L190.3 31.0L191.8 31.1L195.4 31.7z M233.8 33.2L229.7 33.7L227.4 33.1L226.2 32.1L226.0 30.9L229.6 31.0L231.2 31.2L234.6 32.2L233.8 33.2z M222.1 32.4L223.1 33.6L218.6 33.3L214.0 32.4L207.8 32.3L210.5 31.5L207.2 30.8L207.0 29.7L212.4 30.1L219.9 31.1L222.1 32.4z M258.3 28.7L261.6 29.6L257.8 30.4L252.7 32.5L247.8 32.7L242.0 32.4L239.0 31.2L239.1 30.2L241.3 29.5L236.2 29.5L233.1 28.6L231.4 27.3L233.3 26.1L235.2 25.3L238.1 25.1L236.8 24.4L243.3 24.3L246.9 25.8L251.5 26.4L256.1 26.9L258.3 28.7z M309.7 19.1L317.1 19.4L323.1 19.7L328.2 20.5L328.1 21.2L321.3 22.4L314.6 23.0L312.1 23.6L318.1 23.6L311.6 25.3L307.0 26.1L302.3 28.3L296.5 28.8L294.8 29.4L286.4 29.7L290.2 30.0L288.3 30.5L290.6 31.9L287.9 32.8L283.6 33.6L282.3 34.7L278.4 35.5L278.8 36.2L283.6 36.0L283.6 36.7L276.2 38.4L269.0 37.6L260.8 38.1L256.7 37.7L251.4 37.6L251.1 36.2L256.2 35.6L254.8 33.6L256.5 33.4L264.0 34.6L260.2 32.8L255.7 32.3L257.9 31.2L262.8 30.6L263.6 29.6L259.7 28.5L258.5 27.1L266.1 27.2L268.3 27.5L272.6 26.5L266.4 26.2L256.7 26.3L251.8 25.4L249.4 24.3L246.2 23.5L245.6 22.5L249.7 22.0L253.0 21.9L258.4 21.4L262.5 20.4L265.9 20.6L268.9 21.3L271.1 19.8L274.7 19.4L279.7 19.1L288.2 19.0L289.7 19.3L297.7 18.8L303.7 19.0L309.7 19.1z M526.7 118.0L526.8 118.5L526.3 119.2L527.6 119.7L529.0 119.7L528.8 120.9L527.6 121.3L525.5 121.0L524.9 122.1L523.6 122.2L523.1 121.8L521.5 122.7L520.2 122.8L519.0 122.2L518.1 121.0L516.7 121.5L516.8 120.2L518.8 118.6L518.7 117.9L520.0 118.2L520.7 117.7L523.1 117.7L523.7 117.1L526.7 118.0z M309.3 396.2L309.4 402.4L312.3 402.4L314.0 402.5L313.1 403.6L310.7 404.5L309.3 404.4L307.7 404.2L305.7 403.3L302.8 402.9L299.3 401.4L296.4 399.9L292.6 396.8L294.9 397.4L298.8 399.2L302.5 400.2L303.9 398.9L304.8 397.0L307.4 395.9L309.3 396.2z M310.5 309.7L311.6 313.5L313.6 313.2L313.9 313.9L313.0 316.7L310.0 318.1L310.0 322.7L309.5 323.6L310.3 324.7L308.3 326.4L306.5 329.1L305.5 331.6L305.8 334.3L304.1 337.1L305.3 341.9L306.1 342.4L306.1 345.0L304.5 347.7L304.5 350.0L302.4 351.8L302.4 354.4L303.3 357.1L301.6 358.1L300.9 360.6L300.2 363.4L300.7 366.8L299.6 367.4L300.2 370.6L301.5 371.6L300.6 372.8L301.9 373.4L302.2 374.4L300.9 374.9L301.2 376.6L300.2 380.2L298.8 382.6L299.1 384.0L298.2 385.8L296.1 387.0L296.3 389.9L297.3 390.9L299.1 390.8L299.1 392.8L300.2 394.5L306.9 394.8L309.5 395.3L307.1 395.3L305.7 395.9L303.2 396.9L302.8 399.5L301.6 399.6L298.5 398.7L295.3 396.8L295.3 396.8L291.8 395.2L290.9 393.4L291.7 391.8L290.3 389.9L290.0 385.2L291.2 382.5L294.1 380.4L289.9 379.6L292.5 377.1L293.5 372.5L296.6 373.5L298.0 367.7L296.1 367.0L295.3 370.5L293.5 370.1L294.4 366.1L295.3 361.0L296.6 359.1L295.8 356.3L295.6 353.2L296.8 353.1L298.5 348.6L300.4 344.2L301.6 340.1L300.9 335.9L301.7 333.6L301.4 330.2L303.0 326.8L303.5 321.4L304.4 315.6L305.3 309.4L305.1 304.9L304.5 301.0L305.9 300.3L306.7 298.8L308.1 300.7L308.4 302.7L309.9 303.9L309.0 306.6L310.5 309.7z M806.5 198.1L804.1 199.5L801.8 198.6L801.7 196.2L803.1 194.9L806.1 194.2L807.7 194.2L808.4 195.3L807.1 196.5L806.5 198.1z M854.6 111.8L859.4 112.7L862.7 114.6L863.9 117.2L868.1 117.3L870.5 116.2L875.1 115.3L873.6 117.8L872.5 118.9L871.6 121.9L869.7 124.6L866.3 124.1L864.0 125.1L864.7 127.5L864.3 130.8L862.9 130.8L862.9 132.2L861.1 130.6L860.0 132.2L855.7 133.3L856.1 134.8L853.7 134.7L852.4 133.8L850.5 135.8L847.4 137.3L845.2 139.1L841.3 139.9L839.3 141.2L836.3 142.0L837.7 140.7L837.2 139.6L839.4 137.7L837.9 136.3L835.5 137.2L832.3 139.2L830.6 141.0L827.9 141.1L826.5 142.4L827.9 144.3L830.2 144.7L830.3 146.0L832.5 146.8L835.6 144.8L838.1 145.9L839.9 146.0L840.3 147.4L836.4 148.2L835.1 149.7L832.4 151.1L831.0 153.0L834.0 154.6L835.1 157.3L836.7 159.8L838.6 162.0L838.6 164.0L836.8 164.8L837.5 166.3L839.1 167.1L838.7 169.4L838.0 171.6L836.5 171.8L834.4 174.9L832.2 178.5L829.6 181.8L825.8 184.4L821.9 186.7L818.8 187.0L817.1 188.3L816.1 187.4L814.6 188.7L810.7 190.1L807.7 190.6L806.8 193.5L805.2 193.7L804.5 191.6L805.2 190.6L801.5 189.7L800.1 190.1L797.3 189.4L796.0 188.3L796.5 186.7L793.9 186.2L792.6 185.1L790.2 186.6L787.5 186.9L785.3 186.9L783.8 187.6L782.4 188.0L782.8 191.2L781.3 191.1L781.1 190.5L781.0 189.3L778.9 190.1L777.7 189.6L775.7 188.6L776.5 186.3L774.7 185.7L774.1 183.2L771.1 183.6L771.5 180.3L774.1 178.0L774.2 175.7L774.1 173.6L772.9 172.9L772.0 171.3L770.4 171.5L767.4 171.1L768.3 169.9L767.0 168.2L765.0 169.4L762.7 168.7L759.5 170.4L757.0 172.5L754.7 172.9L753.5 172.1L752.0 172.0L750.0 171.4L748.5 172.1L746.7 174.2L746.5 172.0L744.8 172.6L741.5 172.3L738.4 171.7L736.1 170.4L734.0 169.9L733.1 168.6L731.5 168.2L728.7 166.3L726.5 165.5L725.3 166.2L721.4 164.2L718.7 162.5L717.9 159.4L719.9 159.8L720.0 158.3L718.9 156.9L719.2 154.7L716.2 151.4L711.6 150.3L710.8 148.1L708.8 146.9L708.3 146.1L707.9 144.5L708.0 143.4L706.3 142.8L705.4 143.0L704.7 140.5L705.4 139.8L705.1 139.2L707.7 137.9L709.6 137.3L712.6 137.7L713.6 135.9L717.2 135.6L718.2 134.5L722.6 133.0L722.9 132.4L722.7 130.8L724.6 130.1L722.1 125.2L727.6 124.1L729.1 123.5L731.1 118.5L736.6 119.4L738.1 118.2L738.2 115.4L740.6 115.1L742.7 113.3L743.8 113.1L744.5 115.0L746.8 116.5L750.8 117.5L752.7 119.8L751.6 123.0L752.6 124.2L755.9 124.7L759.7 125.1L763.0 126.8L764.7 127.1L766.0 129.7L767.6 131.3L770.7 131.3L776.4 131.9L780.1 131.5L782.9 131.9L787.0 133.6L790.3 133.6L791.6 134.5L794.8 133.0L799.3 132.0L803.5 131.9L806.7 130.9L808.7 129.4L810.6 128.5L810.2 127.6L809.3 126.5L810.8 124.7L812.3 125.0L815.2 125.5L817.9 124.1L822.2 123.0L824.2 121.1L826.2 120.4L830.2 120.0L832.4 120.3L832.7 119.3L830.2 117.4L828.0 116.5L825.8 117.5L823.1 117.1L821.5 117.4L820.8 116.3L822.8 113.5L824.1 111.4L827.4 112.5L831.4 110.7L831.3 109.5L833.8 106.5L835.4 105.7L835.3 104.1L833.8 103.5L836.1 102.1L839.6 101.6L843.3 101.5L847.4 102.3L849.9 103.4L851.6 106.2L852.6 107.4L853.6 109.1L854.6 111.8z M492.1 236.1L490.8 236.2L488.9 235.6L487.1 235.6L483.8 236.1L481.9 236.9L479.1 237.9L478.6 237.9L478.8 235.6L479.1 235.2L479.0 234.1L477.8 233.0L476.9 232.8L476.1 232.0L476.7 230.8L476.4 229.5L476.6 228.6L477.0 228.6L477.2 227.4L476.9 226.9L477.2 226.5L478.2 226.2L477.6 224.0L476.9 222.8L477.1 221.9L477.7 221.6L478.1 221.4L478.8 221.8L481.0 221.8L481.5 221.0L482.0 221.1L482.8 220.8L483.2 222.0L483.8 221.6L485.0 221.2L486.2 221.8L486.7 222.7L488.0 223.3L488.9 222.6L490.2 222.5L492.1 223.2L492.9 227.2L491.7 229.5L491.0 232.6L492.2 235.0L492.1 236.1z M536.3 243.7L536.0 243.6L534.3 243.9L532.6 243.5L531.3 243.7L526.8 243.7L527.2 241.5L526.1 239.6L524.9 239.2L524.3 237.9L523.6 237.5L523.6 236.7L524.3 234.8L525.6 232.1L526.5 232.1L528.1 230.4L529.2 230.4L530.7 231.5L532.6 230.6L532.9 229.5L533.5 228.3L533.9 226.9L535.4 225.8L536.0 223.8L536.6 223.2L537.0 221.8L537.7 220.0L540.0 217.9L540.2 216.9L540.5 216.4L539.4 215.3L539.5 214.4L540.3 214.3L541.4 216.1L541.6 217.9L541.5 219.7L543.0 222.3L541.4 222.2L540.6 222.4L539.4 222.2L538.8 223.5L540.4 225.1L541.6 225.6L542.0 226.7L542.9 228.6L542.4 229.4L541.0 232.2L540.4 232.7L540.2 234.9L540.4 236.0L540.2 236.9L541.5 238.3L541.8 239.3L542.8 240.7L544.1 241.6L544.2 242.9L544.5 243.7L544.3 245.2L542.1 244.5L539.8 243.8L536.3 243.7z M585.6 240.3L585.5 243.5L586.6 243.9L585.7 244.9L584.6 245.6L583.6 247.0L583.0 248.3L582.8 250.6L582.2 251.6L582.2 253.7L581.4 254.5L581.3 256.2L580.9 256.4L580.6 257.9L581.3 259.1L581.5 262.5L582.0 265.1L581.7 266.5L582.3 268.1L583.9 269.7L585.4 273.2L584.3 272.9L580.6 273.4L579.8 273.7L579.0 275.5L579.6 276.7L579.2 280.0L578.8 282.8L579.6 283.3L581.5 284.3L582.3 283.8L582.5 286.8L580.4 286.8L579.2 285.3L578.2 284.1L576.1 283.7L575.5 282.2L573.8 283.1L571.5 282.7L570.6 281.5L568.8 281.2L567.5 281.3L567.4 280.4L566.4 280.4L565.2 280.2L563.4 280.6L562.2 280.5L561.5 280.8L561.7 277.5L560.8 276.5L560.6 274.7L561.0 273.1L560.4 272.0L560.4 270.3L557.0 270.3L557.2 269.3L555.8 269.3L555.7 269.8L553.9 269.9L553.2 271.5L552.8 272.2L551.3 271.8L550.4 272.2L548.5 272.4L547.5 271.0L546.8 270.1L546.0 268.4L545.4 266.3L537.2 266.3L536.2 266.6L535.4 266.6L534.2 266.9L533.8 266.1L534.5 265.8L534.6 264.6L535.1 263.9L536.1 263.3L536.8 263.6L537.8 262.5L539.3 262.5L539.5 263.3L540.5 263.8L542.1 262.1L543.8 260.7L544.5 259.8L544.4 257.5L545.6 254.8L546.8 253.4L548.7 252.1L549.0 251.2L549.1 250.2L549.5 249.2L549.4 247.6L549.7 245.2L550.3 243.4L551.1 241.9L551.3 240.3L551.5 238.3L552.6 236.9L554.1 236.0L556.4 237.0L558.1 238.0L560.2 238.3L562.2 238.8L563.1 237.1L563.4 236.9L564.7 237.2L567.8 235.8L568.9 236.4L569.8 236.3L570.2 235.6L571.3 235.4L573.3 235.7L575.1 235.8L576.0 235.5L577.7 237.8L579.0 238.1L579.7 237.6L581.0 237.8L582.5 237.2L583.2 238.4L585.6 240.3z M536.1 263.3L535.1 262.3L534.2 262.8L533.1 264.0L530.8 261.1L532.9 259.5L531.9 257.7L532.8 257.0L534.7 256.6L534.9 255.4L536.4 256.7L538.9 256.9L539.7 255.6L540.1 253.7L539.8 251.5L538.5 249.9L539.7 246.7L539.0 246.1L536.9 246.3L536.1 244.9L536.3 243.7L539.8 243.8L542.1 244.5L544.3 245.2L544.5 243.7L545.9 241.1L547.6 239.6L549.5 240.1L551.3 240.3L551.1 241.9L550.3 243.4L549.7 245.2L549.4 247.6L549.5 249.2L549.1 250.2L549.0 251.2L548.7 252.1L546.8 253.4L545.6 254.8L544.4 257.5L544.5 259.8L543.8 260.7L542.1 262.1L540.5 263.8L539.5 263.3L539.3 262.5L537.8 262.5L536.8 263.6L536.1 263.3z M290.6 250.4L289.4 249.8L288.1 248.8L287.3 249.3L284.9 248.9L284.3 247.7L283.7 247.8L281.0 246.2L280.6 245.3L281.6 245.1L281.5 243.7L282.1 242.7L283.5 242.5L284.7 240.8L285.8 239.3L284.7 238.6L285.3 237.0L284.6 234.5L285.2 233.8L284.8 231.4L283.7 229.9L284.0 228.6L284.9 228.8L285.4 228.0L284.8 226.3L285.1 225.9L286.6 226.0L288.6 224.1L289.8 223.8L289.8 222.8L290.3 220.5L291.9 219.2L293.7 219.2L293.9 218.6L296.1 218.8L298.3 217.4L299.3 216.8L300.7 215.5L301.7 215.6L302.4 216.4L301.9 217.3L300.1 217.8L299.4 219.1L298.3 219.9L297.5 221.0L297.1 223.0L296.4 224.6L297.8 224.8L298.2 226.0L298.8 226.7L299.0 227.8L298.7 228.8L298.8 229.4L299.4 229.6L300.1 230.6L303.7 230.3L305.3 230.7L307.3 233.1L308.4 232.8L310.4 232.9L312.0 232.6L312.9 233.1L312.4 234.6L311.8 235.5L311.6 237.5L312.2 239.3L313.0 240.2L313.0 240.8L311.6 242.2L312.6 242.8L313.4 243.7L314.2 246.5L313.7 246.9L313.2 245.2L312.4 244.3L311.5 245.3L306.1 245.2L306.1 247.0L307.7 247.3L307.6 248.3L307.1 248.0L305.5 248.5L305.5 250.5L306.7 251.5L307.2 253.1L307.1 254.3L305.9 261.9L304.5 260.5L303.6 260.4L305.4 257.6L303.3 256.3L301.6 256.5L300.6 256.0L299.1 256.8L297.0 256.4L295.4 253.5L294.1 252.8L293.2 251.5L291.4 250.2L290.6 250.4z M269.5 227.2L268.0 226.5L267.5 226.0L267.8 225.5L267.7 224.9L266.9 224.2L265.8 223.6L264.9 223.3L264.7 222.5L264.0 222.0L264.1 222.8L263.6 223.5L262.9 222.7L262.1 222.4L261.7 221.8L261.7 221.0L262.1 220.1L261.3 219.7L261.9 219.2L262.3 218.8L264.2 219.6L264.8 219.2L265.7 219.4L266.1 220.0L267.0 220.2L267.6 219.6L268.3 221.1L269.4 222.2L270.7 223.4L269.6 223.7L269.6 224.8L270.2 225.2L269.8 225.5L269.9 226.0L269.7 226.6L269.5 227.2z M271.5 185.6L273.9 185.8L276.1 185.8L278.7 186.8L279.8 187.8L282.4 187.5L283.4 188.1L285.7 189.8L287.4 191.1L288.3 191.1L290.0 191.6L289.8 192.4L291.9 192.5L293.9 193.7L293.6 194.3L291.8 194.7L289.9 194.8L288.0 194.6L284.0 194.8L285.9 193.3L284.7 192.6L283.0 192.4L282.0 191.6L281.3 190.0L279.8 190.1L277.2 189.4L276.3 188.8L272.7 188.4L271.8 187.8L272.8 187.1L270.1 187.0L268.1 188.4L266.9 188.5L266.5 189.1L265.1 189.4L264.0 189.2L265.4 188.3L266.0 187.3L267.3 186.7L268.7 186.2L270.8 185.9L271.5 185.6z M590.9 152.4L591.1 152.4L591.5 151.7L593.5 151.7L596.0 150.9L594.2 152.1L594.4 152.6L594.1 152.5L593.5 152.7L593.1 152.7L593.0 152.8L592.9 152.5L592.7 152.3L592.2 152.3L591.4 152.5L590.9 152.4z M594.4 152.6L594.5 152.8L591.6 154.0L590.3 153.6L589.6 152.5L590.9 152.4L591.4 152.5L592.2 152.3L592.7 152.3L592.9 152.5L593.0 152.8L593.1 152.7L593.5 152.7L594.1 152.5L594.4 152.6z M547.1 115.0L545.8 114.5L544.5 114.6L542.4 113.8L541.4 114.0L539.8 115.1L537.8 114.2L536.2 113.0L534.8 112.4L534.5 111.2L534.0 110.4L536.0 109.8L537.1 109.1L539.0 108.5L539.7 108.0L540.5 108.3L541.7 108.0L543.0 108.9L545.1 109.2L544.9 109.9L546.4 110.5L546.9 109.8L548.8 110.1L549.0 111.0L551.1 111.1L552.4 112.5L551.5 112.5L551.1 113.0L550.5 113.1L550.3 113.8L549.8 113.9L549.7 114.2L548.7 114.4L547.5 114.4L547.1 115.0z M527.6 97.3L527.6 98.3L530.4 99.0L530.4 100.0L533.2 99.5L534.8 98.7L537.9 99.8L539.2 100.7L539.9 102.1L539.1 102.8L540.1 103.8L540.8 105.3L540.6 106.3L541.7 108.0L540.5 108.3L539.7 108.0L539.0 108.5L537.1 109.1L536.0 109.8L534.0 110.4L534.5 111.2L534.8 112.4L536.2 113.0L537.8 114.2L536.8 115.5L535.8 115.9L536.2 117.7L535.9 118.1L535.1 117.6L533.7 117.5L531.7 118.0L529.3 117.9L528.9 118.6L527.5 117.8L526.7 118.0L523.7 117.1L523.1 117.7L520.7 117.7L521.1 115.7L522.5 113.8L518.5 113.3L517.2 112.6L517.3 111.4L516.8 110.8L517.1 108.9L516.6 106.0L518.3 106.0L519.0 104.9L519.7 102.4L519.2 101.4L519.7 100.9L522.0 100.7L522.6 101.3L524.4 99.9L523.8 98.9L523.7 97.3L525.8 97.7L527.6 97.3z M619.7 214.7L620.3 215.6L620.2 216.7L618.7 217.4L619.8 218.2L618.8 219.6L618.2 219.2L617.5 219.3L616.0 219.3L615.9 218.5L615.7 217.7L616.7 216.4L617.6 215.2L618.8 215.4L619.7 214.7z M535.3 95.5L533.6 97.8L530.7 96.2L530.3 95.1L534.4 94.1L535.3 95.5z M530.3 93.2L529.6 94.2L528.8 93.9L526.8 95.9L527.6 97.3L525.8 97.7L523.7 97.3L522.6 95.8L522.5 92.9L522.9 92.2L523.7 91.4L526.2 91.2L527.2 90.4L529.4 89.6L529.3 91.1L528.5 92.0L528.8 92.8L530.3 93.2z M300.8 195.2L301.1 194.8L303.3 194.8L305.0 195.5L305.7 195.4L306.2 196.4L307.7 196.4L307.6 197.2L308.9 197.3L310.2 198.3L309.2 199.4L307.9 198.8L306.6 198.9L305.7 198.8L305.2 199.3L304.1 199.5L303.7 198.8L302.8 199.2L301.7 201.1L301.0 200.7L300.8 199.9L300.9 199.1L300.2 198.3L300.8 197.8L301.0 196.8L300.8 195.2z M533.3 184.8L523.8 190.1L515.8 195.6L511.9 196.8L508.8 197.1L508.7 195.3L507.5 194.8L505.7 194.0L505.1 192.7L495.7 186.7L486.3 180.6L475.9 173.9L475.9 173.4L475.9 173.2L475.9 169.9L480.4 167.8L483.2 167.4L485.4 166.7L486.5 165.3L489.7 164.2L489.9 162.1L491.5 161.9L492.7 160.8L496.4 160.4L496.9 159.3L496.1 158.7L495.2 155.8L495.0 154.1L494.0 152.3L496.6 150.8L499.6 150.3L501.4 149.2L504.1 148.3L508.8 147.8L513.4 147.6L514.8 148.0L517.4 146.9L520.4 146.9L521.5 147.5L523.4 147.4L522.8 148.8L523.3 151.4L522.6 153.7L520.9 155.3L521.1 157.4L523.4 159.0L523.4 159.7L525.2 160.8L526.3 165.8L527.2 168.3L527.4 169.6L526.9 171.8L527.1 173.1L526.7 174.6L527.0 176.4L525.9 177.5L527.5 179.5L527.6 180.7L528.6 182.3L529.9 181.8L532.1 183.1L533.3 184.8z M276.9 259.5L278.4 257.4L277.8 256.2L276.8 257.5L275.1 256.2L275.7 255.5L275.2 252.9L276.2 252.5L276.7 250.8L277.7 249.0L277.5 247.9L279.0 247.3L281.0 246.2L283.7 247.8L284.3 247.7L284.9 248.9L287.3 249.3L288.1 248.8L289.4 249.8L290.6 250.4L291.0 252.5L290.2 254.3L287.1 257.2L283.8 258.3L282.1 260.8L281.6 262.6L280.0 263.8L278.8 262.4L277.7 262.1L276.5 262.3L276.5 261.3L277.3 260.6L276.9 259.5z M597.0 168.1L596.2 169.2L595.6 171.3L594.9 172.7L594.2 173.2L593.3 172.3L592.0 171.1L590.1 167.1L589.8 167.3L590.9 170.3L592.6 173.1L594.7 177.4L595.8 178.9L596.7 180.5L599.1 183.5L598.6 184.0L598.7 185.8L601.9 188.3L602.4 188.9L591.4 188.9L580.6 188.9L569.4 188.9L569.4 178.7L569.4 168.8L568.6 166.5L569.3 164.8L568.9 163.6L569.9 162.3L573.6 162.3L576.3 163.0L579.0 163.8L580.3 164.2L582.5 163.4L583.6 162.6L586.0 162.3L588.0 162.7L588.8 164.1L589.4 163.2L591.6 163.8L593.8 164.0L595.2 163.3L597.0 168.1z M617.6 215.2L616.7 214.3L615.6 212.6L614.3 211.7L613.6 210.8L611.2 209.7L609.3 209.6L608.6 209.1L607.0 209.7L605.3 208.4L604.4 210.5L601.2 209.9L600.9 208.8L602.1 204.7L602.4 202.9L603.2 202.0L605.3 201.6L606.7 200.0L608.3 203.2L609.1 205.8L610.6 207.1L614.4 209.7L615.9 211.3L617.4 212.9L618.3 213.9L619.7 214.7L618.8 215.4L617.6 215.2z M474.9 133.7L475.0 131.7L473.9 130.5L477.8 128.5L481.2 129.0L485.0 129.0L487.9 129.4L490.2 129.3L494.7 129.4L495.8 130.5L500.9 131.7L501.9 131.1L505.1 132.4L508.3 132.0L508.4 133.6L505.8 135.5L502.3 136.1L502.0 137.0L500.3 138.5L499.2 140.8L500.3 142.4L498.7 143.6L498.1 145.4L496.0 146.0L494.0 148.1L490.5 148.2L487.9 148.1L486.1 149.1L485.1 150.1L483.7 149.9L482.7 149.0L481.9 147.4L479.3 147.0L479.1 146.0L480.1 145.0L480.5 144.2L479.5 143.4L480.3 141.6L479.2 139.9L480.4 139.7L480.5 138.4L480.9 138.0L481.0 135.8L482.3 135.1L481.5 133.7L479.9 133.6L479.4 133.9L477.7 133.9L477.0 132.6L475.9 133.0L474.9 133.7z M567.5 89.5L567.9 87.8L566.8 88.2L565.1 87.2L564.8 85.6L568.3 84.8L571.8 84.4L574.9 84.9L577.7 84.8L578.1 85.3L576.2 86.9L577.0 89.5L575.8 90.3L573.5 90.3L571.1 89.3L569.9 89.0L567.5 89.5z M605.3 208.4L607.0 209.7L608.6 209.1L609.3 209.6L611.2 209.7L613.6 210.8L614.3 211.7L615.6 212.6L616.7 214.3L617.6 215.2L616.7 216.4L615.7 217.7L615.9 218.5L616.0 219.3L617.5 219.3L618.2 219.2L618.8 219.6L618.2 220.6L619.2 222.2L620.3 223.5L621.3 224.5L630.4 227.8L632.7 227.8L624.9 236.1L621.3 236.2L618.8 238.2L617.0 238.2L616.3 239.1L614.4 239.1L613.2 238.2L610.7 239.3L609.9 240.5L608.0 240.3L607.4 240.0L606.8 240.0L605.9 240.0L602.4 237.6L600.4 237.6L599.5 236.7L599.5 235.2L598.1 234.7L596.4 231.7L595.1 231.0L594.7 229.9L593.2 228.6L591.5 228.4L592.5 226.8L594.0 226.7L594.4 225.9L594.3 223.4L595.2 220.5L596.5 219.7L596.8 218.6L597.9 216.4L599.6 215.1L600.8 212.3L601.2 209.9L604.4 210.5L605.3 208.4z M579.4 58.2L579.0 60.1L583.3 61.9L580.7 64.0L583.9 67.2L582.1 69.6L584.6 71.7L583.4 73.5L587.5 75.4L586.5 76.8L583.9 78.4L578.0 81.9L572.9 82.2L568.0 83.2L563.5 83.8L561.9 82.2L559.2 81.3L559.8 78.6L558.5 76.1L559.8 74.5L562.3 72.7L568.7 69.7L570.6 69.1L570.3 68.0L566.4 66.6L565.5 65.6L565.4 61.3L561.1 59.4L557.3 58.0L559.0 57.3L562.1 58.8L565.7 58.6L568.7 59.3L571.4 58.1L572.7 56.0L577.0 55.1L580.6 56.2L579.4 58.2z M995.5 298.2L996.4 299.0L996.0 300.4L994.3 300.8L992.7 300.5L992.5 299.2L993.5 298.3L994.8 298.6L995.5 298.2z M998.2 296.7L996.5 297.3L996.1 296.2L997.5 295.6L998.4 295.5L1000.0 294.6L1000.0 296.0L998.2 296.7z M0.2 295.8L0.0 296.0L0.0 294.6L0.6 294.5L0.2 295.8z M330.0 394.0L333.3 392.4L335.7 393.1L337.4 391.9L339.6 393.2L338.8 394.2L335.0 395.0L333.8 394.0L331.4 395.3L330.0 394.0z M526.6 132.9L525.6 135.1L524.4 134.5L523.7 132.6L524.3 131.6L526.1 130.5L526.6 132.9z M510.0 110.1L511.9 111.4L513.3 111.2L515.8 112.4L516.4 112.7L517.2 112.6L518.5 113.3L522.5 113.8L521.1 115.7L520.7 117.7L520.0 118.2L518.7 117.9L518.8 118.6L516.8 120.2L516.7 121.5L518.1 121.0L519.0 122.2L518.9 123.0L519.7 124.1L518.7 124.9L519.5 127.1L521.0 127.4L520.7 128.6L518.1 130.2L512.7 129.4L508.6 130.3L508.3 132.0L505.1 132.4L501.9 131.1L500.9 131.7L495.8 130.5L494.7 129.4L496.2 127.7L496.7 122.2L493.8 119.3L491.8 117.9L487.5 116.8L487.2 114.8L490.8 114.2L495.5 114.9L494.6 111.7L497.3 112.9L503.7 110.8L504.6 108.5L507.0 107.9L507.4 108.9L508.7 108.9L510.0 110.1z M530.8 261.1L528.0 258.2L526.1 256.0L524.4 253.1L524.5 252.2L525.1 251.3L525.8 249.3L526.4 247.2L527.3 247.0L531.3 247.1L531.3 243.7L532.6 243.5L534.3 243.9L536.0 243.6L536.3 243.7L536.1 244.9L536.9 246.3L539.0 246.1L539.7 246.7L538.5 249.9L539.8 251.5L540.1 253.7L539.7 255.6L538.9 256.9L536.4 256.7L534.9 255.4L534.7 256.6L532.8 257.0L531.9 257.7L532.9 259.5L530.8 261.1z M484.3 98.5L482.8 100.4L480.7 99.8L479.0 99.8L479.5 98.3L479.0 96.9L481.3 96.7L484.3 98.5z M491.7 87.1L488.7 90.1L491.5 89.7L494.6 89.8L493.8 92.0L491.3 94.5L494.2 94.7L494.4 95.0L496.9 98.3L498.8 98.7L500.5 101.9L501.3 103.0L504.7 103.5L504.3 105.3L502.9 106.1L504.0 107.5L501.5 109.0L497.8 109.0L493.1 109.7L491.8 109.2L490.0 110.5L487.4 110.2L485.4 111.2L484.0 110.7L488.0 107.7L490.5 107.1L490.5 107.1L486.2 106.7L485.4 105.6L488.3 104.7L486.7 103.2L487.3 101.4L491.4 101.7L491.4 101.7L491.8 100.0L490.0 98.3L489.9 98.3L486.5 97.8L485.9 97.1L486.9 95.8L486.0 95.0L484.5 96.4L484.3 93.7L482.9 92.3L483.9 89.4L486.1 87.1L488.3 87.4L491.7 87.1z M615.4 134.6L615.8 133.4L615.1 131.5L613.5 130.5L612.0 130.2L611.0 129.3L611.3 129.0L613.7 129.5L617.8 129.9L621.5 131.3L622.0 131.8L623.7 131.4L626.3 131.9L627.2 133.1L628.9 133.7L628.2 134.1L629.5 135.6L629.2 135.9L627.7 135.8L625.6 135.0L624.9 135.4L621.1 135.9L618.4 134.5L615.4 134.6z M502.9 233.5L498.6 235.2L497.0 236.1L494.5 236.9L492.1 236.1L492.2 235.0L491.0 232.6L491.7 229.5L492.9 227.2L492.1 223.2L491.8 221.1L491.8 219.5L496.7 219.4L497.9 219.6L498.8 219.2L500.1 219.4L499.9 220.3L501.0 221.7L501.0 223.7L501.3 225.9L502.0 226.9L501.4 229.4L501.6 230.8L502.3 232.6L502.9 233.5z M476.6 228.6L475.8 228.6L475.2 229.7L474.4 229.7L473.9 229.1L474.1 228.0L472.9 226.3L472.2 226.6L471.6 226.6L470.8 226.8L470.8 225.8L470.4 225.1L470.5 224.3L469.9 223.1L469.1 222.1L466.9 222.1L466.2 222.6L465.5 222.7L465.0 223.3L464.7 224.0L463.2 225.3L462.0 223.6L460.9 222.5L460.2 222.2L459.5 221.6L459.2 220.4L458.8 219.8L458.0 219.3L459.2 218.0L460.0 218.0L460.8 217.6L461.4 217.6L461.8 217.2L461.6 216.3L461.9 216.0L461.9 215.0L463.3 215.1L465.3 215.7L465.9 215.7L466.1 215.4L467.6 215.6L468.0 215.4L468.2 216.5L468.6 216.5L469.3 216.1L469.8 216.2L470.6 216.9L471.8 217.1L472.5 216.5L473.4 216.1L474.1 215.7L474.6 215.8L475.3 216.4L475.6 217.2L476.7 218.4L476.2 219.1L476.1 220.0L476.6 219.7L477.0 220.0L476.8 220.8L477.7 221.6L477.1 221.9L476.9 222.8L477.6 224.0L478.2 226.2L477.2 226.5L476.9 226.9L477.2 227.4L477.0 228.6L476.6 228.6z M453.2 213.5L453.6 212.2L456.6 212.2L457.2 211.5L458.1 211.5L459.2 212.1L460.1 212.2L461.0 211.7L461.5 212.5L460.3 213.1L459.1 213.1L457.9 212.5L456.9 213.1L456.4 213.1L455.7 213.5L453.2 213.5z M458.0 219.3L456.5 218.2L455.3 218.0L454.7 217.2L454.7 216.8L453.9 216.2L453.7 215.6L455.1 215.1L456.1 215.2L456.8 214.9L461.9 215.0L461.9 216.0L461.6 216.3L461.8 217.2L461.4 217.6L460.8 217.6L460.0 218.0L459.2 218.0L458.0 219.3z M526.4 247.2L525.8 246.8L526.8 243.7L531.3 243.7L531.3 247.1L527.3 247.0L526.4 247.2z M565.8 150.8L567.4 151.8L569.5 151.6L571.6 151.8L571.5 152.3L573.0 151.9L572.7 152.8L568.7 153.0L568.7 152.5L565.3 152.0L565.8 150.8z M573.9 134.5L573.0 136.3L572.4 136.6L570.7 136.5L569.2 136.3L565.9 137.0L567.8 138.5L566.4 139.0L564.8 139.0L563.4 137.6L562.9 138.2L563.5 139.8L564.9 141.1L563.8 141.7L565.4 143.0L566.7 143.8L566.8 145.4L564.2 144.7L565.0 146.1L563.3 146.4L564.3 148.8L562.5 148.9L560.2 147.7L559.2 145.4L558.7 143.6L557.6 142.3L556.2 140.7L556.0 139.9L557.3 138.6L557.4 137.7L558.3 137.3L558.4 136.5L560.2 136.3L561.3 135.7L562.8 135.7L563.2 135.3L563.8 135.2L565.8 135.3L568.0 134.5L570.0 135.5L572.5 135.2L572.5 133.8L573.9 134.5z M370.1 20.5L379.4 18.8L389.2 18.9L392.7 17.9L402.5 17.7L424.7 18.0L442.1 20.2L437.0 21.3L426.3 21.4L411.4 21.7L412.8 22.2L422.6 21.9L431.0 22.8L436.4 22.0L438.7 23.0L435.6 24.6L442.7 23.5L456.2 22.5L464.5 23.0L466.1 24.2L454.8 26.2L453.2 26.8L444.3 27.3L450.7 27.4L447.5 29.4L445.3 31.2L445.4 34.3L448.7 36.2L444.3 36.3L439.8 37.1L444.9 38.6L445.6 41.0L442.6 41.2L446.2 43.6L440.0 43.8L443.2 45.0L442.3 45.9L438.4 46.4L434.5 46.4L438.0 48.3L438.1 49.5L432.6 48.3L431.1 49.1L434.9 49.8L438.5 51.5L439.6 53.7L434.6 54.2L432.5 53.2L429.0 51.6L430.0 53.5L426.8 54.9L434.1 55.0L437.9 55.2L430.5 57.6L422.9 59.8L414.8 60.8L411.7 60.8L408.9 61.8L405.0 64.8L399.0 66.7L397.1 66.8L393.4 67.5L389.4 68.2L387.0 69.9L387.0 71.8L385.6 73.7L381.1 75.9L382.2 78.1L380.9 80.3L379.5 83.1L375.6 83.2L371.5 81.0L365.9 80.9L363.2 79.4L361.4 76.7L356.6 73.3L355.2 71.4L354.8 69.0L350.9 66.4L351.9 64.3L350.1 63.4L352.8 60.1L357.0 59.1L358.1 57.9L358.7 55.8L355.5 56.7L354.0 57.1L351.5 57.5L348.1 56.6L347.9 54.8L349.0 53.3L351.6 53.2L357.2 54.0L352.5 52.2L350.0 51.3L347.2 51.6L344.9 51.0L348.0 48.4L346.3 47.3L344.1 45.4L340.8 42.5L337.2 41.4L337.3 40.2L329.8 38.6L323.9 38.4L316.5 38.5L309.7 38.7L306.5 37.8L301.7 36.1L309.0 35.2L314.5 35.1L302.7 34.3L296.4 33.2L296.8 32.1L307.3 30.8L317.5 29.5L318.5 28.4L311.0 27.5L313.5 26.3L323.1 24.4L327.1 24.1L326.0 22.9L332.5 22.1L341.1 21.7L349.6 21.7L352.7 22.5L360.0 21.0L366.7 22.0L370.6 22.3L376.3 23.2L369.7 21.7L370.1 20.5z M249.7 211.8L248.3 211.4L246.6 211.3L245.3 210.8L243.8 209.6L243.9 208.8L244.2 208.2L243.8 207.6L245.1 205.4L248.7 205.4L248.8 204.4L248.3 204.2L248.0 203.6L247.0 203.0L246.0 202.1L247.2 202.1L247.2 200.5L249.8 200.5L252.4 200.5L252.4 202.7L252.1 205.9L253.0 205.9L253.9 206.4L254.1 206.0L254.9 206.3L253.7 207.4L252.3 208.1L252.2 208.7L252.4 209.2L251.8 209.9L251.1 210.1L251.3 210.4L250.8 210.7L249.8 211.4L249.7 211.8z M354.0 243.0L352.9 244.1L351.6 244.3L351.2 243.5L350.6 243.4L349.8 244.2L348.5 243.6L349.2 242.4L349.5 241.1L350.0 239.9L348.9 238.3L348.7 236.4L350.1 234.0L351.1 234.3L353.1 235.0L356.0 237.3L356.5 238.5L354.9 241.0L354.0 243.0z M334.0 226.8L335.8 227.8L337.5 229.6L337.6 231.0L338.7 231.1L340.2 232.4L341.3 233.4L340.8 235.9L339.1 236.6L339.3 237.3L338.8 238.7L340.0 240.7L340.9 240.7L341.2 242.3L342.9 244.7L342.3 244.8L340.7 244.6L339.8 245.3L338.6 245.8L337.7 245.9L337.4 246.5L336.0 246.3L334.3 245.0L334.1 243.8L333.4 242.3L333.8 240.0L334.6 239.0L334.0 237.7L333.0 237.3L333.4 236.1L332.7 235.4L331.3 235.6L329.4 233.4L330.2 232.7L330.1 231.4L331.8 231.0L332.5 230.4L331.6 229.4L331.8 228.4L334.0 226.8z M257.5 213.9L257.0 213.1L256.1 212.8L256.3 211.7L255.9 211.4L255.4 211.2L254.2 211.5L254.1 211.2L253.2 210.7L252.6 210.2L251.8 209.9L252.4 209.2L252.2 208.7L252.3 208.1L253.7 207.4L254.9 206.3L255.2 206.4L255.8 205.9L256.6 205.9L256.9 206.1L257.3 206.0L258.6 206.2L259.9 206.2L260.8 205.9L261.1 205.5L262.0 205.7L262.7 205.9L263.4 205.8L263.9 205.6L265.2 206.0L265.6 206.0L266.5 206.5L267.3 207.2L268.3 207.6L269.0 208.3L268.1 208.3L267.7 208.7L266.7 209.0L266.0 209.0L265.4 209.4L264.9 209.3L264.4 208.8L264.1 208.9L263.7 209.6L263.5 209.6L263.4 210.1L262.5 210.9L261.9 211.2L261.7 211.6L260.8 211.0L260.2 211.7L259.7 211.7L259.0 211.8L259.1 213.2L258.7 213.2L258.3 213.8L257.5 213.9z M552.3 122.5L553.0 123.6L553.9 124.3L552.8 125.4L551.5 124.8L549.6 124.8L547.2 124.4L545.9 124.4L545.3 125.0L544.3 124.4L543.8 125.5L545.1 126.8L545.7 127.7L547.0 128.7L548.0 129.3L549.1 130.5L551.6 131.5L551.3 132.0L548.6 131.0L547.0 130.0L544.5 129.1L542.2 127.1L542.7 126.9L541.4 125.7L541.4 124.8L539.6 124.4L538.8 125.5L537.9 124.6L538.0 123.7L538.1 123.6L540.0 123.7L540.5 123.2L541.5 123.7L542.6 123.7L542.6 123.0L543.5 122.7L543.8 121.6L546.0 120.8L546.9 121.2L549.0 122.4L551.3 122.9L552.3 122.5z M296.7 194.7L298.4 194.8L300.8 195.2L301.0 196.8L300.8 197.8L300.2 198.3L300.9 199.1L300.8 199.9L299.0 199.4L297.7 199.6L296.0 199.4L294.7 199.9L293.2 199.0L293.4 198.2L296.0 198.5L298.1 198.8L299.1 198.1L297.8 196.9L297.8 195.9L296.1 195.4L296.7 194.7z M545.0 119.9L545.9 118.1L545.4 117.5L547.0 117.5L547.2 116.3L548.6 117.0L549.6 117.3L551.9 117.0L552.2 116.4L553.3 116.4L554.6 115.9L554.9 116.1L556.2 115.8L556.9 115.1L557.8 114.9L560.8 115.8L561.3 115.5L562.9 116.2L563.1 117.0L561.4 117.6L560.1 119.5L558.4 121.3L556.2 121.9L554.4 121.7L552.3 122.5L551.3 122.9L549.0 122.4L546.9 121.2L546.0 120.8L545.5 119.9L545.0 119.9z M835.3 278.4L834.2 278.5L830.5 276.5L833.1 276.0L834.5 276.8L835.5 277.7L835.3 278.4z M845.7 278.2L843.3 278.8L842.9 278.4L843.2 277.5L844.4 275.8L847.1 274.7L847.4 275.2L847.5 276.1L845.7 278.2z M827.5 272.5L828.5 273.2L830.2 273.0L830.9 274.2L827.7 274.7L825.8 275.1L824.3 275.1L825.2 273.5L826.8 273.5L827.5 272.5z M841.4 272.5L841.0 274.0L836.8 274.8L833.1 274.5L833.1 273.5L835.3 272.9L837.1 273.7L838.9 273.5L841.4 272.5z M801.7 268.8L807.1 269.1L807.7 268.0L812.8 269.3L813.8 271.1L818.0 271.6L821.4 273.3L818.2 274.3L815.2 273.2L812.7 273.3L809.8 273.1L807.2 272.6L804.0 271.5L801.9 271.2L800.8 271.6L795.7 270.4L795.2 269.2L792.7 269.0L794.6 266.4L798.0 266.5L800.2 267.6L801.4 267.8L801.7 268.8z M874.2 267.3L872.8 269.2L872.5 267.1L873.0 266.1L873.6 265.1L874.2 265.9L874.2 267.3z M853.5 259.6L852.4 260.5L850.5 260.0L850.0 258.8L852.8 258.7L853.5 259.6z M862.4 258.6L863.4 260.7L861.1 259.6L858.8 259.3L857.2 259.5L855.3 259.4L855.9 257.9L859.4 257.8L862.4 258.6z M872.6 253.2L873.4 257.7L876.3 259.4L878.6 256.4L881.8 254.7L884.2 254.7L886.6 255.7L888.7 256.7L891.7 257.2L891.7 266.3L891.8 275.3L889.3 273.0L886.5 272.5L885.8 273.3L882.3 273.4L883.4 271.1L885.2 270.3L884.5 267.3L883.1 265.0L877.7 262.6L875.5 262.4L871.3 259.8L870.5 261.2L869.4 261.4L868.8 260.4L868.8 259.2L866.6 257.8L869.6 256.8L871.6 256.9L871.4 256.2L867.3 256.1L866.2 254.5L863.7 254.0L862.6 252.6L866.3 251.9L867.7 251.0L872.2 252.2L872.6 253.2z M847.9 246.1L845.7 248.8L843.6 249.3L840.9 248.8L836.3 248.9L833.8 249.3L833.4 251.4L835.9 253.9L837.4 252.7L842.6 251.7L842.4 253.0L841.2 252.6L840.0 254.2L837.5 255.3L840.2 258.9L839.6 259.8L842.1 263.0L842.1 264.8L840.6 265.7L839.5 264.7L840.9 262.4L838.2 263.5L837.5 262.7L837.8 261.6L835.8 260.0L836.0 257.3L834.2 258.1L834.4 261.4L834.5 265.4L832.8 265.8L831.6 264.9L832.4 262.4L831.9 259.7L830.8 259.7L829.9 257.8L831.1 256.0L831.5 253.8L832.8 249.6L833.4 248.4L835.8 246.4L838.0 247.2L841.5 247.6L844.7 247.5L847.4 245.4L847.9 246.1z M857.5 246.9L857.3 249.3L855.9 249.0L855.5 250.7L856.6 252.2L855.8 252.5L854.7 250.7L853.9 247.2L854.4 245.0L855.4 244.0L855.6 245.5L857.2 245.7L857.5 246.9z M827.4 244.9L830.5 247.5L827.3 247.8L826.3 249.7L826.4 252.2L823.8 254.1L823.7 256.9L822.6 261.1L822.2 260.2L819.1 261.4L818.0 259.7L816.0 259.6L814.6 258.7L811.3 259.7L810.3 258.3L808.5 258.5L806.2 258.2L805.8 254.4L804.4 253.7L803.0 251.3L802.6 248.8L803.0 246.3L804.6 244.4L805.1 246.3L807.0 247.9L808.8 247.3L810.5 247.5L812.2 246.1L813.5 245.8L816.1 246.6L818.4 246.0L819.8 242.2L820.9 241.2L821.8 238.0L825.0 238.0L827.5 238.5L825.9 241.0L827.9 243.6L827.4 244.9z M793.9 266.3L790.9 266.3L788.5 264.0L785.0 261.7L783.8 260.0L781.7 257.8L780.3 255.7L778.2 251.8L775.7 249.5L774.9 247.1L773.9 244.9L771.4 243.2L769.9 240.8L767.8 239.3L764.9 236.2L764.7 234.8L766.5 234.9L770.8 235.4L773.2 238.1L775.4 240.0L776.9 241.2L779.6 244.2L782.4 244.2L784.7 246.1L786.3 248.4L788.4 249.7L787.3 252.0L788.9 252.9L789.9 253.0L790.4 255.0L791.4 256.5L793.4 256.7L794.7 258.5L794.0 262.0L793.9 266.3z M716.2 151.4L719.2 154.7L718.9 156.9L720.0 158.3L719.9 159.8L717.9 159.4L718.7 162.5L721.4 164.2L725.3 166.2L723.5 167.4L722.5 170.0L725.2 171.1L727.8 172.4L731.4 174.0L735.2 174.3L736.8 175.8L739.0 176.0L742.3 176.7L744.6 176.6L744.9 175.5L744.6 173.8L744.8 172.6L746.5 172.0L746.7 174.2L746.8 174.7L749.3 175.8L751.0 175.3L753.4 175.5L755.6 175.4L755.8 173.7L754.7 172.9L757.0 172.5L759.5 170.4L762.7 168.7L765.0 169.4L767.0 168.2L768.3 169.9L767.4 171.1L770.4 171.5L770.6 172.5L769.6 173.1L769.8 174.8L767.8 174.3L764.2 176.2L764.3 177.8L762.8 180.1L762.6 181.5L761.4 183.7L759.2 183.1L759.1 186.0L758.5 186.9L758.8 188.1L757.4 188.8L756.0 184.4L755.2 184.4L754.7 186.2L753.2 184.7L754.1 183.1L755.3 183.0L756.6 180.6L755.0 180.1L752.4 180.2L749.8 179.8L749.5 177.9L748.2 177.7L746.0 176.5L745.0 178.4L747.0 179.9L745.3 180.9L744.7 181.9L746.4 182.7L745.9 184.4L746.9 186.4L747.3 188.7L746.9 189.7L745.0 189.7L741.6 190.3L741.8 192.4L740.3 194.0L736.3 195.9L733.2 199.2L731.1 200.9L728.3 202.7L728.3 204.0L726.9 204.7L724.4 205.7L723.1 205.8L722.3 208.0L722.9 211.6L723.0 213.9L721.8 216.5L721.8 221.2L720.4 221.4L719.1 223.5L720.0 224.4L717.4 225.2L716.5 227.1L715.4 227.9L712.8 225.3L711.5 221.4L710.4 218.6L709.4 217.3L708.0 214.6L707.3 211.1L706.8 209.4L704.3 205.6L703.1 200.2L702.3 196.6L702.3 193.3L701.8 190.7L697.7 192.3L695.8 192.0L692.1 188.6L693.5 187.6L692.6 186.5L689.4 184.2L691.2 182.3L697.3 182.3L696.8 180.0L695.2 178.5L694.9 176.4L693.1 175.2L696.2 172.3L699.4 172.5L702.3 169.6L704.0 166.7L706.7 163.9L706.7 162.0L709.1 160.4L706.8 159.0L705.8 157.1L704.9 154.7L706.2 153.5L710.4 154.2L713.5 153.7L716.2 151.4z M482.8 100.4L483.2 102.4L481.1 104.8L476.2 106.5L472.3 106.1L474.5 103.2L473.1 100.3L476.9 98.2L479.0 96.9L479.5 98.3L479.0 99.8L480.7 99.8L482.8 100.4z M649.8 146.7L652.2 146.1L654.2 144.5L656.1 144.6L657.3 144.1L659.3 144.4L662.3 145.8L664.5 146.1L667.7 148.5L669.8 148.6L670.0 151.0L668.9 154.4L668.1 156.5L669.3 156.9L668.2 158.4L669.1 160.6L669.3 162.4L671.4 162.8L671.6 164.6L669.1 167.1L670.5 168.6L671.6 170.3L674.2 171.5L674.3 173.9L675.6 174.4L675.9 175.7L671.9 177.1L670.8 180.3L665.6 179.5L662.6 178.9L659.4 178.5L658.3 175.1L656.9 174.6L654.8 175.1L652.0 176.4L648.6 175.5L645.8 173.4L643.1 172.6L641.3 170.0L639.2 166.3L637.7 166.7L635.9 165.8L634.9 166.9L633.4 165.4L633.3 163.9L632.5 163.9L632.9 161.9L631.5 159.8L628.1 158.3L626.2 155.6L626.8 153.5L628.2 152.5L628.0 150.9L626.2 150.1L624.4 146.7L622.8 144.5L623.4 143.7L622.5 140.5L624.4 139.7L624.9 140.7L626.3 142.0L628.2 142.4L629.2 142.3L632.5 140.3L633.5 140.0L634.3 140.9L633.4 142.2L635.1 143.7L635.8 143.6L636.7 145.6L639.3 146.2L641.2 147.6L645.2 148.1L649.5 147.3L649.8 146.7z M626.2 150.1L628.0 150.9L628.2 152.5L626.8 153.5L626.2 155.6L628.1 158.3L631.5 159.8L632.9 161.9L632.5 163.9L633.3 163.9L633.4 165.4L634.9 166.9L633.3 166.7L631.4 166.5L629.4 169.2L624.2 168.9L616.4 163.4L612.2 161.4L608.9 160.7L607.8 157.3L613.9 154.4L615.0 151.0L614.7 149.0L616.2 148.3L617.6 146.6L618.8 146.2L622.1 146.5L623.0 147.2L624.4 146.7L626.2 150.1z M459.7 65.4L459.1 67.2L462.2 69.1L458.6 71.2L450.6 73.1L448.2 73.6L444.5 73.2L436.8 72.3L439.5 71.1L433.5 69.7L438.4 69.2L438.3 68.4L432.4 67.7L434.3 65.9L438.5 65.5L442.8 67.4L447.1 65.9L450.6 66.7L455.1 65.2L459.7 65.4z M599.2 159.1L598.7 160.0L597.7 159.6L597.2 161.5L597.8 161.8L597.1 162.2L597.0 162.9L598.3 162.5L598.4 163.6L597.0 168.1L595.2 163.3L596.0 162.4L595.8 162.2L596.5 160.9L597.1 158.8L597.5 158.1L597.6 158.1L598.5 158.1L598.8 157.6L599.5 157.6L599.5 158.7L599.2 159.1L599.2 159.1z M543.1 143.8L542.1 146.0L542.5 146.8L541.9 148.3L539.8 147.2L538.4 146.9L534.5 145.5L534.9 144.1L538.2 144.3L541.0 144.0L543.1 143.8z M525.6 135.5L527.2 137.5L526.9 141.2L525.6 141.0L524.5 141.9L523.4 141.2L523.3 137.8L522.7 136.2L524.2 136.4L525.6 135.5z M534.4 120.1L538.4 120.8L538.1 122.2L538.7 123.4L536.5 123.0L534.2 123.9L534.4 125.3L534.1 126.1L535.0 127.5L537.6 128.9L539.0 131.2L542.1 133.5L544.2 133.4L544.9 134.1L544.1 134.6L546.6 135.6L548.7 136.5L551.0 137.9L551.3 138.4L550.8 139.4L549.3 138.1L546.9 137.7L545.7 139.5L547.7 140.5L547.4 141.9L546.2 142.1L544.7 144.5L543.6 144.7L543.6 143.8L544.1 142.4L544.7 141.8L543.7 140.2L542.8 138.8L541.7 138.4L540.8 137.2L539.1 136.7L537.9 135.6L535.8 135.4L533.6 134.2L531.1 132.3L529.2 130.7L528.3 128.0L527.0 127.7L524.7 126.8L523.4 127.1L521.8 128.4L520.7 128.6L521.0 127.4L519.5 127.1L518.7 124.9L519.7 124.1L518.9 123.0L519.0 122.2L520.2 122.8L521.5 122.7L523.1 121.8L523.6 122.2L524.9 122.1L525.5 121.0L527.6 121.3L528.8 120.9L529.0 119.7L530.7 120.1L531.0 119.6L533.8 119.1L534.4 120.1z M284.5 198.6L286.4 198.9L287.9 199.6L288.3 200.3L286.4 200.4L285.5 200.8L284.0 200.4L282.4 199.4L282.7 198.7L283.9 198.5L284.5 198.6z M598.7 160.0L599.2 159.1L602.3 160.2L607.8 157.3L608.9 160.7L608.3 161.1L602.8 162.5L605.6 165.3L604.6 165.7L604.2 166.7L602.1 167.0L601.4 168.0L600.2 168.9L597.1 168.5L597.0 168.1L598.4 163.6L598.3 162.5L598.7 161.7L598.7 160.0z M874.0 155.1L874.4 156.1L872.8 157.8L871.6 156.9L870.2 157.5L869.5 159.2L867.7 158.4L867.7 157.0L869.2 155.4L870.8 155.7L872.0 154.5L874.0 155.1z M891.6 146.8L890.6 149.0L891.0 150.4L889.6 152.4L886.0 153.7L881.2 153.9L877.2 157.0L875.3 156.0L875.2 153.9L870.4 154.5L867.1 155.8L863.9 155.9L866.7 157.9L864.8 162.6L863.0 163.8L861.7 162.7L862.4 160.2L860.6 159.4L859.5 157.5L862.1 156.7L863.6 154.9L866.3 153.5L868.4 151.6L873.9 150.7L876.9 151.3L879.8 146.4L881.6 147.7L885.7 144.9L887.3 143.8L889.0 140.4L888.6 137.3L889.7 135.6L892.7 135.1L894.2 138.9L894.1 141.2L891.6 144.0L891.6 146.8z M899.8 127.3L901.7 127.9L903.7 126.7L904.3 129.8L900.2 130.6L897.7 133.3L893.4 131.4L891.9 134.5L888.8 134.5L888.4 131.8L889.8 129.6L892.7 129.5L893.5 125.6L894.4 123.5L897.6 126.4L899.8 127.3z M697.1 132.6L695.5 133.1L691.9 135.0L690.6 137.0L689.6 137.0L688.8 135.7L685.3 135.6L684.8 133.4L683.4 133.3L683.6 130.6L680.3 128.5L675.5 128.7L672.3 129.2L669.6 126.7L667.3 125.6L663.0 123.6L662.5 123.4L655.4 125.0L655.5 135.3L654.0 135.4L652.1 133.2L650.2 132.4L647.1 133.0L645.8 133.9L645.7 133.3L646.4 132.1L645.8 131.1L642.6 130.2L641.4 127.7L639.8 127.0L639.7 126.1L642.4 126.3L642.5 124.3L644.9 123.9L647.3 124.3L647.8 121.6L647.3 119.9L644.6 120.0L642.2 119.3L639.0 120.5L636.4 121.1L635.0 120.7L635.3 119.2L633.5 117.4L631.4 117.5L629.1 115.6L630.7 113.5L629.9 112.9L632.1 109.8L634.9 111.5L635.3 109.4L641.0 106.4L645.4 106.3L651.5 108.3L654.8 109.4L657.7 108.2L662.1 108.2L665.7 109.6L666.5 108.8L670.4 108.9L671.1 107.6L666.6 105.7L669.2 104.3L668.7 103.6L671.4 102.8L669.4 100.9L670.7 100.0L681.1 99.0L682.4 98.3L689.4 97.3L691.9 96.2L696.8 96.8L697.7 99.6L700.6 99.0L704.2 99.9L704.0 101.4L706.6 101.3L713.6 98.6L712.6 99.5L716.1 101.7L722.3 108.7L723.8 107.3L727.6 108.9L731.6 108.1L733.2 108.6L734.5 110.2L736.4 110.8L737.6 112.0L741.2 111.6L742.7 113.3L740.6 115.1L738.2 115.4L738.1 118.2L736.6 119.4L731.1 118.5L729.1 123.5L727.6 124.1L722.1 125.2L724.6 130.1L722.7 130.8L722.9 132.4L721.2 132.0L719.8 131.0L715.7 130.7L711.1 130.6L710.1 130.9L706.1 129.7L704.6 130.3L704.1 131.9L699.6 131.0L697.7 131.4L697.1 132.6z M613.9 252.4L615.5 254.7L613.6 255.8L612.9 256.9L611.8 257.1L611.4 259.1L610.6 260.2L610.0 262.1L608.9 263.0L604.9 260.2L604.7 258.6L594.6 252.9L594.2 252.6L594.1 249.7L594.9 248.6L596.3 246.7L597.3 244.7L596.1 241.5L595.8 240.1L594.5 238.2L596.2 236.5L598.1 234.7L599.5 235.2L599.5 236.7L600.4 237.6L602.4 237.6L605.9 240.0L606.8 240.0L607.4 240.0L608.0 240.3L609.9 240.5L610.7 239.3L613.2 238.2L614.4 239.1L616.3 239.1L613.8 242.3L613.9 252.4z M697.1 132.6L697.7 131.4L699.6 131.0L704.1 131.9L704.6 130.3L706.1 129.7L710.1 130.9L711.1 130.6L715.7 130.7L719.8 131.0L721.2 132.0L722.9 132.4L722.6 133.0L718.2 134.5L717.2 135.6L713.6 135.9L712.6 137.7L709.6 137.3L707.7 137.9L705.1 139.2L705.4 139.8L704.7 140.5L699.4 140.9L696.0 140.0L693.0 140.2L693.2 138.6L696.2 139.1L697.3 138.2L699.4 138.5L702.9 136.5L699.6 135.0L697.7 135.7L695.6 134.7L697.9 132.9L697.1 132.6z M787.5 220.5L786.4 219.0L785.0 216.1L784.3 212.8L786.1 210.5L789.7 210.0L792.3 210.4L794.6 211.4L795.8 209.5L798.3 210.5L798.9 212.4L798.6 215.7L793.9 217.9L795.1 219.6L792.2 219.8L789.8 220.9L787.5 220.5z M856.5 142.7L858.9 146.0L859.6 147.8L859.6 151.0L858.6 152.5L856.1 153.1L853.9 154.2L851.3 154.5L851.0 153.0L851.6 150.9L850.3 148.0L852.4 147.5L850.5 145.1L850.7 144.9L851.9 145.0L853.0 143.7L854.9 143.6L856.1 143.4L856.5 142.7z M557.7 133.2L557.5 133.8L557.2 133.7L557.0 132.7L556.3 132.4L555.8 131.7L556.3 131.1L556.9 130.9L557.3 130.0L557.8 129.8L558.2 130.2L558.7 130.4L559.1 130.8L559.6 130.9L560.1 131.5L560.5 131.4L560.2 132.1L559.8 132.4L559.9 132.7L559.3 132.8L557.7 133.2z M633.3 166.7L633.8 168.0L633.6 168.6L634.5 170.7L632.5 170.8L631.8 169.4L629.4 169.2L631.4 166.5L633.3 166.7z M792.3 210.4L793.2 209.1L793.3 206.7L791.1 204.3L790.9 201.6L788.8 199.3L786.7 199.1L786.1 200.1L784.5 200.2L783.6 199.7L780.7 201.4L780.7 198.9L781.3 195.9L779.5 195.8L779.3 194.1L778.1 193.3L778.7 192.3L781.1 190.5L781.3 191.1L782.8 191.2L782.4 188.0L783.8 187.6L785.4 189.8L786.7 192.3L790.1 192.3L791.2 194.8L789.4 195.5L788.6 196.5L791.9 198.1L794.2 201.4L796.0 203.9L798.1 205.8L798.8 207.8L798.3 210.5L795.8 209.5L794.6 211.4L792.3 210.4z M599.5 157.6L598.8 157.6L598.5 158.1L597.6 158.1L598.6 155.8L599.9 153.9L600.0 153.8L601.2 153.9L601.7 155.0L600.2 156.0L599.5 157.6z M478.6 237.9L477.8 237.9L475.0 236.6L472.5 234.5L470.1 232.9L468.2 231.2L468.9 230.3L469.0 229.5L470.3 227.9L471.6 226.6L472.2 226.6L472.9 226.3L474.1 228.0L473.9 229.1L474.4 229.7L475.2 229.7L475.8 228.6L476.6 228.6L476.4 229.5L476.7 230.8L476.1 232.0L476.9 232.8L477.8 233.0L479.0 234.1L479.1 235.2L478.8 235.6L478.6 237.9z M541.3 186.5L539.3 187.5L537.7 186.0L533.3 184.8L532.1 183.1L529.9 181.8L528.6 182.3L527.6 180.7L527.5 179.5L525.9 177.5L527.0 176.4L526.7 174.6L527.1 173.1L526.9 171.8L527.4 169.6L527.2 168.3L526.3 165.8L527.7 165.2L527.9 164.0L527.6 162.8L529.5 161.8L530.4 160.9L531.8 160.1L531.9 158.0L535.2 158.9L536.3 158.7L538.7 159.1L542.3 160.4L543.6 162.8L546.1 163.4L550.1 164.5L553.0 165.9L554.4 165.2L555.7 163.9L555.1 161.8L555.9 160.4L557.9 159.1L559.8 158.8L563.6 159.3L564.5 160.6L565.6 160.6L566.5 161.1L569.2 161.4L569.9 162.3L568.9 163.6L569.3 164.8L568.6 166.5L569.4 168.8L569.4 178.7L569.4 188.9L569.4 194.4L566.2 194.4L566.2 195.6L555.1 190.3L544.1 185.0L541.3 186.5z M727.2 229.1L726.8 232.0L725.6 232.8L723.2 233.4L721.9 231.2L721.4 227.2L722.6 222.7L724.6 224.3L725.8 226.2L727.2 229.1z M580.5 330.4L581.5 331.3L580.6 332.6L580.1 333.5L578.6 334.0L578.1 334.8L577.1 335.1L575.0 333.0L576.5 331.2L578.0 330.1L579.3 329.6L580.5 330.4z M563.1 99.1L562.9 98.4L563.2 97.6L562.0 97.2L559.1 96.7L558.5 94.4L561.7 93.5L566.3 93.7L569.1 93.4L569.4 94.0L570.9 94.2L573.6 95.5L573.9 96.8L571.6 97.6L570.9 99.2L567.9 100.3L565.2 100.2L564.6 99.4L563.1 99.1z M516.8 110.8L517.3 111.4L517.2 112.6L516.4 112.7L515.8 112.4L516.1 110.9L516.8 110.8z M558.5 94.4L558.6 92.3L559.9 90.5L562.6 89.6L564.8 91.6L567.0 91.6L567.5 89.5L569.9 89.0L571.1 89.3L573.5 90.3L575.8 90.3L577.1 91.0L577.4 92.3L578.3 94.0L575.3 95.0L573.6 95.5L570.9 94.2L569.4 94.0L569.1 93.4L566.3 93.7L561.7 93.5L558.5 94.4z M485.6 150.7L487.2 151.9L489.9 151.7L492.8 152.3L494.0 152.3L495.0 154.1L495.2 155.8L496.1 158.7L496.9 159.3L496.4 160.4L492.7 160.8L491.5 161.9L489.9 162.1L489.7 164.2L486.5 165.3L485.4 166.7L483.2 167.4L480.4 167.8L475.9 169.9L475.9 173.2L475.5 173.2L475.5 173.2L475.6 174.7L473.9 174.8L473.0 175.4L471.7 175.4L470.7 175.0L468.4 175.3L467.4 177.5L466.6 177.7L465.3 181.2L461.4 184.2L460.5 188.0L459.4 189.3L459.0 190.3L452.8 190.5L452.7 190.5L452.9 189.2L453.9 188.4L454.8 187.0L454.6 186.1L455.6 184.1L457.1 182.3L458.1 181.9L458.8 180.3L458.9 178.8L459.9 177.1L461.7 176.1L463.5 173.2L463.6 173.2L464.9 172.1L467.5 171.8L469.7 169.9L471.1 169.2L473.4 166.9L472.7 163.4L473.8 161.0L474.2 159.5L476.0 157.7L478.7 156.4L480.8 155.2L482.7 152.4L483.5 150.7L485.6 150.7z M573.9 116.1L574.6 115.6L576.5 115.4L578.5 116.2L579.6 116.3L580.9 117.1L580.7 118.0L581.7 118.5L582.1 119.6L583.1 120.3L582.9 120.8L583.4 121.0L582.7 121.3L581.0 121.2L580.8 120.8L580.2 121.0L580.4 121.5L579.6 122.4L579.1 123.3L578.4 123.6L577.9 122.4L578.2 121.2L578.1 120.0L576.5 118.3L575.6 117.1L574.8 116.3L573.9 116.1z M637.6 284.6L638.4 285.8L639.0 287.7L639.5 291.0L640.2 292.3L639.9 293.6L639.4 294.4L638.5 292.8L638.0 293.6L638.5 295.7L638.3 296.9L637.5 297.5L637.3 299.9L636.2 303.1L634.9 306.9L633.1 312.2L632.1 316.1L630.8 319.3L628.6 319.9L626.1 321.1L624.5 320.4L622.3 319.4L621.6 317.9L621.4 315.5L620.4 313.3L620.2 311.3L620.6 309.3L621.9 308.8L621.9 307.9L623.3 305.8L623.5 304.0L622.9 302.7L622.3 300.9L622.1 298.4L623.1 296.8L623.5 295.0L624.8 294.9L626.4 294.4L627.4 293.9L628.6 293.8L630.2 292.3L632.5 290.5L633.3 289.1L633.0 288.0L634.1 288.3L635.7 286.4L635.7 284.7L636.7 283.4L637.6 284.6z M230.2 178.1L229.1 180.6L228.6 182.6L228.4 186.3L228.1 187.7L228.6 189.2L229.5 190.5L230.0 192.7L231.9 194.7L232.5 196.3L233.6 197.7L236.6 198.4L237.7 199.6L240.1 198.8L242.3 198.5L244.3 198.0L246.1 197.6L247.9 196.4L248.5 194.8L248.7 192.5L249.2 191.7L251.1 190.9L254.0 190.3L256.5 190.4L258.2 190.2L258.9 190.7L258.8 192.1L257.3 193.7L256.6 195.4L257.1 195.9L256.7 197.1L256.0 199.3L255.3 198.6L254.7 198.6L254.2 198.6L253.2 200.3L252.7 200.0L252.4 200.1L252.4 200.5L249.8 200.5L247.2 200.5L247.2 202.1L246.0 202.1L247.0 203.0L248.0 203.6L248.3 204.2L248.8 204.4L248.7 205.4L245.1 205.4L243.8 207.6L244.2 208.2L243.9 208.8L243.8 209.6L240.7 206.6L239.2 205.7L237.0 205.0L235.4 205.2L233.2 206.2L231.8 206.5L229.8 205.8L227.7 205.3L225.1 204.0L223.1 203.6L219.9 202.3L217.6 201.0L216.9 200.2L215.3 200.1L212.5 199.2L211.3 197.9L208.4 196.3L207.0 194.6L206.3 193.2L207.2 193.0L206.9 192.2L207.6 191.5L207.6 190.5L206.7 189.2L206.4 188.1L205.5 186.7L203.0 184.0L200.2 181.8L198.9 180.1L196.5 178.9L196.0 178.3L196.4 176.5L195.0 175.9L193.4 174.5L192.7 172.6L191.2 172.4L189.6 170.9L188.3 169.6L188.1 168.7L186.6 166.6L185.7 164.5L185.7 163.4L183.7 162.3L182.8 162.4L181.2 161.7L180.7 162.8L181.2 164.1L181.5 166.2L182.4 167.4L184.5 169.3L184.9 169.9L185.4 170.1L185.7 171.1L186.2 171.0L186.8 172.8L187.6 173.5L188.2 174.5L190.0 175.9L190.9 178.5L191.7 179.7L192.5 181.0L192.6 182.5L194.0 182.6L195.1 183.9L196.1 185.1L196.0 185.6L194.8 186.6L194.4 186.6L193.6 184.9L191.8 183.3L189.8 182.0L188.4 181.3L188.5 179.2L188.1 177.7L186.7 176.9L184.8 175.6L184.5 176.0L183.8 175.3L182.0 174.6L180.4 173.0L180.6 172.8L181.7 172.9L182.8 171.9L182.9 170.6L180.7 168.7L179.1 167.9L178.1 166.2L177.1 164.3L175.8 162.1L174.6 159.6L177.8 159.4L181.3 159.1L181.1 159.7L185.3 161.0L191.6 163.0L197.1 162.9L199.3 162.9L199.3 161.8L204.1 161.8L205.2 162.8L206.6 163.7L208.2 164.9L209.2 166.3L209.8 167.9L211.3 168.7L213.6 169.5L215.3 167.3L217.6 167.3L219.6 168.4L221.0 170.3L221.9 171.9L223.6 173.5L224.2 175.4L224.9 176.7L227.1 177.6L229.1 178.2L230.2 178.1z M557.2 133.7L557.5 133.8L557.7 133.2L559.3 132.8L559.9 132.7L560.9 132.5L562.2 132.4L563.6 133.3L563.8 135.2L563.2 135.3L562.8 135.7L561.3 135.7L560.2 136.3L558.4 136.5L557.2 135.9L556.8 134.7L557.2 133.7z M466.2 209.4L467.1 208.9L467.6 207.3L468.5 207.2L470.4 208.0L472.0 207.4L473.1 207.6L473.5 207.0L484.6 206.9L485.2 205.0L484.8 204.7L483.4 192.7L482.1 180.7L486.3 180.6L495.7 186.7L505.1 192.7L505.7 194.0L507.5 194.8L508.7 195.3L508.8 197.1L511.9 196.8L511.9 203.2L510.3 205.0L510.1 206.8L507.6 207.2L503.8 207.4L502.8 208.4L501.0 208.5L499.3 208.5L498.6 208.0L497.0 208.4L494.4 209.6L493.9 210.4L491.8 211.7L491.4 212.4L490.2 213.0L488.9 212.6L488.1 213.3L487.7 215.2L485.5 217.5L485.6 218.4L484.8 219.6L485.0 221.2L483.8 221.6L483.2 222.0L482.8 220.8L482.0 221.1L481.5 221.0L481.0 221.8L478.8 221.8L478.1 221.4L477.7 221.6L476.8 220.8L477.0 220.0L476.6 219.7L476.1 220.0L476.2 219.1L476.7 218.4L475.6 217.2L475.3 216.4L474.6 215.8L474.1 215.7L473.4 216.1L472.5 216.5L471.8 217.1L470.6 216.9L469.8 216.2L469.3 216.1L468.6 216.5L468.2 216.5L468.0 215.4L468.1 214.6L467.9 213.5L466.9 212.7L466.3 211.1L466.2 209.4z M540.5 150.4L540.4 150.5L540.1 150.5L539.9 150.4L539.9 150.1L540.1 150.1L540.4 150.3L540.5 150.4z M539.8 149.9L539.6 150.0L539.4 149.9L539.4 149.8L539.6 149.8L539.7 149.8L539.8 149.9L539.8 149.9z M776.5 193.9L774.9 195.1L772.9 195.3L771.7 198.3L770.5 198.8L771.8 201.2L773.6 203.2L774.7 205.1L773.7 207.5L772.8 208.0L773.4 209.4L775.3 211.6L775.6 213.1L775.5 214.4L776.6 217.0L775.1 219.6L773.8 222.4L773.5 220.3L774.3 218.2L773.4 216.6L773.6 213.5L772.5 212.1L771.6 208.8L771.1 205.3L769.9 203.0L768.1 204.4L764.9 206.3L763.4 206.1L761.6 205.5L762.6 202.0L762.0 199.4L759.8 196.2L760.2 195.2L758.6 194.8L756.6 192.6L756.4 190.3L757.4 190.8L757.4 188.8L758.8 188.1L758.5 186.9L759.1 186.0L759.2 183.1L761.4 183.7L762.6 181.5L762.8 180.1L764.3 177.8L764.2 176.2L767.8 174.3L769.8 174.8L769.6 173.1L770.6 172.5L770.4 171.5L772.0 171.3L772.9 172.9L774.1 173.6L774.2 175.7L774.1 178.0L771.5 180.3L771.1 183.6L774.1 183.2L774.7 185.7L776.5 186.3L775.7 188.6L777.7 189.6L778.9 190.1L781.0 189.3L781.1 190.5L778.7 192.3L778.1 193.3L776.5 193.9z M555.0 131.9L554.8 131.4L553.6 132.8L553.8 133.7L553.2 133.5L552.5 132.6L551.2 132.0L551.6 131.5L552.0 130.0L552.9 129.4L553.4 129.1L554.1 129.6L554.5 130.0L555.4 130.3L556.5 130.8L556.3 131.1L555.8 131.7L555.0 131.9z M743.8 113.1L746.7 112.6L752.0 110.2L756.2 108.9L758.6 109.7L761.5 109.8L763.4 111.1L766.2 111.2L770.2 111.9L772.9 109.9L771.7 108.3L774.6 105.4L777.7 106.6L780.2 106.9L783.5 107.6L784.0 109.7L788.0 110.9L790.6 110.3L794.1 110.0L796.9 110.3L799.6 111.7L801.3 113.1L803.9 113.1L807.4 113.5L809.9 112.8L813.6 112.4L817.7 110.4L819.3 110.7L820.8 111.7L824.1 111.4L822.8 113.5L820.8 116.3L821.5 117.4L823.1 117.1L825.8 117.5L828.0 116.5L830.2 117.4L832.7 119.3L832.4 120.3L830.2 120.0L826.2 120.4L824.2 121.1L822.2 123.0L817.9 124.1L815.2 125.5L812.3 125.0L810.8 124.7L809.3 126.5L810.2 127.6L810.6 128.5L808.7 129.4L806.7 130.9L803.5 131.9L799.3 132.0L794.8 133.0L791.6 134.5L790.3 133.6L787.0 133.6L782.9 131.9L780.1 131.5L776.4 131.9L770.7 131.3L767.6 131.3L766.0 129.7L764.7 127.1L763.0 126.8L759.7 125.1L755.9 124.7L752.6 124.2L751.6 123.0L752.7 119.8L750.8 117.5L746.8 116.5L744.5 115.0L743.8 113.1z M596.0 282.0L598.1 281.8L601.4 282.6L602.2 282.2L604.1 282.1L605.1 281.3L606.7 281.3L609.8 280.3L612.0 278.7L612.4 279.9L612.3 282.7L612.7 285.1L612.8 289.4L613.3 290.8L612.4 292.8L611.4 294.7L609.6 296.4L607.1 297.5L603.9 298.9L600.8 301.8L599.7 302.3L597.8 304.3L596.6 305.0L596.4 306.9L597.7 309.0L598.3 310.7L598.3 311.5L598.8 311.4L598.7 314.1L598.3 315.4L598.9 315.9L598.5 317.0L597.3 318.0L595.0 318.9L591.7 320.4L590.5 321.5L590.7 322.6L591.4 322.8L591.2 324.3L589.1 324.3L588.8 323.0L588.4 321.8L588.2 320.8L588.7 317.7L588.0 315.7L586.6 311.8L589.6 308.7L590.3 306.7L590.7 306.4L591.0 304.8L590.6 303.9L590.7 301.9L591.2 299.9L591.2 296.4L589.8 295.5L588.5 295.3L587.9 294.6L586.6 294.1L584.3 294.1L584.1 293.1L583.8 291.1L592.3 288.8L593.9 290.1L594.6 289.9L595.7 290.6L595.9 291.7L595.3 293.0L595.5 295.0L597.3 296.7L598.2 294.7L599.4 294.2L599.1 290.6L598.0 288.6L597.0 287.7L596.0 287.7L595.2 284.1L596.0 282.0z M466.2 209.4L464.4 207.5L462.7 205.4L460.8 204.7L459.5 203.9L458.0 203.9L456.6 204.5L455.2 204.3L454.3 205.2L454.0 203.7L454.8 202.3L455.1 199.7L454.8 197.0L454.5 195.6L454.8 194.2L454.1 192.9L452.6 191.7L453.2 190.7L464.1 190.8L463.6 186.7L464.2 185.3L466.8 185.1L466.8 178.0L475.9 178.1L475.9 173.9L486.3 180.6L482.1 180.7L483.4 192.7L484.8 204.7L485.2 205.0L484.6 206.9L473.5 207.0L473.1 207.6L472.0 207.4L470.4 208.0L468.5 207.2L467.6 207.3L467.1 208.9L466.2 209.4z M596.0 282.0L595.2 284.1L596.0 287.7L597.0 287.7L598.0 288.6L599.1 290.6L599.4 294.2L598.2 294.7L597.3 296.7L595.5 295.0L595.3 293.0L595.9 291.7L595.7 290.6L594.6 289.9L593.9 290.1L592.3 288.8L590.8 288.1L591.6 285.5L592.5 284.5L592.0 282.2L592.5 280.0L593.0 279.2L592.3 276.9L591.0 275.6L593.7 276.2L594.3 276.9L595.2 278.2L596.0 282.0z M780.8 232.8L781.0 234.2L782.8 233.9L783.7 232.7L784.4 233.0L786.0 234.7L787.2 236.5L787.3 238.4L787.0 239.6L787.3 240.6L787.5 242.2L788.5 243.0L789.6 245.5L789.5 246.4L787.6 246.6L784.9 244.5L781.6 242.3L781.3 240.9L779.7 239.1L779.3 236.8L778.3 235.2L778.6 233.2L778.0 232.0L778.5 231.5L780.8 232.8z M829.5 237.6L827.5 238.5L825.0 238.0L821.8 238.0L820.9 241.2L819.8 242.2L818.4 246.0L816.1 246.6L813.5 245.8L812.2 246.1L810.5 247.5L808.8 247.3L807.0 247.9L805.1 246.3L804.6 244.4L806.7 245.4L808.8 244.9L809.4 242.5L810.5 242.0L813.9 241.4L815.9 239.2L817.2 237.4L818.5 238.9L819.1 237.9L820.4 238.0L820.6 236.2L820.7 234.9L822.8 232.9L824.2 230.8L825.4 230.8L826.8 232.2L826.9 233.4L828.7 234.1L831.1 235.0L830.9 236.1L829.0 236.2L829.5 237.6z M545.4 329.4L543.3 327.3L542.3 325.3L541.6 322.5L541.0 320.5L540.0 316.3L540.0 312.9L539.6 311.4L538.5 310.3L537.1 308.0L535.6 304.6L535.0 302.9L532.8 300.2L532.6 298.1L533.9 297.5L535.6 297.1L537.4 297.1L539.1 298.4L539.5 298.2L550.7 298.1L552.7 299.4L559.4 299.8L564.5 298.7L566.8 298.0L568.6 298.2L569.7 298.8L569.7 299.1L568.1 299.7L567.3 299.7L565.5 300.8L564.4 299.6L560.2 300.6L558.1 300.7L558.0 310.6L555.3 310.7L555.3 318.8L555.3 329.1L552.8 330.5L551.3 330.7L549.5 330.2L548.3 330.0L547.8 328.8L546.7 328.0L545.4 329.4z M960.5 308.6L962.8 310.3L964.2 311.6L963.2 312.2L961.6 311.5L959.7 310.2L957.9 308.7L956.0 306.8L955.6 305.8L956.8 305.9L958.4 306.8L959.6 307.8L960.5 308.6z M506.0 216.8L506.0 214.9L502.8 214.3L502.8 213.0L501.2 211.1L500.8 209.9L501.0 208.5L502.8 208.4L503.8 207.4L507.6 207.2L510.1 206.8L510.3 205.0L511.9 203.2L511.9 196.8L515.8 195.6L523.8 190.1L533.3 184.8L537.7 186.0L539.3 187.5L541.3 186.5L541.9 190.8L543.0 191.5L543.0 192.4L544.2 193.4L543.6 194.6L542.5 200.2L542.4 203.8L538.8 206.4L537.6 210.1L538.8 211.1L538.8 212.9L540.5 213.0L540.3 214.3L539.5 214.4L539.4 215.3L538.9 215.4L537.0 212.3L536.3 212.2L534.2 213.8L532.0 213.0L530.5 212.8L529.7 213.2L528.1 213.1L526.5 214.3L525.0 214.4L521.7 212.9L520.4 213.6L518.9 213.6L517.9 212.5L515.1 211.5L512.1 211.8L511.4 212.4L511.0 214.0L510.2 215.1L510.0 217.6L507.9 216.0L506.9 216.0L506.0 216.8z M523.6 236.7L520.7 237.7L519.7 237.6L518.6 238.2L516.4 238.2L514.9 236.4L514.0 234.4L512.0 232.6L509.9 232.6L507.5 232.6L507.6 228.1L507.6 226.4L508.1 224.6L508.9 223.8L510.3 222.0L510.0 221.3L510.5 220.2L509.9 218.5L510.0 217.6L510.2 215.1L511.0 214.0L511.4 212.4L512.1 211.8L515.1 211.5L517.9 212.5L518.9 213.6L520.4 213.6L521.7 212.9L525.0 214.4L526.5 214.3L528.1 213.1L529.7 213.2L530.5 212.8L532.0 213.0L534.2 213.8L536.3 212.2L537.0 212.3L538.9 215.4L539.4 215.3L540.5 216.4L540.2 216.9L540.0 217.9L537.7 220.0L537.0 221.8L536.6 223.2L536.0 223.8L535.4 225.8L533.9 226.9L533.5 228.3L532.9 229.5L532.6 230.6L530.7 231.5L529.2 230.4L528.1 230.4L526.5 232.1L525.6 232.1L524.3 234.8L523.6 236.7z M261.9 219.2L260.9 218.3L259.7 217.2L259.0 216.3L257.9 215.4L256.5 214.1L256.8 213.7L257.2 214.1L257.5 213.9L258.3 213.8L258.7 213.2L259.1 213.2L259.0 211.8L259.7 211.7L260.2 211.7L260.8 211.0L261.7 211.6L261.9 211.2L262.5 210.9L263.4 210.1L263.5 209.6L263.7 209.6L264.1 208.9L264.4 208.8L264.9 209.3L265.4 209.4L266.0 209.0L266.7 209.0L267.7 208.7L268.1 208.3L269.0 208.3L268.8 208.6L268.7 209.2L268.9 210.2L268.3 211.2L268.0 212.3L267.9 213.5L268.1 214.3L268.1 215.5L267.7 215.8L267.4 217.0L267.6 217.7L267.1 218.4L267.2 219.2L267.6 219.6L267.0 220.2L266.1 220.0L265.7 219.4L264.8 219.2L264.2 219.6L262.3 218.8L261.9 219.2z M516.9 101.4L519.2 101.4L519.7 102.4L519.0 104.9L518.3 106.0L516.6 106.0L517.1 108.9L515.6 108.2L513.8 107.0L511.2 107.6L509.2 107.4L510.6 106.6L513.1 102.5L516.9 101.4z M578.2 52.3L586.9 54.3L583.3 55.0L586.4 56.8L581.7 57.9L579.4 58.2L580.6 56.2L577.0 55.1L572.7 56.0L571.4 58.1L568.7 59.3L565.7 58.6L562.1 58.8L559.0 57.3L557.3 58.0L555.6 58.2L555.2 60.0L550.0 59.5L549.2 61.1L546.6 61.1L544.7 63.0L542.0 66.1L537.7 70.0L538.7 71.0L537.7 72.1L534.9 72.0L533.1 74.6L533.3 78.3L535.1 79.7L534.2 83.0L531.9 84.9L530.6 86.5L528.8 84.8L523.3 88.0L519.6 88.7L515.7 87.3L514.7 84.3L513.9 77.9L516.4 76.1L523.8 73.7L529.2 70.9L534.3 67.0L541.0 61.6L545.7 59.5L553.3 56.1L559.4 54.8L564.0 55.0L568.2 52.7L573.3 52.8L578.2 52.3z M568.7 33.7L562.5 34.9L557.6 34.2L559.5 33.5L557.8 32.6L563.6 32.1L564.7 33.1L568.7 33.7z M550.7 28.6L559.8 30.7L552.9 31.8L551.3 33.8L548.9 34.3L547.6 36.6L544.2 36.7L538.2 35.1L540.7 34.1L536.6 33.3L531.2 30.9L529.0 28.7L536.6 27.7L538.1 28.7L542.1 28.7L543.1 27.7L547.2 27.6L550.7 28.6z M570.7 26.6L576.1 27.6L572.0 29.1L564.0 29.4L555.8 29.0L555.3 28.2L551.3 28.2L548.2 26.9L556.8 26.1L560.9 26.8L563.7 26.0L570.7 26.6z M744.8 172.6L744.6 173.8L744.9 175.5L744.6 176.6L742.3 176.7L739.0 176.0L736.8 175.8L735.2 174.3L731.4 174.0L727.8 172.4L725.2 171.1L722.5 170.0L723.5 167.4L725.3 166.2L726.5 165.5L728.7 166.3L731.5 168.2L733.1 168.6L734.0 169.9L736.1 170.4L738.4 171.7L741.5 172.3L744.8 172.6z M980.6 363.7L981.2 364.8L983.2 363.7L984.0 364.9L984.0 366.0L983.0 367.3L981.2 369.4L979.8 370.5L980.8 371.8L978.6 371.8L976.3 372.9L975.5 374.7L973.9 377.5L971.8 378.8L970.4 379.6L967.8 379.5L966.0 378.6L963.0 378.4L962.5 377.4L964.0 375.3L967.5 372.6L969.3 372.0L971.3 371.0L973.7 369.5L975.3 368.1L976.6 366.0L977.6 365.3L978.0 363.8L980.0 362.5L980.6 363.7z M985.0 350.4L987.0 353.4L987.1 351.5L988.4 352.2L988.8 354.3L991.0 355.2L992.9 355.4L994.5 354.4L995.9 354.7L995.2 357.2L994.4 358.8L992.2 358.7L991.5 359.6L991.8 360.8L991.3 361.3L990.3 362.8L988.9 364.7L986.8 365.8L986.3 365.1L985.1 364.7L986.7 362.4L985.8 360.9L982.8 359.7L982.9 358.7L984.9 357.8L985.4 355.6L985.3 353.8L984.1 352.0L984.2 351.5L982.9 350.3L980.7 347.9L979.5 345.9L980.6 345.7L982.1 347.2L984.2 348.0L985.0 350.4z M663.5 191.3L662.5 193.3L661.2 193.1L660.6 193.8L660.2 195.2L660.5 197.0L660.3 197.4L659.0 197.4L657.2 198.4L657.0 199.8L656.3 200.3L654.6 200.3L653.5 201.0L653.5 202.1L652.2 202.9L650.7 202.7L648.8 203.6L647.5 203.7L646.6 201.8L644.4 197.2L652.8 194.4L654.6 188.9L653.4 186.9L653.4 185.8L654.2 184.7L654.2 183.5L655.5 183.0L655.0 182.6L655.2 180.8L656.7 180.8L657.9 182.7L659.5 183.7L661.5 184.0L663.1 184.5L664.4 186.1L665.1 187.1L666.1 187.4L666.1 188.0L665.1 189.7L664.7 190.5L663.5 191.3z M656.6 178.1L656.3 178.6L655.8 177.6L656.6 176.7L656.9 176.9L656.6 178.1z M708.8 146.9L710.8 148.1L711.6 150.3L716.2 151.4L713.5 153.7L710.4 154.2L706.2 153.5L704.9 154.7L705.8 157.1L706.8 159.0L709.1 160.4L706.7 162.0L706.7 163.9L704.0 166.7L702.3 169.6L699.4 172.5L696.2 172.3L693.1 175.2L694.9 176.4L695.2 178.5L696.8 180.0L697.3 182.3L691.2 182.3L689.4 184.2L687.3 183.5L686.5 181.5L684.4 179.4L679.3 179.9L674.7 179.9L670.8 180.3L671.9 177.1L675.9 175.7L675.6 174.4L674.3 173.9L674.2 171.5L671.6 170.3L670.5 168.6L669.1 167.1L673.7 168.6L676.5 168.1L678.2 168.5L678.8 167.9L680.7 168.1L684.3 167.0L684.4 164.6L685.9 163.0L688.0 163.0L688.3 162.3L690.4 161.9L691.5 162.2L692.5 161.4L692.4 159.7L693.6 158.0L695.3 157.3L694.3 155.5L696.9 155.6L697.7 154.6L697.5 153.5L698.9 152.4L698.6 151.0L698.0 149.8L699.6 148.6L702.6 148.0L705.7 147.7L707.2 147.2L708.8 146.9z M283.7 229.9L282.7 229.1L282.1 227.6L282.8 226.9L282.1 226.7L281.6 225.8L280.2 225.0L279.0 225.2L278.4 226.2L277.3 226.9L276.7 226.9L276.4 227.5L277.8 229.0L277.0 229.4L276.6 229.8L275.3 229.9L274.8 228.3L274.5 228.8L273.6 228.6L273.0 227.5L271.9 227.3L271.1 227.0L269.9 227.0L269.9 227.6L269.5 227.2L269.7 226.6L269.9 226.0L269.8 225.5L270.2 225.2L269.6 224.8L269.6 223.7L270.7 223.4L271.7 224.4L271.6 225.0L272.8 225.1L273.0 224.9L273.8 225.6L275.1 225.4L276.3 224.7L278.0 224.1L279.0 223.3L280.5 223.5L280.4 223.7L281.9 223.8L283.2 224.3L284.1 225.1L285.1 225.9L284.8 226.3L285.4 228.0L284.9 228.8L284.0 228.6L283.7 229.9z M306.7 298.8L305.9 300.3L304.5 301.0L301.7 299.4L301.5 298.2L296.0 295.4L291.0 292.4L288.9 290.7L287.7 288.4L288.2 287.6L285.8 284.0L283.1 278.8L280.5 273.3L279.3 272.0L278.4 270.0L276.3 268.2L274.3 267.0L275.2 265.8L273.9 263.2L274.7 261.2L276.9 259.5L277.3 260.6L276.5 261.3L276.5 262.3L277.7 262.1L278.8 262.4L280.0 263.8L281.6 262.6L282.1 260.8L283.8 258.3L287.1 257.2L290.2 254.3L291.0 252.5L290.6 250.4L291.4 250.2L293.2 251.5L294.1 252.8L295.4 253.5L297.0 256.4L299.1 256.8L300.6 256.0L301.6 256.5L303.3 256.3L305.4 257.6L303.6 260.4L304.5 260.5L305.9 261.9L303.3 261.8L303.0 262.2L300.7 262.8L297.5 264.7L297.3 265.9L296.6 266.9L296.9 268.4L295.2 269.2L295.2 270.4L294.5 270.9L295.6 273.4L297.2 275.1L296.6 276.3L298.4 276.4L299.5 277.9L301.9 278.0L304.2 276.4L304.0 280.6L305.3 280.9L306.9 280.4L309.3 284.9L308.7 285.8L308.5 287.8L308.5 290.1L307.4 291.5L307.9 292.6L307.3 293.5L308.4 295.8L306.7 298.8z M851.0 226.6L851.3 228.5L851.5 230.0L850.5 232.6L849.5 229.7L848.2 231.1L849.1 233.2L848.3 234.5L845.1 232.9L844.3 230.9L845.1 229.6L843.4 228.2L842.5 229.4L841.2 229.3L839.1 230.8L838.7 230.0L839.8 227.7L841.5 226.9L843.0 225.9L844.0 227.1L846.1 226.3L846.6 225.1L848.5 225.0L848.4 222.9L850.6 224.2L850.9 225.6L851.0 226.6z M844.4 221.4L843.4 222.4L842.5 224.1L841.7 224.9L839.9 223.0L840.5 222.3L841.2 221.5L841.5 219.8L843.1 219.6L842.6 221.5L844.7 218.8L844.4 221.4z M829.2 224.1L825.5 226.8L826.8 224.8L828.9 223.1L830.5 221.2L832.0 218.4L832.5 220.7L830.6 222.2L829.2 224.1z M838.6 217.0L840.2 217.8L842.0 217.8L841.9 219.0L840.7 220.2L838.9 221.0L838.8 219.7L839.0 218.3L838.6 217.0z M848.6 216.2L849.4 219.3L847.3 218.6L847.3 219.5L848.0 221.2L846.7 221.8L846.6 219.9L845.7 219.8L845.3 218.1L846.9 218.3L846.9 217.2L845.2 215.1L847.9 215.2L848.6 216.2z M837.6 213.7L836.8 216.1L835.6 214.7L834.2 212.6L836.6 212.7L837.6 213.7z M837.0 198.6L838.7 199.4L839.6 198.7L839.8 199.4L839.4 200.5L840.3 202.5L839.6 204.8L838.0 205.7L837.5 208.0L838.1 210.2L839.6 210.5L840.8 210.2L844.3 211.7L844.0 213.2L844.9 213.9L844.7 215.2L842.5 213.8L841.5 212.4L840.8 213.4L839.0 211.7L836.5 212.1L835.1 211.5L835.2 210.4L836.1 209.7L835.3 209.0L834.9 210.0L833.5 208.4L833.1 207.2L833.0 204.5L834.1 205.5L834.4 201.1L835.3 198.6L837.0 198.6z M933.0 268.9L932.2 269.2L931.0 268.2L929.8 266.4L929.2 264.3L929.6 264.0L929.9 264.8L930.7 265.5L932.1 267.2L933.4 268.2L933.0 268.9z M922.2 265.2L920.7 265.4L920.3 266.2L918.8 266.9L917.3 267.5L915.9 267.5L913.6 266.7L912.0 266.0L912.2 265.1L914.7 265.5L916.2 265.3L916.7 264.0L917.1 263.9L917.3 265.4L918.9 265.2L919.7 264.2L921.2 263.2L920.9 261.6L922.6 261.5L923.2 262.0L923.1 263.5L922.2 265.2z M908.9 270.5L911.3 272.3L913.2 275.3L914.7 275.2L914.6 276.4L916.8 276.9L915.9 277.4L918.9 278.6L918.6 279.4L916.7 279.6L916.1 278.9L913.7 278.6L910.9 278.1L908.7 276.4L907.1 274.8L905.7 272.4L902.1 271.2L899.7 272.0L898.0 272.9L898.4 275.0L896.2 275.9L894.6 275.4L891.8 275.3L891.7 266.3L891.7 257.2L896.5 259.1L901.6 260.7L903.5 262.1L905.1 263.5L905.5 265.2L910.1 266.9L910.8 268.4L908.3 268.7L908.9 270.5z M925.4 262.5L924.5 263.2L924.0 261.6L923.4 260.5L922.1 259.6L920.5 258.4L918.5 257.6L919.3 256.9L920.8 257.7L921.7 258.3L922.9 259.0L924.0 260.2L925.1 261.1L925.4 262.5z M541.7 108.0L540.6 106.3L540.8 105.3L540.1 103.8L539.1 102.8L539.9 102.1L539.2 100.7L541.1 99.9L545.5 98.6L549.0 97.6L551.7 98.1L551.9 98.8L554.6 98.8L558.0 99.1L563.1 99.1L564.6 99.4L565.2 100.2L565.4 101.5L566.1 102.5L566.1 103.6L564.4 104.2L565.3 105.5L565.4 106.7L566.7 109.2L566.5 109.9L565.1 110.3L562.6 112.6L563.3 113.8L562.7 113.7L560.0 112.6L558.0 113.0L556.7 112.7L555.1 113.3L553.7 112.3L552.5 112.7L552.4 112.5L551.1 111.1L549.0 111.0L548.8 110.1L546.9 109.8L546.4 110.5L544.9 109.9L545.1 109.2L543.0 108.9L541.7 108.0z M315.9 198.6L317.3 198.8L317.8 199.4L317.1 200.1L315.0 200.1L313.4 200.1L313.2 199.0L313.6 198.6L315.9 198.6z M862.9 132.2L863.3 132.7L862.2 132.6L861.0 133.5L860.2 134.4L860.3 136.4L858.9 137.1L858.4 137.5L857.3 138.4L855.5 138.8L854.3 139.6L854.2 140.8L853.8 141.1L855.0 141.5L856.5 142.7L856.1 143.4L854.9 143.6L853.0 143.7L851.9 145.0L850.7 144.9L850.5 145.1L849.1 144.6L848.8 145.1L848.0 145.4L847.9 144.8L847.2 144.6L846.4 144.1L847.2 142.9L847.8 142.6L847.6 142.1L848.3 140.6L848.1 140.1L846.5 139.8L845.2 139.1L847.4 137.3L850.5 135.8L852.4 133.8L853.7 134.7L856.1 134.8L855.7 133.3L860.0 132.2L861.1 130.6L862.9 132.2z M474.9 133.7L475.9 133.0L477.0 132.6L477.7 133.9L479.4 133.9L479.9 133.6L481.5 133.7L482.3 135.1L481.0 135.8L480.9 138.0L480.5 138.4L480.4 139.7L479.2 139.9L480.3 141.6L479.5 143.4L480.5 144.2L480.1 145.0L479.1 146.0L479.3 147.0L478.2 147.7L476.7 147.3L475.3 147.6L475.7 145.4L475.4 143.7L474.2 143.4L473.5 142.4L473.8 140.6L474.9 139.6L475.1 138.4L475.6 136.8L475.6 135.6L475.0 134.6L474.9 133.7z M325.9 311.8L327.0 308.5L327.0 307.0L328.4 304.5L333.2 303.7L335.8 303.8L338.4 305.2L338.4 306.0L339.2 307.6L339.1 311.4L342.0 311.9L343.1 311.4L345.0 312.1L345.5 312.9L345.8 315.5L346.1 316.5L347.1 316.7L348.2 316.2L349.2 316.7L349.2 318.3L348.8 319.9L348.3 321.5L347.8 323.9L345.3 326.1L343.1 326.5L340.0 326.1L337.2 325.3L339.9 321.1L339.5 319.9L336.6 318.8L333.3 316.8L331.0 316.3L325.9 311.8z M641.1 181.2L641.0 179.2L641.7 177.8L642.5 177.5L643.3 178.3L643.4 180.0L642.7 181.6L642.0 181.8L641.1 181.2z M563.1 117.0L564.3 116.4L566.0 116.7L567.8 116.7L569.1 117.4L570.0 117.0L572.1 116.7L572.8 116.1L573.9 116.1L574.8 116.3L575.6 117.1L576.5 118.3L578.1 120.0L578.2 121.2L577.9 122.4L578.4 123.6L579.7 124.2L581.0 123.7L582.2 124.2L582.3 124.9L580.9 125.5L580.1 125.2L579.3 128.6L577.7 128.3L575.7 127.3L572.4 127.9L571.0 128.6L566.9 128.5L564.8 128.1L563.7 128.3L562.9 127.1L562.4 126.6L563.1 126.2L562.4 125.8L561.5 126.4L559.9 125.6L559.7 124.5L558.0 123.8L557.7 123.0L556.2 121.9L558.4 121.3L560.1 119.5L561.4 117.6L563.1 117.0z M899.0 109.0L901.8 114.0L897.7 113.0L896.0 117.1L898.7 119.9L898.6 121.8L896.5 120.2L894.7 122.3L894.2 120.0L894.5 117.3L894.2 114.3L894.8 112.2L894.9 108.5L893.3 105.7L893.6 101.9L896.1 100.7L895.0 99.4L896.3 99.0L897.0 100.8L897.9 103.5L897.9 106.2L899.0 109.0z M563.1 99.1L558.0 99.1L554.6 98.8L555.2 97.6L559.1 96.7L562.0 97.2L563.2 97.6L562.9 98.4L563.1 99.1z M13.8 65.0L15.7 65.7L15.1 63.7L22.6 64.1L28.1 66.7L25.3 67.9L20.7 68.2L20.7 70.9L19.6 71.5L17.0 71.4L14.9 70.5L11.2 69.7L10.5 68.5L7.7 68.0L4.6 68.4L3.0 67.4L3.6 66.4L0.3 67.0L1.6 68.3L0.0 69.5L0.0 58.4L6.8 60.6L14.1 63.3L13.8 65.0z M1000.0 53.2L997.0 53.4L996.5 52.5L1000.0 51.3L1000.0 53.2z M3.6 53.1L0.0 53.2L0.0 51.3L0.4 51.2L2.7 51.2L6.7 52.0L6.5 52.4L3.6 53.1z M898.9 46.6L894.7 46.7L889.0 46.3L888.5 46.2L891.1 45.1L894.6 44.8L898.6 45.9L898.9 46.6z M918.7 41.4L915.5 42.5L911.0 42.3L905.9 41.2L906.6 40.3L911.7 40.7L918.7 41.4z M903.0 40.1L900.8 42.2L890.6 42.1L886.0 42.7L880.5 40.9L882.0 39.0L885.6 38.5L893.0 38.6L903.0 40.1z M659.8 53.6L658.2 53.8L649.1 53.4L648.4 52.2L643.3 51.5L642.9 50.0L645.8 49.4L645.7 47.8L651.2 45.5L648.6 45.1L655.3 42.7L654.5 41.4L660.7 40.0L669.9 38.2L679.2 37.7L683.9 36.6L689.3 36.3L691.3 37.4L689.4 38.2L679.5 39.6L671.1 40.9L662.4 43.6L658.3 46.3L653.9 49.0L654.5 51.3L659.8 53.6z M797.1 36.2L797.9 37.6L800.4 36.9L808.5 36.9L814.8 38.3L817.0 39.3L816.3 40.8L813.3 41.6L806.0 43.1L803.9 43.9L807.3 44.3L811.4 45.0L813.9 44.5L815.4 46.3L816.6 45.6L821.0 45.1L829.9 45.6L830.6 46.9L842.2 47.3L842.4 45.2L848.3 45.7L852.7 45.7L857.2 47.1L858.5 48.9L856.8 50.1L860.3 52.2L864.7 53.4L867.4 50.5L871.8 51.7L876.6 51.0L881.9 51.8L884.0 51.0L888.5 51.4L886.5 48.8L890.2 47.6L915.3 49.4L917.6 51.1L924.9 53.2L936.1 52.7L941.7 53.1L944.0 54.3L943.6 56.3L947.1 57.1L950.8 56.5L955.7 56.5L960.9 57.0L966.2 56.7L971.0 59.2L974.5 58.3L972.2 56.5L973.5 55.3L982.3 56.1L988.1 55.9L996.1 57.2L1000.0 58.4L1000.0 69.5L1000.0 69.5L996.4 70.7L992.8 70.5L995.3 72.0L997.0 74.3L998.3 75.0L998.6 76.2L997.9 76.9L992.7 76.3L984.9 78.4L982.4 78.7L978.2 80.7L974.2 82.4L973.1 83.7L969.2 81.7L961.9 83.9L960.7 82.9L958.0 84.1L954.3 83.7L953.4 85.5L950.0 88.2L950.1 89.3L953.3 90.0L952.9 94.0L950.4 94.1L949.2 96.4L950.3 97.6L945.5 99.0L944.5 102.2L940.4 102.9L939.5 105.7L935.5 108.3L934.5 106.4L933.3 102.3L931.8 96.2L933.1 92.3L935.4 90.7L935.6 89.4L939.9 88.7L944.9 85.2L949.6 82.4L954.6 80.2L956.9 76.2L953.5 76.5L951.8 78.8L944.8 81.8L942.5 78.4L935.3 79.3L928.4 84.0L930.7 85.7L924.5 86.4L920.2 86.7L920.4 84.7L916.1 84.3L912.6 85.7L904.1 85.2L895.0 86.0L886.0 91.4L875.4 98.0L879.7 98.3L881.1 100.1L883.8 100.7L885.6 99.3L888.6 99.5L892.6 102.5L892.7 104.9L890.5 107.7L890.3 111.0L889.1 115.4L884.9 119.4L883.9 121.4L880.2 124.6L876.4 127.8L874.6 129.4L870.9 131.1L869.2 131.1L867.4 129.8L863.7 131.8L863.3 132.7L862.9 132.2L862.9 130.8L864.3 130.8L864.7 127.5L864.0 125.1L866.3 124.1L869.7 124.6L871.6 121.9L872.5 118.9L873.6 117.8L875.1 115.3L870.5 116.2L868.1 117.3L863.9 117.2L862.7 114.6L859.4 112.7L854.6 111.8L853.6 109.1L852.6 107.4L851.6 106.2L849.9 103.4L847.4 102.3L843.3 101.5L839.6 101.6L836.1 102.1L833.8 103.5L835.3 104.1L835.4 105.7L833.8 106.5L831.3 109.5L831.4 110.7L827.4 112.5L824.1 111.4L820.8 111.7L819.3 110.7L817.7 110.4L813.6 112.4L809.9 112.8L807.4 113.5L803.9 113.1L801.3 113.1L799.6 111.7L796.9 110.3L794.1 110.0L790.6 110.3L788.0 110.9L784.0 109.7L783.5 107.6L780.2 106.9L777.7 106.6L774.6 105.4L771.7 108.3L772.9 109.9L770.2 111.9L766.2 111.2L763.4 111.1L761.5 109.8L758.6 109.7L756.2 108.9L752.0 110.2L746.7 112.6L743.8 113.1L742.7 113.3L741.2 111.6L737.6 112.0L736.4 110.8L734.5 110.2L733.2 108.6L731.6 108.1L727.6 108.9L723.8 107.3L722.3 108.7L716.1 101.7L712.6 99.5L713.6 98.6L706.6 101.3L704.0 101.4L704.2 99.9L700.6 99.0L697.7 99.6L696.8 96.8L691.9 96.2L689.4 97.3L682.4 98.3L681.1 99.0L670.7 100.0L669.4 100.9L671.4 102.8L668.7 103.6L669.2 104.3L666.6 105.7L671.1 107.6L670.4 108.9L666.5 108.8L665.7 109.6L662.1 108.2L657.7 108.2L654.8 109.4L651.5 108.3L645.4 106.3L641.0 106.4L635.3 109.4L634.9 111.5L632.1 109.8L629.9 112.9L630.7 113.5L629.1 115.6L631.4 117.5L633.5 117.4L635.3 119.2L635.0 120.7L636.4 121.1L635.1 122.8L632.4 123.2L629.7 126.1L632.2 128.7L631.9 130.6L635.0 133.9L633.3 135.0L632.8 135.7L631.6 135.5L629.7 133.8L628.9 133.7L627.2 133.1L626.3 131.9L623.7 131.4L622.0 131.8L621.5 131.3L617.8 129.9L613.7 129.5L611.3 129.0L611.0 129.3L607.4 127.0L604.3 126.0L601.9 124.3L603.9 123.9L606.2 121.6L604.6 120.5L608.7 119.3L608.7 118.7L606.2 119.2L606.3 117.9L607.7 117.2L610.4 116.9L610.8 116.0L610.2 114.5L611.3 113.0L611.3 112.2L607.2 111.3L605.6 111.3L603.9 110.0L601.7 110.5L598.2 109.5L598.3 109.0L597.3 107.8L595.1 107.6L594.8 106.8L595.5 106.2L593.8 104.6L590.9 104.9L590.0 104.8L589.3 105.4L588.3 105.3L587.6 103.5L587.0 102.6L587.5 102.3L589.7 102.4L590.8 101.8L590.0 101.1L588.1 100.6L588.3 100.1L587.2 99.6L585.4 97.7L586.0 97.0L585.8 95.7L583.0 95.0L581.6 95.4L581.2 94.7L578.3 94.0L577.4 92.3L577.1 91.0L575.8 90.3L577.0 89.5L576.2 86.9L578.1 85.3L577.7 84.8L580.9 83.3L578.0 81.9L583.9 78.4L586.5 76.8L587.5 75.4L583.4 73.5L584.6 71.7L582.1 69.6L583.9 67.2L580.7 64.0L583.3 61.9L579.0 60.1L579.4 58.2L581.7 57.9L586.4 56.8L589.3 55.8L593.8 57.5L601.4 58.2L611.9 61.3L614.1 62.6L614.2 64.5L611.2 65.9L606.6 66.7L594.2 64.6L592.2 64.9L596.7 66.9L596.9 68.2L597.1 71.1L600.6 71.9L602.8 72.6L603.2 71.3L601.5 70.1L603.3 69.0L610.0 70.8L612.3 70.1L610.5 68.1L616.9 65.3L619.5 65.5L622.1 66.5L623.7 64.6L621.4 62.9L622.7 61.2L620.7 59.5L628.5 60.4L630.1 62.0L626.5 62.3L626.6 63.9L628.7 64.8L633.0 64.2L633.7 62.4L639.5 61.1L649.2 58.7L651.3 58.9L648.6 60.6L652.0 60.8L654.0 59.9L659.2 59.8L663.3 58.7L666.5 60.3L669.7 58.5L666.8 56.9L668.2 56.0L676.4 56.8L680.2 57.7L690.3 60.9L692.2 59.4L689.3 57.9L689.3 57.3L685.9 57.1L686.8 55.8L685.3 53.6L685.3 52.7L690.4 50.2L692.2 47.7L694.3 47.1L701.6 47.8L702.2 49.4L699.6 51.6L701.3 52.5L702.2 54.5L701.6 58.3L704.6 60.0L703.4 61.8L698.0 65.8L701.2 66.2L702.3 65.2L705.3 64.5L706.1 63.1L708.5 61.8L706.9 60.2L708.2 58.4L705.1 58.1L704.4 56.6L706.7 53.8L703.1 51.5L708.0 49.7L707.4 47.7L708.8 47.6L710.2 49.2L709.1 51.8L712.1 52.4L710.8 50.3L715.5 49.3L721.3 49.1L726.4 50.7L723.9 48.4L723.6 45.4L728.5 44.9L735.2 45.0L741.2 44.6L738.9 43.2L742.1 41.3L745.3 41.3L750.7 39.9L758.1 39.5L759.0 38.8L766.3 38.5L768.6 39.1L774.8 37.6L779.9 37.7L780.7 36.5L783.3 35.3L789.9 34.2L794.6 35.1L790.8 35.8L797.1 36.2z M791.9 32.5L776.2 33.6L781.3 29.9L783.6 29.6L785.7 29.8L792.7 31.4L791.9 32.5z M642.0 26.3L638.3 26.6L635.8 26.8L635.4 27.3L632.2 27.7L629.2 27.1L630.8 26.2L624.6 26.1L630.0 25.6L634.2 25.6L634.8 26.3L636.4 25.7L639.0 25.2L643.1 25.8L642.0 26.3z M777.6 30.9L771.5 31.2L763.8 30.4L759.2 29.4L757.1 27.4L753.3 26.8L760.5 24.9L766.5 24.3L771.9 25.7L778.3 28.4L777.6 30.9z M584.5 253.2L585.6 254.7L585.4 256.4L584.6 256.7L583.2 256.5L582.3 258.1L580.6 257.9L580.9 256.4L581.3 256.2L581.4 254.5L582.2 253.7L582.8 254.0L584.5 253.2z M475.6 174.7L475.5 173.2L475.9 173.2L475.9 173.4L475.9 173.9L475.9 178.1L466.8 178.0L466.8 185.1L464.2 185.3L463.6 186.7L464.1 190.8L453.2 190.7L452.6 191.7L452.7 190.5L452.8 190.5L459.0 190.3L459.4 189.3L460.5 188.0L461.4 184.2L465.3 181.2L466.6 177.7L467.4 177.5L468.4 175.3L470.7 175.0L471.7 175.4L473.0 175.4L473.9 174.8L475.6 174.7z M618.8 204.6L618.5 203.4L617.6 202.6L617.4 201.5L616.0 200.5L614.5 198.1L613.7 195.9L611.8 194.0L610.6 193.5L608.7 190.9L608.4 188.9L608.5 187.3L606.9 184.2L605.6 183.1L604.1 182.5L603.2 180.9L603.4 180.3L602.6 178.9L601.8 178.3L600.7 176.2L599.0 174.0L597.6 172.0L596.2 172.1L596.6 170.5L596.8 169.6L597.1 168.5L600.2 168.9L601.4 168.0L602.1 167.0L604.2 166.7L604.6 165.7L605.6 165.3L602.8 162.5L608.3 161.1L608.9 160.7L612.2 161.4L616.4 163.4L624.2 168.9L629.4 169.2L631.8 169.4L632.5 170.8L634.5 170.7L635.6 173.1L636.9 173.7L637.4 174.7L639.3 175.9L639.5 177.0L639.2 177.9L639.6 178.9L640.4 179.6L640.7 180.6L641.1 181.2L642.0 181.8L642.7 181.6L643.3 182.7L643.4 183.3L644.4 186.1L652.8 187.5L653.4 186.9L654.6 188.9L652.8 194.4L644.4 197.2L636.4 198.3L633.8 199.5L631.9 202.5L630.6 202.9L629.9 202.0L628.8 202.1L626.1 201.9L625.6 201.6L622.4 201.6L621.6 201.9L620.5 201.2L619.8 202.5L620.1 203.7L618.8 204.6z M594.3 223.7L594.0 223.7L594.0 222.3L593.7 221.3L592.2 220.2L591.9 218.2L592.2 216.2L591.0 216.0L590.8 216.6L589.1 216.7L589.8 217.6L590.0 219.2L588.5 220.7L587.1 222.7L585.7 223.0L583.3 221.4L582.3 222.0L582.0 222.8L580.6 223.3L580.5 223.9L577.7 223.9L577.3 223.3L575.3 223.2L574.3 223.7L573.5 223.5L572.1 221.8L571.6 221.1L569.6 221.5L568.9 222.7L568.2 225.2L567.2 225.8L566.4 226.1L566.1 225.9L565.2 225.1L565.0 224.3L565.4 223.1L565.4 222.0L563.8 220.2L563.5 219.0L563.5 218.4L562.5 217.6L562.5 215.9L561.9 214.9L560.9 215.0L561.2 214.0L561.9 212.9L561.6 211.7L562.5 210.9L562.0 210.2L562.7 208.5L564.0 206.4L566.4 206.6L566.2 195.6L566.2 194.4L569.4 194.4L569.4 188.9L580.6 188.9L591.4 188.9L602.4 188.9L603.3 191.6L602.7 192.1L603.1 195.0L604.1 198.3L605.2 199.0L606.7 200.0L605.3 201.6L603.2 202.0L602.4 202.9L602.1 204.7L600.9 208.8L601.2 209.9L600.8 212.3L599.6 215.1L597.9 216.4L596.8 218.6L596.5 219.7L595.2 220.5L594.3 223.4L594.3 223.7z M594.3 223.7L594.4 225.9L594.0 226.7L592.5 226.8L591.5 228.4L593.2 228.6L594.7 229.9L595.1 231.0L596.4 231.7L598.1 234.7L596.2 236.5L594.5 238.2L592.7 239.5L590.8 239.5L588.6 240.1L586.8 239.5L585.6 240.3L583.2 238.4L582.5 237.2L581.0 237.8L579.7 237.6L579.0 238.1L577.7 237.8L576.0 235.5L575.6 234.6L573.5 233.5L572.8 231.8L571.7 230.6L569.8 229.2L569.8 228.3L568.2 227.1L566.4 226.1L567.2 225.8L568.2 225.2L568.9 222.7L569.6 221.5L571.6 221.1L572.1 221.8L573.5 223.5L574.3 223.7L575.3 223.2L577.3 223.3L577.7 223.9L580.5 223.9L580.6 223.3L582.0 222.8L582.3 222.0L583.3 221.4L585.7 223.0L587.1 222.7L588.5 220.7L590.0 219.2L589.8 217.6L589.1 216.7L590.8 216.6L591.0 216.0L592.2 216.2L591.9 218.2L592.2 220.2L593.7 221.3L594.0 222.3L594.0 223.7L594.3 223.7z M453.6 212.2L452.4 210.1L451.0 209.1L452.3 208.6L453.6 206.6L454.3 205.2L455.2 204.3L456.6 204.5L458.0 203.9L459.5 203.9L460.8 204.7L462.7 205.4L464.4 207.5L466.2 209.4L466.3 211.1L466.9 212.7L467.9 213.5L468.1 214.6L468.0 215.4L467.6 215.6L466.1 215.4L465.9 215.7L465.3 215.7L463.3 215.1L461.9 215.0L456.8 214.9L456.1 215.2L455.1 215.1L453.7 215.6L453.2 213.5L455.7 213.5L456.4 213.1L456.9 213.1L457.9 212.5L459.1 213.1L460.3 213.1L461.5 212.5L461.0 211.7L460.1 212.2L459.2 212.1L458.1 211.5L457.2 211.5L456.6 212.2L453.6 212.2z M950.3 279.1L951.1 280.1L949.2 280.1L948.1 278.3L949.8 279.0L950.3 279.1z M946.8 277.4L945.7 277.5L944.0 277.2L943.4 276.8L943.6 275.7L945.5 276.1L946.4 276.7L946.8 277.4z M949.1 276.7L948.7 277.2L946.6 274.8L946.1 273.1L947.0 273.1L948.0 275.3L949.1 276.7z M944.1 273.2L944.2 273.7L942.0 272.5L940.5 271.5L939.5 270.6L939.9 270.3L941.2 271.0L943.4 272.3L944.1 273.2z M937.6 270.4L937.1 270.6L935.8 269.9L934.7 268.8L934.8 268.3L936.5 269.5L937.6 270.4z M468.2 231.2L467.5 230.9L465.5 229.8L464.0 228.3L463.5 227.3L463.2 225.3L464.7 224.0L465.0 223.3L465.5 222.7L466.2 222.6L466.9 222.1L469.1 222.1L469.9 223.1L470.5 224.3L470.4 225.1L470.8 225.8L470.8 226.8L471.6 226.6L470.3 227.9L469.0 229.5L468.9 230.3L468.2 231.2z M256.1 212.8L255.8 213.5L254.2 213.4L253.2 213.2L252.1 212.6L250.5 212.4L249.7 211.8L249.8 211.4L250.8 210.7L251.3 210.4L251.1 210.1L251.8 209.9L252.6 210.2L253.2 210.7L254.1 211.2L254.2 211.5L255.4 211.2L255.9 211.4L256.3 211.7L256.1 212.8z M635.9 223.7L634.7 225.5L632.7 227.8L630.4 227.8L621.3 224.5L620.3 223.5L619.2 222.2L618.2 220.6L618.8 219.6L619.8 218.2L620.8 218.7L621.3 219.8L622.5 221.0L623.9 221.0L626.5 220.3L629.6 220.0L632.0 219.1L633.4 218.9L634.4 218.4L636.0 218.3L636.0 218.3L635.9 219.5L635.9 222.3L635.9 223.7z M638.1 217.8L639.6 217.6L640.9 216.6L642.0 216.6L642.0 217.4L641.8 219.0L641.8 220.4L641.2 221.4L640.4 224.4L639.1 227.6L637.4 231.1L635.0 235.2L632.6 238.3L629.3 242.1L626.6 244.3L622.4 247.1L619.8 249.2L616.8 252.6L616.1 254.0L615.5 254.7L613.9 252.4L613.8 242.3L616.3 239.1L617.0 238.2L618.8 238.2L621.3 236.2L624.9 236.1L632.7 227.8L634.7 225.5L635.9 223.7L635.9 222.3L635.9 219.5L636.0 218.3L636.0 218.3L636.9 218.2L638.1 217.8z M558.0 123.8L559.7 124.5L559.9 125.6L561.5 126.4L562.4 125.8L563.1 126.2L562.4 126.6L562.9 127.1L562.3 127.8L562.5 128.8L563.9 130.0L562.8 130.8L562.3 131.7L562.6 132.1L562.2 132.4L560.9 132.5L559.9 132.7L559.8 132.4L560.2 132.1L560.5 131.4L560.1 131.5L559.6 130.9L559.1 130.8L558.7 130.4L558.2 130.2L557.8 129.8L557.3 130.0L556.9 130.9L556.3 131.1L556.5 130.8L555.4 130.3L554.5 130.0L554.1 129.6L553.4 129.1L554.0 129.0L554.4 127.7L553.1 126.6L553.8 125.4L552.8 125.4L553.9 124.3L553.0 123.6L552.3 122.5L554.4 121.7L556.2 121.9L557.7 123.0L558.0 123.8z M341.3 233.4L344.6 234.0L344.9 233.5L347.1 233.3L350.1 234.0L348.7 236.4L348.9 238.3L350.0 239.9L349.5 241.1L349.3 242.4L348.5 243.6L347.0 243.0L345.6 243.3L344.5 243.0L344.2 243.8L344.7 244.4L344.5 245.0L342.9 244.7L341.2 242.3L340.9 240.7L340.0 240.7L338.8 238.7L339.3 237.3L339.1 236.6L340.8 235.9L341.3 233.4z M552.4 112.5L552.5 112.7L553.7 112.3L555.1 113.3L556.7 112.7L558.0 113.0L560.0 112.6L562.7 113.7L561.9 114.4L561.3 115.5L560.8 115.8L557.8 114.9L556.9 115.1L556.2 115.8L554.9 116.1L554.6 115.9L553.3 116.4L552.2 116.4L551.9 117.0L549.6 117.3L548.6 117.0L547.2 116.3L546.9 115.4L547.1 115.0L547.5 114.4L548.7 114.4L549.7 114.2L549.8 113.9L550.3 113.8L550.5 113.1L551.1 113.0L551.5 112.5L552.4 112.5z M538.4 120.8L540.6 121.0L542.0 120.4L544.5 120.3L545.0 119.9L545.5 119.9L546.0 120.8L543.8 121.6L543.5 122.7L542.6 123.0L542.6 123.7L541.5 123.7L540.5 123.2L540.0 123.7L538.1 123.6L538.7 123.4L538.1 122.2L538.4 120.8z M561.6 67.4L558.9 69.4L559.4 71.1L554.9 73.3L549.6 75.7L547.6 79.6L549.5 81.6L552.2 83.1L549.6 86.2L546.7 86.9L545.7 91.6L544.1 94.2L540.7 93.9L539.2 96.1L536.0 96.2L535.1 93.6L532.7 90.4L530.6 86.5L531.9 84.9L534.2 83.0L535.1 79.7L533.3 78.3L533.1 74.6L534.9 72.0L537.7 72.1L538.7 71.0L537.7 70.0L542.0 66.1L544.7 63.0L546.6 61.1L549.2 61.1L550.0 59.5L555.2 60.0L555.6 58.2L557.3 58.0L561.1 59.4L565.4 61.3L565.5 65.6L566.4 66.6L561.6 67.4z M547.4 90.6L547.8 90.8L545.6 93.9L545.5 92.9L547.4 90.6z M553.8 89.0L552.2 89.9L552.3 90.4L552.8 90.4L552.6 90.6L551.9 90.8L552.0 91.1L551.3 91.3L550.9 91.9L550.3 92.0L550.5 91.4L550.2 90.9L550.4 90.6L550.3 90.2L551.8 89.1L552.9 89.1L553.1 88.9L553.8 88.9L553.8 89.0z M557.9 72.7L558.5 72.7L558.3 73.0L557.8 73.4L557.5 73.4L557.8 73.0L557.8 72.8L557.9 72.7z M589.1 324.3L588.5 325.5L586.9 325.8L585.2 324.3L585.2 323.3L586.0 322.3L586.2 321.5L587.0 321.3L588.4 321.8L588.8 323.0L589.1 324.3z M607.8 157.3L602.3 160.2L599.2 159.1L599.2 159.1L599.5 158.7L599.5 157.6L600.2 156.0L601.7 155.0L601.2 153.9L600.0 153.8L599.7 151.6L600.4 150.5L601.2 149.9L601.9 149.3L602.1 147.7L603.0 148.3L606.0 147.5L607.5 148.0L609.8 148.0L613.0 147.0L614.5 147.0L617.6 146.6L616.2 148.3L614.7 149.0L615.0 151.0L613.9 154.4L607.8 157.3z M540.3 214.3L540.5 213.0L538.8 212.9L538.8 211.1L537.6 210.1L538.8 206.4L542.4 203.8L542.5 200.2L543.6 194.6L544.2 193.4L543.0 192.4L543.0 191.5L541.9 190.8L541.3 186.5L544.1 185.0L555.1 190.3L566.2 195.6L566.4 206.6L564.0 206.4L562.7 208.5L562.0 210.2L562.5 210.9L561.6 211.7L561.9 212.9L561.2 214.0L560.9 215.0L561.9 214.9L562.5 215.9L562.5 217.6L563.5 218.4L563.5 219.0L561.8 219.5L560.3 220.6L558.3 223.7L555.7 225.0L553.0 224.8L552.3 225.0L552.5 226.0L551.1 227.0L549.9 228.1L546.4 229.1L545.7 228.5L545.3 228.5L544.7 229.2L542.4 229.4L542.9 228.6L542.0 226.7L541.6 225.6L540.4 225.1L538.8 223.5L539.4 222.2L540.6 222.4L541.4 222.2L543.0 222.3L541.5 219.7L541.6 217.9L541.4 216.1L540.3 214.3z M505.2 232.9L502.9 233.5L502.3 232.6L501.6 230.8L501.4 229.4L502.0 226.9L501.3 225.9L501.0 223.7L501.0 221.7L499.9 220.3L500.1 219.4L502.5 219.5L502.1 220.9L503.0 221.7L504.0 222.7L504.1 224.1L504.6 224.6L504.5 231.0L505.2 232.9z M785.0 216.1L782.5 214.9L780.1 214.9L780.5 212.7L778.0 212.8L777.8 215.8L776.3 219.9L775.4 222.3L775.6 224.3L777.4 224.4L778.6 227.0L779.1 229.4L780.6 231.0L782.3 231.3L783.7 232.7L782.8 233.9L781.0 234.2L780.8 232.8L778.5 231.5L778.0 232.0L776.9 231.0L776.4 229.6L775.0 228.0L773.6 226.7L773.2 228.3L772.6 226.8L772.9 225.1L773.8 222.4L775.1 219.6L776.6 217.0L775.5 214.4L775.6 213.1L775.3 211.6L773.4 209.4L772.8 208.0L773.7 207.5L774.7 205.1L773.6 203.2L771.8 201.2L770.5 198.8L771.7 198.3L772.9 195.3L774.9 195.1L776.5 193.9L778.1 193.3L779.3 194.1L779.5 195.8L781.3 195.9L780.7 198.9L780.7 201.4L783.6 199.7L784.5 200.2L786.1 200.1L786.7 199.1L788.8 199.3L790.9 201.6L791.1 204.3L793.3 206.7L793.2 209.1L792.3 210.4L789.7 210.0L786.1 210.5L784.3 212.8L785.0 216.1z M697.3 138.2L696.2 139.1L693.2 138.6L693.0 140.2L696.0 140.0L699.4 140.9L704.7 140.5L705.4 143.0L706.3 142.8L708.0 143.4L707.9 144.5L708.3 146.1L705.4 146.1L703.5 145.8L701.8 147.1L700.5 147.4L699.6 147.9L698.5 147.0L698.7 144.7L697.9 144.6L698.2 143.7L696.7 143.1L695.5 144.1L695.2 145.2L694.8 145.6L693.1 145.5L692.2 146.8L691.3 146.3L689.3 147.2L688.4 146.8L690.0 144.0L689.4 141.9L687.3 141.3L688.1 140.1L690.4 140.2L691.7 138.6L692.6 136.9L696.3 136.2L695.7 137.5L696.1 138.3L697.3 138.2z M670.0 151.0L669.8 148.6L667.7 148.5L664.5 146.1L662.3 145.8L659.3 144.4L657.3 144.1L656.1 144.6L654.2 144.5L652.2 146.1L649.8 146.7L649.3 144.7L649.7 141.8L647.5 140.9L648.2 139.0L646.4 138.8L647.0 136.5L649.6 137.1L652.0 136.2L650.0 134.6L649.2 133.0L647.0 133.7L646.7 135.7L645.8 133.9L647.1 133.0L650.2 132.4L652.1 133.2L654.0 135.4L655.5 135.3L658.6 135.2L658.1 133.8L660.5 132.9L662.9 131.2L666.6 132.7L666.9 134.9L668.0 135.5L671.0 135.4L671.9 135.9L673.3 138.7L676.4 140.7L678.3 142.0L681.2 143.3L684.9 144.5L684.8 146.2L683.9 146.1L682.6 145.4L682.2 146.4L679.9 146.9L679.3 149.1L677.7 150.0L675.5 150.4L675.0 151.7L672.9 152.0L670.0 151.0z M847.1 274.7L847.5 274.0L849.9 273.4L851.8 273.3L852.7 273.0L853.7 273.3L852.7 274.1L849.8 275.3L847.5 276.1L847.4 275.2L847.1 274.7z M328.7 220.1L330.3 219.8L330.8 219.8L330.7 221.9L328.4 222.2L327.9 222.0L328.7 221.2L328.7 220.1z M526.3 165.8L525.2 160.8L523.4 159.7L523.4 159.0L521.1 157.4L520.9 155.3L522.6 153.7L523.3 151.4L522.8 148.8L523.4 147.4L526.4 146.3L528.4 146.6L528.3 148.0L530.6 147.0L530.8 147.5L529.4 148.9L529.4 150.1L530.4 150.8L530.0 153.2L528.2 154.6L528.7 156.2L530.2 156.2L530.9 157.5L531.9 158.0L531.8 160.1L530.4 160.9L529.5 161.8L527.6 162.8L527.9 164.0L527.7 165.2L526.3 165.8z M602.5 135.2L606.5 136.3L609.8 135.8L612.1 136.1L615.4 134.6L618.4 134.5L621.1 135.9L621.5 136.8L621.3 138.2L623.3 138.9L624.4 139.7L622.5 140.5L623.4 143.7L622.8 144.5L624.4 146.7L623.0 147.2L622.1 146.5L618.8 146.2L617.6 146.6L614.5 147.0L613.0 147.0L609.8 148.0L607.5 148.0L606.0 147.5L603.0 148.3L602.1 147.7L601.9 149.3L601.2 149.9L600.4 150.5L599.4 149.2L600.4 148.2L598.8 148.4L596.4 147.8L594.5 149.4L590.3 149.7L588.1 148.2L585.1 148.1L584.4 149.3L582.5 149.6L579.8 148.1L576.8 148.2L575.1 145.4L573.1 143.9L574.5 141.7L572.7 140.4L575.8 137.7L580.1 137.6L581.2 135.5L586.5 135.9L589.9 134.1L593.1 133.3L597.7 133.2L602.5 135.2z M575.5 137.0L573.2 138.5L572.3 137.2L572.4 136.6L573.0 136.3L573.9 134.5L572.5 133.8L575.4 132.9L577.8 133.3L578.1 134.4L580.5 135.3L580.0 136.0L576.7 136.1L575.5 137.0z M838.3 182.2L836.6 186.7L835.4 189.0L833.9 186.6L833.6 184.6L835.3 181.8L837.5 179.7L838.8 180.6L838.3 182.2z M594.2 252.6L594.6 252.9L604.7 258.6L604.9 260.2L608.9 263.0L607.6 266.4L607.8 268.0L609.6 269.0L609.6 269.7L608.9 271.4L609.0 272.2L608.9 273.6L609.8 275.3L611.0 278.1L612.0 278.7L609.8 280.3L606.7 281.3L605.1 281.3L604.1 282.1L602.2 282.2L601.4 282.6L598.1 281.8L596.0 282.0L595.2 278.2L594.3 276.9L593.7 276.2L591.0 275.6L589.4 274.8L587.7 274.3L586.5 273.9L585.4 273.2L583.9 269.7L582.3 268.1L581.7 266.5L582.0 265.1L581.5 262.5L582.6 262.4L583.7 261.4L584.7 259.9L585.4 259.3L585.4 258.4L584.8 257.8L584.6 256.7L585.4 256.4L585.6 254.7L584.5 253.2L585.5 252.8L588.5 252.9L594.2 252.6z M588.5 252.9L585.5 252.8L584.5 253.2L582.8 254.0L582.2 253.7L582.2 251.6L582.8 250.6L583.0 248.3L583.6 247.0L584.6 245.6L585.7 244.9L586.6 243.9L585.5 243.5L585.6 240.3L586.8 239.5L588.6 240.1L590.8 239.5L592.7 239.5L594.5 238.2L595.8 240.1L596.1 241.5L597.3 244.7L596.3 246.7L594.9 248.6L594.1 249.7L594.2 252.6L588.5 252.9z M588.3 105.3L589.3 105.4L590.0 104.8L590.9 104.9L593.8 104.6L595.5 106.2L594.8 106.8L595.1 107.6L597.3 107.8L598.3 109.0L598.2 109.5L601.7 110.5L603.9 110.0L605.6 111.3L607.2 111.3L611.3 112.2L611.3 113.0L610.2 114.5L610.8 116.0L610.4 116.9L607.7 117.2L606.3 117.9L606.2 119.2L604.0 119.4L602.1 120.3L599.5 120.4L597.1 121.5L597.3 123.2L598.6 123.9L601.5 123.7L600.9 124.7L597.9 125.2L594.1 126.8L592.6 126.2L593.2 124.9L590.2 124.1L590.6 123.6L593.3 122.6L592.5 122.0L588.2 121.3L588.0 120.3L585.4 120.6L584.4 122.1L582.2 124.2L581.0 123.7L579.7 124.2L578.4 123.6L579.1 123.3L579.6 122.4L580.4 121.5L580.2 121.0L580.8 120.8L581.0 121.2L582.7 121.3L583.4 121.0L582.9 120.8L583.1 120.3L582.1 119.6L581.7 118.5L580.7 118.0L580.9 117.1L579.6 116.3L578.5 116.2L576.5 115.4L574.6 115.6L573.9 116.1L572.8 116.1L572.1 116.7L570.0 117.0L569.1 117.4L567.8 116.7L566.0 116.7L564.3 116.4L563.1 117.0L562.9 116.2L561.3 115.5L561.9 114.4L562.7 113.7L563.3 113.8L562.6 112.6L565.1 110.3L566.5 109.9L566.7 109.2L565.4 106.7L566.7 106.6L568.2 105.9L570.4 105.8L573.2 106.0L576.3 106.7L578.4 106.7L579.5 107.1L580.5 106.7L581.3 107.3L583.8 107.2L584.9 107.4L585.1 106.0L585.9 105.4L588.3 105.3z M339.9 333.9L341.7 333.6L344.5 335.8L345.6 335.7L348.4 337.5L350.6 339.0L352.2 340.9L351.0 342.2L351.7 343.8L350.5 345.5L347.4 347.1L345.3 346.5L343.8 346.8L341.3 345.6L339.4 345.7L337.7 344.2L337.9 342.4L338.5 341.8L338.5 339.0L339.2 336.2L339.9 333.9z M67.9 197.0L67.5 197.5L66.8 197.1L66.9 196.3L66.5 195.3L66.6 195.0L67.1 194.5L66.9 194.0L67.1 193.7L67.3 193.8L68.3 194.2L68.8 194.5L69.3 194.8L70.0 195.8L69.9 196.0L68.8 196.6L67.9 197.0z M66.4 192.7L65.5 192.9L65.0 192.3L64.7 192.0L64.7 191.9L65.0 191.6L66.0 191.9L66.7 192.3L66.4 192.7z M64.6 191.2L64.5 191.5L63.0 191.4L63.2 191.1L64.6 191.2z M62.1 190.8L61.9 190.9L61.7 190.9L60.8 190.8L60.4 190.2L60.3 190.1L61.0 189.7L61.3 189.9L62.1 190.8z M57.4 188.9L57.0 189.2L56.1 188.7L56.3 188.5L56.7 188.2L57.3 188.3L57.4 188.9z M236.6 112.8L237.1 114.3L238.0 114.8L239.9 115.0L242.8 115.4L245.4 116.3L247.7 115.9L251.1 116.6L252.0 116.6L254.5 115.8L257.1 116.8L259.8 117.9L262.1 118.8L264.2 119.7L264.5 120.5L265.2 120.7L265.0 121.0L265.7 121.1L266.3 120.8L266.4 121.5L267.0 121.9L267.7 121.9L268.1 122.2L267.8 122.7L270.7 124.0L271.3 126.6L271.8 129.0L271.0 130.6L269.7 132.1L269.1 133.1L269.1 133.4L269.4 133.8L270.3 134.2L271.0 134.2L274.2 132.8L277.1 132.3L280.7 130.9L280.8 130.7L280.5 129.8L280.1 129.3L281.3 128.8L284.1 128.8L286.6 128.8L287.5 127.7L287.8 127.5L290.8 125.5L292.0 125.0L296.3 125.0L301.4 125.0L301.7 124.3L302.5 124.2L303.7 123.7L304.7 122.5L305.6 120.3L307.7 118.2L308.6 118.9L310.5 118.5L311.7 119.3L311.7 123.0L313.5 124.6L314.0 125.5L311.0 126.9L308.2 127.8L305.2 128.7L303.8 130.3L303.3 130.9L303.3 132.4L304.2 133.9L305.3 133.9L305.0 132.9L305.9 133.5L305.7 134.3L303.8 134.8L302.4 134.7L300.4 135.2L299.2 135.4L297.6 135.5L295.2 136.3L299.3 135.8L300.2 136.3L296.3 137.1L294.5 137.1L294.6 136.8L293.7 137.6L294.5 137.7L293.9 139.7L291.9 141.8L291.7 141.1L291.1 141.0L290.2 140.3L290.8 141.8L291.5 142.3L291.5 143.3L290.6 144.4L289.1 146.6L288.8 146.5L289.7 144.6L288.2 143.6L287.9 141.2L287.4 142.5L288.0 144.2L286.1 143.8L288.1 144.7L288.2 147.3L289.0 147.5L289.3 148.5L289.6 151.2L287.9 153.3L285.0 154.1L283.2 155.8L281.8 155.9L280.4 157.0L280.0 157.9L276.9 159.7L275.4 161.0L274.1 162.7L273.6 164.6L274.1 166.6L275.1 168.9L276.3 170.9L276.3 172.1L277.6 175.3L277.5 177.2L277.4 178.3L276.7 180.0L275.9 180.3L274.5 180.0L274.1 178.8L273.0 178.1L271.6 175.7L270.3 173.6L269.8 172.5L270.4 170.7L269.6 169.2L267.5 166.8L266.4 166.4L263.6 167.7L263.1 167.5L261.7 166.2L260.0 165.6L256.9 165.9L254.4 165.6L252.3 165.8L251.1 166.2L251.6 167.0L251.6 168.1L252.2 168.6L251.6 169.0L250.6 168.6L249.6 169.1L247.6 169.0L245.5 167.6L243.1 167.9L241.0 167.3L239.3 167.5L237.0 168.1L234.4 170.2L231.7 171.4L230.2 172.7L229.5 173.9L229.5 175.9L229.6 177.2L230.2 178.1L229.1 178.2L227.1 177.6L224.9 176.7L224.2 175.4L223.6 173.5L221.9 171.9L221.0 170.3L219.6 168.4L217.6 167.3L215.3 167.3L213.6 169.5L211.3 168.7L209.8 167.9L209.2 166.3L208.2 164.9L206.6 163.7L205.2 162.8L204.1 161.8L199.3 161.8L199.3 162.9L197.1 162.9L191.6 163.0L185.3 161.0L181.1 159.7L181.3 159.1L177.8 159.4L174.6 159.6L174.2 158.2L172.4 156.6L171.1 156.3L170.8 155.5L169.2 155.3L168.2 154.6L165.6 154.3L164.9 153.9L164.6 152.3L161.9 149.6L159.6 145.7L159.7 145.0L158.5 144.1L156.3 141.8L155.9 139.5L154.4 138.0L155.1 135.7L155.0 133.3L154.1 131.2L155.2 128.6L155.5 126.1L155.8 123.5L155.3 119.8L154.5 117.4L153.6 116.2L154.0 115.6L158.0 116.6L159.5 119.2L160.2 118.4L159.7 116.2L158.8 113.9L166.7 113.9L174.9 113.9L177.6 113.9L186.1 113.9L194.3 113.9L202.6 113.9L211.0 113.9L220.4 113.9L229.9 113.9L235.7 113.9L235.7 112.8L236.6 112.8z M75.0 91.3L72.2 92.4L70.8 91.7L70.4 90.4L72.9 89.4L74.4 89.0L76.2 89.2L77.4 90.0L75.0 91.3z M40.1 83.6L38.4 84.0L36.5 83.5L34.8 82.7L37.6 82.3L39.8 82.5L40.1 83.6z M23.0 72.8L24.7 73.4L26.4 73.1L28.7 73.8L31.4 74.2L31.2 74.5L29.1 75.1L27.0 74.5L25.9 74.0L23.5 74.1L22.8 73.9L23.0 72.8z M69.3 52.4L71.3 53.6L72.5 53.1L77.2 53.3L77.0 53.9L81.3 54.4L84.1 54.1L90.0 55.0L95.3 55.2L97.4 55.6L101.1 55.1L105.4 56.0L108.4 56.4L108.4 66.7L108.3 82.5L111.1 82.6L113.8 83.3L115.7 84.5L118.2 86.4L120.9 84.8L123.7 83.9L125.2 85.4L127.0 86.5L129.6 87.7L131.3 89.7L134.1 92.9L138.9 94.7L138.9 96.4L137.4 97.8L135.9 96.7L133.4 95.8L132.6 93.4L129.1 91.2L127.6 88.5L124.9 88.4L120.5 88.3L117.2 87.5L111.5 84.6L108.8 84.1L104.0 83.1L100.1 83.3L94.7 82.1L91.3 80.9L88.3 81.5L88.8 83.4L87.3 83.6L84.1 84.2L81.6 85.1L78.6 85.7L78.2 84.0L79.4 81.3L82.4 80.5L81.6 79.8L78.1 81.3L76.2 83.2L72.2 85.1L74.2 86.5L71.6 88.5L68.6 89.6L65.8 90.5L65.1 91.7L60.8 93.2L59.9 94.5L56.7 95.6L54.8 95.4L52.2 96.2L49.3 97.2L47.0 98.1L42.3 98.9L41.8 98.4L44.9 97.1L47.6 96.3L50.5 94.7L54.0 94.4L55.4 93.3L59.2 91.6L59.8 91.1L61.9 90.1L62.4 88.0L63.8 86.3L60.6 87.2L59.7 86.7L58.2 87.7L56.4 86.3L55.6 87.3L54.6 85.9L51.8 87.0L50.1 87.0L49.8 85.4L50.3 84.4L48.6 83.4L44.9 83.9L42.6 82.6L40.7 81.9L40.7 80.4L38.6 79.2L39.6 77.6L41.9 76.0L42.9 74.6L45.1 74.4L47.0 74.8L49.3 73.5L51.3 73.7L53.4 72.9L52.9 71.6L51.3 71.1L53.4 70.0L51.7 70.1L48.7 70.7L47.9 71.3L45.7 70.7L41.8 71.0L37.7 70.3L36.5 69.2L33.0 67.6L36.9 66.4L43.1 65.1L45.4 65.1L45.0 66.5L50.9 66.3L48.6 64.6L45.2 63.6L43.2 62.2L40.6 61.0L36.8 60.1L38.3 58.7L43.2 58.6L46.8 57.3L47.4 55.9L50.3 54.6L53.0 54.3L58.2 53.1L60.8 53.3L65.1 51.8L69.3 52.4z M684.8 146.2L684.9 144.5L681.2 143.3L678.3 142.0L676.4 140.7L673.3 138.7L671.9 135.9L671.0 135.4L668.0 135.5L666.9 134.9L666.6 132.7L662.9 131.2L660.5 132.9L658.1 133.8L658.6 135.2L655.5 135.3L655.4 125.0L662.5 123.4L663.0 123.6L667.3 125.6L669.6 126.7L672.3 129.2L675.5 128.7L680.3 128.5L683.6 130.6L683.4 133.3L684.8 133.4L685.3 135.6L688.8 135.7L689.6 137.0L690.6 137.0L691.9 135.0L695.5 133.1L697.1 132.6L697.9 132.9L695.6 134.7L697.7 135.7L699.6 135.0L702.9 136.5L699.4 138.5L697.3 138.2L696.1 138.3L695.7 137.5L696.3 136.2L692.6 136.9L691.7 138.6L690.4 140.2L688.1 140.1L687.3 141.3L689.4 141.9L690.0 144.0L688.4 146.8L686.3 146.2L684.8 146.2z M301.9 217.3L301.8 217.9L300.1 218.3L301.1 219.5L301.0 221.0L299.8 222.6L300.8 224.8L302.0 224.6L302.7 222.6L301.8 221.6L301.7 219.5L305.1 218.4L304.7 217.1L305.7 216.2L306.7 218.2L308.7 218.2L310.5 219.8L310.6 220.7L313.1 220.7L316.0 220.4L317.6 221.7L319.7 222.0L321.3 221.1L321.3 220.4L324.8 220.3L328.1 220.2L325.7 221.1L326.7 222.4L328.9 222.6L331.0 223.9L331.5 226.2L332.9 226.1L334.0 226.8L331.8 228.4L331.6 229.4L332.5 230.4L331.8 231.0L330.1 231.4L330.2 232.7L329.4 233.4L331.3 235.6L331.7 236.3L330.6 237.4L327.5 238.4L325.5 238.9L324.7 239.5L322.5 238.8L320.5 238.5L320.0 238.7L321.2 239.5L321.1 241.3L321.5 243.1L323.8 243.3L324.0 243.9L322.0 244.7L321.7 245.9L320.5 246.3L318.5 247.0L317.9 247.8L315.8 248.0L314.2 246.5L313.4 243.7L312.6 242.8L311.6 242.2L313.0 240.8L313.0 240.2L312.2 239.3L311.6 237.5L311.8 235.5L312.4 234.6L312.9 233.1L312.0 232.6L310.4 232.9L308.4 232.8L307.3 233.1L305.3 230.7L303.7 230.3L300.1 230.6L299.4 229.6L298.8 229.4L298.7 228.8L299.0 227.8L298.8 226.7L298.2 226.0L297.8 224.8L296.4 224.6L297.1 223.0L297.5 221.0L298.3 219.9L299.4 219.1L300.1 217.8L301.9 217.3z M800.1 190.1L796.4 192.5L794.1 195.1L793.5 197.1L795.6 200.0L798.2 203.6L800.7 205.3L802.4 207.6L803.7 212.7L803.3 217.6L801.0 219.4L797.8 221.2L795.6 223.5L792.1 226.1L791.1 224.3L791.9 222.4L789.8 220.9L792.2 219.8L795.1 219.6L793.9 217.9L798.6 215.7L798.9 212.4L798.3 210.5L798.8 207.8L798.1 205.8L796.0 203.9L794.2 201.4L791.9 198.1L788.6 196.5L789.4 195.5L791.2 194.8L790.1 192.3L786.7 192.3L785.4 189.8L783.8 187.6L785.3 186.9L787.5 186.9L790.2 186.6L792.6 185.1L793.9 186.2L796.5 186.7L796.0 188.3L797.3 189.4L800.1 190.1z M966.2 295.7L965.3 296.1L964.4 294.9L964.5 294.1L966.2 295.7z M964.2 291.5L964.6 293.7L963.9 293.4L963.3 293.5L962.9 292.8L962.9 290.6L964.2 291.5z M598.7 160.0L598.7 161.7L598.3 162.5L597.0 162.9L597.1 162.2L597.8 161.8L597.2 161.5L597.7 159.6L598.7 160.0z M647.5 203.7L645.5 204.5L645.0 205.7L644.9 206.7L642.1 207.8L637.7 209.1L635.2 211.1L634.0 211.3L633.2 211.1L631.5 212.2L629.8 212.8L627.4 212.9L626.7 213.1L626.1 213.8L625.4 214.0L625.0 214.7L623.6 214.7L622.7 215.0L620.8 214.9L620.1 213.3L620.1 211.8L619.7 210.9L619.1 208.9L618.3 207.7L618.9 207.6L618.6 206.3L619.0 205.8L618.8 204.6L620.1 203.7L619.8 202.5L620.5 201.2L621.6 201.9L622.4 201.6L625.6 201.6L626.1 201.9L628.8 202.1L629.9 202.0L630.6 202.9L631.9 202.5L633.8 199.5L636.4 198.3L644.4 197.2L646.6 201.8L647.5 203.7z M587.6 331.3L587.0 331.7L585.8 333.1L585.1 334.5L583.5 336.5L580.3 339.4L578.4 341.0L576.3 342.3L573.4 343.4L572.0 343.5L571.6 344.3L569.9 343.9L568.5 344.4L565.5 343.9L563.9 344.2L562.7 344.1L559.8 345.2L557.5 345.6L555.8 346.7L554.5 346.7L553.3 345.7L552.4 345.7L551.2 344.4L551.0 344.8L550.7 344.1L550.7 342.4L549.8 340.6L550.7 340.1L550.6 337.9L548.8 335.3L547.4 333.0L547.4 333.0L545.4 329.4L546.7 328.0L547.8 328.8L548.3 330.0L549.5 330.2L551.3 330.7L552.8 330.5L555.3 329.1L555.3 318.8L556.0 319.2L557.7 321.9L557.4 323.5L558.0 324.5L560.0 324.2L561.4 323.0L562.7 322.2L563.4 320.8L564.8 320.2L565.9 320.5L567.3 321.3L569.5 321.4L571.3 320.8L571.6 319.9L572.1 318.6L573.6 318.4L574.4 317.3L575.3 315.5L577.8 313.4L581.8 311.4L582.9 311.4L584.2 311.9L585.2 311.5L586.6 311.8L588.0 315.7L588.7 317.7L588.2 320.8L588.4 321.8L587.0 321.3L586.2 321.5L586.0 322.3L585.2 323.3L585.2 324.3L586.9 325.8L588.5 325.5L589.1 324.3L591.2 324.3L590.5 326.3L590.2 328.6L589.5 329.9L587.6 331.3z M580.5 330.4L579.3 329.6L578.0 330.1L576.5 331.2L575.0 333.0L577.1 335.1L578.1 334.8L578.6 334.0L580.1 333.5L580.6 332.6L581.5 331.3L580.5 330.4z M591.0 275.6L592.3 276.9L593.0 279.2L592.5 280.0L592.0 282.2L592.5 284.5L591.6 285.5L590.8 288.1L592.3 288.8L583.8 291.1L584.1 293.1L582.0 293.5L580.4 294.6L580.1 295.5L579.1 295.7L576.7 298.0L575.1 299.8L574.2 299.9L573.3 299.6L570.2 299.3L569.7 299.1L569.7 298.8L568.6 298.2L566.8 298.0L564.5 298.7L562.7 296.9L560.8 294.7L560.9 285.8L566.7 285.9L566.5 284.9L566.9 283.9L566.4 282.6L566.7 281.2L566.4 280.4L567.4 280.4L567.5 281.3L568.8 281.2L570.6 281.5L571.5 282.7L573.8 283.1L575.5 282.2L576.1 283.7L578.2 284.1L579.2 285.3L580.4 286.8L582.5 286.8L582.3 283.8L581.5 284.3L579.6 283.3L578.8 282.8L579.2 280.0L579.6 276.7L579.0 275.5L579.8 273.7L580.6 273.4L584.3 272.9L585.4 273.2L586.5 273.9L587.7 274.3L589.4 274.8L591.0 275.6z M586.6 311.8L585.2 311.5L584.2 311.9L582.9 311.4L581.8 311.4L580.0 310.1L577.8 309.7L577.0 307.9L577.0 306.9L575.8 306.6L572.7 303.6L571.8 302.0L571.2 301.5L570.2 299.3L573.3 299.6L574.2 299.9L575.1 299.8L576.7 298.0L579.1 295.7L580.1 295.5L580.4 294.6L582.0 293.5L584.1 293.1L584.3 294.1L586.6 294.1L587.9 294.6L588.5 295.3L589.8 295.5L591.2 296.4L591.2 299.9L590.7 301.9L590.6 303.9L591.0 304.8L590.7 306.4L590.3 306.7L589.6 308.7L586.6 311.8z"; console.log('World Map JS file loaded, length: 127184');
\ No newline at end of file
+window.WORLD_MAP_VIEWBOX = [0, 0, 1000, 500];
+window.WORLD_MAP_PATH = "M670 151l5 1 1-2 3-1 1-2 2-1 1-1 6 2 2-1 1 1 1-1 2 0 2-3 1 1 0 3 2 1 4-2 4 0 1 1-9 2-2 1 1 2-1 2 0 1-1 1-3 0 1 1-3 3 0 1-6 2-2 2 0 2-6 1-4 1-5-2 3-2-1-2-2-1-1-4 1-1-1-1zm-125 115l3 6 5 0 1-2 2-1 1 0 0 1 3 0 1 11 5-1 1 6-6 0 0 9 3 4-5 1-6-1-2-1-12 0-2-1-4 1 1-8 4-7 0-2-2-5 1-2-3-7zm-11 0l-1-2 2-2 1 1zm23 -132l0 1 1 2-2 3-2-2 0-4 0-1 1-2zm86 49l7 0 6-5 0 1 1 2-2 0 1 2-2 1-1 4-9-2zm-325 220l-9-1 0-6 3 4 7 2zm2 -92l1 2 1-2 3 0 6 5 9 4 0 1-3 4 6 1 2 0 3-2 0-2 2-1 1 2 0 2-4 2-7 7-2 12 3 2 0 2 1 1 0 1-2 4-4 2-9 0 0 5-1 1-3 0-3-1-1 1 1 3 1 1 2-1 1 1-5 3-1 4-3 0-2 1-1 3 3 2 3 0-1 3-4 1-1 3-4 3 1 3 2 1-11-1-1-3-2 0-1-1 0-3 2-1 1-2 0-1 2-6 0-2 1-1-1-1 1-1-2-1 0-4 1 0-1-4 2-5 1-1-1-5 2-2 0-2 2-3 0-3-2-5 2-3 0-2 0-3 4-4 0-1 0-6 3-1 1-4 2-2zm301 -175l4-1 2 2-1 0 2 1-1 1 2 1 0 2-1 0-1-2-6-2zm-287 336l-1 3-12 0-5-2 12 0 4-2zm-276 -1l-6 0-7-3 2-1 5 1 5 2zm317 -4l3 1 2 4-20 3-11-1 1-1 8-2 7-4 5-1zm-212 -13l7 0-4 2-7-1 1-1zm-12 0l5 1-10-1 2-1zm74 -4l6 0 2 1-13 0-4-1zm85 -3l0 1-1 2-6 1-4 0 1-1-6 1-2-1 0-1 5-1 3 0 1-5 4-2zm27 -19l-5 1-4 1-2 2 1 2-4 1-5 3 0 1 2 2 4 1 5 5 2 6-1 3-6 1-3 2-15 3-2 1-19 0 1 1 9 2-11 2-1 2 8 3 43 6 4 2 24-4 19 1 6-2 34-3-3-2 0-1-17 1-1-1 1-2 1-1 8-1 10-3 18-2 13-2 5-2 1-1-3-1 3-2 9-2 5-3 8 1 2-2 7 1 10 0 1 1 18-3 5-2 2 1 2-1 4 3 7-3 4 0 1 2 2-2 10 0 6 1 3 1 12 0 14-2 5-4 6 2 3 0 4 2 10-3 12-3 3 0 4-2 5 0 3-2 8-1 7 1 0 1 12 4 2 0 5-2 13 2 3 3-1 2-5 1 1 1 3 0-3 4 5 1 3-1 8-6 11-1 4-3 8-3 13-1 2 0 1-2 3 2 2 0 13 0 4 1 11 0 9-5 9 4 3 0 8-1 10-2 5 2 12 2 9-2 16 0 16-1 1-3 5 5 2 0 22 0 2 1 0 1 1 1 6 1 14 1 2-1 7 3 6 0 7 3 12 0 13 2 2 1-1 1-5 5-9 2-5 3-2 2 0 2 4 3 5 1 1 1-15 1-5 5 7 3 18 4 2 1 8 0 2 1 8 0 11 1-1000 0 3-1 5 1 3-1 5 1 4-1 8-1 8 2 25 2 8-1 18 2 16-2 0-1-20-1-2-1-8-1 3-3-1-1-11-3 14 0 4 1 11-3-1-1-7-2-17 0-7-3-1-3 4 1 9-1 2 1 5 0 14-3-1-2 1-1 3 0 2 1 25-4 44 1 16-2 4 2 3 0 10 2 8-1 11 1 2-1-3-2-4 0-1-1-2-3 13 0 4 2 3 0 11-1 7 1 2-2 2 1 7 0 2 1 11 1 3-2 11 3 20-3 5-2 1-1-4-6 3-5-1-2 13-7 14-4 2 0zm355 -43l4 2-1 1-4 0zm212 -22l3 1 5 0 0 3-1 3-1-1-2 2-2 0-4-7 0-1zm-5 -75l1 2 2-1 2 3-1 1 4 10 7 4-1 0 3 5 1 0 1 1 1-1 0 3 6 5 0 2 0 4 2 2-2 10-1 2-3 2-3 7-1 5-5 1-6 3-4-1 1-2-4 3-8-2-2-2-1-4-4-1 1-1-1-2-1 1-3 1 3-5 0-2-4 4-1 2-2-1 0-2-4-3 1 0-8-3-15 2-5 2-2 2-10 0-5 3-4 0-5-2 1-2 1-1 0-4-2-5 1-1-5-10 1 2-1-3 2 2-2-5 1-6 1-2 0 2 1-1 6-3 12-3 4-5 0-2 2-2 1 2 1-1-1-1 1-1 1 0 1-2 3-3 1 0 3-2 4 3 3 1-1-2 3-3 0-1 1-1 1-1 4 0 0-2-2-1 2 0 8 3 3-1 1 1-2 3-2 5 14 7 1-1 3-6-1-4 2-7 1-1 1 1 2 5zm-352 -172l0 1-2 0 1 1-2 2-3 1-7-1 0-1-3 1-5-1 2-1 1 1 5-2 2 1 0-2 2-2 2 1 2-1 4 0 1 1zm78 24l2 0 1 2-2 0-1-1zm7 -4l1 0 2-2 3 3 2 1-2 0-2 6-3-2 1-1 0-1-5 2 0-2-2-1 1-1-3-3 4 1-1-2 1 0zm-50 126l-1-4 1 0 1-2 2 1 0 2-2 3zm-73 -155l5 0 3 2 0 2-1 1-4-1-3-2-2 0 0-1zm-2 126l-2 0 0-8-3-4 2-3 3-2 3 2 0 2-2 6zm-15 -10l-5 0-2-2 1-4 3-4 2-1 6-4 4 0 0 2 2 4 3 1 0 2-4 2-10 0zm265 -34l0 2-1-1 1 3-3-6-3 0 0 2-4 0-1-5 0-1-1-1 2-2-2-2 1-2 4 2 0 2 7 1-4 4 2 1 0-2 1 0zm-194 -62l1 1 7 1 5-2 3 2-2 3 1 1-3 0-3 1 0 1-2 1-2-2-4 1 0-2-2-1 2-2-2-1zm-278 57l-3-2 1-2 1 0zm-1 -8l-3 1 0-1 3-1zm2 0l0 2-2-3zm267 -51l1 0-1 2 1 1-2 4-3-2-5-4 0-2zm12 -25l6-1 1-1 2-1 0-1 4-2 4 1 4 1-1 2 3 3 3 1-4 1 1 2-2 0-1 2-15-1-5 1-1-3 2 0zm-313 100l2-1 1 0 0 5-2 2-1 0zm73 111l-3 0-1 2-1-2-4 0-2 2-2 1-3-7 1-3-2-1-1-4 1-3-1-4 1-2 1-5-2-5 3 1 5-3 3-1 0 5 3 3 11 3 1 4-1 0 1 3 5 0 0 3 2 2-1 4 0 2-1 0 0-1-2-1-8 0-2 8zm15 23l7-7 4-2 0-2-1-2-2 1 1-5-3-1-1-4-6-1-1-5 1 0 0-2 1-4-2-2 0-3-5 0-1-3 1 0-1-4-11-3-3-3 0-5-3 1-5 3-6 0 0-5-2 2-3 0-1-2-1 0 0-1-3-4 1-2 2-1 1-3 5-3 3 0 1-9-1-3 0-2 2 0 0-1-2 0 0-2 6 0 0-1 2 3 2 1 2 0 6-4-2-1-1-3-1-1 5 1 6-3 1-1-1 0 2-1 0 2 2 2-2 3 1 3 3 1 4-1 3 0 0-2 9 1 3-6 1 0 3 7 1 0 0 2-2 2 1 1 5 1 0 2 2-1 8 2 2 2-1 2 3-1 6 1 4 0 8 5 4 1 1 1 1 5-1 5-9 11-3 18-3 4-1 3-2 1-1 2-7 1-8 4-3 3-1 8-12 14-1-2 1-1-1-2-9-5zm477 -97l4-2-1 3-1 0-1 1zm-62 -64l1 1 0 1-7 1-2-2 3-3zm-184 128l6 6 1 3 4 1-7 5-1 2-2 1-1 2-4 0-2-1-5 4-2 0 0-2-3-3 0-8 3 0 0-10 6-1 1 1 5-2zm-29 -72l8-1 2-2 0-1 4 0 2-1 2-3 4-2 1 3 0 3 5 3 6 8-5-1-2 1-1 0-3 1-2 0-1 2-8-3-2 2-1 2-3 0-4 4 0-2-4-5 0-4zm-219 -108l5 0-3 1-3-1-1-1 1-1zm5 -7l-7-2 4 0zm-171 1l-6-1-4-2-3-1-1-2 8 1zm187 -6l-2 3 2-1 2 0-1 1 6 1 0 2 1 0 2 3-1 2-4 0 1-2-1-1-3 3-2 0 2-2-2 0-9 0 0-1 2-1-1-1 2-1 3-5 4-2 1 0zm-213 -9l3 0-1 3 3 2-6-3 0-2zm149 -23l-1 2-2-1 1-1zm-8 -1l-3 1-2-1 2-1zm-9 -8l1 1 1-1 8 3 1 1 4 1-3 1-4-1-2-1-7 3 0-2-4 1 2-2 1-5zm26 -5l-3 1 0-2 1-1 2-1 2 1 0 1zm-55 -5l-1 1-10-2 4-2zm14 -1l0 3 4-2 4 1-1 3 2 1 5-4 0-3 8 1 4 1 0 1-2 2 2 1 0 2-9 2-3-1-5 5-3 2-4 0-2 1 0 2-3 1-7 5-1 2 0 3 4 1 3 4 3 0 17 5 8 1-1 2 1 3 2 3 4 3 2-1 2-3-2-4-2-2 5-1 4-4 0-2-2-2-3-2 3-3-2-7 2-1 8 1 2-1 7 4 5 0 1 6 2 1 2 1 4-1 5-5 9 10-2 1 6 4 5 0 2 1 1 3 3 1 0 3-4 2-4 1-4 2-17 0-3 2-3 2-8 6 3 0 4-4 6-2 4-1 3 2-3 1 2 6 3 1 5-1 3-3 0 2 2 1-12 5-4 2-2 0 0-3 5-2-7 1-2-2 0-4-4-1-4 6-3 1-9 0-5 4-6 0-1 0 1 2-11 3-1-1 3-4-1-5-3-1-2-2-1 0-1-1-10-4-2 1-7-1-7-1-1-2-1 0 0 1-78 0-7-4-5-1-2-3 1-1-4-2 0-2-3-2 1-4-5-2-4-5-6-4-6 2-4-3-6-1 0-26 13 3 6-2 4 0 9-2 1 1 2 0 1-2 7 3 3-2 1 2 8-1 10 2 7 1 4 1-4 1 5 1 10-1 3 2 3-2-3-1 7-1 5 2 3 0 5 1 8 0 0-2 3 0 4 0 0 3 2-2 2 0 1-3-6-3 0-3 4-2 6 2 4 3-3 1zm-65 -10l-1 1 6-1 4 2 3-2 2 1 2 3 2-1-2-3 5 0 3 1 3 5 9 3 0 1-4 0 1 1 0 1-10-1-21 2-1-2-6 0-4-2 14-1-16-1-1-1 7-1-10-1 5-3 7-2zm27 -1l-3 2-4-2 5-1zm78 1l0 1-9 0-4-2 1-1 1 0 6 0zm-28 0l2 1 2-2 7-1 5 3 0 2 8-2 10 3 0 1 5-1 3 2 9 2 3 3-5 1 11 3 4 2 4 0-1 2-5 3-7-3-4 0 0 1 6 3 3 4-1 2-10-3 7 5-13-3-4-1 1-1-8-3 0 1-8 1-2-1 2-2 11-1-1-1 4-4-1-1-1-1-10-2 2-1-7-3-7 1-20-2-3-1 3-1-4 0-1-3 3-2 2-1 8-1zm-39 -2l9 0 0 1-2 1 4 1-1 3-7 1-9-3 0-1 6 0-3-2zm20 3l-3 2-3 0-2-3 0-1 2-1 3-1 11 1-5 2zm-76 4l-7 1-1-1-7-2 6-5-3-1 20 0 6 2-10 3-4 2zm75 -10l-2 1-7-1 1-1 4-1zm-14 -5l2 1-1 4-4 0-3-1 0-1-5 0 0-2zm-27 1l1 1 6 0 0 1-1 2-21 1 0-1 6-1-17 0 4-3 2 0 18 2-4-2 3-1 2 0zm38 -2l8 1 3 1-1 1 5 1 23 0 3 1 0 1-6 1-17 0-12-1-1-3-3-1-9-1 1-1zm-60 -2l0 2-2 1-13 2-3 0 10-4zm62 1l-6 0-1-1 6 0zm-45 -1l-5 1-4-1 6-1 4 0zm1 -2l-8 0 3-1zm39 1l-7 0-1-2 9 1zm-12 -1l1 2-15-2 2 0-3-1 0-1 13 1zm36 -3l4 1-9 3-11-1-3-1 0-1 2 0-5 0-5-3 4-2 3 0-1-1 6 0 4 2 9 1zm52 -10l13 1 5 0 0 1-16 3 6 0-11 2-5 2-16 2 4 0-2 1 3 1-13 4 1 0 5 0 0 1-8 1-25 0 0-2 5 0-1-2 9 1-4-2-4-1 7-1 1-1-4-1-2-2 10 1 5-1-16-1-11-3 0-1 16-2 7 1 2-1 9-1zm217 99l-1 1 3 1 0 1-3 0-1 1-5 1-2-2-1 1 2-4 5-1zm-218 278l0 6 5 0-3 2-8-1-7-3-3-3 9 3 3-3 2-1zm1 -86l2 4 2-1 0 1-1 3-3 1 0 6 0 1-4 4 0 3 0 2-2 3 2 5 0 3-2 3 0 2-2 2 1 5-1 1-2 5 1 4-1 0 0 4 2 1-1 1 1 1-1 1 0 2-2 6 0 1-1 2-2 1 0 3 1 1 2 0 1 3 10 1-7 2 0 2-1 1-10-5-2-10 1-3 3-2-4 0 2-3 2-5 3 2 1-6-2-1-1 3-1 0 1-9 2-2-1-6 1 0 5-13-1-4 0-6 2-3 2-18-1-8 3-2 1 2 0 2 2 1-1 3zm497 -112l-3 1-2 0 0-3 1-1 5-1 0 1zm48 -86l4 1 4 2 1 2 4 0 7-2-3 4 0 3-2 3-4-1-2 1 0 6-1 0 0 1-2-1-1 1-4 1 0 2-4-1-7 5-9 3 2-1-1-1 2-2-1-2-7 5-3 0-2 1 2 2 2 1 0 1 2 1 4-2 4 1 0 1-4 1-5 5 3 2 5 7 0 2-2 1 2 2-1 5-2 0-6 10-8 5-3 0-2 1-1-1-1 2-7 2-1 2-2 1-1-2 1-1-8-2-1-1 0-1-3-2-3 2-8 1 1 3-2 0 0-2-2 1-3-1 0-3-1 0-1-3-3 1 1-4 2-2 0-4-2-3-5 0 1-1-1-2-2 1-2 0-6 3-2 1-5-2-3 3-1-2-1 1-7-1-9-6-3 0-1 0-4-2-2-2-1-3 2 1-1-5-3-4-4-1-1-2-3-2 0-3-3 0 0-3 0-1 3-1 5 0 1-2 3 0 6-3 0-2 2-1-3-5 7-1 2-6 6 1 1-1 0-3 3 0 2-2 1 0 0 2 3 1 4 1 2 3-1 3 1 1 7 1 5 2 3 4 12 1 12 2 3-1 12-2 4-3-2-2 2-1 4 1 7-3 4-3 6 0 1-1-5-3-2 1-4 0-1-1 3-5 3 1 4-1 0-1 4-4 0-2-1-1 2-1 7 0 7 1zm-363 124l-5 0-8 2 0-4-3-2 1-5 1-1-1-4 4 0 2-1 0 1 2-1 3 2 2-1 2 1 1 4-2 6zm44 8l-9 0 0-3-3-4 2-5 2-2 3 2 2-1 5-11 2-2 0-2-1-1 1-1 3 8-4 0 0 2 3 2 1 3-3 4 0 4 4 5 0 3zm50 -4l0 3 1 1-4 4-2 10 1 8 3 7-4 0-2 3 1 1-1 6 3 1 0 3-2 0-2-3-2 0 0-2-2 1-2 0-1-1-3-1-1-1-6 1-1-11-3 0 0-1-1 0-2 1-1 2-5 0-3-6-11 1 0-1 1-2 3-2 1 0 1 2 4-4 2-5 3-4 3-13 2-2 8 3 1-2 2 0 3-1 1 0 2-1 5 1 2 2 4-1zm-50 23l-1-1-2 2-2-3 2-1-1-2 3-1 0-2 1 2 3 0 1-1 0-4-2-2 2-3-3-1-1-2 8 1 2-4 2-1 3 0-2 12-3 3-2 5-4 4-1-2zm-245 -13l-3-1-3 0-4-4 1 0 0-2 2-1 2-3-1 0 0-5-1-5 1-1 0-2 2 0 3-2 0-4 2-1 4 0 6-3 0 1-2 1-2 2-2 5 2 0 1 4 1 2 5 0 2 2 6 0-1 5 1 3-1 1 1 2 1 2 0 1-2-3 0 1-6 0 0 2 2 0 0 1-2 0 0 2 1 3-1 9-2-2 1-2-2-2-6 0-2-2zm-21 -23l-6-5 0 2-2-2 0-2-1 0 1-1 5 1 1 0 3 3-1 1 0 1zm2 -41l4 0 4 2 2 0 5 3 3 1 4 2-2 1-8 0 2-2-3-1-2-2-8-2-1 0 1-1-3 0-4 2-2 0 2-2zm319 -34l5-1-2 2zm3 1l-2 1-2-2zm-47 -38l-5-1-2 1-5-3-1-2 6-2 5 1 0 1 1 0 1 0 2 0 0 1 2 0 1 1zm-19 -18l0 1 2 1 0 1 5-1 3 1 2 2-1 1 3 5-8 2 1 2 3 2-2 2 0 2-2-1-5 2-5-2-3 1 1-4-5-1 0-7 1 0 1-1 0-4 3 0 1 0 1-1 0-3zm92 118l0 2-1 0 1 1-1 2-3-1 0-1 2-3zm-85 -119l-1 2-4-3 4-1zm-5 -3l-3 3 1 1-4 0-1-1-1-3 2-2 5-1-1 2zm-229 102l5 0 4 3-1 1-3 0-2 0-2 2-2-3zm232 -10l-17 11-7 1 0-2-3-1-1-1-29-19 0-4 9-3 1-2 4-1 0-2 3-1 3-1 1-1-3-7 3-1 7-3 11 0 2-1 6 0 0 7-2 1 0 2 4 4 2 7 0 8-1 2 3 4 1 0zm-256 75l1-3 0-1-1 2-2-2 0-3 1-1 2-4 3-2 3 2 1 1 3 0 3 1 0 2-1 2-3 3-3 1-2 5-2 1-1-2-3 0zm320 -92l-3 5-4-6 5 10 4 7 0 2 3 3-33 0 0-20 0-3 1-4 4 0 6 2 6-2 2 1 1 1 0-1 5 1 1-1zm21 47l-4-4-3-1-2-1-2 1-2-2-1 2-3 0 1-7 5-3 2 6 11 9zm-143 -81l0-2-1-2 4-2 17 1 1 1 5 2 1-1 3 1 3 0 0 2-2 2-4 0-3 5 1 1-2 3-2 1-2 2-6 0-3 2-1 0-2-3-3 0 1-3 0-1 0-1-1-2 1 0 1-4 1-1 0-1-4 0-1-1zm93 -44l0-2-1 0-2-1 0-1 7-2 6 1-2 2 1 3-1 0-6-1zm37 118l2 2 2-1 2 1 5 3 2 2-2 3 0 1 3 1-1 1 3 3 9 4 3 0-8 8-4 0-5 3-3-1-3 2-4 0-4-2-2 0 0-3-2 0-3-5-3-2 0-1 2 0 1-7 5-5 1-5 3 0zm-26 -150l0 2 4 2-2 2 3 3-2 3 3 2-2 2 5 1-2 2-8 5-14 2-5-3 1-2-2-3 2-2 11-5-1-1-5-2 0-5-8-3 2-1 3 2 7 0 2-1 2-2 4-1 4 1zm417 240l0 1 0 1-3 0-1-1 1-1zm2 -1l-2 0 0-1 4-1 0 1zm-668 97l3-2 3 1 1-1 3 1-1 1-4 1-1-1-3 1zm197 -261l-1 2-2-2 2-3zm-17 -23l2 1 10 3-1 4-2 0-2 2 0 2 1-1 1 1 1 2-1 1 1 2 1 0 0 2-3 1-5-1-4 1-1 2-3 0-3-1-1 1-5-2-1-1 1-1 1-6-5-4-4-1-1-2 4-1 4 1 0-3 2 1 7-2 1-3 2 0zm21 151l-5-5-2-4 2-5 5 0 0-3 5 0 1 2 3 1-2 3 2 2 0 4-1 1-3 0-1-2 0 2-3 1 1 2zm-47 -163l-1 2-4 0 0-3 2 0zm8 -11l-3 3 6 0-1 2-3 2 3 1 3 3 2 1 2 4 4 0-1 2-1 1 1 2-3 1-9 0-2 1-3 0-2 1-1 0 4-3 2-1-4 0-1-1 3-1-1-2 0-2 4 1 1-2-2-2-4 0 0-1 1-1-1-1-2 1 0-2-1-2 1-3 2-2zm123 48l0-3-3-2-1-1 7 1 4 2 4 0 3 2-1 0 2 2-4-1-5 1-3-2zm-112 99l-9 3-2-1-1-3 2-6-1-8 8 0 2 8 0 4zm-26 -5l-3 1-1-4-2 1-2-5-3 1-3 2-5-6 4-2 0-2 6 0 0 1 4 1 3-1 2 2-1 2 1 0 1 2-1 1 1 3-1 1zm-24 -15l1-2 3 0 4 0zm5 5l-3-1-1-2 8-1 0 2zm68 28l1-3 4 0 0 3zm40 -96l1 1 6 0 0 1-4 0-4-1zm8 -17l-2 3-6 0 2 1-2 1-1 0-2-1 1 2 1 1-1 1 3 2 0 1-3 0 1 1-2 0 1 3-4-1-1-4-3-4 2-4 10-2 2 2 2-1 0-1zm-204 -114l9-1 10 0 4-1 32 0 17 2-5 1-24 1 10 0 8 1 5-1 3 1-3 2 20-3 8 1 2 1-13 3-9 0 7 0-6 4 0 3 4 2-9 1 5 2 1 2-3 0 3 3-6 0 3 1-1 1-7 0 3 2 0 1-5-1-2 1 7 3 2 2-5 0-6-2 1 2-3 1 11 0-15 5-11 1-7 4-16 3-2 2 0 2-1 2-5 2 1 2-2 5-4 0-4-2-6 0-9-8-2-4-4-3 1-2-2-1 3-3 4-1 2-3-8 2-3-1 0-2 1-2 8 1-7-3-5 0 3-3-7-6-4-1 0-1-7-1-20 0-8-3 12-1-18-2 1-1 21-2 0-2-7 0 3-2 13-2-1-1 15-1 12 0 7-1 16 2-6-1zm-120 192l-5-1-1-1 0-2 1-3 4 0 0-1-3-2 1 0 0-2 5 0 0 6 3 0-3 2 0 1zm104 31l-2 1-1-1-1 1-2 0 2-4-1-4 1-2 6 3 0 1zm-20 -16l4 3 0 1 3 2 0 3-2 1 0 2 1 2 1 0 2 4-2 0-4 1-3-1-1-3 2-3-2-2 0-1-2 0-2-3 1-2 2-1 0-2zm-76 -13l-2-3-2 1-2-2 0-2 3-2 9 0 5 2-4 1-1 0-2 3-1-1-2 1 0 1zm294 -92l2 2-1 1-9-1 0 2 7 6-7-3-2-2-1-2-1-1-1 2-1-1 0-1 5 0 1-2 2-1 3 1zm-255 73l4 0 0 5-6 0-2-1 0-1 5 1 1-1-1-2-2-1zm248 -75l0-3 2 0 0-1 3 1 2 0 6-2 3 0 2 2-2 1-3 3-7 2zm290 158l-5-2 3 0zm11 0l-3 1 0-1 1-2 3-1 1 1zm-19 -6l3 1 1 1-7 1 1-1 2 0zm14 0l0 2-8 0 2-1 2 1zm-39 -3l5 0 1-1 5 1 1 2 4 1 3 1-3 1-3-1-14-1-8-3 2-3 3 0 3 2zm72 -2l-1 2-1-2 2-2zm-20 -7l-2 0-2 0 0-1 3 0zm8 -1l1 2-2-1-6-1 1-1zm11 -6l0 5 3 1 3-3 3-1 10 2 0 18-3-2-3-1 0 1-4 0 1-2 2-1-2-5-7-3-5-2-2 1 0-2-2-1 5-1-1-1-4 0-1-2-2 0-1-1 5-2 4 1zm-25 -7l-2 3-2 0-10 0-1 2 3 3 1-1 6-1-1 1-1 0-3 2 2 4 0 1 2 3 0 2-1 1-1-1 1-3-3 2 0-1 0-1-2-2 0-3-2 1 0 7-1 1-1-1 0-3 0-2-1 0-1-2 3-10 3-2 6 2 3-1 2-2zm9 1l0 2-1 0 0 2 1 1-1 0-2-5 0-2 1-1 1 1 1 1zm-30 -2l3 2-3 1-1 4-2 2-1 7-1-1-3 1-1-1-3-1-4 1-1-2-4 0 0-4-3-3 0-5 2-2 0 2 2 2 3-1 4-1 2 1 2-1 4-8 5 0-1 3 2 3zm-33 21l-3 0-6-4-9-13-2-4-9-9 0-1 6 0 9 9 2 0 6 6-1 2 3 1 1 3 2 1 2 1zm-78 -115l3 4 0 2 1 1 0 2-2-1 1 3 6 4-2 1-1 3 9 4 4 0 2 2 8 1 0-4 1-1 1 3 2 1 7-1 0-1-1-1 2-1 6-3 2 0 2-1 1 2-1 1 3 0 1 1-1 1 0 2-2-1-4 2 0 2-3 6-2-1 0 5-2 1-1-5-1 0 0 2-2-1 4-4-7-1 0-2-4-2-1 2 2 2-2 2 1 1 0 1 1 2 0 4-5 0 0 2-2 2-4 2-8 7 0 1-5 2-1 2 1 6-1 2 0 5-2 0-1 3 1 0-3 1-2 3-2-3-5-10-1-6-3-3-2-15-4 1-2 0-4-3 2-1-1-2-4-2 2-2 6 0-2-6-2-1 3-3 3 0 8-8 0-2 2-2-2-1-2-4 1-1 8 0zm-233 -51l0 2-2 3-5 1-4 0 2-3-1-3 6-3 0 3zm167 47l4-3 3 0 7 2 4 2 2 1 0 2-2 5 1 1-1 1 1 4 2 1 1 2-3 2 3 3 2 1 0 3 2 0 0 2-4 1-1 3-12-2-1-3-1 0-5 1-9-3-4-7-1 1-2-1-1 1-2-2 0-1-1 0 1-2-1-2-4-2-2-2 1-2 1-2 0-1-2-1-3-6-1-4 2 0 2 2 2 0 6-2 0 1-1 1 3 2 1 2 4 2 4 0zm-24 3l2 1 0 1-1 2-1 2 2 2 4 2 1 2-1 2 1 0 0 1 2 2-4-1-2 3-5 0-8-6-7-2-1-4 6-3 1-5 3-2 6 0zm-166 -85l-1 2 3 2-3 2-11 3-11-2 3-1-6-1 4-1 0-1-6 0 2-2 4 0 5 1 4-1 4 1 4-2zm139 94l0 1-1 0-1 2 1 0-1 1 1-1 0 2-1 4-2-5 3-5 2 0zm-56 -15l-1 4-8-2 1-2zm-17 -8l1 2 0 3-3 1-1-1 0-5zm8 -16l4 1 1 2-3 0-2 1 1 3 3 2 1 2 3 3 2-1 1 1-1 1 7 3 0 1-4-1-1 2 2 0-1 2-1 0-1 2-1 1 1-3-2-3-5-3-4-2-5-3-1-3-3-1-4 2 0-2-1 0-1-5 1 1 5-1 1-1 3 0 0-1 2 0 3-1zm-250 79l4 1-4 0-2-1zm315 -39l0-1 3 1 6-3 1 4-6 1 3 3-6 4-3-1zm275 -5l0 1-1 2-1-1-2 1-1 1-1-1 0-1 1-2 2 1 1-2zm18 -8l-1 2 0 1-1 2-4 2-5 0-4 3-2-1 0-2-11 2 3 2-2 5-2 1-1-1 0-3-1-1-2-1 3-1 6-5 6-1 3 0 3-5 2 2 5-4 2-4 0-3 1-1 3-1 1 4 0 2-2 3zm8 -20l2 1 2-1 0 3-4 1-2 2-5-2-1 3-3 0-1-2 2-2 3 0 1-6zm-203 6l-7 4-1-1-4 0 0-3-2 0 1-2-4-3-8 1-2-2-8-4-7 2 1 10-2 0-4-3-4 2 0-2 0-1-3-1-3-4 2 0 0-2 5 0 0-4-5-1-6 2-1 0 0-2-1-2-3 0-2-1 3-6 3 2 0-3 6-3 4 0 10 3 3-1 4 0 4 2 0-1 4 0 1-1-4-2 2-2 2-1-2-2 2-1 10-1 11-3 5 1 1 3 3-1 3 1 0 1 3 0 7-2-1 1 3 2 6 7 2-2 4 2 4-1 6 4 3 0 2 1-2 2-3 0 0 3-1 1-6-1-2 6-7 1 3 5-2 1 0 1-3-1-10 0-4-1-1 0-1 2-4-1-2 0zm-83 119l1 3-3 2-3 6-4-3 0-1-10-6-1-3 3-5-3-7 4-3 2 0 0 3 2 0 4 2 4 0 3-2 3 1-2 3zm83 -119l1-2 2 0 4 1 1-2 1 0 4 1 10 0 3 1-6 4-3 0-1 2-3-1-5 2 0 1-6 1-6-1 0-1 6-1 4-2-3-1-2 1-2-1 2-2zm91 87l-3-4-1-3 2-3 4 0 5 1 1-1 2 0 1 6-5 2 1 2-5 1zm69 -77l3 5 0 3-1 1-8 2 1-3-2-3 2 0-2-3zm-299 -10l-1 1-1-2 2-2 2 1 0 2zm75 34l1 4-2 0 0-2-3 0 2-3zm159 43l1-3-2-3 0-2-2-3-5 1-3 1 0-5-1 0-1-2-1-1 3-3 2 1-1-3 2 0 3 4 3 0 1 3-2 1 3 2 6 8 1 2-1 2-2 0-1 1zm-192 -52l-2 0 1-2 1-2 1 0 1 1zm-121 80l-4-1-7-6 4-4 1-1 1 4 3-1-1 3 3 2zm62 -52l-2 2-1-2-5-1-3-3-1 0-3-4 1-2 0-6-1-4 2-1 0-2 4-3 0-2 10 2 2 3 9 3 3-2-1-2 3-3 6 0 0 2 5 0 1 1-1 4 0 3 0 25-3 0 0 2-22-11zm186 43l0 3-4 1-1-2-1-4 2-4 2 1zm-147 101l2 1-4 4-1 0-2-2 3-3 1 0zm-17 -231l0-1-4-1-1-3 11-1 5 3 0 1-6 3zm-46 12l0 2-1 0 0-2zm41 -17l1-2 1-2 3 0 2 2 2 0 1-2 2-1 7 2 1 3-4 2-5-3zm-72 57l1 1 7 0 3 7-1 1-3 1-3 1 0 2-4 1-1 2-9 3 0 5-8 0-3 6-4 3-2 6-6 0 3-6 2-2 2-5 5-5 3 0 5-5 0-4 1-3 7-5 3-4zm88 -35l2-1 4 1 3 5-3 0-2 3 0-4zm64 169l2 7 0 2-1 0-1-1 0 1 0 3-7 22-5 2-4-2-2-6 1-4 1 0 1-3-1-8 2-3 5-1 3-4 1-2 1 0 2-2 1-3zm-408 -107l-1 5-1 5 2 5 4 5 3 0 1 2 8-2 2-2 1-4 2-1 7-1 1 2-2 3-1 4-2 0-1 1-6 0 0 2-1 0 3 2 0 1-4 0-1 5-3-3-4-2-5 1-4-1-8-3-3-2-5-1-4-3-2-3 1 0 1-3-2-3-7-7-3-1 0-3-3-2 0-1-2-1-3-2-2-7-5-1 1 4 8 10 3 6 1 1 2 2-2 2-2-4-4-2 0-3-8-5 3-1 0-1-4-3-4-8 6-1 0 1 11 3 7 0 0-1 5 0 7 7 3 0 1-2 5 1 4 6 1 3zm327 -44l5-2 2 1 0 2-6 1-1 0zm-91 75l2-2 2 1 4-1 11 0 0-2-3-24 4 0 23 14 0 2 3 0 0 6-2 2 0 2-6 0-1 1-6 0-6 4-2 1-3 4-1 4-2 1 0-1-2 1-3 0-1-2-1 0 1-2-2-2-3 1-4-1zm310 -15l-3 1-1 3-2 1 5 6-2 3 2 4 2 5-3 5 0-8-4-11-5 3-3 0 1-4-1-3-2-3 0-1-1 0-2-2-1-3 1 1 0-2 2-1 0-5 2 1 3-6 0-2 4-2 2 1 0-4 2 0 2 3 0 4-2 2-1 4 3-1 1 3 1 0 0 3 3 1 2-1 0 1zm-221 -62l-1 1 0 1-3-2 2-3 3 2zm189 -19l12-4 5 1 2 1 7 1 3-2-1-2 3-3 9 3 0 2 4 1 9-1 4 3 6 1 7-2 4-2 3 2 3-1-3 5 1 1 4 0 2-1 5 3-1 1-8 1-2 2-7 3-4-1-2 1 2 2-4 3-12 2-3 1-12-2-12-1-3-4-5-2-7-1-1-1 1-3-2-3-7-2zm-148 169l8 0 8-3 1 12-3 5-6 3-7 6-1 2 3 4-1 6-6 3-2 2 1 2-2 0-1-3 1-3-2-6 4-6 0-10-4-2-3 0 0-3 8-2 4 2 0 4 1 2 2-3 0-3-1-2-2-1-1-4zm-130 -73l-3-4-4-1-4 0-1 1 1-11-2-2 0-1 11 0 0-6 3 0 0-7 9 0 0-4 10 7-4 0 3 24 0 2-11 0-4 1-2-1zm130 73l-1 2 1 4 2 1 1 2 0 3-2 3-1-2 0-4-5-3 1-4 0-2 1-3-2-3 3 1zm185 -49l0 1 3-1 3 3 1 6 2 4-2 1-6-5-4-7 0-3zm49 5l-3 0-5 0-4 8-2 1-2-1-4 1-3 1-2-2 0-2 2 1 2 0 0-3 5-1 3-4 1 2 1-1 1 0 1-3 3-4 1 0 2 2 4 2 0 1-2 0zm-285 91l-3-4-2-14-7-11 0-2 4-1 2 1 12 0 2 1 6 1 8-2 3 1-5 2-1-1-6 1 0 10-3 0 0 18-4 2-3-1-1-2zm415 -20l4 3-1 0-1 0-6-6zm-454 -92l0-2-3-1-2-4 0-2 9-1 0-2 2-2 0-6 4-1 17-11 5 1 1 2 2-2 1 5 2 2-2 11-3 2-1 4 1 1 0 2 1 0-1 2-2-3-3 2-4-1-5 1-3-1-3 1-4-2-4 0-1 6-2-2zm18 20l-8 1-4-5-5 0 1-7 2-4 0-7 1-3 4 0 4 2 3-1 3 1 5-1 4 1 3-2 3 4 0 2-2 2-5 11-2 1-3-2-2 2zm-262 -18l-6-5 3-1 0-1 2-1 1 1 2-3 1 0 4-1-2 10 1 2-1 0zm255 -118l2 0 1 1-2 4-1 0 0 3-3-2-5 0 4-5zm61 -49l9 2-4 1 3 2-7 1 2-2-4-1-4 1-2 2-2 1-7 0-3-2-3 1-1 2-5 0-1 1-2 0-9 9 1 1-1 1-3 0-2 3 0 3 2 2-1 3-3 3-2-1-6 3-3 1-4-2-2-9 15-7 12-9 12-6 6-1 5 0 4-2zm-9 -18l-7 1-4-1 2 0-2-1 6-1 1 1zm-18 -5l9 2-7 1-2 2-2 0-1 3-4 0-6-2 3-1-10-3-2-2 8-1 1 1 4 0 1-1 4 0zm20 -2l5 1-4 1-8 0-8 0-1-1-4 0-3-1 9-1 4 1 3-1zm174 146l0 4-3 0-5-1-2-2-4 0-9-4 1-3 3-1 12 6zm236 191l0 1 2-1 1 1 0 1-4 4 1 2-5 1-2 5-4 2-7-2-1-1 2-2 10-5 4-6 2-2zm4 -14l2 3 0-2 1 1 1 2 2 1 5 0-2 4-2 0 0 2-3 4-2 1-2-1 2-3-1-1-3-1 0-1 2-1 0-4-5-8 1 0 3 2zm-321 -159l-2 2-1 1-1 3-3 1 0 2-3 1 0 1-2 1-4 1-4-7 9-3 2-5-2-3 1-2 2-1-1-2 2 0 3 3 3 0 3 3zm-7 -13l-1 0 1-1zm52 -31l2 1 1 2 4 1-2 3-8 0-1 1 2 4 2 1-2 2 0 2-8 8-3 0-3 3 2 1 2 6-6 0-2 2-2 0-3-5-13 1 1-3 4-1 0-2-2 0 0-3-2-1-3-3 5 2 10-2 0-2 2-2 6-2 0-1 3-3-1-1 3 0 1-2 1-2-1-2 2-1zm-425 83l-2-2 1-1-3-2-3 2 1 2-1 1-2 0 0-2-1 1-1-1-3 0 0-4 1-1 1 2 2 1 5-3 4 1 2 2 0 2-1 1zm23 69l-3 2-2-2 0-1-13-7-1-3-8-15-2-3-4-3 1-1-1-3 1-2 2-1-1 2 3 0 1 2 2-1 2-5 3-1 3-3 1-2 0-2 4 4 2 2 6 0 2 2-1 2 2 2-3 0-5 3-1 3-2 1-1 2 3 4 0 1 1 0 1 2 3 0 2-2 0 5 3-1 2 5-1 5-1 2 1 4zm544 -72l1 3-2 3 0-3-2 1 1 2-1 1-3-1-1-2 1-1-2-2-4 3 0-1 1-2 3-2 1 1 2-1 1-1 1 0 0-2 3 1zm-7 -6l-2 4-2-2 2-3 1 0 0 1 2-2zm-15 3l-3 3 6-9 0 3zm10 -7l3 1 0 1-3 2zm10 -1l0 3-2 0 1 2-1 1-2-4 2 0 0-1-2-2 3 0zm-11 -2l-1 2-3-3 3 0zm-1 -15l2 0 1 0 0 3 0 3-2 1 0 4 3 0 3 2 1 3-3-3-1 1-2-1-4 0 1-2-1-1 0 1-1-2-1-4 1 2 1-7zm96 70l-2-1-2-4 4 4zm-11 -4l-5 3-5-2 0-1 4 0 1-1 0 1 2 0 2-2 0-1 2 0zm-13 5l4 5 2 0 0 1 4 3-8-1-5-6-4-1-4 2 0 2-2 1-4-1 0-18 10 4 3 3 1 1 4 2 1 1-3 1zm16 -8l-1 1-1-3-5-2 1-1 4 2zm-383 -154l-3-5 1-1-1-1 10-3 3 1 13 0 1 5-2 0 3 5-4 4 0 1-3-1-5 0-1-1-2 1-1-2-4-1-1 0zm-226 91l2 0-1 1-4 0 1-1zm547 -67l0 1-1 0-2 1 0 2-6 4 0 1 3 2-1 0-8 2-2-1 2-3-3-2 2-2 5-3 4 1 0-2 4-1 1-1zm-388 2l2-1 1 1 4 0 0 1-1 1-1 4-1 0 1 2 0 1 0 1-2 4-3 0 0-4-1-2 2-5zm-149 178l2-8 8 0 2 1 1 6 6 1 1 4 3 1-1 7-3 2-2 0-6-1 3-4 0-1-9-4zm315 -131l0-2 1-1 1 2 0 2zm-78 -64l1-1 5 1 6-1 3 4 0 4 3 0 1 1-2 0-1 4-3-2-5 2-7-1-2-1 1-1-3 0 0-2-4-2 2-1 3-3zm336 -8l3 5-4-1-2 4 3 3 0 2-3-2-1 2-1-8 1-6-2-2 1-4 2-1-1-2 1 0zm-336 -10l-8 0 0-1 4-1 4 1zm-549 -34l2 1-1-2 8 0 5 3-3 1-4 0 0 3-1 0-9-1 0-2-6 0-2-1 1-1-4 1 2 1-2 1 0-11 14 5zm986 -12l-3 0-1 0 4-2zm-996 0l-4 0 0-2 7 1zm895 -6l-11-1 7-1zm20 -6l-3 1-10-1 1-1zm-16 -1l-2 2-15 1-6-2 2-2 4-1zm-243 14l-11-1-1-1-5 0 0-2 3-1 0-1 5-3-2 0 6-2-1-2 16-3 14-1 5-1 2 1-20 4-9 3-8 5 0 2zm137 -18l1 2 10-1 9 2-1 2-12 3 7 1 3-1 1 2 6-1 9 1 1 1 11 0 0-2 11 1 4 1 1 2-1 1 8 3 2-2 5 1 5-1 5 1 2-1 4 0-2-2 4-1 25 1 3 2 7 2 17 0 2 1 0 2 3 1 19 0 5 2 3-1-2-1 2-2 14 1 12 2 0 11-4 2-3-1 5 5 0 2-5-1-11 3-8 3-1 2-4-2-7 2-1-1-3 1-4 0-4 4 0 1 3 1 0 4-3 0-1 2 1 2-4 1-2 3-4 1 0 3-5 2-3-12 1-4 2-1 1-2 4 0 15-9 2-4-4 0-1 3-7 3-3-4-7 1-7 5 3 2-11 1 0-2-4-1-3 2-9-1-9 1-20 12 5 0 1 2 3 1 2-2 3 1 4 2 0 3-2 3-2 7-9 10-5 4-4 2-4-1-4 3 0-2 1 0 1-4-1-2 2-1 4 1 5-10-7 2-4 0-1-2-4-2-4-1-5-9-7-1-7 0-2 1 1 1 0 2-4 4 0 1-4 1-3-1-3 1-3-2-4 2-7 2-6-1-4-3-9 1-4-1 0-2-9-3-3 3 1 2-3 2-7-1-2-1-5-1-13 4-2-1-3 0-6-4-4 1-4-2-2 2-6-7-3-2 1-1-7 2-3 0 0-1-3-1-3 1-1-3-5-1-11 3-10 1-2 1 2 2-2 1-2 2 4 2-1 1-4 0 0 1-4-2-4 0-3 1-10-3-4 0-6 3 0 3-3-2-3 6 2 1 3 0 1 2 0 2 1 0-1 2-3 0-2 3 2 3 0 2 3 3-2 2-7-4-4 0-4-2-7-1-9-5 2 0 2-2-1-2 4-1-3 0 0-1 4-1 0-3 1-2-5-1-2-1-2 0-4 0-1-2-2 0 1-2-2-1-6 0-1-2 4-1-3-1-3-3 1-2-4-1-4-1-1-3-1-1 1 0-1-3 2-2 3-2-3-1 10-7-5-1 2-2-3-2 2-3-3-3 2-2-4-2 0-2 10-2 5 2 7 0 13 5 0 1-7 3-15-2 5 2 0 4 6 2 0-2-1-1 1-1 7 2 2-1-2-2 7-3 5 1 2-1-3-2 2-2-2-1 7 0 2 2-4 0 1 2 2 1 4-1 1-2 15-3 2 0-2 2 3 0 11-2 3 1 4-1-3-2 1-1 8 1 14 4 2-2-3-2-3 0 1-1-2-3 9-6 8 1 0 1-2 3 1 1 1 2 0 3 3 2-7 6 3 0 4-2 3-2-1-2 1-2-3 0-1-1 3-3-4-2 5-2-1-2 2 0 1 1-1 3 3 0-1-2 4-1 6 0 5 2-2-3 0-3 17 0-2-2 3-2 17-2 10 0 6-1 5 0 3-3 7-1 5 1-4 1zm-5 -3l-16 1 5-4 3 0 9 1zm-150 -7l-10 2-3-1 2-1-6 0 9 0 1 0 4-1 4 1zm136 5l-14-1-5-1-2-2-4 0 13-3 12 4zm-194 222l2 2-1 1-2 0-1 2-1 0 0-4zm-108 -78l0 3-9 0 0 7-3 0 0 6-11 0 0 1 0-2 6 0 2-6 4-3 3-6zm143 30l-5-9-5-5-1-4-1-3-3-2-1-3-5-7-2 0 1-4 3 1 6-4-3-3 6-1 3 0 12 8 8 0 0 2 2 0 2 2 3 3 1 3 1 2 2 1 1 4 9 2 0-1 2 2-2 5-9 3-8 1-2 1-2 3-1 1-1-1-8 0-2-1 0 3zm-25 19l0-3-2-1 0-4-1 0-2 1 1 2-3 4-1 0-3-2-3 3-6 0-2-3-2 0-2 4-2 1-1-1 0-3-3-4 0-3-1 0 3-9 2 1 0-13 3 0 0-5 33 0 2 9 3 2-5 3-1 9-5 8-1 0zm0 0l0 3-2 0 0 1 3 2 3 5-5 5-4 0-2 0-1 0-4-3-4 1-8-10-4-2 2-1 2-4 2 0 2 3 6 0 3-3 3 2 1 0 3-4-1-2 2-1 1 0 0 4 2 1zm-140 -12l-3-3 1 0 3-5 4 0 4 1 3 4 2 6-11 0-3 1-1-2 8-2-3 0zm496 67l1 1-2 0-1-2zm-3 -2l-3 0 0-1zm2 0l-2-2-1-2 1 0zm-11 -7l-2 0-1-2zm-470 -39l-4-3-1-3 4-3 2 0 2 5 1 0zm-212 -18l-2 0-4-1 2-2 2 2 2-1zm380 11l-3 4-3 0-9-4-3-3 2-3 2 3 14-3zm2 -6l4-1 0 3-7 15-6 7-9 7-5 6-1-3 0-10 3-4 2 0 2-2 4 0 10-10 1-2 0-6zm-80 -94l3 2 2 0-1 3 2 1-2 2-2 1 0-2-2-1-2 1-3-2 1-1-1-1 1-2-1 0 1-1-2-2 4 0zm-217 109l9 1-1 2 1 4-2 4-4-1 0 2-1 0-2-4-1 0-1-2 0-2 2-1zm211 -121l3 1 5 0 3 1-2 2-3-1-8 2-3-1 0-1zm-14 9l7-1 1 1-2 1-1 2-5 0zm24 -54l-3 2 0 2-9 5-2 4 4 3-2 3-3 1-1 5-2 2-3 0-2 2-3 0-5-10 3-3 1-3-2-2 0-3 2-3 3 0 1-1-1-1 9-9 2 0 1-1 5 0 1-2 1 0 8 3 0 5 1 1zm-8 22l-4 3 0-2zm35 235l-1 2-1 0-2-2 1-2 2 0zm19 -167l-6 3-3-1 1-3 2-1-1-1-1 0 0-2 2-3 0-1 8 0 8-1-3 2-1 5zm-68 57l0-1-1 0 0-2-1-1 1-4 3-2 2-11-2-2-1-5 3-1 22 11 0 11-2-1-3 9 1 0 2 4-4 2-2 3-2 1-4 0 0 1-2 2-8 1 1 0-1-3-3-2 0-2 4 0zm-35 19l-2 1-1-3 0-4-2-8 2 0 0 2 2 2zm280 -17l-5-1 0-2-2 0-3 9 1 2 1 0 2 5 5 4-1 1-2 0 0-1-3-1-4-5-1 1 0-3 4-8-2-5-2-4 2-3-5-6 2-1 1-3 5-2 1 1 1 2 1 0 0 5 3-1 2 0 1-1 2 0 2 3 0 2 2 3 0 2-1 1-6 0-2 3zm-88 -78l-1 1-3 0 0 1 12 0 0 3 3 0 0 3-4 0-4 2-2-1 0-3-1-1-2 3-2 0-1 1-4 0 2-3-1-2-2-1 1-1 2 0 3-3 3-1 0 2zm-27 13l0-2-2-1-4-2-5-2-5 0-4 3 0-5-2-1 0-2-2 0 1-3 3 1 2-1-3-3-2 1 0 2-1-2 4-2 4 3 5 0-1-1 5-3 4 2 0 2 1 1 4 0 1 3 5 3 7 2 0 2-2-1-1 1-2 1-1 2-3 1-1 2zm177 124l3-2 4 0-6 3zm-518 -55l2 0 0 2-3 0zm197 -54l-1-5-4-4 0-2 2-1 0-7 3-1 2 1 0 1 3-1-2 2 1 2 0 2-2 2 1 1 1 0 2 2 0 2-4 3 0 2zm76 -31l4 1 6 0 3-1 3-1 3 2 0 2 3 2-2 0 1 4 1 3-1 0-4-1-9 2-8 0 0 1-2 1-1-1 1-1-4 0-2 1-4 1-2-2-3 0-1 1-2 1-2-2-3 0-4-4 1-2-1-2 3-2 4 0 1-2 5 0 7-3 5 0zm-26 2l-3 1-1-1 2-3-2 0 3-1 3 0 0 1 2 1zm262 45l-3 7-1-4 4-5 1 1zm-244 71l11 6 0 1 4 3-1 3 0 2 2 1-1 5 3 5-2 1-9 3-5-1-1-4-1-2-9-3-3-5 0-6 1 0 2-3 0-2 1-2-2-2zm-6 0l-6 1 1-6 4-4-1-1 0-3 1 0 2 0 4 0 1-2 3 7-3 5 0 3zm0 -148l6 0 2 1-1 2 2 0 1 2 4 0 2 0 2 1 5 1-1 2 0 3-4 1 0 1-9 3 0 1 5 1-1 1-7 2-1-1 0-1-3-1 3-1-5-2 0-1-3 1-3 3-2 0-2 0 2-3 3 0-3-5-4-1-7 2-5-1-1 1-2-2 2-1 0-1 3-3-1-3 5-1 15 1 1-2zm-248 229l2 0 9 5 1 2-1 1 1 2-2 2-3 1-3 0-5-1-1-2zm-272 -137l-1 0 0-3 3 2zm-6 -6l-2-1 1 0zm175 -78l1 2 7 1 7 1 2-1 10 4 1 1 1 0 2 2 3 1 1 5-3 4 1 1 11-3-1-2 1 0 6 0 5-4 9 0 3-1 4-6 4 1 0 4 2 3-9 3-2 2 0 1 1 2 1 0 0-1 1 1-11 2 5 0-5 1-1 1 0 2-2 2-2-2 2 3-3 4 1-2-2-1 0-3 0 3-2 0 2 1 2 6-2 2-6 3-8 7 0 4 4 8-1 3-1 2-2 0-1-2-3-6 0-1 0-2-4-3-2 2-4-2-8 0-1 0 1 3-4 0-3-1-4-1-4 1-7 5 0 1 0 4-1 0-4-1-1-3-4-6-5-1-1 2-3 0-7-7-5 0 0 1-7 0-11-3 0-1-6 1-1-2-3-2-6-2 0-2-3-2-2-5-4-3 0-2-2-2 1-5-1-2 2-7-2-8 4 1 2 2 0-1-1-4 77 0 0-1zm-162 -22l-3 1-2-2 6-1 1 1zm-35 -7l-2 0-3-1 5-1zm-17 -11l8 1-2 1-6-1zm46 -21l2 2 6-1 0 1 4 0 16 2 4-1 7 1 0 26 6 1 4 3 6-2 6 4 4 5 5 2 0 1-2 2-4-2 0-3-4-2-1-3-8 0-9-3-7-2-4 0-9-2-3 1 1 1-10 3-1-2 1-3 3-1-10 5 2 1-2 2-6 2-1 2-4 1-1 1-18 5 0-1 9-3 3-1 8-4 2-4-4 1-2 1-2-2 0 1-1-1-5 1 0-3-1-1-4 1-4-2 0-2-2-1 1-1 3-3 4 0 6-2 0-1-2-1 2-1-5 1-6 0-4-1-5-2 10-3 2 0 0 1 6 0-10-5-4-1 1-1 5 0 4-2 0-1 3-1 11-2 4-1zm616 94l0-2-7-2-5-3-1-3-4 0-1-1 0-2-4-2-5 3 1 1-3 0-1-10 7-2 8 4 2 2 8-1 4 3-1 2 2 0 0 3 4 0 1 1 7-4 1 0-2 2 2 1 2-1 3 1-4 2-3 0 0-2-3 1-3 3-2 0-1 1 2 1 1 2-2 3zm-383 71l-2 1 1 1-1 4 1 2 1 0 1-2-1-4 3-1 0-1 1-1 1 2 2 0 2 3 5-1 4 2 1-2 7 0-2 1 1 1 2 1 2 1 1 2 2 1-2 1 0 2-2 1-1 2 3 3-7 4-5-1 1 1 1 3 2 1-2 1 0 1-6 2-4-6 1-1-1-3 1-5-6 0-2-2-5 0-1-2-1-4-2 0 2-5 2-2zm498 -27l-4 2-3 5 5 7 4 4 2 5-1 5-11 8-1-2 1-2-2-1 5-1-1-2 5-2 0-8-7-10-3-2 2-1-1-3-3 0-3-4 6-1 3-2 3 2 0 1 1 1zm166 106l-1 0-1-2zm-2 -4l1 2-2-1 0-2zm-365 -132l-1 2-1 1 1-3zm49 44l-2 0-1 3-7 2-3 2-8 2-2 2-4 0-3-7 2-7 2 1 8 0 1 1 1-1 2-3 2-1 8-1zm-60 127l-4 5-8 6-4 2-9 0-9 3-3-2-1-4 1-1 0-2-6-9 2-1 1 2 3 1 4-2 0-10 3 3 0 2 2 0 5-4 2 1 4 0 1-2 2-1 4-5 4-2 3 1 2 0 2 6-1 4-2 0-1 2 2 2 1 0 1-2 2 0-1 5zm-8 -1l-1 0-1 0-3 3 2 2 1 0 4-4zm11 -54l2 3-1 3 0 2-1 4 1 1-8 2 0 2-4 2-5 5-8-2-3 1-3-4 0-9 6 0-1-6 5 2 1 1 2 0 2-1 0 2 2 0 2 3 2 0 0-3-3-1 1-9 4-1zm-4 36l-5-1-4-1-1-3-4-3-3-5 5 1 5-5 4-2 0 1 3 0 4 2 0 10z";
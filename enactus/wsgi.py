@@ -0,0 +1,50 @@
+"""Production entry point.
+
+``application`` is the configured Flask app for any WSGI server::
+
+    gunicorn -c gunicorn.conf.py wsgi:application
+
+Running this file does the same, picking the best server available: gunicorn
+(Linux/macOS) with the worker settings in ``gunicorn.conf.py``, else waitress
+(Windows) with ``WEB_THREADS`` threads, else Werkzeug's threaded development
+server. Run ``python maintenance.py migrate`` (or ``seed``) first; workers
+never change the schema themselves.
+
+Importing this module also starts the scheduler thread (see ``scheduler``)
+in each worker process.
+"""
+import os
+import sys
+
+from app import create_app
+from scheduler import scheduler
+
+application = create_app()
+scheduler.start()
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    bind = os.environ.get('WEB_BIND', '0.0.0.0:5003')
+    if sys.platform != 'win32':
+        try:
+            import gunicorn  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            os.chdir(here)
+            os.execv(sys.executable, [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py',
+                                      'wsgi:application'])
+    host, _, port = bind.rpartition(':')
+    try:
+        import waitress
+    except ImportError:
+        print("Neither gunicorn nor waitress is installed; using the Werkzeug development server")
+        application.run(host=host, port=int(port), threaded=True)
+    else:
+        waitress.serve(application, host=host, port=int(port),
+                       threads=int(os.environ.get('WEB_THREADS', 8)))
+
+
+if __name__ == '__main__':
+    main()